@@ -44,6 +44,20 @@ case "${RUN_MODE:-cron}" in
 
     exec /usr/local/bin/supercronic -passthrough-logs /tmp/crontab
     ;;
+"daemon")
+    # 启动 Web 服务器（如果配置了）
+    if [ "${ENABLE_WEBSERVER:-false}" = "true" ]; then
+        echo "🌐 启动 Web 服务器..."
+        /usr/local/bin/python manage.py start_webserver
+    fi
+
+    echo "♻️ 常驻模式: ${CRON_SCHEDULE:-*/30 * * * *}"
+    echo "🎯 trendradar 将作为 PID 1 运行，按内置调度执行"
+
+    # 调度和立即执行由程序读取 CRON_SCHEDULE / IMMEDIATE_RUN
+    cd /app
+    exec /usr/local/bin/python -m trendradar --daemon
+    ;;
 *)
     exec "$@"
     ;;
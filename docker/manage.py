@@ -1,9 +1,10 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 """
-新闻爬虫容器管理工具 - supercronic
+新闻爬虫容器管理工具 - supercronic / 常驻模式
 """
 
+import json
 import os
 import sys
 import subprocess
@@ -16,6 +17,9 @@ WEBSERVER_PORT = int(os.environ.get("WEBSERVER_PORT", "8080"))
 WEBSERVER_DIR = "/app/output"
 WEBSERVER_PID_FILE = "/tmp/webserver.pid"
 
+# 常驻模式状态文件（与 trendradar.daemon 一致）
+DAEMON_STATUS_FILE = os.environ.get("DAEMON_STATUS_FILE", "/tmp/trendradar_daemon.json")
+
 
 def run_command(cmd, shell=True, capture_output=True):
     """执行系统命令"""
@@ -124,10 +128,62 @@ def parse_cron_schedule(cron_expr):
         return f"解析失败: {cron_expr}"
 
 
+def show_daemon_status():
+    """显示常驻模式状态，返回常驻进程是否正常运行"""
+    print("  ♻️ 常驻模式状态:")
+
+    if not Path(DAEMON_STATUS_FILE).exists():
+        print("    ❌ 状态文件不存在，常驻进程可能尚未启动")
+        return False
+
+    try:
+        with open(DAEMON_STATUS_FILE, "r", encoding="utf-8") as f:
+            status = json.load(f)
+    except Exception as e:
+        print(f"    ❌ 读取状态文件失败: {e}")
+        return False
+
+    pid = status.get("pid")
+    alive = False
+    if pid:
+        try:
+            os.kill(pid, 0)
+            alive = True
+        except OSError:
+            pass
+
+    state_names = {
+        "starting": "启动中",
+        "idle": "等待下次运行",
+        "running": "运行中",
+        "stopped": "已停止",
+    }
+    state = status.get("state", "")
+    print(f"    进程: PID {pid} ({'存活' if alive else '不存在'})")
+    print(f"    状态: {state_names.get(state, state)}")
+    print(f"    调度: {status.get('schedule')} ({parse_cron_schedule(status.get('schedule'))})")
+    print(f"    启动时间: {status.get('started_at') or '-'}")
+    print(f"    配置加载时间: {status.get('config_loaded_at') or '-'}")
+    print(f"    已运行: {status.get('runs', 0)} 次 (失败 {status.get('failures', 0)} 次)")
+    if status.get("last_run_start"):
+        duration = status.get("last_run_seconds")
+        duration_desc = f"，耗时 {duration} 秒" if duration is not None else ""
+        print(f"    上次运行: {status['last_run_start']}{duration_desc}")
+    if status.get("last_error"):
+        print(f"    上次错误: {status['last_error']}")
+    if status.get("next_run"):
+        print(f"    下次运行: {status['next_run']}")
+    print(f"    状态更新: {status.get('updated_at') or '-'}")
+
+    return alive and state != "stopped"
+
+
 def show_status():
     """显示容器状态"""
     print("📊 容器状态:")
 
+    daemon_mode = os.environ.get("RUN_MODE", "") == "daemon"
+
     # 检查 PID 1 状态
     supercronic_is_pid1 = False
     pid1_cmdline = ""
@@ -136,7 +192,12 @@ def show_status():
             pid1_cmdline = f.read().replace('\x00', ' ').strip()
         print(f"  🔍 PID 1 进程: {pid1_cmdline}")
         
-        if "supercronic" in pid1_cmdline.lower():
+        if daemon_mode:
+            if "--daemon" in pid1_cmdline:
+                print("  ✅ trendradar 常驻进程正确运行为 PID 1")
+            else:
+                print("  ❌ PID 1 不是 trendradar 常驻进程")
+        elif "supercronic" in pid1_cmdline.lower():
             print("  ✅ supercronic 正确运行为 PID 1")
             supercronic_is_pid1 = True
         else:
@@ -160,6 +221,10 @@ def show_status():
     print(f"    RUN_MODE: {run_mode}")
     print(f"    IMMEDIATE_RUN: {immediate_run}")
 
+    daemon_ok = False
+    if daemon_mode:
+        daemon_ok = show_daemon_status()
+
     # 检查配置文件
     config_files = ["/app/config/config.yaml", "/app/config/frequency_words.txt"]
     print("  📁 配置文件:")
@@ -176,6 +241,9 @@ def show_status():
         ("/tmp/crontab", "crontab文件"),
         ("/entrypoint.sh", "启动脚本")
     ]
+    if daemon_mode:
+        # 常驻模式不生成 crontab
+        key_files = [item for item in key_files if item[0] != "/tmp/crontab"]
     
     print("  📂 关键文件检查:")
     for file_path, description in key_files:
@@ -234,7 +302,16 @@ def show_status():
 
     # 状态总结和建议
     print("  📊 状态总结:")
-    if supercronic_is_pid1:
+    if daemon_mode:
+        if daemon_ok:
+            print("    ✅ 常驻进程正常运行，按内置调度执行")
+            print("    💡 修改 config.yaml 后下次运行自动重新加载，无需重启容器")
+        else:
+            print("    ❌ 常驻进程状态异常")
+            print("    💡 建议操作:")
+            print("       • 检查容器日志: docker logs trendradar")
+            print("       • 重启容器: docker restart trendradar")
+    elif supercronic_is_pid1:
         print("    ✅ supercronic 正确运行为 PID 1")
         print("    ✅ 定时任务应该正常工作")
         
@@ -612,7 +689,7 @@ def show_help():
 
 💡 常用操作指南:
   1. 检查运行状态: status
-     - 查看 supercronic 是否为 PID 1
+     - 查看 supercronic 是否为 PID 1（常驻模式下显示常驻进程状态）
      - 检查配置文件和关键文件
      - 查看 cron 调度设置
 
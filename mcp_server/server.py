@@ -332,7 +332,9 @@ async def get_rss_feeds_status() -> str:
         - available_dates: 有 RSS 数据的日期列表
         - total_dates: 总日期数
         - today_feeds: 今日各 RSS 源的数据统计
-            - {feed_id}: { name, item_count }
+            - {feed_id}: { name, item_count, circuit_breaker }
+              circuit_breaker（启用熔断时）: state（closed/open/half_open）、
+              consecutive_failures、last_failure、next_probe
         - generated_at: 生成时间
 
     Examples:
@@ -588,7 +590,7 @@ async def generate_summary_report(
 async def aggregate_news(
     date_range: Optional[Union[Dict[str, str], str]] = None,
     platforms: Optional[List[str]] = None,
-    similarity_threshold: float = 0.7,
+    similarity_threshold: Optional[float] = None,
     limit: int = 50,
     include_url: bool = False
 ) -> str:
@@ -600,7 +602,8 @@ async def aggregate_news(
     Args:
         date_range: 日期范围，不指定则查询今天
         platforms: 平台ID列表，如 ['zhihu', 'weibo']，不指定则使用所有平台
-        similarity_threshold: 相似度阈值，0.3-1.0，默认0.7（越高越严格）
+        similarity_threshold: 相似度阈值，0.3-1.0，默认0.7（越高越严格）；
+            不指定时用 LSH 近似召回相似新闻，指定时全量精确比较（较慢）
         limit: 返回聚合新闻数量，默认50
         include_url: 是否包含URL链接，默认False
 
@@ -847,6 +847,50 @@ class DataService:
 
         return result
 
+    def _get_rss_breaker_states(self) -> Dict[str, Dict]:
+        """
+        根据今天的抓取状态计算各 RSS 源的熔断状态
+
+        Returns:
+            {feed_id: {"state", "consecutive_failures", "last_failure", "next_probe"}}，
+            时间为 HH:MM；未启用熔断时返回空字典
+        """
+        from trendradar.crawler.breaker import CircuitBreaker
+
+        try:
+            config_data = self.parser.parse_yaml_config()
+        except Exception:
+            return {}
+
+        breaker_config = (config_data or {}).get("advanced", {}).get("circuit_breaker", {})
+        if not breaker_config.get("enabled", False):
+            return {}
+
+        breaker = CircuitBreaker(
+            failure_threshold=breaker_config.get("failure_threshold", 3),
+            probe_interval=breaker_config.get("probe_interval", 30),
+            max_probe_interval=breaker_config.get("max_probe_interval", 240),
+        )
+
+        def format_minutes(minutes: Optional[int]) -> Optional[str]:
+            if minutes is None:
+                return None
+            return f"{minutes // 60:02d}:{minutes % 60:02d}" if minutes < 24 * 60 else "次日"
+
+        now = datetime.now()
+        now_minutes = now.hour * 60 + now.minute
+
+        states = {}
+        for feed_id, health in self.parser.read_rss_feed_health().items():
+            next_probe = breaker.next_probe(health)
+            states[feed_id] = {
+                "state": breaker.state(health, now_minutes),
+                "consecutive_failures": health["consecutive_failures"],
+                "last_failure": format_minutes(health["last_failure"]),
+                "next_probe": format_minutes(next_probe),
+            }
+        return states
+
     def get_rss_feeds_status(self) -> Dict:
         """
         获取 RSS 源状态
@@ -880,6 +924,11 @@ class DataService:
         except DataNotFoundError:
             pass
 
+        # 熔断状态
+        for feed_id, breaker_state in self._get_rss_breaker_states().items():
+            today_stats.setdefault(feed_id, {"name": feed_id, "item_count": 0})
+            today_stats[feed_id]["circuit_breaker"] = breaker_state
+
         result = {
             "available_dates": available_dates[:10],  # 最近 10 天
             "total_dates": len(available_dates),
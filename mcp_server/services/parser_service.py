@@ -134,25 +134,41 @@ class ParserService:
         if not cursor.fetchone():
             return None
 
+        # 事件聚类表（旧数据库可能不存在，此时 story_id 为空）
+        cursor.execute("""
+            SELECT name FROM sqlite_master
+            WHERE type='table' AND name='news_stories'
+        """)
+        if cursor.fetchone():
+            story_select = "s.story_id"
+            story_join = "LEFT JOIN news_stories s ON s.news_item_id = n.id"
+        else:
+            story_select = "NULL as story_id"
+            story_join = ""
+
         # 构建查询
         if platform_ids:
             placeholders = ','.join(['?' for _ in platform_ids])
             query = f"""
                 SELECT n.id, n.platform_id, p.name as platform_name, n.title,
                        n.rank, n.url, n.mobile_url,
-                       n.first_crawl_time, n.last_crawl_time, n.crawl_count
+                       n.first_crawl_time, n.last_crawl_time, n.crawl_count,
+                       {story_select}
                 FROM news_items n
                 LEFT JOIN platforms p ON n.platform_id = p.id
+                {story_join}
                 WHERE n.platform_id IN ({placeholders})
             """
             cursor.execute(query, platform_ids)
         else:
-            cursor.execute("""
+            cursor.execute(f"""
                 SELECT n.id, n.platform_id, p.name as platform_name, n.title,
                        n.rank, n.url, n.mobile_url,
-                       n.first_crawl_time, n.last_crawl_time, n.crawl_count
+                       n.first_crawl_time, n.last_crawl_time, n.crawl_count,
+                       {story_select}
                 FROM news_items n
                 LEFT JOIN platforms p ON n.platform_id = p.id
+                {story_join}
             """)
 
         rows = cursor.fetchall()
@@ -197,6 +213,7 @@ class ParserService:
                 "first_time": row['first_crawl_time'] or "",
                 "last_time": row['last_crawl_time'] or "",
                 "count": row['crawl_count'] or 1,
+                "story_id": row['story_id'],
             }
 
         # 获取抓取时间作为 timestamps
@@ -341,6 +358,175 @@ class ParserService:
             suggestion="请先运行爬虫或检查日期是否正确"
         )
 
+    def read_keyword_heat(
+        self,
+        date: datetime = None,
+        keyword_type: Optional[str] = None
+    ) -> Optional[List[Dict]]:
+        """
+        读取指定日期的关键词小时热度汇总（带缓存）
+
+        Args:
+            date: 日期对象，默认为今天
+            keyword_type: 关键词类型过滤（"group" 或 "token"），None 表示全部
+
+        Returns:
+            汇总行列表 [{"keyword", "keyword_type", "platform_id", "hour",
+            "count", "best_rank", "weight_sum"}, ...]；
+            数据库不存在或没有汇总表（旧数据）时返回 None
+        """
+        date_str = self.get_date_folder_name(date)
+        cache_key = f"keyword_heat:{date_str}:{keyword_type or 'all'}"
+
+        cached = self.cache.get(cache_key, ttl=900)
+        if cached is not None:
+            return cached
+
+        db_path = self._get_db_path(date, "news")
+        if db_path is None:
+            return None
+
+        try:
+            conn = sqlite3.connect(str(db_path))
+            conn.row_factory = sqlite3.Row
+            cursor = conn.cursor()
+
+            cursor.execute("""
+                SELECT name FROM sqlite_master
+                WHERE type='table' AND name='keyword_heat'
+            """)
+            if not cursor.fetchone():
+                return None
+
+            if keyword_type:
+                cursor.execute("""
+                    SELECT keyword, keyword_type, platform_id, hour, count, best_rank, weight_sum
+                    FROM keyword_heat WHERE keyword_type = ?
+                    ORDER BY hour
+                """, (keyword_type,))
+            else:
+                cursor.execute("""
+                    SELECT keyword, keyword_type, platform_id, hour, count, best_rank, weight_sum
+                    FROM keyword_heat
+                    ORDER BY hour
+                """)
+
+            rows = [dict(row) for row in cursor.fetchall()]
+            if not rows:
+                return None
+
+            self.cache.set(cache_key, rows)
+            return rows
+
+        except Exception as e:
+            print(f"Warning: 读取关键词热度汇总失败: {e}")
+            return None
+        finally:
+            if 'conn' in locals():
+                conn.close()
+
+    def read_rising_news(self, date: datetime = None, limit: int = 20) -> List[Dict]:
+        """
+        读取最近一次抓取中排名上升最快的新闻（带缓存）
+
+        数据来自入库时增量维护的排名动量表，只按速度索引取前 limit 条。
+
+        Args:
+            date: 日期对象，默认为今天
+            limit: 返回条数
+
+        Returns:
+            [{"title", "platform_id", "platform_name", "rank", "url", "rank_delta",
+            "velocity", "max_climb", "age_minutes"}, ...]；没有动量数据时返回空列表
+        """
+        date_str = self.get_date_folder_name(date)
+        cache_key = f"rising_news:{date_str}:{limit}"
+
+        cached = self.cache.get(cache_key, ttl=900)
+        if cached is not None:
+            return cached
+
+        db_path = self._get_db_path(date, "news")
+        if db_path is None:
+            return []
+
+        try:
+            conn = sqlite3.connect(str(db_path))
+            conn.row_factory = sqlite3.Row
+            cursor = conn.cursor()
+
+            cursor.execute("""
+                SELECT name FROM sqlite_master
+                WHERE type='table' AND name='news_momentum'
+            """)
+            if not cursor.fetchone():
+                return []
+
+            cursor.execute("""
+                SELECT n.title, n.platform_id, p.name as platform_name, n.rank, n.url,
+                       m.rank_delta, m.velocity, m.max_climb, m.age_minutes
+                FROM news_momentum m
+                JOIN news_items n ON n.id = m.news_item_id
+                LEFT JOIN platforms p ON n.platform_id = p.id
+                WHERE m.velocity > 0
+                  AND n.last_crawl_time = (SELECT MAX(crawl_time) FROM crawl_records)
+                ORDER BY m.velocity DESC, m.max_climb DESC
+                LIMIT ?
+            """, (limit,))
+
+            rows = []
+            for row in cursor.fetchall():
+                item = dict(row)
+                item["platform_name"] = item["platform_name"] or item["platform_id"]
+                item["url"] = item["url"] or ""
+                item["velocity"] = round(item["velocity"], 2)
+                rows.append(item)
+
+            self.cache.set(cache_key, rows)
+            return rows
+
+        except Exception as e:
+            print(f"Warning: 读取排名动量失败: {e}")
+            return []
+        finally:
+            if 'conn' in locals():
+                conn.close()
+
+    def read_rss_feed_health(self, date: datetime = None) -> Dict[str, Dict]:
+        """
+        读取各 RSS 源当天的抓取健康状况（连续失败次数、最近成功/失败时间）
+
+        Args:
+            date: 日期对象，默认为今天
+
+        Returns:
+            {feed_id: {"consecutive_failures", "last_failure", "last_success"}}，
+            时间为当天的分钟数；没有数据时返回空字典
+        """
+        from trendradar.crawler.breaker import summarize_source_health
+
+        db_path = self._get_db_path(date, "rss")
+        if db_path is None:
+            return {}
+
+        try:
+            conn = sqlite3.connect(str(db_path))
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT s.feed_id, r.crawl_time, s.status
+                FROM rss_crawl_status s
+                JOIN rss_crawl_records r ON r.id = s.crawl_record_id
+                ORDER BY r.crawl_time
+            """)
+            return summarize_source_health(cursor.fetchall())
+
+        except Exception as e:
+            print(f"Warning: 读取 RSS 源抓取状态失败: {e}")
+            return {}
+        finally:
+            if 'conn' in locals():
+                conn.close()
+
     def parse_yaml_config(self, config_path: str = None) -> dict:
         """
         解析YAML配置文件
@@ -14,6 +14,8 @@ from difflib import SequenceMatcher
 import yaml
 
 from trendradar.core.analyzer import calculate_news_weight as _calculate_news_weight
+from trendradar.utils.keywords import extract_title_keywords
+from trendradar.utils.story import StoryIndex, minhash_signature
 
 from ..services.data_service import DataService
 from ..utils.validators import (
@@ -32,13 +34,14 @@ def _get_weight_config() -> Dict:
     从 config.yaml 读取权重配置
 
     Returns:
-        权重配置字典，包含 RANK_WEIGHT, FREQUENCY_WEIGHT, HOTNESS_WEIGHT
+        权重配置字典，包含 RANK_WEIGHT, FREQUENCY_WEIGHT, HOTNESS_WEIGHT, MOMENTUM_WEIGHT
     """
     # 默认值
     default_config = {
         "RANK_WEIGHT": 0.6,
         "FREQUENCY_WEIGHT": 0.3,
         "HOTNESS_WEIGHT": 0.1,
+        "MOMENTUM_WEIGHT": 0.0,
     }
 
     try:
@@ -53,6 +56,7 @@ def _get_weight_config() -> Dict:
                 "RANK_WEIGHT": weight.get('rank', 0.6),
                 "FREQUENCY_WEIGHT": weight.get('frequency', 0.3),
                 "HOTNESS_WEIGHT": weight.get('hotness', 0.1),
+                "MOMENTUM_WEIGHT": weight.get('momentum', 0.0),
             }
     except Exception:
         return default_config
@@ -256,7 +260,10 @@ class AnalyticsTools:
             date_range: 日期范围（可选）
                        - **格式**: {"start": "YYYY-MM-DD", "end": "YYYY-MM-DD"}
                        - **默认**: 不指定时默认分析最近7天
-            granularity: 时间粒度，仅支持 day（天）
+            granularity: 时间粒度
+                       - day: 按天统计（默认）
+                       - hour: 按小时统计（读取入库时维护的关键词小时热度汇总，
+                         不指定日期范围时默认今天）
 
         Returns:
             趋势分析结果字典
@@ -289,19 +296,21 @@ class AnalyticsTools:
             # 验证参数
             topic = validate_keyword(topic)
 
-            # 验证粒度参数（只支持day）
-            if granularity != "day":
+            # 验证粒度参数
+            if granularity not in ("day", "hour"):
                 from ..utils.errors import InvalidParameterError
                 raise InvalidParameterError(
                     f"不支持的粒度参数: {granularity}",
-                    suggestion="当前仅支持 'day' 粒度，因为底层数据按天聚合"
+                    suggestion="支持 'day'（按天）和 'hour'（按小时，基于小时热度汇总）"
                 )
 
-            # 处理日期范围（不指定时默认最近7天）
+            # 处理日期范围（不指定时 day 默认最近7天，hour 默认今天）
             if date_range:
                 from ..utils.validators import validate_date_range
                 date_range_tuple = validate_date_range(date_range)
                 start_date, end_date = date_range_tuple
+            elif granularity == "hour":
+                start_date = end_date = datetime.now()
             else:
                 # 默认最近7天
                 end_date = datetime.now()
@@ -311,7 +320,11 @@ class AnalyticsTools:
             trend_data = []
             current_date = start_date
 
-            while current_date <= end_date:
+            while granularity == "hour" and current_date <= end_date:
+                trend_data.extend(self._collect_hourly_topic_heat(topic, current_date))
+                current_date += timedelta(days=1)
+
+            while granularity == "day" and current_date <= end_date:
                 try:
                     all_titles, _, _ = self.data_service.parser.read_all_titles_for_date(
                         date=current_date
@@ -360,7 +373,7 @@ class AnalyticsTools:
                 # 找到峰值时间
                 max_count = max(counts)
                 peak_index = counts.index(max_count)
-                peak_time = trend_data[peak_index]["date"]
+                peak_time = trend_data[peak_index].get("time", trend_data[peak_index]["date"])
             else:
                 change_rate = 0
                 peak_time = None
@@ -1634,10 +1647,12 @@ class AnalyticsTools:
 
         Args:
             threshold: 热度突增倍数阈值
-            time_window: 检测时间窗口（小时）
+            time_window: 检测时间窗口（小时）。有小时热度汇总时对比最近 time_window 小时
+                         与之前同长度窗口；否则对比今天与昨天的全部标题
 
         Returns:
-            爆火话题列表
+            爆火话题列表（data），以及最近一次抓取中排名上升最快的新闻（rising_news，
+            含每次抓取的排名变化、上升速度、最大爬升和在榜时长）
 
         Examples:
             用户询问示例：
@@ -1658,6 +1673,18 @@ class AnalyticsTools:
             threshold = validate_threshold(threshold, default=3.0, min_value=1.0, max_value=100.0)
             time_window = validate_limit(time_window, default=24, max_limit=72)
 
+            # 优先使用入库时维护的小时热度汇总：对比最近 time_window 小时与之前同长度窗口
+            now_hour = datetime.now().replace(minute=0, second=0, microsecond=0)
+            current_keywords = self._collect_keyword_heat_window(now_hour, time_window)
+            if current_keywords:
+                previous_keywords = self._collect_keyword_heat_window(
+                    now_hour - timedelta(hours=time_window), time_window
+                ) or Counter()
+                return self._build_viral_topics_result(
+                    current_keywords, previous_keywords, threshold, time_window,
+                    data_source="hourly_rollup"
+                )
+
             # 读取当前和之前的数据
             current_all_titles, _, _ = self.data_service.parser.read_all_titles_for_date()
 
@@ -1690,65 +1717,11 @@ class AnalyticsTools:
                     keywords = self._extract_keywords(title)
                     previous_keywords.update(keywords)
 
-            # 检测异常热度
-            viral_topics = []
-
-            for keyword, current_count in current_keywords.items():
-                previous_count = previous_keywords.get(keyword, 0)
-
-                # 计算增长倍数
-                if previous_count == 0:
-                    # 新出现的话题
-                    if current_count >= 5:  # 至少出现5次才认为是爆火
-                        growth_rate = float('inf')
-                        is_viral = True
-                    else:
-                        continue
-                else:
-                    growth_rate = current_count / previous_count
-                    is_viral = growth_rate >= threshold
-
-                if is_viral:
-                    viral_topics.append({
-                        "keyword": keyword,
-                        "current_count": current_count,
-                        "previous_count": previous_count,
-                        "growth_rate": round(growth_rate, 2) if growth_rate != float('inf') else "新话题",
-                        "sample_titles": current_keyword_titles[keyword][:3],
-                        "alert_level": "高" if growth_rate > threshold * 2 else "中"
-                    })
-
-            # 按增长率排序
-            viral_topics.sort(
-                key=lambda x: x["current_count"] if x["growth_rate"] == "新话题" else x["growth_rate"],
-                reverse=True
+            return self._build_viral_topics_result(
+                current_keywords, previous_keywords, threshold, time_window,
+                data_source="titles", keyword_titles=current_keyword_titles
             )
 
-            if not viral_topics:
-                return {
-                    "success": True,
-                    "summary": {
-                        "description": "异常热度检测结果",
-                        "total": 0,
-                        "threshold": threshold,
-                        "time_window": time_window
-                    },
-                    "data": [],
-                    "message": f"未检测到热度增长超过 {threshold} 倍的话题"
-                }
-
-            return {
-                "success": True,
-                "summary": {
-                    "description": "异常热度检测结果",
-                    "total": len(viral_topics),
-                    "threshold": threshold,
-                    "time_window": time_window,
-                    "detection_time": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                },
-                "data": viral_topics
-            }
-
         except MCPError as e:
             return {
                 "success": False,
@@ -1763,6 +1736,118 @@ class AnalyticsTools:
                 }
             }
 
+    def _build_viral_topics_result(
+        self,
+        current_keywords: Counter,
+        previous_keywords: Counter,
+        threshold: float,
+        time_window: int,
+        data_source: str,
+        keyword_titles: Optional[Dict[str, List[str]]] = None
+    ) -> Dict:
+        """
+        根据当前/之前的关键词热度检测爆火话题并构建返回结果
+
+        Args:
+            current_keywords: 当前窗口的关键词热度
+            previous_keywords: 基准窗口的关键词热度
+            threshold: 热度突增倍数阈值
+            time_window: 检测时间窗口（小时）
+            data_source: 数据来源（hourly_rollup: 小时热度汇总，titles: 按天标题统计）
+            keyword_titles: 关键词 → 样本标题（可选，未提供时从今天的标题中查找）
+
+        Returns:
+            爆火话题检测结果
+        """
+        # 检测异常热度
+        viral_topics = []
+
+        for keyword, current_count in current_keywords.items():
+            previous_count = previous_keywords.get(keyword, 0)
+
+            # 计算增长倍数
+            if previous_count == 0:
+                # 新出现的话题
+                if current_count >= 5:  # 至少出现5次才认为是爆火
+                    growth_rate = float('inf')
+                    is_viral = True
+                else:
+                    continue
+            else:
+                growth_rate = current_count / previous_count
+                is_viral = growth_rate >= threshold
+
+            if is_viral:
+                viral_topics.append({
+                    "keyword": keyword,
+                    "current_count": current_count,
+                    "previous_count": previous_count,
+                    "growth_rate": round(growth_rate, 2) if growth_rate != float('inf') else "新话题",
+                    "sample_titles": self._sample_titles_for_keyword(keyword, keyword_titles),
+                    "alert_level": "高" if growth_rate > threshold * 2 else "中"
+                })
+
+        # 按增长率排序
+        viral_topics.sort(
+            key=lambda x: x["current_count"] if x["growth_rate"] == "新话题" else x["growth_rate"],
+            reverse=True
+        )
+
+        # 排名上升最快的新闻（入库时维护的排名动量，不扫描全天数据）
+        rising_news = self.data_service.parser.read_rising_news(limit=10)
+
+        if not viral_topics:
+            return {
+                "success": True,
+                "summary": {
+                    "description": "异常热度检测结果",
+                    "total": 0,
+                    "threshold": threshold,
+                    "time_window": time_window,
+                    "data_source": data_source
+                },
+                "data": [],
+                "rising_news": rising_news,
+                "message": f"未检测到热度增长超过 {threshold} 倍的话题"
+            }
+
+        return {
+            "success": True,
+            "summary": {
+                "description": "异常热度检测结果",
+                "total": len(viral_topics),
+                "threshold": threshold,
+                "time_window": time_window,
+                "data_source": data_source,
+                "detection_time": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            },
+            "data": viral_topics,
+            "rising_news": rising_news
+        }
+
+    def _sample_titles_for_keyword(
+        self,
+        keyword: str,
+        keyword_titles: Optional[Dict[str, List[str]]] = None
+    ) -> List[str]:
+        """获取包含关键词的样本标题（最多3条）"""
+        if keyword_titles is not None:
+            return keyword_titles.get(keyword, [])[:3]
+
+        try:
+            all_titles, _, _ = self.data_service.parser.read_all_titles_for_date()
+        except DataNotFoundError:
+            return []
+
+        samples = []
+        for titles in all_titles.values():
+            for title in titles.keys():
+                if keyword in title:
+                    samples.append(title)
+                    if len(samples) >= 3:
+                        return samples
+        return samples
+
     def predict_trending_topics(
         self,
         lookahead_hours: int = 6,
@@ -1932,6 +2017,95 @@ class AnalyticsTools:
 
     # ==================== 辅助方法 ====================
 
+    def _collect_hourly_topic_heat(self, topic: str, date: datetime) -> List[Dict]:
+        """
+        从关键词小时热度汇总中统计话题在某天每个小时的热度
+
+        话题匹配包含该话题的标题关键词（token）以及同名的频率词组（group）。
+
+        Args:
+            topic: 话题关键词
+            date: 日期
+
+        Returns:
+            每小时一条的趋势数据；当天没有热度汇总时返回空列表
+        """
+        rows = self.data_service.parser.read_keyword_heat(date)
+        if not rows:
+            return []
+
+        topic_lower = topic.lower()
+        date_str = date.strftime("%Y-%m-%d")
+        hourly = {}
+
+        # 每个抓取小时都输出一个点（话题未出现的小时计 0）
+        for row in rows:
+            hourly.setdefault(row["hour"], {
+                "date": date_str,
+                "hour": row["hour"],
+                "time": f"{date_str} {row['hour']}:00",
+                "count": 0,
+                "best_rank": None,
+                "weight": 0.0,
+                "sample_titles": []
+            })
+
+        for row in rows:
+            keyword = row["keyword"]
+            if row["keyword_type"] == "group":
+                if keyword.lower() != topic_lower:
+                    continue
+            elif topic_lower not in keyword.lower():
+                continue
+
+            point = hourly[row["hour"]]
+            point["count"] += row["count"] or 0
+            point["weight"] = round(point["weight"] + (row["weight_sum"] or 0), 1)
+            if row["best_rank"] and (point["best_rank"] is None or row["best_rank"] < point["best_rank"]):
+                point["best_rank"] = row["best_rank"]
+            if row["keyword_type"] == "token" and len(point["sample_titles"]) < 3 \
+                    and keyword not in point["sample_titles"]:
+                point["sample_titles"].append(keyword)
+
+        return [hourly[hour] for hour in sorted(hourly)]
+
+    def _collect_keyword_heat_window(
+        self,
+        end_hour: datetime,
+        hours: int
+    ) -> Optional[Counter]:
+        """
+        从关键词小时热度汇总中统计时间窗口内各标题关键词的热度（出现条数之和）
+
+        Args:
+            end_hour: 窗口最后一个小时（含）
+            hours: 窗口长度（小时）
+
+        Returns:
+            关键词 → 热度计数；窗口内所有日期都没有热度汇总时返回 None
+        """
+        start_hour = end_hour - timedelta(hours=hours - 1)
+        wanted = defaultdict(set)
+        point = start_hour
+        while point <= end_hour:
+            wanted[point.strftime("%Y-%m-%d")].add(point.strftime("%H"))
+            point += timedelta(hours=1)
+
+        counts = Counter()
+        has_rollup = False
+        for date_str, hour_set in wanted.items():
+            rows = self.data_service.parser.read_keyword_heat(
+                datetime.strptime(date_str, "%Y-%m-%d"), keyword_type="token"
+            )
+            if not rows:
+                continue
+            has_rollup = True
+            for row in rows:
+                if row["hour"] in hour_set:
+                    counts[row["keyword"]] += row["count"] or 0
+
+        return counts if has_rollup else None
+
     def _extract_keywords(self, title: str, min_length: int = 2) -> List[str]:
         """
         从标题中提取关键词（简单实现）
@@ -1943,22 +2117,7 @@ class AnalyticsTools:
         Returns:
             关键词列表
         """
-        # 移除URL和特殊字符
-        title = re.sub(r'http[s]?://\S+', '', title)
-        title = re.sub(r'[^\w\s]', ' ', title)
-
-        # 简单分词（按空格和常见分隔符）
-        words = re.split(r'[\s，。！？、]+', title)
-
-        # 过滤停用词和短词
-        stopwords = {'的', '了', '在', '是', '我', '有', '和', '就', '不', '人', '都', '一', '一个', '上', '也', '很', '到', '说', '要', '去', '你', '会', '着', '没有', '看', '好', '自己', '这'}
-
-        keywords = [
-            word.strip() for word in words
-            if word.strip() and len(word.strip()) >= min_length and word.strip() not in stopwords
-        ]
-
-        return keywords
+        return extract_title_keywords(title, min_length)
 
     def _calculate_similarity(self, text1: str, text2: str) -> float:
         """
@@ -2013,7 +2172,7 @@ class AnalyticsTools:
         self,
         date_range: Optional[Union[Dict[str, str], str]] = None,
         platforms: Optional[List[str]] = None,
-        similarity_threshold: float = 0.7,
+        similarity_threshold: Optional[float] = None,
         limit: int = 50,
         include_url: bool = False
     ) -> Dict:
@@ -2023,12 +2182,16 @@ class AnalyticsTools:
         将不同平台报道的同一事件合并为一条聚合新闻，
         显示该新闻在各平台的覆盖情况和综合热度。
 
+        未指定 similarity_threshold 时使用默认阈值 0.7，并用 MinHash/LSH 召回候选（近似，
+        可能漏掉少量相似但分桶不同的新闻）；指定阈值时对全部新闻两两比较（精确，较慢）。
+        使用的方式见 summary.candidate_search（"lsh" 或 "exact"）。
+
         Args:
             date_range: 日期范围（可选）
                 - 不指定: 查询今天
                 - {\"start\": \"YYYY-MM-DD\", \"end\": \"YYYY-MM-DD\"}: 日期范围
             platforms: 平台过滤列表，如 ['zhihu', 'weibo']
-            similarity_threshold: 相似度阈值，0-1之间，默认0.7
+            similarity_threshold: 相似度阈值，0.3-1.0之间，默认0.7（指定时精确比较）
             limit: 返回聚合新闻数量，默认50
             include_url: 是否包含URL链接，默认False
 
@@ -2040,6 +2203,8 @@ class AnalyticsTools:
         try:
             # 参数验证
             platforms = validate_platforms(platforms)
+            # LSH 分桶按默认阈值调校，用户指定阈值时使用全量两两比较
+            exact = similarity_threshold is not None
             similarity_threshold = validate_threshold(
                 similarity_threshold, default=0.7, min_value=0.3, max_value=1.0
             )
@@ -2074,7 +2239,8 @@ class AnalyticsTools:
                                 "date": current_date.strftime("%Y-%m-%d"),
                                 "ranks": info.get("ranks", []),
                                 "count": len(info.get("ranks", [])),
-                                "rank": info["ranks"][0] if info["ranks"] else 999
+                                "rank": info["ranks"][0] if info["ranks"] else 999,
+                                "story_id": info.get("story_id")
                             }
 
                             if include_url:
@@ -2104,7 +2270,7 @@ class AnalyticsTools:
 
             # 执行聚合
             aggregated = self._aggregate_similar_news(
-                all_news, similarity_threshold, include_url
+                all_news, similarity_threshold, include_url, exact=exact
             )
 
             # 按综合权重排序
@@ -2132,6 +2298,7 @@ class AnalyticsTools:
                     "returned": len(results),
                     "deduplication_rate": f"{dedup_rate * 100:.1f}%",
                     "similarity_threshold": similarity_threshold,
+                    "candidate_search": "exact" if exact else "lsh",
                     "date_range": {
                         "start": start_date.strftime("%Y-%m-%d"),
                         "end": end_date.strftime("%Y-%m-%d")
@@ -2154,17 +2321,24 @@ class AnalyticsTools:
         self,
         news_list: List[Dict],
         threshold: float,
-        include_url: bool
+        include_url: bool,
+        exact: bool = False
     ) -> List[Dict]:
         """
         对新闻列表进行相似度聚合
 
-        使用双层过滤策略：先用 Jaccard 快速粗筛，再用 SequenceMatcher 精确计算
+        聚合策略：
+        1. 同一天 story_id 相同的新闻（入库时已聚类）直接合并，无需再比较
+        2. 其余新闻用 MinHash/LSH 分桶召回候选，只对同桶候选做
+           Jaccard 粗筛 + SequenceMatcher 精确计算，避免全量两两比较
+           （近似：相似度略高于阈值但分桶不同的新闻可能不会合并）
+        3. exact=True 时不使用 LSH，对排在后面的全部新闻做粗筛 + 精确计算
 
         Args:
             news_list: 新闻列表
             threshold: 相似度阈值
             include_url: 是否包含URL
+            exact: 是否全量两两比较（不使用 LSH 召回）
 
         Returns:
             聚合后的新闻列表
@@ -2172,24 +2346,30 @@ class AnalyticsTools:
         if not news_list:
             return []
 
-        # 预计算字符集合用于快速过滤
+        # 按权重排序，预计算字符集合与 MinHash 签名
+        sorted_news = sorted(news_list, key=lambda x: x.get("weight", 0), reverse=True)
         prepared_news = []
-        for news in news_list:
+        lsh_index = StoryIndex()
+        story_members = defaultdict(list)
+
+        for idx, news in enumerate(sorted_news):
             char_set = set(news["title"])
+            signature = minhash_signature(news["title"])
             prepared_news.append({
                 "data": news,
                 "char_set": char_set,
-                "set_len": len(char_set)
+                "set_len": len(char_set),
+                "signature": signature
             })
-
-        # 按权重排序
-        sorted_items = sorted(prepared_news, key=lambda x: x["data"].get("weight", 0), reverse=True)
+            lsh_index.add(idx, idx, signature)
+            if news.get("story_id") is not None:
+                story_members[(news["date"], news["story_id"])].append(idx)
 
         aggregated = []
         used_indices = set()
         PRE_FILTER_RATIO = 0.5  # 粗筛阈值系数
 
-        for i, item in enumerate(sorted_items):
+        for i, item in enumerate(prepared_news):
             if i in used_indices:
                 continue
 
@@ -2221,12 +2401,24 @@ class AnalyticsTools:
 
             used_indices.add(i)
 
-            # 查找相似新闻
-            for j in range(i + 1, len(sorted_items)):
-                if j in used_indices:
+            # 同一事件（入库聚类结果）直接合并
+            matched = []
+            if news.get("story_id") is not None:
+                matched.extend(
+                    j for j in story_members[(news["date"], news["story_id"])]
+                    if j > i and j not in used_indices
+                )
+
+            # 查找相似新闻（默认仅比较 LSH 同桶候选）
+            if exact:
+                candidates = range(i + 1, len(prepared_news))
+            else:
+                candidates = sorted(lsh_index.candidates(item["signature"]))
+            for j in candidates:
+                if j <= i or j in used_indices or j in matched:
                     continue
 
-                compare_item = sorted_items[j]
+                compare_item = prepared_news[j]
                 compare_set = compare_item["char_set"]
                 compare_len = compare_item["set_len"]
 
@@ -2247,38 +2439,40 @@ class AnalyticsTools:
                     continue
 
                 # 精确计算：SequenceMatcher
-                other_news = compare_item["data"]
-                real_similarity = self._calculate_similarity(news["title"], other_news["title"])
+                if self._calculate_similarity(news["title"], compare_item["data"]["title"]) >= threshold:
+                    matched.append(j)
 
-                if real_similarity >= threshold:
-                    # 合并到当前组
-                    if other_news["platform_name"] not in group["platforms"]:
-                        group["platforms"].append(other_news["platform_name"])
-                        group["platform_ids"].append(other_news["platform"])
+            for j in matched:
+                other_news = prepared_news[j]["data"]
 
-                    if other_news["date"] not in group["dates"]:
-                        group["dates"].append(other_news["date"])
+                # 合并到当前组
+                if other_news["platform_name"] not in group["platforms"]:
+                    group["platforms"].append(other_news["platform_name"])
+                    group["platform_ids"].append(other_news["platform"])
 
-                    group["best_rank"] = min(group["best_rank"], other_news["rank"])
-                    group["total_count"] += other_news["count"]
-                    group["aggregate_weight"] += other_news.get("weight", 0) * 0.5  # 额外权重
+                if other_news["date"] not in group["dates"]:
+                    group["dates"].append(other_news["date"])
 
-                    group["sources"].append({
+                group["best_rank"] = min(group["best_rank"], other_news["rank"])
+                group["total_count"] += other_news["count"]
+                group["aggregate_weight"] += other_news.get("weight", 0) * 0.5  # 额外权重
+
+                group["sources"].append({
+                    "platform": other_news["platform_name"],
+                    "rank": other_news["rank"],
+                    "date": other_news["date"]
+                })
+
+                if include_url and other_news.get("url"):
+                    if "urls" not in group:
+                        group["urls"] = []
+                    group["urls"].append({
                         "platform": other_news["platform_name"],
-                        "rank": other_news["rank"],
-                        "date": other_news["date"]
+                        "url": other_news.get("url", ""),
+                        "mobileUrl": other_news.get("mobileUrl", "")
                     })
 
-                    if include_url and other_news.get("url"):
-                        if "urls" not in group:
-                            group["urls"] = []
-                        group["urls"].append({
-                            "platform": other_news["platform_name"],
-                            "url": other_news.get("url", ""),
-                            "mobileUrl": other_news.get("mobileUrl", "")
-                        })
-
-                    used_indices.add(j)
+                used_indices.add(j)
 
             # 添加聚合信息
             group["platform_count"] = len(group["platforms"])
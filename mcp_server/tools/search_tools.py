@@ -819,6 +819,14 @@ class SearchTools:
             for search_date in search_dates:
                 try:
                     all_titles, id_to_name, _ = self.data_service.parser.read_all_titles_for_date(search_date)
+
+                    # 参考标题当天所属的事件（入库时聚类分配的 story_id）
+                    reference_stories = {
+                        info.get("story_id")
+                        for titles in all_titles.values()
+                        for title, info in titles.items()
+                        if title == reference_title and info.get("story_id") is not None
+                    }
                     
                     for platform_id, titles in all_titles.items():
                         platform_name = id_to_name.get(platform_id, platform_id)
@@ -826,6 +834,9 @@ class SearchTools:
                         for title, info in titles.items():
                             if title == reference_title:
                                 continue
+
+                            # 同一事件的新闻无论措辞差异多大都视为相关
+                            same_story = info.get("story_id") in reference_stories
                             
                             # 计算相似度（使用混合算法）
                             text_similarity = self._calculate_similarity(reference_title, title)
@@ -839,14 +850,15 @@ class SearchTools:
                             else:
                                 similarity = text_similarity
                             
-                            if similarity >= threshold:
+                            if similarity >= threshold or same_story:
                                 news_item = {
                                     "title": title,
                                     "platform": platform_id,
                                     "platform_name": platform_name,
                                     "date": search_date.strftime("%Y-%m-%d"),
                                     "similarity": round(similarity, 3),
-                                    "rank": info["ranks"][0] if info["ranks"] else 0
+                                    "rank": info["ranks"][0] if info["ranks"] else 0,
+                                    "same_story": same_story
                                 }
                                 
                                 if include_url:
@@ -0,0 +1,15 @@
+# coding=utf-8
+"""测试共用的 fixture"""
+
+import pytest
+
+from samples import FREQUENCY_WORDS
+from trendradar.core.frequency import load_frequency_words
+
+
+@pytest.fixture
+def frequency_words(tmp_path):
+    """(词组列表, 词组内过滤词, 全局过滤词)"""
+    path = tmp_path / "frequency_words.txt"
+    path.write_text(FREQUENCY_WORDS, encoding="utf-8")
+    return load_frequency_words(str(path))
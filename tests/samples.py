@@ -0,0 +1,72 @@
+# coding=utf-8
+"""测试共用的频率词和抓取数据"""
+
+from trendradar.core.records import TitleRecord
+
+
+FREQUENCY_WORDS = """\
+[GLOBAL_FILTER]
+广告
+
+[WORD_GROUPS]
+AI
+人工智能
+!游戏
+
+芯片
++华为
+
+新能源
+汽车
+"""
+
+# (来源 ID, 来源名称, 标题, 排名列表, URL)
+SAMPLE_TITLES = [
+    ("zhihu", "知乎", "OpenAI 发布新一代 AI 模型", [1, 2], "https://zhihu.com/q/1"),
+    ("zhihu", "知乎", "华为芯片新突破", [3], "https://zhihu.com/q/2"),
+    ("zhihu", "知乎", "AI 游戏引发争议", [4], ""),
+    ("zhihu", "知乎", "今日天气", [5], ""),
+    ("weibo", "微博", "人工智能写作工具走红", [2, 1], "https://weibo.com/1"),
+    ("weibo", "微博", "新能源汽车销量创新高", [6, 4, 3], ""),
+    ("weibo", "微博", "AI 广告铺天盖地", [7], ""),
+    ("baidu", "百度", "华为发布麒麟芯片", [1], "https://baidu.com/s?wd=1"),
+    ("baidu", "百度", "芯片产业链调查", [8], ""),
+    ("baidu", "百度", "汽车召回通知", [12], ""),
+]
+
+ID_TO_NAME = {"zhihu": "知乎", "weibo": "微博", "baidu": "百度"}
+
+
+def sample_dict_data():
+    """按原有字典结构构建 (results, title_info)"""
+    results, title_info = {}, {}
+    for source_id, _, title, ranks, url in SAMPLE_TITLES:
+        results.setdefault(source_id, {})[title] = {
+            "ranks": list(ranks),
+            "url": url,
+            "mobileUrl": "",
+        }
+        title_info.setdefault(source_id, {})[title] = {
+            "first_time": "08-00",
+            "last_time": "10-30",
+            "count": len(ranks),
+            "ranks": list(ranks),
+            "url": url,
+            "mobileUrl": "",
+            "rank_timeline": [{"time": "08-00", "rank": ranks[0]}],
+        }
+    return results, title_info
+
+
+def sample_record_data():
+    """按存储读取的结构构建 (results, title_info)：两者共享同一个 TitleRecord"""
+    results, title_info = {}, {}
+    for source_id, source_name, title, ranks, url in SAMPLE_TITLES:
+        record = TitleRecord(
+            title, source_id, source_name, url=url,
+            first_time="08-00", last_time="10-30", count=len(ranks), ranks=ranks,
+            rank_timeline=[{"time": "08-00", "rank": ranks[0]}],
+        )
+        results.setdefault(source_id, {})[title] = record
+        title_info.setdefault(source_id, {})[title] = record
+    return results, title_info
@@ -0,0 +1,40 @@
+# coding=utf-8
+"""AI 分析输入准备测试"""
+
+from datetime import datetime
+
+from samples import ID_TO_NAME, sample_dict_data, sample_record_data
+from trendradar.ai.analyzer import AIAnalyzer
+from trendradar.core.analyzer import count_word_frequency
+from trendradar.core.records import MatchedTitle
+
+
+def _analyzer():
+    return AIAnalyzer({}, {"MAX_NEWS_FOR_ANALYSIS": 50}, get_time_func=datetime.now)
+
+
+def _stats(data, frequency_words):
+    word_groups, filter_words, global_filters = frequency_words
+    results, title_info = data
+    stats, _ = count_word_frequency(
+        results, word_groups, filter_words, ID_TO_NAME, title_info,
+        global_filters=global_filters, quiet=True,
+    )
+    return stats
+
+
+def test_matched_titles_are_analyzed(frequency_words):
+    stats = _stats(sample_record_data(), frequency_words)
+    assert isinstance(stats[0]["titles"][0], MatchedTitle)
+
+    news_content, _, hotlist_total, _, analyzed = _analyzer()._prepare_news_content(stats)
+    assert hotlist_total == 6
+    assert analyzed == 6
+    assert "[知乎] OpenAI 发布新一代 AI 模型 | 排名:1-2 | 时间:08:00~10:30 | 出现:2次" in news_content
+
+
+def test_record_and_dict_input_give_same_content(frequency_words):
+    analyzer = _analyzer()
+    from_records = analyzer._prepare_news_content(_stats(sample_record_data(), frequency_words))
+    from_dicts = analyzer._prepare_news_content(_stats(sample_dict_data(), frequency_words))
+    assert from_records == from_dicts
@@ -0,0 +1,59 @@
+# coding=utf-8
+"""来源熔断测试"""
+
+from trendradar.crawler.breaker import (
+    STATE_CLOSED,
+    STATE_HALF_OPEN,
+    STATE_OPEN,
+    CircuitBreaker,
+    summarize_source_health,
+)
+
+
+def test_summarize_counts_consecutive_failures():
+    health = summarize_source_health([
+        ("zhihu", "08-00", "failed"),
+        ("zhihu", "08-30", "success"),
+        ("zhihu", "09-00", "failed"),
+        ("zhihu", "09:30", "failed"),
+        ("weibo", "09-00", "success"),
+        ("weibo", "bad", "failed"),
+    ])
+    assert health["zhihu"] == {"consecutive_failures": 2, "last_failure": 570, "last_success": 510}
+    assert health["weibo"] == {"consecutive_failures": 0, "last_failure": None, "last_success": 540}
+
+
+def test_probe_wait_doubles_up_to_cap():
+    breaker = CircuitBreaker(failure_threshold=3, probe_interval=30, max_probe_interval=240)
+    assert [breaker.probe_wait(n) for n in range(3, 8)] == [30, 60, 120, 240, 240]
+    assert breaker.probe_wait(1000) == 240
+
+
+def test_state_transitions():
+    breaker = CircuitBreaker(failure_threshold=3, probe_interval=30)
+    health = {"consecutive_failures": 3, "last_failure": 600, "last_success": None}
+
+    assert breaker.state(None, 600) == STATE_CLOSED
+    assert breaker.state(dict(health, consecutive_failures=2), 600) == STATE_CLOSED
+    assert breaker.state(health, 610) == STATE_OPEN
+    assert breaker.state(health, 630) == STATE_HALF_OPEN
+    # 时间倒退时放行探测
+    assert breaker.state(health, 500) == STATE_HALF_OPEN
+
+
+def test_split_keeps_order_and_reports_wait():
+    breaker = CircuitBreaker(failure_threshold=2, probe_interval=30)
+    health = {
+        "a": {"consecutive_failures": 2, "last_failure": 600, "last_success": None},
+        "b": {"consecutive_failures": 1, "last_failure": 600, "last_success": None},
+        "c": {"consecutive_failures": 3, "last_failure": 600, "last_success": None},
+    }
+    allowed, opened = breaker.split(["c", "d", "a", "b"], health, 610)
+    assert allowed == ["d", "b"]
+    assert opened == {"c": 50, "a": 20}
+
+
+def test_probe_is_allowed_once_wait_elapses():
+    breaker = CircuitBreaker(failure_threshold=2, probe_interval=30)
+    health = {"a": {"consecutive_failures": 2, "last_failure": 600, "last_success": None}}
+    assert breaker.split(["a"], health, 630) == (["a"], {})
@@ -0,0 +1,138 @@
+# coding=utf-8
+"""热榜与 RSS 抓取阶段并行测试"""
+
+import threading
+import time
+
+import pytest
+
+from samples import FREQUENCY_WORDS
+from trendradar import context as context_module
+from trendradar.__main__ import NewsAnalyzer
+from trendradar.context import AppContext
+
+
+class FakeContext:
+    """只提供 run() 用到的配置和清理方法"""
+
+    def __init__(self, rss_enabled=True):
+        self.rss_enabled = rss_enabled
+        self.config = {"OUTBOX": {"ENABLED": False}, "DEBUG": True}
+        self.cleanups = []
+
+    def cleanup(self, keep_connections=False):
+        self.cleanups.append(keep_connections)
+
+
+def _analyzer(rss_enabled=True, stage_delay=0.2):
+    analyzer = NewsAnalyzer.__new__(NewsAnalyzer)
+    analyzer.ctx = FakeContext(rss_enabled)
+    analyzer.proxy_pool = None
+    analyzer.report_mode = "daily"
+    analyzer.stages = {}
+    analyzer.executed = []
+    analyzer._initialize_and_check_config = lambda: None
+
+    def stage(name, result, circuit_open):
+        def run():
+            start = time.monotonic()
+            time.sleep(stage_delay)
+            # 两个阶段都会追加熔断跳过的来源
+            analyzer.circuit_open_ids.append(circuit_open)
+            analyzer.stages[name] = (threading.current_thread().name, start, time.monotonic())
+            return result
+        return run
+
+    analyzer._crawl_data = stage(
+        "hotlist", ({"zhihu": {}}, {"zhihu": "知乎"}, ["weibo"]), "baidu"
+    )
+    analyzer._crawl_rss_data = stage(
+        "rss", (["rss-stats"], ["rss-new"], ["rss-raw"]), "hacker-news"
+    )
+
+    def execute(mode_strategy, results, id_to_name, failed_ids, **kwargs):
+        analyzer.executed.append((results, id_to_name, failed_ids, kwargs))
+
+    analyzer._execute_mode_strategy = execute
+    return analyzer
+
+
+def test_rss_stage_overlaps_hotlist_stage():
+    analyzer = _analyzer()
+    started = time.monotonic()
+    analyzer.run(keep_warm=True)
+    elapsed = time.monotonic() - started
+
+    hot_thread, hot_start, hot_end = analyzer.stages["hotlist"]
+    rss_thread, rss_start, rss_end = analyzer.stages["rss"]
+    assert hot_thread == threading.current_thread().name
+    assert rss_thread.startswith("rss-crawl")
+    assert rss_start < hot_end and hot_start < rss_end
+    assert elapsed < 0.35
+
+
+def test_stage_results_are_merged_before_analysis():
+    analyzer = _analyzer(stage_delay=0)
+    analyzer.run(keep_warm=True)
+
+    [(results, id_to_name, failed_ids, kwargs)] = analyzer.executed
+    assert results == {"zhihu": {}}
+    assert id_to_name == {"zhihu": "知乎"}
+    # 熔断跳过的热榜平台和 RSS 源都进入失败列表
+    assert failed_ids[0] == "weibo"
+    assert sorted(failed_ids[1:]) == ["baidu", "hacker-news"]
+    assert kwargs == {"rss_items": ["rss-stats"], "rss_new_items": ["rss-new"], "raw_rss_items": ["rss-raw"]}
+    assert analyzer.ctx.cleanups == [True]
+
+
+def test_rss_disabled_runs_hotlist_only():
+    analyzer = _analyzer(rss_enabled=False, stage_delay=0)
+    analyzer.run(keep_warm=True)
+
+    assert "rss" not in analyzer.stages
+    [(_, _, failed_ids, kwargs)] = analyzer.executed
+    assert failed_ids == ["weibo", "baidu"]
+    assert kwargs == {"rss_items": None, "rss_new_items": None, "raw_rss_items": None}
+
+
+def test_rss_stage_error_is_raised_after_hotlist_finishes():
+    analyzer = _analyzer(stage_delay=0)
+
+    def fail():
+        raise RuntimeError("RSS 抓取失败")
+
+    analyzer._crawl_rss_data = fail
+    with pytest.raises(RuntimeError):
+        analyzer.run(keep_warm=True)
+    assert "hotlist" in analyzer.stages
+    assert analyzer.executed == []
+    assert analyzer.ctx.cleanups == [True]
+
+
+def test_frequency_words_are_parsed_once_across_threads(tmp_path, monkeypatch):
+    path = tmp_path / "frequency_words.txt"
+    path.write_text(FREQUENCY_WORDS, encoding="utf-8")
+
+    calls = []
+    original = context_module.load_frequency_words
+
+    def slow_load(frequency_file):
+        calls.append(frequency_file)
+        time.sleep(0.05)
+        return original(frequency_file)
+
+    monkeypatch.setattr(context_module, "load_frequency_words", slow_load)
+    ctx = AppContext({})
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(ctx.load_frequency_words(str(path))))
+        for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # 热榜和 RSS 线程同时加载频率词时只解析一次，得到同一个结果
+    assert len(calls) == 1
+    assert all(result is results[0] for result in results)
@@ -0,0 +1,85 @@
+# coding=utf-8
+"""CronSchedule 测试"""
+
+from datetime import datetime
+
+import pytest
+import pytz
+
+from trendradar.daemon import CronSchedule
+
+
+def test_every_30_minutes():
+    schedule = CronSchedule("*/30 * * * *")
+    assert schedule.next_run(datetime(2025, 12, 27, 10, 0)) == datetime(2025, 12, 27, 10, 30)
+    assert schedule.next_run(datetime(2025, 12, 27, 10, 29, 59)) == datetime(2025, 12, 27, 10, 30)
+    assert schedule.next_run(datetime(2025, 12, 27, 23, 45)) == datetime(2025, 12, 28, 0, 0)
+
+
+def test_next_run_is_strictly_after():
+    schedule = CronSchedule("0 8 * * *")
+    assert schedule.next_run(datetime(2025, 12, 27, 8, 0)) == datetime(2025, 12, 28, 8, 0)
+    assert schedule.next_run(datetime(2025, 12, 27, 7, 59, 30)) == datetime(2025, 12, 27, 8, 0)
+
+
+def test_ranges_steps_and_lists():
+    schedule = CronSchedule("5,35 9-17/4 * * *")
+    assert schedule.hours == {9, 13, 17}
+    assert schedule.minutes == {5, 35}
+    assert schedule.next_run(datetime(2025, 12, 27, 13, 36)) == datetime(2025, 12, 27, 17, 5)
+    assert schedule.next_run(datetime(2025, 12, 27, 17, 36)) == datetime(2025, 12, 28, 9, 5)
+
+
+def test_start_with_step_runs_to_field_max():
+    assert CronSchedule("50/5 * * * *").minutes == {50, 55}
+
+
+def test_month_rollover():
+    schedule = CronSchedule("0 0 1 3 *")
+    assert schedule.next_run(datetime(2025, 3, 1, 0, 0)) == datetime(2026, 3, 1, 0, 0)
+
+
+def test_weekday_zero_and_seven_are_sunday():
+    # 2025-12-27 是周六
+    for expression in ("0 9 * * 0", "0 9 * * 7"):
+        assert CronSchedule(expression).next_run(datetime(2025, 12, 27, 12, 0)) == datetime(2025, 12, 28, 9, 0)
+
+
+def test_day_or_weekday_when_both_restricted():
+    # 每月 15 日或周一
+    schedule = CronSchedule("0 0 15 * 1")
+    assert schedule.next_run(datetime(2025, 12, 27, 0, 0)) == datetime(2025, 12, 29, 0, 0)
+    assert schedule.next_run(datetime(2026, 1, 13, 0, 0)) == datetime(2026, 1, 15, 0, 0)
+
+
+def test_keeps_timezone():
+    tz = pytz.timezone("Asia/Shanghai")
+    after = tz.localize(datetime(2025, 12, 27, 10, 10))
+    result = CronSchedule("*/30 * * * *").next_run(after)
+    assert result == tz.localize(datetime(2025, 12, 27, 10, 30))
+    assert result.utcoffset() == after.utcoffset()
+
+
+def test_normalizes_offset_across_dst():
+    tz = pytz.timezone("America/New_York")
+    after = tz.localize(datetime(2025, 3, 9, 1, 30))
+    result = CronSchedule("0 * * * *").next_run(after)
+    assert result.utcoffset() == tz.localize(datetime(2025, 3, 9, 12, 0)).utcoffset()
+
+
+def test_impossible_date_raises():
+    with pytest.raises(ValueError):
+        CronSchedule("0 0 30 2 *").next_run(datetime(2025, 1, 1))
+
+
+@pytest.mark.parametrize("expression", [
+    "* * * *",
+    "60 * * * *",
+    "*/0 * * * *",
+    "5-1 * * * *",
+    "* * 0 * *",
+    "a * * * *",
+])
+def test_invalid_expression(expression):
+    with pytest.raises(ValueError):
+        CronSchedule(expression)
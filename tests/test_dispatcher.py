@@ -0,0 +1,87 @@
+# coding=utf-8
+"""通知渠道并行发送测试"""
+
+import threading
+import time
+from datetime import datetime
+
+import pytest
+
+from trendradar.notification.dispatcher import NotificationDispatcher
+
+
+def _dispatcher(workers=4, timeout=300):
+    config = {"NOTIFICATION_WORKERS": workers, "CHANNEL_TIMEOUT": timeout}
+    return NotificationDispatcher(config, get_time_func=datetime.now, split_content_func=lambda *a, **k: [])
+
+
+def _channel(result=True, delay=0.0, calls=None):
+    def send():
+        if calls is not None:
+            calls.append(threading.current_thread().name)
+        time.sleep(delay)
+        if isinstance(result, Exception):
+            raise result
+        return result
+    return send
+
+
+def test_channels_run_in_parallel_and_keep_order():
+    calls = []
+    jobs = [(name, _channel(delay=0.1, calls=calls)) for name in ("feishu", "dingtalk", "telegram")]
+
+    started = time.monotonic()
+    results = _dispatcher()._run_channels(jobs)
+    elapsed = time.monotonic() - started
+
+    assert list(results.items()) == [("feishu", True), ("dingtalk", True), ("telegram", True)]
+    assert elapsed < 0.25
+    assert all(name.startswith("notify") for name in calls)
+
+
+def test_stuck_channel_times_out_without_blocking_others():
+    release = threading.Event()
+
+    def stuck():
+        release.wait(5)
+        return True
+
+    jobs = [("feishu", stuck), ("dingtalk", _channel()), ("bark", _channel(False))]
+    started = time.monotonic()
+    try:
+        results = _dispatcher(timeout=0.2)._run_channels(jobs)
+    finally:
+        release.set()
+    elapsed = time.monotonic() - started
+
+    # 超时的渠道记为失败，其他渠道的结果不受影响
+    assert results == {"feishu": False, "dingtalk": True, "bark": False}
+    assert 0.2 <= elapsed < 1.0
+
+
+def test_timeout_counts_from_channel_start():
+    # 两个线程时第三个渠道排队等待，排队时间不计入它的超时
+    jobs = [(name, _channel(delay=0.15)) for name in ("feishu", "dingtalk", "slack")]
+    dispatcher = _dispatcher(workers=2, timeout=0.25)
+    results = dispatcher._run_channels(jobs)
+    assert results == {"feishu": True, "dingtalk": True, "slack": True}
+
+
+def test_channel_error_is_recorded_as_failure():
+    jobs = [("feishu", _channel(RuntimeError("webhook 异常"))), ("dingtalk", _channel())]
+    assert _dispatcher()._run_channels(jobs) == {"feishu": False, "dingtalk": True}
+
+
+@pytest.mark.parametrize("workers", [0, 1])
+def test_single_worker_sends_in_order(workers):
+    calls = []
+    jobs = [(name, _channel(calls=calls)) for name in ("feishu", "dingtalk")]
+    results = _dispatcher(workers=workers, timeout=0.01)._run_channels(jobs)
+    assert results == {"feishu": True, "dingtalk": True}
+    # 顺序发送时在当前线程执行，不受超时限制
+    assert calls == [threading.current_thread().name] * 2
+
+
+def test_zero_timeout_waits_for_slow_channel():
+    jobs = [("feishu", _channel(delay=0.15)), ("dingtalk", _channel())]
+    assert _dispatcher(timeout=0)._run_channels(jobs) == {"feishu": True, "dingtalk": True}
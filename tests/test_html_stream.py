@@ -0,0 +1,228 @@
+# coding=utf-8
+"""
+HTML 报告流式写入回归测试
+
+render_html_content 改为逐段生成（iter_html_content）、generate_html_report 改为逐段写入
+快照并链接发布副本后，报告内容必须与原先在内存中拼接整份报告的实现逐字节一致。
+
+fixtures/legacy_html.json 记录了旧实现（iter_html_content 引入之前的 html.py）对下面
+同一组随机报告的输出摘要；生成器使用固定种子，修改 _make_case 会使摘要失效，
+需要用旧实现重新生成。
+"""
+
+import hashlib
+import itertools
+import json
+import os
+import random
+from datetime import datetime
+from functools import partial
+from pathlib import Path
+
+import pytest
+
+from trendradar.ai.analyzer import AIAnalysisResult
+from trendradar.report.generator import generate_html_report
+from trendradar.report.html import iter_html_content, render_html_content
+
+
+FIXTURE = Path(__file__).parent / "fixtures" / "legacy_html.json"
+
+SEED = 13
+MODES = ["daily", "incremental", "current"]
+REGIONS = ["hotlist", "rss", "new_items", "standalone", "ai_analysis"]
+WORDS = ["AI", "芯片", "<b>粗体</b>", "A&B", '"引号"', "🔥热点", "新能源汽车"]
+
+
+def _fixed_time():
+    return datetime(2025, 12, 27, 10, 0, 0)
+
+
+def _make_title(rnd, i):
+    return {
+        "title": rnd.choice(WORDS) + f" 标题 {i} " + rnd.choice(WORDS),
+        "source_name": rnd.choice(["知乎", "微博", "H&N", "<百度>"]),
+        "url": rnd.choice(["", f"https://e.com/{i}?a=1&b=2"]),
+        "mobile_url": rnd.choice(["", f"https://m.e.com/{i}"]),
+        "ranks": [rnd.randint(1, 30) for _ in range(rnd.randint(0, 3))],
+        "rank_threshold": rnd.choice([5, 10]),
+        "time_display": rnd.choice(["", "10:00~12:00"]),
+        "count": rnd.randint(1, 4),
+        "is_new": rnd.random() < 0.3,
+        "matched_keyword": rnd.choice(WORDS),
+        "published_at": rnd.choice(["", "2025-12-27T10:00:00+08:00"]),
+        "author": rnd.choice(["", "bob"]),
+    }
+
+
+def _make_stats(rnd, n):
+    stats = []
+    for _ in range(n):
+        count = rnd.randint(0, 12)
+        stats.append({
+            "word": rnd.choice(WORDS),
+            "count": count,
+            "titles": [_make_title(rnd, j) for j in range(count)],
+        })
+    return stats
+
+
+def _make_standalone(rnd):
+    return {
+        "platforms": [{
+            "id": "zhihu",
+            "name": "知乎",
+            "items": [
+                dict(_make_title(rnd, j), rank=j + 1, first_time="10-00", last_time="11-00")
+                for j in range(rnd.randint(0, 6))
+            ],
+        }],
+        "rss_feeds": [{
+            "id": "hn",
+            "name": "H&N",
+            "items": [_make_title(rnd, j) for j in range(rnd.randint(0, 4))],
+        }],
+    }
+
+
+def _make_ai(rnd):
+    return AIAnalysisResult(
+        core_trends="核心热点 <AI> & 芯片",
+        sentiment_controversy=rnd.choice(["", "舆论分歧"]),
+        signals="异动信号",
+        rss_insights=rnd.choice(["", "RSS 洞察"]),
+        outlook_strategy="研判建议",
+        success=True,
+        total_news=20,
+        analyzed_news=rnd.randint(1, 20),
+        max_news_limit=50,
+        hotlist_count=12,
+        rss_count=8,
+    )
+
+
+def _make_case(rnd, mode, with_rss, with_standalone, with_ai, display_mode):
+    """生成一份随机报告和渲染参数"""
+    report_data = {
+        "stats": _make_stats(rnd, rnd.randint(0, 5)),
+        "new_titles": [
+            {"source_id": f"s{k}", "source_name": f"源{k}",
+             "titles": [_make_title(rnd, j) for j in range(rnd.randint(1, 5))]}
+            for k in range(rnd.randint(0, 3))
+        ],
+        "failed_ids": [f"id{k}" for k in range(rnd.randint(0, 2))],
+        "total_new_count": rnd.randint(0, 15),
+    }
+    kwargs = {
+        "mode": mode,
+        "update_info": rnd.choice([None, {"remote_version": "9.9", "current_version": "1.0"}]),
+        "region_order": rnd.sample(REGIONS, rnd.randint(1, 5)),
+        "rss_items": _make_stats(rnd, rnd.randint(1, 3)) if with_rss else None,
+        "rss_new_items": _make_stats(rnd, rnd.randint(0, 2)) if with_rss else None,
+        "display_mode": display_mode,
+        "standalone_data": _make_standalone(rnd) if with_standalone else None,
+        "ai_analysis": _make_ai(rnd) if with_ai else None,
+        "show_new_section": rnd.random() < 0.8,
+    }
+    return report_data, rnd.randint(0, 500), kwargs
+
+
+def make_cases():
+    """按固定种子生成全部用例（顺序固定，与 fixture 一一对应）"""
+    rnd = random.Random(SEED)
+    combos = itertools.product(MODES, [False, True], [False, True], [False, True], ["keyword", "platform"])
+    return [_make_case(rnd, *combo) for combo in combos]
+
+
+def html_digest(html):
+    return hashlib.sha1(html.encode("utf-8")).hexdigest()
+
+
+def render(case, func=render_html_content):
+    report_data, total_titles, kwargs = case
+    kwargs = dict(kwargs)
+    mode, update_info = kwargs.pop("mode"), kwargs.pop("update_info")
+    return func(report_data, total_titles, mode, update_info, get_time_func=_fixed_time, **kwargs)
+
+
+CASES = make_cases()
+EXPECTED = json.loads(FIXTURE.read_text(encoding="utf-8"))
+
+
+def test_fixture_matches_case_count():
+    assert len(CASES) == len(EXPECTED) == 48
+
+
+@pytest.mark.parametrize("index", range(len(CASES)))
+def test_streamed_chunks_match_legacy_output(index):
+    chunks = list(render(CASES[index], iter_html_content))
+    assert all(isinstance(chunk, str) for chunk in chunks)
+    assert html_digest("".join(chunks)) == EXPECTED[index], CASES[index][2]
+    assert html_digest(render(CASES[index])) == EXPECTED[index]
+
+
+def _generate(tmp_path, case, render_func):
+    return Path(generate_html_report(
+        [], case[1], mode=case[2]["mode"],
+        output_dir=str(tmp_path / "output"), date_folder="2025-12-27", time_filename="10-00",
+        render_html_func=lambda *args: render_func(case),
+    ))
+
+
+def _published(tmp_path, mode):
+    return [
+        tmp_path / "output" / "html" / "latest" / f"{mode}.html",
+        tmp_path / "output" / "index.html",
+        tmp_path / "index.html",
+    ]
+
+
+@pytest.mark.parametrize("index", range(0, 48, 6))
+def test_written_report_matches_in_memory_render(tmp_path, monkeypatch, index):
+    monkeypatch.chdir(tmp_path)
+    case = CASES[index]
+    expected = render(case).encode("utf-8")
+
+    snapshot = _generate(tmp_path, case, partial(render, func=iter_html_content))
+    assert snapshot.read_bytes() == expected
+    # 最新报告和入口文件硬链接到快照
+    for path in _published(tmp_path, case[2]["mode"]):
+        assert path.read_bytes() == expected
+        assert os.path.samefile(path, snapshot)
+    assert not list(tmp_path.rglob("*.tmp"))
+
+
+def test_string_render_and_copy_fallback(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    case = CASES[1]
+    first = _generate(tmp_path, case, render)
+
+    # 无法硬链接（如跨文件系统）时复制文件；再次生成覆盖上次的文件
+    def no_link(src, dst):
+        raise OSError(18, "Invalid cross-device link")
+
+    monkeypatch.setattr(os, "link", no_link)
+    snapshot = _generate(tmp_path, case, partial(render, func=iter_html_content))
+    assert snapshot == first
+    expected = render(case).encode("utf-8")
+    for path in _published(tmp_path, case[2]["mode"]):
+        assert path.read_bytes() == expected
+        assert not os.path.samefile(path, snapshot)
+
+
+def test_failed_render_keeps_previous_report(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    case = CASES[2]
+    snapshot = _generate(tmp_path, case, render)
+    expected = snapshot.read_bytes()
+
+    def broken(case):
+        yield "<html>"
+        raise RuntimeError("渲染失败")
+
+    with pytest.raises(RuntimeError):
+        _generate(tmp_path, case, broken)
+    # 写了一半的临时文件被删除，已发布的报告不变
+    assert snapshot.read_bytes() == expected
+    assert (tmp_path / "index.html").read_bytes() == expected
+    assert not list(tmp_path.rglob("*.tmp"))
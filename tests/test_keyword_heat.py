@@ -0,0 +1,169 @@
+# coding=utf-8
+"""关键词小时热度汇总测试"""
+
+from datetime import datetime
+
+import pytest
+
+from mcp_server.services.cache_service import get_cache
+from mcp_server.tools.analytics import AnalyticsTools
+from trendradar.storage.base import NewsData, NewsItem
+from trendradar.storage.local import LocalStorageBackend
+
+DATE = "2025-12-27"
+AI_TITLE = "OpenAI 发布新一代 AI 模型"
+CHIP_TITLE = "华为芯片新突破"
+
+
+@pytest.fixture(autouse=True)
+def _clear_mcp_cache():
+    get_cache().clear()
+    yield
+    get_cache().clear()
+
+
+@pytest.fixture
+def make_backend(tmp_path, frequency_words):
+    backends = []
+
+    def make(name="a"):
+        backend = LocalStorageBackend(
+            data_dir=str(tmp_path / name / "output"), enable_txt=False, enable_html=False
+        )
+        backend.set_keyword_groups(*frequency_words)
+        backends.append(backend)
+        return backend
+
+    yield make
+    for backend in backends:
+        backend.cleanup()
+
+
+def _save(backend, crawl_time, titles, date=DATE):
+    items = {}
+    for source_id, title, rank in titles:
+        items.setdefault(source_id, []).append(NewsItem(
+            title=title, source_id=source_id, rank=rank,
+            url=f"https://{source_id}.example.com/{abs(hash(title))}",
+        ))
+    assert backend.save_news_data(NewsData(date=date, crawl_time=crawl_time, items=items))
+
+
+def _heat(backend, keyword_type="group", date=DATE):
+    return {
+        (row["keyword"], row["platform_id"], row["hour"]): (row["count"], row["best_rank"], row["weight_sum"])
+        for row in backend.get_keyword_heat(date, keyword_type=keyword_type)
+    }
+
+
+def _crawls(backend):
+    _save(backend, "10-00", [("zhihu", AI_TITLE, 3), ("zhihu", CHIP_TITLE, 5)])
+    _save(backend, "10-30", [("zhihu", AI_TITLE, 1)])
+    _save(backend, "11-00", [("zhihu", AI_TITLE, 2), ("weibo", CHIP_TITLE, 12)])
+
+
+def test_rollup_upserts_per_hour(make_backend):
+    backend = make_backend()
+    _crawls(backend)
+
+    assert _heat(backend) == {
+        # 同一小时内再次出现只累加权重，count 按条目计
+        ("AI 人工智能", "zhihu", "10"): (1, 1, 8 + 10),
+        ("AI 人工智能", "zhihu", "11"): (1, 2, 9),
+        ("芯片", "zhihu", "10"): (1, 5, 6),
+        # 排名 10 以后按 10 计算权重
+        ("芯片", "weibo", "11"): (1, 12, 1),
+    }
+    tokens = _heat(backend, "token")
+    assert tokens[("OpenAI", "zhihu", "10")] == (1, 1, 18)
+
+
+def test_backfill_from_rank_history(make_backend):
+    incremental = make_backend("incremental")
+    _crawls(incremental)
+
+    # 升级前的数据库：已有抓取记录，但汇总表为空
+    upgraded = make_backend("upgraded")
+    _save(upgraded, "10-00", [("zhihu", AI_TITLE, 3), ("zhihu", CHIP_TITLE, 5)])
+    _save(upgraded, "10-30", [("zhihu", AI_TITLE, 1)])
+    conn = upgraded._get_connection(DATE)
+    conn.execute("DELETE FROM keyword_heat")
+    conn.commit()
+    upgraded._heat_keyword_cache = None
+
+    _save(upgraded, "11-00", [("zhihu", AI_TITLE, 2), ("weibo", CHIP_TITLE, 12)])
+    assert _heat(upgraded) == _heat(incremental)
+    assert _heat(upgraded, "token") == _heat(incremental, "token")
+
+
+def test_unchanged_titles_are_not_matched_again(make_backend, frequency_words, monkeypatch):
+    backend = make_backend()
+    matched = []
+    original = LocalStorageBackend._heat_keywords
+
+    def heat_keywords(self, title):
+        matched.append(title)
+        return original(self, title)
+
+    monkeypatch.setattr(LocalStorageBackend, "_heat_keywords", heat_keywords)
+
+    _save(backend, "10-00", [("zhihu", AI_TITLE, 3), ("zhihu", CHIP_TITLE, 5)])
+    assert sorted(matched) == sorted([AI_TITLE, CHIP_TITLE])
+
+    # 已在榜的标题复用上次的结果，只匹配新标题
+    matched.clear()
+    _save(backend, "10-30", [("zhihu", AI_TITLE, 1), ("weibo", "新能源汽车销量创新高", 4)])
+    assert matched == ["新能源汽车销量创新高"]
+
+    # 相同的词组配置（重新加载）不清空缓存，变化时重新匹配
+    backend.set_keyword_groups(*frequency_words)
+    matched.clear()
+    _save(backend, "11-00", [("zhihu", AI_TITLE, 1)])
+    assert matched == []
+
+    word_groups, filter_words, global_filters = frequency_words
+    backend.set_keyword_groups(word_groups[:1], filter_words, global_filters)
+    _save(backend, "11-30", [("zhihu", AI_TITLE, 1)])
+    assert matched == [AI_TITLE]
+
+
+def test_mcp_hour_granularity_reads_rollup(tmp_path, make_backend):
+    backend = make_backend()
+    _save(backend, "09-00", [("zhihu", CHIP_TITLE, 5)])
+    _crawls(backend)
+
+    tools = AnalyticsTools(project_root=str(tmp_path / "a"))
+    result = tools.get_topic_trend_analysis(
+        "AI", date_range={"start": DATE, "end": DATE}, granularity="hour"
+    )
+    assert result["success"]
+    points = result["data"]
+    # 每个抓取小时一个点，话题未出现的小时计 0
+    assert [p["hour"] for p in points] == ["09", "10", "11"]
+    assert points[0]["count"] == 0
+    assert points[1]["count"] > 0 and points[1]["best_rank"] == 1
+    assert "AI" in points[1]["sample_titles"]
+    assert result["summary"]["peak_time"] == f"{DATE} 10:00"
+
+    # 没有数据库的日期：没有小时数据点
+    empty = tools.get_topic_trend_analysis(
+        "AI", date_range={"start": "2025-12-26", "end": "2025-12-26"}, granularity="hour"
+    )
+    assert empty["success"] and empty["data"] == []
+
+
+def test_viral_topics_fall_back_without_rollup(tmp_path, make_backend):
+    now = datetime.now()
+    today = now.strftime("%Y-%m-%d")
+    backend = make_backend()
+    _save(backend, now.strftime("%H-%M"), [("zhihu", AI_TITLE, 1), ("weibo", CHIP_TITLE, 2)], date=today)
+
+    tools = AnalyticsTools(project_root=str(tmp_path / "a"))
+    assert tools.detect_viral_topics()["summary"]["data_source"] == "hourly_rollup"
+
+    # 旧数据库没有汇总表：回退到按天标题统计
+    conn = backend._get_connection(today)
+    conn.execute("DROP TABLE keyword_heat")
+    conn.commit()
+    get_cache().clear()
+    assert tools.detect_viral_topics()["summary"]["data_source"] == "titles"
@@ -0,0 +1,110 @@
+# coding=utf-8
+"""抓取延迟控制测试"""
+
+import threading
+
+import pytest
+
+from trendradar.crawler import latency as latency_module
+from trendradar.crawler.latency import (
+    CrawlDeadline,
+    CrawlDeadlineExceeded,
+    hedge_delays,
+    hedged_request,
+    percentile,
+)
+
+
+class FakeClock:
+    """替代 time 模块的可控时钟"""
+
+    def __init__(self):
+        self.now = 100.0
+
+    def monotonic(self):
+        return self.now
+
+
+def test_percentile_nearest_rank():
+    assert percentile([], 90) is None
+    assert percentile([5], 90) == 5
+    assert percentile(list(range(1, 11)), 90) == 9
+    assert percentile([30, 10, 20], 50) == 20
+    assert percentile([1, 2, 3], 0) == 1
+
+
+def test_hedge_delays_uses_p90_in_seconds():
+    latencies = {
+        "zhihu": [100, 200, 300, 400, 500, 600, 700, 800, 900, 1000],
+        "weibo": [50, 60, 70],
+        "empty": [0, 0, 0, 0, 0],
+    }
+    assert hedge_delays(latencies) == {"zhihu": 0.9}
+    assert hedge_delays(latencies, min_samples=3) == {"zhihu": 0.9, "weibo": 0.07}
+
+
+def test_deadline_disabled():
+    for seconds in (None, 0, -1):
+        deadline = CrawlDeadline(seconds)
+        assert deadline.remaining() is None
+        assert deadline.expired() is False
+        assert deadline.clamp_timeout(15) == 15
+
+
+def test_deadline_clamps_and_expires(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(latency_module, "time", clock)
+    deadline = CrawlDeadline(30)
+
+    assert deadline.clamp_timeout(10) == 10
+    clock.now += 25
+    assert deadline.remaining() == pytest.approx(5)
+    assert deadline.clamp_timeout(10) == pytest.approx(5)
+    assert deadline.expired() is False
+
+    clock.now += 5
+    assert deadline.expired() is True
+    with pytest.raises(CrawlDeadlineExceeded):
+        deadline.clamp_timeout(10)
+
+
+def test_hedged_request_without_hedge_calls_once():
+    calls = []
+    assert hedged_request(lambda: calls.append(1) or "ok", hedge_after=None) == "ok"
+    assert calls == [1]
+
+
+def test_hedged_request_fast_first_response():
+    calls = []
+    assert hedged_request(lambda: calls.append(1) or "ok", hedge_after=1.0) == "ok"
+    assert calls == [1]
+
+
+def test_hedged_request_second_request_wins():
+    release = threading.Event()
+    lock = threading.Lock()
+    attempts = []
+
+    def send():
+        with lock:
+            attempts.append(1)
+            attempt = len(attempts)
+        if attempt == 1:
+            # 第一次请求一直挂起，直到测试结束
+            release.wait(5)
+            return "slow"
+        return "hedged"
+
+    try:
+        assert hedged_request(send, hedge_after=0.05) == "hedged"
+        assert len(attempts) == 2
+    finally:
+        release.set()
+
+
+def test_hedged_request_raises_when_both_fail():
+    def send():
+        raise ConnectionError("down")
+
+    with pytest.raises(ConnectionError):
+        hedged_request(send, hedge_after=0.01)
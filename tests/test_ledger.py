@@ -0,0 +1,128 @@
+# coding=utf-8
+"""推送台账测试"""
+
+from trendradar.notification.ledger import PushLedger, item_key
+
+
+class MemoryStorage:
+    """内存中的推送台账存储"""
+
+    def __init__(self, ledger=None):
+        self.ledger = ledger or {}
+        self.recorded = []
+
+    def get_push_ledger(self, channels, date=None):
+        return {channel: dict(self.ledger.get(channel, {})) for channel in channels}
+
+    def record_push_ledger(self, channel, entries, date=None):
+        self.recorded.append((channel, entries))
+        return True
+
+
+def _title(title, rank, url="", source="知乎"):
+    return {"title": title, "source_name": source, "url": url, "ranks": [rank, rank + 3]}
+
+
+def _report(*groups):
+    return {
+        "stats": [{"word": word, "count": len(titles), "titles": titles} for word, titles in groups],
+        "new_titles": [],
+        "failed_ids": [],
+    }
+
+
+def test_item_key_normalizes_url_and_title():
+    a = item_key({"source_name": "HN", "url": "https://Example.com/post/1/#top"})
+    b = item_key({"source_name": "HN", "url": "http://example.com/post/1"})
+    assert a == b
+    assert item_key({"source_name": "HN", "url": "https://example.com/post/1?page=2"}) != a
+    assert item_key({"source_name": "知乎", "url": "https://example.com/post/1"}) != a
+
+    assert item_key({"source_name": "知乎", "title": "  Hello   World "}) == item_key(
+        {"source_name": "知乎", "title": "hello world"}
+    )
+    # 没有 URL 时使用移动端链接
+    assert item_key({"source_name": "HN", "mobile_url": "https://example.com/post/1"}) == a
+
+
+def test_first_push_sends_everything_and_records():
+    storage = MemoryStorage()
+    ledger = PushLedger(storage)
+    ledger.load(["feishu"])
+    report = _report(("AI", [_title("A", 1), _title("B", 2)]))
+
+    view = ledger.filter("feishu", report)
+    assert view.skipped == 0
+    assert [t["title"] for t in view.report_data["stats"][0]["titles"]] == ["A", "B"]
+    assert [e["rank"] for e in view.entries] == [1, 2]
+
+    assert ledger.record("feishu", view.entries)
+    assert storage.recorded[0][0] == "feishu"
+
+
+def test_already_pushed_items_are_skipped_per_channel():
+    ledger = PushLedger(MemoryStorage())
+    ledger.load(["feishu", "slack"])
+    report = _report(("AI", [_title("A", 1), _title("B", 2)]))
+    ledger.record("feishu", ledger.filter("feishu", report).entries)
+
+    again = ledger.filter("feishu", _report(("AI", [_title("A", 1), _title("B", 2), _title("C", 3)])))
+    assert [t["title"] for group in again.report_data["stats"] for t in group["titles"]] == ["C"]
+    assert again.report_data["stats"][0]["count"] == 1
+    assert again.skipped == 2
+
+    # 其他渠道不受影响
+    assert ledger.filter("slack", report).skipped == 0
+
+
+def test_empty_groups_are_dropped():
+    ledger = PushLedger(MemoryStorage())
+    ledger.load(["feishu"])
+    report = _report(("AI", [_title("A", 1)]))
+    ledger.record("feishu", ledger.filter("feishu", report).entries)
+
+    view = ledger.filter("feishu", report)
+    assert view.report_data["stats"] == []
+    assert view.is_empty
+    # 原报告不被修改
+    assert len(report["stats"][0]["titles"]) == 1
+
+
+def test_new_group_match_is_pushed_again():
+    ledger = PushLedger(MemoryStorage())
+    ledger.load(["feishu"])
+    ledger.record("feishu", ledger.filter("feishu", _report(("AI", [_title("A", 1)]))).entries)
+
+    view = ledger.filter("feishu", _report(("AI", [_title("A", 1)]), ("芯片", [_title("A", 1)])))
+    assert [group["word"] for group in view.report_data["stats"]] == ["芯片"]
+
+
+def test_rank_rise_is_pushed_again():
+    storage = MemoryStorage({"feishu": {(item_key(_title("A", 0)), "AI"): 10}})
+    ledger = PushLedger(storage, rank_change=5)
+    ledger.load(["feishu"])
+
+    assert ledger.filter("feishu", _report(("AI", [_title("A", 6)]))).skipped == 1
+    view = ledger.filter("feishu", _report(("AI", [_title("A", 5)])))
+    assert view.skipped == 0
+    assert view.entries[0]["rank"] == 5
+
+    # rank_change <= 0 时排名变化不重新推送
+    ledger = PushLedger(storage, rank_change=0)
+    ledger.load(["feishu"])
+    assert ledger.filter("feishu", _report(("AI", [_title("A", 1)]))).skipped == 1
+
+
+def test_rss_groups_are_filtered_and_new_titles_kept():
+    ledger = PushLedger(MemoryStorage())
+    ledger.load(["feishu"])
+    rss = [{"word": "HN", "count": 1, "titles": [_title("R", 1, url="https://e.com/r", source="HN")]}]
+    report = _report(("AI", [_title("A", 1)]))
+    report["new_titles"] = [{"source_name": "知乎", "titles": [_title("A", 1)]}]
+    ledger.record("feishu", ledger.filter("feishu", report, rss).entries)
+
+    view = ledger.filter("feishu", report, rss)
+    assert view.rss_items == []
+    assert view.report_data["new_titles"] == report["new_titles"]
+    assert not view.is_empty
+    assert ledger.filter("feishu", report).rss_items is None
@@ -0,0 +1,47 @@
+# coding=utf-8
+"""MCP aggregate_news 相似新闻合并测试"""
+
+from mcp_server.tools.analytics import AnalyticsTools
+
+
+def _news(title, platform, weight, story_id=None):
+    return {
+        "title": title,
+        "platform": platform,
+        "platform_name": platform,
+        "date": "2025-12-27",
+        "rank": 1,
+        "count": 1,
+        "weight": weight,
+        "story_id": story_id,
+    }
+
+
+def _tools():
+    # 合并逻辑不依赖数据服务
+    return object.__new__(AnalyticsTools)
+
+
+def test_exact_mode_compares_pairs_outside_lsh_buckets():
+    # 字符相同但顺序颠倒：没有共同的二元组，不会落入同一 LSH 分桶
+    news = [
+        _news("华为发布新款折叠屏手机", "zhihu", 2),
+        _news("手机屏叠折款新布发为华", "weibo", 1),
+    ]
+    tools = _tools()
+
+    lsh = tools._aggregate_similar_news(news, 0.05, include_url=False)
+    exact = tools._aggregate_similar_news(news, 0.05, include_url=False, exact=True)
+
+    assert [g["platforms"] for g in lsh] == [["zhihu"], ["weibo"]]
+    assert [g["platforms"] for g in exact] == [["zhihu", "weibo"]]
+
+
+def test_same_story_id_is_merged_without_comparison():
+    news = [
+        _news("华为发布新款折叠屏手机", "zhihu", 2, story_id=7),
+        _news("美联储宣布降息", "weibo", 1, story_id=7),
+        _news("美联储宣布降息", "douyin", 1, story_id=8),
+    ]
+    groups = _tools()._aggregate_similar_news(news, 0.9, include_url=False)
+    assert [g["platforms"] for g in groups] == [["zhihu", "weibo"], ["douyin"]]
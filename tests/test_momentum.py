@@ -0,0 +1,95 @@
+# coding=utf-8
+"""排名动量测试"""
+
+import pytest
+
+from samples import ID_TO_NAME, sample_record_data
+from trendradar.core.analyzer import calculate_momentum_score, count_word_frequency
+from trendradar.storage.base import NewsData, NewsItem, RankMomentum
+from trendradar.storage.local import LocalStorageBackend
+
+DATE = "2025-12-27"
+DEFAULT_WEIGHTS = {"RANK_WEIGHT": 0.4, "FREQUENCY_WEIGHT": 0.3, "HOTNESS_WEIGHT": 0.3}
+
+
+@pytest.fixture
+def backend(tmp_path):
+    backend = LocalStorageBackend(data_dir=str(tmp_path / "output"), enable_txt=False, enable_html=False)
+    yield backend
+    backend.cleanup()
+
+
+def _save(backend, crawl_time, ranks):
+    items = {"zhihu": [
+        NewsItem(title=title, source_id="zhihu", rank=rank, url=f"https://zhihu.com/q/{title}")
+        for title, rank in ranks.items()
+    ]}
+    assert backend.save_news_data(NewsData(date=DATE, crawl_time=crawl_time, items=items))
+
+
+def _momentum(backend, title):
+    data = backend.get_today_all_data(DATE)
+    return next(item.momentum for item in data.items["zhihu"] if item.title == title)
+
+
+def test_velocity_is_smoothed_and_max_climb_kept(backend):
+    _save(backend, "10-00", {"A": 10, "B": 1})
+    first = _momentum(backend, "A")
+    assert first == RankMomentum(rank_delta=0, velocity=0.0, max_climb=0, age_minutes=0)
+
+    # 平滑系数 0.5：velocity = 上次速度 × 0.5 + 本次上升 × 0.5
+    _save(backend, "10-30", {"A": 6, "B": 1})
+    assert _momentum(backend, "A") == RankMomentum(rank_delta=4, velocity=2.0, max_climb=4, age_minutes=30)
+
+    _save(backend, "11-00", {"A": 2, "B": 1})
+    assert _momentum(backend, "A") == RankMomentum(rank_delta=4, velocity=3.0, max_climb=8, age_minutes=60)
+
+    # 回落：速度下降，最大爬升仍按此前最差排名计算
+    _save(backend, "11-30", {"A": 4, "B": 1})
+    assert _momentum(backend, "A") == RankMomentum(rank_delta=-2, velocity=0.5, max_climb=8, age_minutes=90)
+
+    _save(backend, "12-00", {"A": 1, "B": 1})
+    assert _momentum(backend, "A").max_climb == 9
+    assert _momentum(backend, "B") == RankMomentum(rank_delta=0, velocity=0.0, max_climb=0, age_minutes=120)
+
+
+def test_momentum_score():
+    assert calculate_momentum_score(None) == 0.0
+    # 速度封顶 10 名，最大爬升封顶 50 名
+    assert calculate_momentum_score(RankMomentum(velocity=20.0, max_climb=80)) == 100.0
+    assert calculate_momentum_score({"velocity": -3.0, "max_climb": 10, "age_minutes": 0}) == 10.0
+    # 在榜 6 小时后减半
+    assert calculate_momentum_score(RankMomentum(velocity=2.0, max_climb=10, age_minutes=360)) == 10.0
+
+
+def _chip_titles(weight_config, frequency_words, climbing=None):
+    word_groups, filter_words, global_filters = frequency_words
+    results, title_info = sample_record_data()
+    if climbing:
+        # 排名较低但正在快速上升
+        results["zhihu"]["华为芯片新突破"].momentum = RankMomentum(
+            rank_delta=6, velocity=5.0, max_climb=40, age_minutes=30
+        )
+    stats, _ = count_word_frequency(
+        results, word_groups, filter_words, ID_TO_NAME, title_info,
+        weight_config=weight_config, global_filters=global_filters, quiet=True,
+    )
+    group = next(stat for stat in stats if stat["word"] == "芯片 / 华为")
+    return [title["title"] for title in group["titles"]]
+
+
+def test_default_weight_keeps_old_order(frequency_words):
+    old_order = _chip_titles(DEFAULT_WEIGHTS, frequency_words)
+    assert old_order == ["华为发布麒麟芯片", "华为芯片新突破"]
+
+    # 默认 MOMENTUM_WEIGHT=0：有动量数据也不影响排序
+    assert _chip_titles(DEFAULT_WEIGHTS, frequency_words, climbing=True) == old_order
+    assert _chip_titles(dict(DEFAULT_WEIGHTS, MOMENTUM_WEIGHT=0), frequency_words, climbing=True) == old_order
+    assert _chip_titles(None, frequency_words, climbing=True) == old_order
+
+
+def test_momentum_weight_promotes_climbing_titles(frequency_words):
+    weights = dict(DEFAULT_WEIGHTS, MOMENTUM_WEIGHT=0.1)
+    assert _chip_titles(weights, frequency_words, climbing=True) == ["华为芯片新突破", "华为发布麒麟芯片"]
+    # 没有动量数据时与默认排序一致
+    assert _chip_titles(weights, frequency_words) == ["华为发布麒麟芯片", "华为芯片新突破"]
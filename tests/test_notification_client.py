@@ -0,0 +1,193 @@
+# coding=utf-8
+"""通知 HTTP 客户端限速与 429 重试测试"""
+
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import pytest
+
+from trendradar.notification import client as client_module
+from trendradar.notification.client import NotificationClient, TokenBucket, _retry_after
+
+
+class FakeClock:
+    """替代 time 模块的可控时钟（sleep 推进时间）"""
+
+    def __init__(self, advance=True):
+        self.now = 100.0
+        self.sleeps = []
+        self.advance = advance
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(round(seconds, 6))
+        if self.advance:
+            self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(client_module, "time", clock)
+    return clock
+
+
+class FakeResponse:
+    def __init__(self, status_code=200, headers=None, body=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.body = body
+
+    def json(self):
+        if self.body is None:
+            raise ValueError("no json")
+        return self.body
+
+
+class FakeSession:
+    """按顺序返回预设响应，记录请求时间"""
+
+    def __init__(self, clock, responses=()):
+        self.clock = clock
+        self.responses = list(responses)
+        self.requests = []
+
+    def request(self, method, url, **kwargs):
+        self.requests.append((method, url, self.clock.now))
+        return self.responses.pop(0) if self.responses else FakeResponse()
+
+
+def _client(clock, responses=(), **kwargs):
+    client = NotificationClient(**kwargs)
+    session = FakeSession(clock, responses)
+    client._session = lambda url: session
+    return client, session
+
+
+def test_bucket_allows_burst_then_paces(clock):
+    bucket = TokenBucket(rate=2, capacity=3)
+    waits = [bucket.acquire() for _ in range(5)]
+    assert waits == [0.0, 0.0, 0.0, 0.5, 0.5]
+
+    # 空闲期间补充令牌，最多补满容量
+    clock.now += 10
+    assert [bucket.acquire() for _ in range(4)] == [0.0, 0.0, 0.0, 0.5]
+
+
+def test_bucket_reserves_tokens_for_waiting_callers(monkeypatch):
+    clock = FakeClock(advance=False)
+    monkeypatch.setattr(client_module, "time", clock)
+    bucket = TokenBucket(rate=1, capacity=1)
+
+    # 同时到达的调用者依次顺延，而不是在同一时刻之后一起发送
+    assert [bucket.acquire() for _ in range(3)] == [0.0, 1.0, 2.0]
+
+
+def test_bucket_pause_blocks_until_retry_time(clock):
+    bucket = TokenBucket(rate=10, capacity=5)
+    bucket.pause(3)
+    assert bucket.acquire() == 3
+    assert bucket.acquire() == 0.0
+
+
+def test_retry_after_parsing():
+    assert _retry_after(FakeResponse(429, {"Retry-After": "7"})) == 7.0
+    assert _retry_after(FakeResponse(429, {"Retry-After": "-3"})) == 0.0
+
+    retry_at = datetime.now(timezone.utc) + timedelta(seconds=30)
+    wait = _retry_after(FakeResponse(429, {"Retry-After": format_datetime(retry_at, usegmt=True)}))
+    assert 25 <= wait <= 30
+
+    # Telegram 在响应体中给出等待时间
+    telegram = FakeResponse(429, body={"ok": False, "parameters": {"retry_after": 5}})
+    assert _retry_after(telegram) == 5.0
+    assert _retry_after(FakeResponse(429, {"Retry-After": "soon"}, body={"ok": False})) is None
+    assert _retry_after(FakeResponse(429)) is None
+
+
+def test_documented_limits_pace_batches(clock):
+    client, session = _client(clock)
+    for _ in range(5):
+        client.post("feishu", "https://open.feishu.cn/hook/a", json={})
+
+    times = [t - 100.0 for _, _, t in session.requests]
+    # 飞书：突发 3 条，之后按 1.5 条/秒发送
+    assert times[:3] == [0.0, 0.0, 0.0]
+    assert times[3:] == pytest.approx([1 / 1.5, 2 / 1.5])
+
+
+def test_each_webhook_has_its_own_bucket(clock):
+    client, session = _client(clock)
+    client.post("telegram", "https://api.telegram.org/bot1/sendMessage")
+    client.post("telegram", "https://api.telegram.org/bot2/sendMessage")
+    assert clock.sleeps == []
+
+    client.post("telegram", "https://api.telegram.org/bot1/sendMessage")
+    assert clock.sleeps == [1.0]
+
+
+def test_min_interval_for_channels_without_documented_limit(clock):
+    client, session = _client(clock)
+    client.post("ntfy", "https://ntfy.sh/topic", min_interval=2)
+    client.post("ntfy", "https://ntfy.sh/topic", min_interval=2)
+    assert clock.sleeps == [2.0]
+
+    # 没有文档限制且不指定间隔时不限速
+    client.post("bark", "https://api.day.app/key")
+    client.post("bark", "https://api.day.app/key")
+    assert clock.sleeps == [2.0]
+
+
+def test_429_waits_retry_after_then_retries(clock):
+    client, session = _client(clock, [FakeResponse(429, {"Retry-After": "4"}), FakeResponse(200)])
+    response = client.post("slack", "https://hooks.slack.com/services/x", json={})
+
+    assert response.status_code == 200
+    assert len(session.requests) == 2
+    # 重试在令牌桶暂停结束后发送
+    assert session.requests[1][2] - session.requests[0][2] == pytest.approx(4)
+
+
+def test_429_without_bucket_sleeps(clock):
+    telegram_style = FakeResponse(429, body={"parameters": {"retry_after": 3}})
+    client, session = _client(clock, [telegram_style, FakeResponse(200)])
+    assert client.post("bark", "https://api.day.app/key").status_code == 200
+    assert clock.sleeps == [3.0]
+
+
+def test_429_without_wait_uses_default(clock):
+    client, session = _client(clock, [FakeResponse(429), FakeResponse(200)], default_retry_wait=6)
+    assert client.post("bark", "https://api.day.app/key").status_code == 200
+    assert clock.sleeps == [6.0]
+
+
+def test_429_gives_up_after_max_retries(clock):
+    responses = [FakeResponse(429, {"Retry-After": "1"}) for _ in range(5)]
+    client, session = _client(clock, responses, max_retries=2)
+    assert client.post("bark", "https://api.day.app/key").status_code == 429
+    assert len(session.requests) == 3
+
+
+def test_429_with_long_wait_is_not_retried(clock):
+    client, session = _client(clock, [FakeResponse(429, {"Retry-After": "600"})], max_retry_wait=60)
+    response = client.post("dingtalk", "https://oapi.dingtalk.com/robot/send?access_token=x")
+    assert response.status_code == 429
+    assert len(session.requests) == 1
+    assert clock.sleeps == []
+
+    # 令牌桶已暂停，后续批次等到限流结束后才发送
+    client.post("dingtalk", "https://oapi.dingtalk.com/robot/send?access_token=x")
+    assert clock.sleeps == [600.0]
+
+
+def test_sessions_are_shared_per_host():
+    client = NotificationClient()
+    first = client._session("https://open.feishu.cn/hook/a")
+    assert client._session("https://OPEN.feishu.cn/hook/b") is first
+    assert client._session("https://oapi.dingtalk.com/robot/send") is not first
+
+    client.close()
+    assert client._session("https://open.feishu.cn/hook/a") is not first
+    client.close()
@@ -0,0 +1,222 @@
+# coding=utf-8
+"""通知发件箱测试"""
+
+import json
+from datetime import datetime
+
+import pytest
+
+from trendradar.notification import outbox as outbox_module
+from trendradar.notification.outbox import NotificationOutbox, OutboxMessage, collect_secrets
+
+
+TODAY = datetime(2025, 12, 27, 10, 0)
+
+
+class FakeClock:
+    """替代 time 模块的可控时钟"""
+
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def time(self):
+        return self.now
+
+    def monotonic(self):
+        return self.now
+
+
+class MemoryStorage:
+    """按日期保存发件箱的内存存储"""
+
+    def __init__(self):
+        self.rows = {}
+        self.next_id = 1
+        self.flushes = 0
+
+    def enqueue_notifications(self, messages, date=None):
+        date = date or TODAY.strftime("%Y-%m-%d")
+        for message in messages:
+            self.rows.setdefault(date, []).append(dict(
+                message, id=self.next_id, status="pending", attempts=0,
+                next_attempt_at=0, last_error=None,
+            ))
+            self.next_id += 1
+        return True
+
+    def get_pending_notifications(self, date=None):
+        return [dict(row) for row in self.rows.get(date, []) if row["status"] == "pending"]
+
+    def update_notifications(self, updates, date=None):
+        rows = {row["id"]: row for row in self.rows[date]}
+        for update in updates:
+            rows[update["id"]].update(update)
+        return True
+
+    def flush_uploads(self):
+        self.flushes += 1
+        return True
+
+    def statuses(self, date="2025-12-27"):
+        return [(row["batch_no"], row["status"], row["attempts"]) for row in self.rows[date]]
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(outbox_module, "time", fake)
+    return fake
+
+
+def _outbox(storage, secrets=None, **kwargs):
+    return NotificationOutbox(storage, secrets=secrets, get_time_func=lambda: TODAY, **kwargs)
+
+
+def _messages(count, url="https://hooks.example.com/abc", channel="feishu"):
+    return [
+        OutboxMessage(
+            channel=channel, url=url, sequence=i, batch_no=i, total=count,
+            label="飞书", report_type="当日汇总", payload={"text": f"批次 {i}"},
+        )
+        for i in range(1, count + 1)
+    ]
+
+
+def _script_send(monkeypatch, results):
+    """按顺序返回预设的投递结果，记录投递的批次编号"""
+    sent = []
+
+    def send(self, row):
+        sent.append(row["batch_no"])
+        return results.pop(0) if results else (None, True)
+
+    monkeypatch.setattr(NotificationOutbox, "_send", send)
+    return sent
+
+
+def test_collect_secrets_skips_short_values_and_extracts_bark_key():
+    secrets = collect_secrets({
+        "FEISHU_WEBHOOK_URL": "https://open.feishu.cn/hook/aaaa;https://open.feishu.cn/hook/bbbb",
+        "NTFY_TOKEN": "short",
+        "BARK_URL": "https://api.day.app/DEVICEKEY123/",
+    })
+    assert secrets["{{SECRET:FEISHU_WEBHOOK_URL:0}}"] == "https://open.feishu.cn/hook/aaaa"
+    assert secrets["{{SECRET:FEISHU_WEBHOOK_URL:1}}"] == "https://open.feishu.cn/hook/bbbb"
+    assert secrets["{{SECRET:BARK_DEVICE_KEY:0}}"] == "DEVICEKEY123"
+    assert not any("NTFY_TOKEN" in key for key in secrets)
+
+
+def test_redact_and_restore_roundtrip():
+    token = "123456:ABC/def\"quoted"
+    outbox = _outbox(MemoryStorage(), secrets={
+        "{{SECRET:TELEGRAM_BOT_TOKEN:0}}": token,
+        "{{SECRET:NTFY_TOKEN:0}}": "ABC/def",
+    })
+    text = json.dumps({"url": f"https://api.telegram.org/bot{token}/sendMessage"}, ensure_ascii=False)
+
+    redacted = outbox._redact(text)
+    assert "ABC/def" not in redacted
+    # 长凭据先替换，不会被其中的短凭据拆开
+    assert "{{SECRET:TELEGRAM_BOT_TOKEN:0}}" in redacted
+    assert outbox._restore(redacted) == text
+
+
+def test_restore_fails_when_secret_removed():
+    redacted = _outbox(MemoryStorage(), secrets={"{{SECRET:SLACK_WEBHOOK_URL:0}}": "https://hooks.slack/x"})._redact(
+        "https://hooks.slack/x"
+    )
+    assert _outbox(MemoryStorage())._restore(redacted) is None
+    assert _outbox(MemoryStorage())._restore("plain text") == "plain text"
+
+
+def test_enqueue_stores_redacted_requests():
+    storage = MemoryStorage()
+    url = "https://hooks.example.com/secret-token"
+    outbox = _outbox(storage, secrets={"{{SECRET:FEISHU_WEBHOOK_URL:0}}": url})
+    assert outbox.enqueue(_messages(2, url=url))
+
+    for row in storage.rows["2025-12-27"]:
+        assert url not in row["request"]
+        assert json.loads(outbox._restore(row["request"]))["url"] == url
+
+
+def test_failed_batch_backs_off_and_blocks_group(clock, monkeypatch):
+    storage = MemoryStorage()
+    outbox = _outbox(storage, backoff_base=30, backoff_max=100)
+    outbox.enqueue(_messages(3))
+    sent = _script_send(monkeypatch, [(None, True), ("状态码：502", True), ("状态码：502", True)])
+
+    assert outbox.drain() == {"sent": 1, "failed": 0, "pending": 2}
+    assert sent == [1, 2]
+    retry_row = storage.rows["2025-12-27"][1]
+    assert retry_row["next_attempt_at"] == clock.now + 30
+
+    # 退避期间不投递
+    clock.now += 29
+    assert outbox.drain() == {"sent": 0, "failed": 0, "pending": 2}
+    assert sent == [1, 2]
+
+    clock.now += 1
+    outbox.drain()
+    assert storage.rows["2025-12-27"][1]["next_attempt_at"] == clock.now + 60
+
+    # 第二次重试的等待时间翻倍
+    clock.now += 60
+    assert outbox.drain() == {"sent": 2, "failed": 0, "pending": 0}
+    assert sent == [1, 2, 2, 2, 3]
+    assert storage.statuses() == [(1, "sent", 1), (2, "sent", 3), (3, "sent", 1)]
+
+
+def test_backoff_is_capped(clock, monkeypatch):
+    storage = MemoryStorage()
+    outbox = _outbox(storage, backoff_base=30, backoff_max=45)
+    outbox.enqueue(_messages(1))
+    _script_send(monkeypatch, [("timeout", True), ("timeout", True)])
+
+    outbox.drain()
+    clock.now += 30
+    outbox.drain()
+    assert storage.rows["2025-12-27"][0]["next_attempt_at"] == clock.now + 45
+
+
+def test_gives_up_after_max_attempts_and_continues(clock, monkeypatch):
+    storage = MemoryStorage()
+    outbox = _outbox(storage, max_attempts=2, backoff_base=10)
+    outbox.enqueue(_messages(2))
+    _script_send(monkeypatch, [("状态码：500", True), ("状态码：500", True)])
+
+    outbox.drain()
+    clock.now += 10
+    assert outbox.drain() == {"sent": 1, "failed": 1, "pending": 0}
+    assert storage.statuses() == [(1, "failed", 2), (2, "sent", 1)]
+
+
+def test_non_retryable_error_fails_immediately(clock, monkeypatch):
+    storage = MemoryStorage()
+    outbox = _outbox(storage)
+    outbox.enqueue(_messages(1))
+    _script_send(monkeypatch, [("状态码：400", False)])
+
+    assert outbox.drain() == {"sent": 0, "failed": 1, "pending": 0}
+    assert storage.rows["2025-12-27"][0]["last_error"] == "状态码：400"
+
+
+def test_drain_reads_previous_day_first(clock, monkeypatch):
+    storage = MemoryStorage()
+    outbox = _outbox(storage)
+    storage.enqueue_notifications([
+        dict(group_id="old", channel="feishu", account="", sequence=1, batch_no=1, total=1,
+             report_type="", request=json.dumps({"url": "u"})),
+    ], date="2025-12-26")
+    outbox.enqueue(_messages(1))
+    sent = []
+
+    def send(self, row):
+        sent.append(row["group_id"])
+        return None, True
+
+    monkeypatch.setattr(NotificationOutbox, "_send", send)
+    assert outbox.drain() == {"sent": 2, "failed": 0, "pending": 0}
+    assert sent[0] == "old"
+    assert storage.rows["2025-12-26"][0]["status"] == "sent"
+    assert storage.flushes == 1
@@ -0,0 +1,93 @@
+# coding=utf-8
+"""并行分类测试"""
+
+import pytest
+
+from samples import ID_TO_NAME, SAMPLE_TITLES, sample_record_data
+from trendradar.core import analyzer, parallel
+from trendradar.core.analyzer import count_rss_frequency, count_word_frequency
+
+PARALLEL = {"WORKERS": 2, "MIN_ITEMS": 0}
+
+
+@pytest.fixture(autouse=True)
+def _shutdown_pool():
+    yield
+    parallel.shutdown_classify_pool()
+
+
+def _rss_items():
+    return [
+        {
+            "title": title,
+            "feed_id": source_id,
+            "feed_name": source_name,
+            "url": url or f"https://rss.example.com/{idx}",
+            "published_at": f"2025-12-27T{idx:02d}:00:00+08:00",
+        }
+        for idx, (source_id, source_name, title, _, url) in enumerate(SAMPLE_TITLES)
+    ]
+
+
+def _word_stats(frequency_words, classify_config):
+    word_groups, filter_words, global_filters = frequency_words
+    results, title_info = sample_record_data()
+    stats, total = count_word_frequency(
+        results, word_groups, filter_words, ID_TO_NAME, title_info,
+        global_filters=global_filters, quiet=True, classify_config=classify_config,
+    )
+    return [
+        dict(stat, titles=[{key: t[key] for key in t.keys()} for t in stat["titles"]])
+        for stat in stats
+    ], total
+
+
+def _rss_stats(frequency_words, classify_config):
+    word_groups, filter_words, global_filters = frequency_words
+    return count_rss_frequency(
+        _rss_items(), word_groups, filter_words, global_filters,
+        quiet=True, classify_config=classify_config,
+    )
+
+
+def test_classify_workers():
+    assert parallel.classify_workers(None, 1000) == 0
+    assert parallel.classify_workers({"WORKERS": 1, "MIN_ITEMS": 0}, 1000) == 0
+    assert parallel.classify_workers({"WORKERS": 4, "MIN_ITEMS": 500}, 499) == 0
+    assert parallel.classify_workers({"WORKERS": 4, "MIN_ITEMS": 500}, 500) == 4
+
+
+def test_parallel_output_matches_single_process(frequency_words):
+    single = _word_stats(frequency_words, None)
+    assert single[0]
+    assert _word_stats(frequency_words, PARALLEL) == single
+
+    single_rss = _rss_stats(frequency_words, None)
+    assert single_rss[0]
+    assert _rss_stats(frequency_words, PARALLEL) == single_rss
+
+
+def test_pool_is_reused_across_calls(frequency_words):
+    shards = {"a": ["OpenAI 发布新一代 AI 模型", "今日天气"], "b": ["华为芯片新突破"]}
+    word_groups, filter_words, global_filters = frequency_words
+
+    first = parallel.classify_titles(shards, word_groups, filter_words, global_filters, PARALLEL)
+    pool = parallel._pool
+    second = parallel.classify_titles(shards, word_groups, filter_words, global_filters, PARALLEL)
+    assert parallel._pool is pool
+    assert list(first["a"]) == list(second["a"]) == [0, -1]
+    assert list(first["b"]) == [1]
+
+    parallel.shutdown_classify_pool()
+    assert parallel._pool is None
+
+
+def test_shards_are_not_built_when_disabled(frequency_words, monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError("未启用并行分类时不应构建分片")
+
+    monkeypatch.setattr(analyzer, "classify_titles", fail)
+    stats, total = _word_stats(frequency_words, {"WORKERS": 4, "MIN_ITEMS": 10_000})
+    assert total == len(SAMPLE_TITLES)
+    rss_stats, _ = _rss_stats(frequency_words, None)
+    assert rss_stats
@@ -0,0 +1,130 @@
+# coding=utf-8
+"""代理池测试"""
+
+import pytest
+import requests
+
+from trendradar.crawler import proxy as proxy_module
+from trendradar.crawler.proxy import ProxyPool, ProxyPoolTimeout
+
+
+class FakeClock:
+    """替代 time 模块的可控时钟"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(proxy_module, "time", fake)
+    return fake
+
+
+def _request(pool, clock, host, seconds=0.1, error=None, mark_failed=False):
+    """模拟一次经代理的请求，返回使用的代理 URL"""
+    try:
+        with pool.lease(host) as lease:
+            clock.now += seconds
+            if mark_failed:
+                lease.mark_failed()
+            if error is not None:
+                raise error
+            return lease.url
+    except Exception:
+        if error is None:
+            raise
+        return None
+
+
+def test_requires_a_proxy():
+    with pytest.raises(ValueError):
+        ProxyPool(["", None])
+
+
+def test_deduplicates_proxies():
+    assert len(ProxyPool(["http://a", "http://a", "http://b"])) == 2
+
+
+def test_prefers_lower_latency_and_sticks_per_host(clock):
+    pool = ProxyPool(["http://a", "http://b"])
+    with pool.lease("warm-a") as lease_a, pool.lease("warm-b") as lease_b:
+        assert {lease_a.url, lease_b.url} == {"http://a", "http://b"}
+        slow, fast = lease_a, lease_b
+    # 两个租用同时结束，手动写入不同的延迟样本
+    states = {s.url: s for s in pool._states}
+    states[slow.url].latency = 2.0
+    states[fast.url].latency = 0.2
+
+    assert _request(pool, clock, "example.com") == fast.url
+    # 粘性分配：延迟变化后同一主机仍使用原代理
+    states[fast.url].latency = 5.0
+    assert _request(pool, clock, "EXAMPLE.com") == fast.url
+    assert _request(pool, clock, "other.com") == slow.url
+
+
+def test_load_spreads_new_hosts(clock):
+    pool = ProxyPool(["http://a", "http://b"], max_concurrency=2)
+    with pool.lease("h1") as first:
+        with pool.lease("h2") as second:
+            assert first.url != second.url
+
+
+def test_connection_errors_demote_after_threshold(clock):
+    pool = ProxyPool(["http://a", "http://b"], failure_threshold=2, demote_seconds=60)
+    bad = _request(pool, clock, "h")
+    for _ in range(2):
+        _request(pool, clock, "h", error=requests.ConnectionError("boom"))
+
+    stats = {s["url"]: s for s in pool.stats()}
+    assert stats[bad]["failures"] == 2
+    assert stats[bad]["demoted"] is True
+
+    # 降级期间主机重新分配到其他代理
+    good = _request(pool, clock, "h")
+    assert good != bad
+
+    clock.now += 61
+    assert {s["url"]: s["demoted"] for s in pool.stats()}[bad] is False
+
+
+def test_timeouts_and_marked_failures_count(clock):
+    pool = ProxyPool(["http://a"], failure_threshold=10)
+    _request(pool, clock, "h", error=requests.Timeout("slow"))
+    _request(pool, clock, "h", mark_failed=True)
+    assert pool.stats()[0]["failures"] == 2
+
+
+def test_origin_http_errors_do_not_count(clock):
+    pool = ProxyPool(["http://a"], failure_threshold=1)
+    _request(pool, clock, "h", error=requests.HTTPError("404"))
+    _request(pool, clock, "h", error=ValueError("parse"))
+    stats = pool.stats()[0]
+    assert stats["failures"] == 0
+    assert stats["demoted"] is False
+    assert stats["requests"] == 2
+
+
+def test_all_demoted_uses_earliest_recovery(clock):
+    pool = ProxyPool(["http://a", "http://b"], failure_threshold=1, demote_seconds=60)
+    first = _request(pool, clock, "h1")
+    _request(pool, clock, "h1", error=requests.ConnectionError())
+    clock.now += 10
+    second = _request(pool, clock, "h2")
+    assert second != first
+    _request(pool, clock, "h2", error=requests.ConnectionError())
+
+    assert all(s["demoted"] for s in pool.stats())
+    assert _request(pool, clock, "h3") == first
+
+
+def test_lease_timeout_when_full():
+    pool = ProxyPool(["http://a"], max_concurrency=1)
+    with pool.lease("h"):
+        with pytest.raises(ProxyPoolTimeout):
+            with pool.lease("h", timeout=0.05):
+                pass
@@ -0,0 +1,138 @@
+# coding=utf-8
+"""紧凑标题记录测试"""
+
+from datetime import datetime
+
+import pytest
+
+from samples import ID_TO_NAME, sample_dict_data, sample_record_data
+from trendradar.core.analyzer import count_word_frequency
+from trendradar.core.records import MatchedTitle, TitleRecord
+from trendradar.notification.splitter import split_content_into_batches
+from trendradar.report.document import ReportItem, build_report_document
+from trendradar.report.generator import prepare_report_data
+from trendradar.report.html import render_html_content
+from trendradar.storage.base import RankMomentum
+
+
+# 原 count_word_frequency 生成的标题字典的键
+LEGACY_MATCH_KEYS = {
+    "title", "source_name", "first_time", "last_time", "time_display", "count",
+    "ranks", "rank_threshold", "url", "mobileUrl", "is_new", "rank_timeline",
+}
+
+
+def _fixed_time():
+    return datetime(2025, 12, 27, 10, 30)
+
+
+def _record(**kwargs):
+    defaults = dict(title="标题", source_id="zhihu", source_name="知乎", ranks=[3, 1])
+    defaults.update(kwargs)
+    return TitleRecord(**defaults)
+
+
+def test_record_reports_only_dict_keys():
+    record = _record()
+    assert "count" in record
+    assert "url" in record and record["url"] == ""
+    assert "mobileUrl" in record
+    # 只能读取、原字典中没有的键
+    assert "title" not in record and record.get("title") == "标题"
+    assert "mobile_url" not in record
+    assert set(record.keys()) == {
+        "first_time", "last_time", "count", "ranks", "url", "mobileUrl", "rank_timeline",
+    }
+
+
+def test_optional_keys_exist_only_when_set():
+    record = _record()
+    assert "story_id" not in record
+    assert "momentum" not in record
+    assert record.get("story_id", 7) == 7
+    with pytest.raises(KeyError):
+        record["story_id"]
+
+    momentum = RankMomentum(rank_delta=2, velocity=1.0, max_climb=5, age_minutes=30)
+    record = _record(story_id=42, momentum=momentum)
+    assert "story_id" in record and record["story_id"] == 42
+    assert record.get("momentum") is momentum
+    assert {"story_id", "momentum"} <= set(record.keys())
+
+
+def test_matched_title_keys_match_legacy_dict():
+    matched = MatchedTitle(_record(), "08:00~10:30", 5, True)
+    assert set(matched.keys()) == LEGACY_MATCH_KEYS
+    for key in LEGACY_MATCH_KEYS:
+        assert key in matched
+    assert "story_id" not in matched
+
+    matched["matched_keyword"] = "AI"
+    assert "matched_keyword" in matched
+    assert "matched_keyword" not in matched.record
+
+
+def test_matched_title_writes_do_not_touch_record():
+    record = _record()
+    matched = MatchedTitle(record)
+    matched["title"] = "Translated"
+    matched["is_new"] = True
+    assert matched["title"] == "Translated"
+    assert record.title == "标题"
+    assert matched.is_new is True
+
+
+def test_report_document_wraps_matched_titles():
+    matched = MatchedTitle(_record(url="https://e.com/1", mobile_url="https://m.e.com/1"), "", 5)
+    report_data = {"stats": [{"word": "AI", "count": 1, "titles": [matched]}], "new_titles": []}
+    doc_data, _, _ = build_report_document(report_data, None, None)
+    item = doc_data["stats"][0]["titles"][0]
+    assert isinstance(item, ReportItem)
+    assert item.link_url == "https://m.e.com/1"
+
+
+def _legacy_stats(stats):
+    """把 MatchedTitle 展开为原 count_word_frequency 返回的普通字典"""
+    legacy = []
+    for stat in stats:
+        titles = []
+        for title in stat["titles"]:
+            item = {key: title[key] for key in title.keys()}
+            item["ranks"] = list(item["ranks"])
+            item["rank_timeline"] = list(item["rank_timeline"])
+            titles.append(item)
+        legacy.append(dict(stat, titles=titles))
+    return legacy
+
+
+@pytest.mark.parametrize("mode", ["daily", "current", "incremental"])
+def test_record_path_renders_like_dict_path(frequency_words, mode):
+    word_groups, filter_words, global_filters = frequency_words
+    new_titles = {"weibo": {"人工智能写作工具走红": {"ranks": [2], "url": "", "mobileUrl": ""}}}
+
+    def run(data):
+        results, title_info = data
+        stats, total = count_word_frequency(
+            results, word_groups, filter_words, ID_TO_NAME, title_info,
+            rank_threshold=3, new_titles=new_titles, mode=mode,
+            global_filters=global_filters, is_first_crawl_func=lambda: False, quiet=True,
+        )
+        return stats, total
+
+    record_stats, total = run(sample_record_data())
+    dict_stats = _legacy_stats(run(sample_dict_data())[0])
+    assert all(isinstance(t, MatchedTitle) for s in record_stats for t in s["titles"])
+    assert all(set(t) == LEGACY_MATCH_KEYS for s in dict_stats for t in s["titles"])
+
+    def render(stats):
+        report_data = prepare_report_data(
+            stats, ["douyin"], new_titles, ID_TO_NAME, mode, rank_threshold=3,
+        )
+        html = render_html_content(report_data, total, mode, get_time_func=_fixed_time)
+        batches = {
+            fmt: split_content_into_batches(report_data, fmt, mode=mode, get_time_func=_fixed_time)
+            for fmt in ("feishu", "dingtalk", "telegram", "slack")
+        }
+        return html, batches
+
+    assert render(record_stats) == render(dict_stats)
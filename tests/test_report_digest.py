@@ -0,0 +1,181 @@
+# coding=utf-8
+"""渲染摘要与报告复用测试"""
+
+from array import array
+
+import pytest
+
+from trendradar.__main__ import NewsAnalyzer
+from trendradar.core.records import MatchedTitle, TitleRecord
+from trendradar.report import compute_render_digest
+from trendradar.report.generator import generate_html_report, load_render_state
+
+
+def _matched(title="标题", ranks=(1, 2), first_time="10-00"):
+    record = TitleRecord(title, "zhihu", "知乎", url="https://e.com/1", ranks=list(ranks), first_time=first_time)
+    return MatchedTitle(record, time_display="10:00", rank_threshold=5)
+
+
+def test_digest_is_stable_and_ignores_key_order():
+    a = {"stats": [{"word": "AI", "count": 1}], "failed_ids": ["x"]}
+    b = {"failed_ids": ["x"], "stats": [{"count": 1, "word": "AI"}]}
+    assert compute_render_digest(a) == compute_render_digest(b)
+    assert compute_render_digest(a) != compute_render_digest(dict(a, failed_ids=[]))
+    assert compute_render_digest("2025-12-27", a) != compute_render_digest("2025-12-28", a)
+
+
+def test_digest_serializes_arrays_and_sets():
+    assert compute_render_digest(array("i", [1, 2])) == compute_render_digest([1, 2])
+    assert compute_render_digest({"b", "a"}) == compute_render_digest(["a", "b"])
+
+
+def test_digest_uses_display_fields_of_titles():
+    base = compute_render_digest([_matched()])
+    # 不展示的字段不影响摘要
+    assert compute_render_digest([_matched(first_time="08-00")]) == base
+    assert compute_render_digest([_matched(ranks=(3,))]) != base
+    assert compute_render_digest([_matched(title="另一个标题")]) != base
+
+
+def test_content_signature_ignores_ranks_and_order():
+    groups = [{"word": "AI", "titles": [
+        {"source_name": "知乎", "title": "A", "url": "u1", "ranks": [1]},
+        {"source_name": "微博", "title": "B", "url": "u2", "ranks": [3]},
+    ]}]
+    reordered = [{"word": "AI", "titles": [
+        {"source_name": "微博", "title": "B", "url": "u2", "ranks": [9], "count": 4},
+        {"source_name": "知乎", "title": "A", "url": "u1", "ranks": [2]},
+    ]}]
+    assert NewsAnalyzer._content_signature(groups) == NewsAnalyzer._content_signature(reordered)
+    assert NewsAnalyzer._content_signature(None) == []
+
+
+@pytest.fixture
+def render(tmp_path, monkeypatch):
+    # 报告同时复制到工作目录下的 index.html
+    monkeypatch.chdir(tmp_path)
+    calls = []
+
+    def render_html(report_data, total_titles, mode, update_info):
+        calls.append(report_data)
+        return ["<html>", str(len(calls)), "</html>"]
+
+    def run(stats, time_filename, date_folder="2025-12-27", render_inputs=None):
+        return generate_html_report(
+            stats, 10, failed_ids=[], new_titles={}, id_to_name={}, mode="daily",
+            output_dir=str(tmp_path / "output"), date_folder=date_folder,
+            time_filename=time_filename, render_html_func=render_html,
+            render_inputs={} if render_inputs is None else render_inputs,
+        )
+
+    run.calls = calls
+    run.output_dir = str(tmp_path / "output")
+    return run
+
+
+STATS = [{"word": "AI", "count": 1, "percentage": 0, "titles": [{
+    "title": "标题", "source_name": "知乎", "first_time": "10-00", "last_time": "10-00",
+    "time_display": "", "count": 1, "ranks": [1], "rank_threshold": 5,
+    "url": "", "mobileUrl": "", "is_new": False,
+}]}]
+
+
+def test_unchanged_report_reuses_snapshot(render):
+    first = render(STATS, "10-00")
+    second = render(STATS, "10-30")
+    assert second == first
+    assert len(render.calls) == 1
+    assert load_render_state(render.output_dir, "daily")["snapshot"] == first
+
+
+def test_changed_inputs_rerender(render):
+    first = render(STATS, "10-00")
+    changed = render(STATS, "10-30", render_inputs={"rss_items": [{"word": "x"}]})
+    assert changed != first
+    assert len(render.calls) == 2
+    assert open(changed, encoding="utf-8").read() == "<html>2</html>"
+
+
+def test_new_day_rerenders(render):
+    first = render(STATS, "23-30", date_folder="2025-12-27")
+    second = render(STATS, "00-00", date_folder="2025-12-28")
+    assert second != first
+    assert len(render.calls) == 2
+
+
+class FakeDispatcher:
+    def __init__(self, results):
+        self.results = results
+        self.calls = 0
+
+    def dispatch_all(self, **kwargs):
+        self.calls += 1
+        return dict(self.results)
+
+
+class FakeContext:
+    """只提供推送流程用到的方法"""
+
+    def __init__(self, results):
+        self.config = {
+            "ENABLE_NOTIFICATION": True,
+            "PUSH_WINDOW": {"ENABLED": False},
+            "SHOW_VERSION_UPDATE": False,
+            "SKIP_UNCHANGED_PUSH": True,
+            "AI_ANALYSIS": {"ENABLED": False},
+        }
+        self.render_state = {}
+        self.dispatcher = FakeDispatcher(results)
+
+    def prepare_report(self, stats, failed_ids, new_titles, id_to_name, mode, circuit_open_ids=None):
+        return {"stats": stats, "new_titles": [], "failed_ids": []}
+
+    def format_date(self):
+        return "2025-12-27"
+
+    def get_render_state(self, mode):
+        return dict(self.render_state)
+
+    def update_render_state(self, mode, **updates):
+        self.render_state.update(updates)
+
+    def create_notification_outbox(self, proxy_url):
+        return None
+
+    def create_push_ledger(self):
+        return None
+
+    def create_notification_dispatcher(self, outbox=None, ledger=None):
+        return self.dispatcher
+
+
+def _push(results):
+    analyzer = NewsAnalyzer.__new__(NewsAnalyzer)
+    analyzer.ctx = FakeContext(results)
+    analyzer.circuit_open_ids = []
+    analyzer.update_info = None
+    analyzer.proxy_url = None
+    analyzer.report_mode = "daily"
+    analyzer._has_notification_configured = lambda: True
+
+    def send():
+        return analyzer._send_notification_if_needed(STATS, "当日汇总", "daily")
+
+    return analyzer.ctx, send
+
+
+def test_unchanged_push_is_skipped_after_all_channels_succeed():
+    ctx, send = _push({"feishu": True, "email": True})
+    assert send() is True
+    assert "push_digest" in ctx.render_state
+    assert send() is False
+    assert ctx.dispatcher.calls == 1
+
+
+def test_partial_failure_does_not_record_push_digest():
+    ctx, send = _push({"feishu": True, "email": False})
+    assert send() is True
+    assert "push_digest" not in ctx.render_state
+    # 失败的渠道下次运行仍会收到相同内容
+    assert send() is True
+    assert ctx.dispatcher.calls == 2
@@ -0,0 +1,271 @@
+# coding=utf-8
+"""RSS 抓取器测试"""
+
+import threading
+import time
+
+import pytest
+import requests
+
+from trendradar.crawler.rss import fetcher as fetcher_module
+from trendradar.crawler.rss.fetcher import HostThrottle, RSSFeedConfig, RSSFetcher
+from trendradar.crawler.rss.parser import RSSParser
+from trendradar.storage.local import LocalStorageBackend
+
+
+def _rss(name, count=2):
+    items = "".join(
+        f"<item><title>{name} {i}</title><link>https://{name}.example.com/{i}</link></item>"
+        for i in range(count)
+    )
+    return f'<?xml version="1.0"?><rss version="2.0"><channel><title>{name}</title>{items}</channel></rss>'
+
+
+class FakeResponse:
+    def __init__(self, status_code=200, text="", headers=None):
+        self.status_code = status_code
+        self.text = text
+        self.content = text.encode("utf-8")
+        self.headers = headers or {}
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} Error")
+
+
+class FakeSession:
+    """所有线程共用的假会话：记录每次请求的开始时间和并发数"""
+
+    def __init__(self, delay=0.0, responses=None):
+        self.delay = delay
+        self.responses = responses or {}
+        self.requests = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def get(self, url, timeout=None, headers=None, proxies=None):
+        with self._lock:
+            self.requests.append((url, time.monotonic(), dict(headers or {})))
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            time.sleep(self.delay)
+            response = self.responses.get(url)
+            if callable(response):
+                response = response(headers or {})
+            return response or FakeResponse(text=_rss(url.split("//")[1].split(".")[0]))
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+    def start_times(self, host):
+        return [start for url, start, _ in self.requests if f"//{host}" in url]
+
+
+def _fetcher(feeds, session, monkeypatch, **kwargs):
+    monkeypatch.setattr(RSSFetcher, "_create_session", lambda self: session)
+    kwargs.setdefault("freshness_enabled", False)
+    return RSSFetcher(feeds, **kwargs)
+
+
+def _feed(feed_id, host, path=""):
+    return RSSFeedConfig(id=feed_id, name=feed_id, url=f"https://{host}.example.com/feed{path}")
+
+
+class FakeClock:
+    """替代 time 模块的可控时钟（sleep 推进时间）"""
+
+    def __init__(self):
+        self.now = 100.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(round(seconds, 6))
+        self.now += seconds
+
+
+def test_host_throttle_spaces_same_host_only(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(fetcher_module, "time", clock)
+    throttle = HostThrottle(500, jitter=0)
+
+    throttle.wait("a.example.com")
+    throttle.wait("b.example.com")
+    assert clock.sleeps == []
+
+    throttle.wait("a.example.com")
+    assert clock.sleeps == [0.5]
+    # 间隔已经过去时不再等待
+    clock.now += 1.0
+    throttle.wait("b.example.com")
+    assert clock.sleeps == [0.5]
+
+
+def test_host_throttle_reserves_slots_for_waiting_callers(monkeypatch):
+    clock = FakeClock()
+    # 模拟同时到达的调用者：等待期间时间不前进
+    clock.sleep = clock.sleeps.append
+    monkeypatch.setattr(fetcher_module, "time", clock)
+    throttle = HostThrottle(200, jitter=0)
+
+    for _ in range(3):
+        throttle.wait("a")
+    # 每个调用者预约下一个时间槽，而不是都在同一时刻之后请求
+    assert [round(s, 6) for s in clock.sleeps] == [0.2, 0.4]
+
+
+def test_concurrent_fetch_overlaps_hosts_and_keeps_order(monkeypatch):
+    session = FakeSession(delay=0.1)
+    feeds = [_feed(f"f{i}", f"host{i}") for i in range(4)]
+    fetcher = _fetcher(feeds, session, monkeypatch, max_workers=4, request_interval=1000)
+
+    started = time.monotonic()
+    data = fetcher.fetch_all()
+    elapsed = time.monotonic() - started
+
+    assert session.max_in_flight > 1
+    assert elapsed < 0.35
+    # 结果按配置顺序合并
+    assert list(data.items) == ["f0", "f1", "f2", "f3"]
+    assert [item.title for item in data.items["f2"]] == ["host2 0", "host2 1"]
+    assert data.failed_ids == []
+
+
+def test_concurrent_fetch_throttles_same_host(monkeypatch):
+    session = FakeSession()
+    feeds = [_feed(f"a{i}", "same", f"/{i}") for i in range(3)] + [_feed("b", "other")]
+    fetcher = _fetcher(feeds, session, monkeypatch, max_workers=4, request_interval=100)
+
+    data = fetcher.fetch_all()
+    assert list(data.items) == ["a0", "a1", "a2", "b"]
+
+    same = sorted(session.start_times("same"))
+    # 同一主机的请求间隔 request_interval（±20% 波动）
+    assert all(b - a >= 0.075 for a, b in zip(same, same[1:]))
+    # 其他主机不等待同一主机的间隔
+    assert session.start_times("other")[0] - same[0] < 0.075
+
+
+def test_concurrent_and_sequential_results_match(monkeypatch):
+    feeds = [_feed(f"f{i}", f"host{i % 2}", f"/{i}") for i in range(4)]
+    feeds.append(RSSFeedConfig(id="bad", name="bad", url="https://bad.example.com/feed"))
+    responses = {"https://bad.example.com/feed": FakeResponse(status_code=500)}
+
+    def run(max_workers):
+        session = FakeSession(responses=responses)
+        data = _fetcher(feeds, session, monkeypatch, max_workers=max_workers, request_interval=10).fetch_all()
+        return (
+            {feed_id: [(i.title, i.url) for i in items] for feed_id, items in data.items.items()},
+            data.failed_ids,
+            data.id_to_name,
+        )
+
+    assert run(4) == run(1)
+    assert run(4)[1] == ["bad"]
+
+
+@pytest.mark.parametrize("max_workers", [1, 3])
+def test_worker_threads_use_their_own_sessions(monkeypatch, max_workers):
+    created = []
+
+    def create_session(self):
+        session = FakeSession()
+        created.append((threading.current_thread().name, session))
+        return session
+
+    monkeypatch.setattr(RSSFetcher, "_create_session", create_session)
+    feeds = [_feed(f"f{i}", f"host{i}") for i in range(3)]
+    RSSFetcher(feeds, max_workers=max_workers, request_interval=10, freshness_enabled=False).fetch_all()
+
+    worker_sessions = [name for name, _ in created if name.startswith("rss-fetch")]
+    # 主线程会话之外，并发模式下每个工作线程各创建一个会话
+    assert len(created) == 1 + len(worker_sessions)
+    assert bool(worker_sessions) == (max_workers > 1)
+
+
+class ConditionalServer:
+    """按 If-None-Match / If-Modified-Since 返回 304 的假服务端"""
+
+    def __init__(self, etag='"v1"', last_modified="Sat, 27 Dec 2025 08:00:00 GMT", echo_headers=True):
+        self.etag = etag
+        self.last_modified = last_modified
+        self.echo_headers = echo_headers
+
+    def __call__(self, headers):
+        validators = {"ETag": self.etag, "Last-Modified": self.last_modified}
+        if headers.get("If-None-Match") == self.etag or headers.get("If-Modified-Since") == self.last_modified:
+            # 部分服务端的 304 响应不携带校验值
+            return FakeResponse(status_code=304, headers=validators if self.echo_headers else {})
+        return FakeResponse(text=_rss("cond"), headers=validators)
+
+
+FEED_URL = "https://cond.example.com/feed"
+
+
+def _conditional_fetch(monkeypatch, server, validators=None, url=FEED_URL):
+    session = FakeSession(responses={url: server})
+    feeds = [RSSFeedConfig(id="cond", name="cond", url=url)]
+    data = _fetcher(feeds, session, monkeypatch, validators=validators).fetch_all()
+    return data, session.requests[0][2]
+
+
+def test_first_fetch_records_validators(monkeypatch):
+    data, headers = _conditional_fetch(monkeypatch, ConditionalServer())
+    assert headers == {}
+    assert len(data.items["cond"]) == 2
+    assert data.not_modified_ids == []
+    assert data.validators == {"cond": {
+        "url": FEED_URL, "etag": '"v1"', "last_modified": "Sat, 27 Dec 2025 08:00:00 GMT",
+    }}
+
+
+def test_not_modified_skips_parsing_and_keeps_validators(monkeypatch):
+    stored = {"cond": {"url": FEED_URL, "etag": '"v1"', "last_modified": "Sat, 27 Dec 2025 08:00:00 GMT"}}
+    parsed = []
+    monkeypatch.setattr(RSSParser, "parse_incremental", lambda self, *args, **kwargs: parsed.append(args))
+
+    data, headers = _conditional_fetch(monkeypatch, ConditionalServer(echo_headers=False), stored)
+    assert headers == {"If-None-Match": '"v1"', "If-Modified-Since": "Sat, 27 Dec 2025 08:00:00 GMT"}
+    assert data.not_modified_ids == ["cond"]
+    assert data.items == {}
+    assert data.failed_ids == []
+    assert parsed == []
+    # 304 未携带校验值时沿用上次的值
+    assert data.validators == stored
+
+
+def test_changed_feed_url_drops_old_validators(monkeypatch):
+    stored = {"cond": {"url": "https://old.example.com/feed", "etag": '"v1"', "last_modified": None}}
+    data, headers = _conditional_fetch(monkeypatch, ConditionalServer(), stored)
+    assert headers == {}
+    assert data.not_modified_ids == []
+    assert len(data.items["cond"]) == 2
+
+
+def test_validators_round_trip_through_storage(monkeypatch, tmp_path):
+    backend = LocalStorageBackend(data_dir=str(tmp_path / "output"), enable_txt=False, enable_html=False)
+    try:
+        first, _ = _conditional_fetch(monkeypatch, ConditionalServer())
+        assert backend.save_rss_data(first)
+        stored = backend.get_rss_feed_validators(first.date)
+        assert stored == first.validators
+
+        # 下一次抓取使用数据库中的校验值发送条件请求，304 后条目仍在、校验值不变
+        second, headers = _conditional_fetch(monkeypatch, ConditionalServer(echo_headers=False), stored)
+        assert headers["If-None-Match"] == '"v1"'
+        assert second.not_modified_ids == ["cond"]
+        assert backend.save_rss_data(second)
+        assert backend.get_rss_feed_validators(first.date) == stored
+        assert len(backend.get_rss_data(first.date).items["cond"]) == 2
+
+        # 内容更新后保存新的校验值
+        third, _ = _conditional_fetch(monkeypatch, ConditionalServer('"v2"', "Sat, 27 Dec 2025 09:00:00 GMT"), stored)
+        assert third.not_modified_ids == []
+        assert backend.save_rss_data(third)
+        assert backend.get_rss_feed_validators(first.date)["cond"]["etag"] == '"v2"'
+    finally:
+        backend.cleanup()
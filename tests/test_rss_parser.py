@@ -0,0 +1,91 @@
+# coding=utf-8
+"""RSS 增量解析测试"""
+
+import json
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import pytest
+
+from trendradar.crawler.rss.parser import ParseCutoff, RSSParser
+
+
+def _rss(ages_days):
+    now = datetime.now(timezone.utc)
+    items = "".join(
+        f"<item><title>标题 {i}</title><link>https://e.com/{i}</link><guid>g{i}</guid>"
+        f"<pubDate>{format_datetime(now - timedelta(days=age, hours=1))}</pubDate>"
+        f"<description>&lt;b&gt;摘要 {i}&lt;/b&gt;</description></item>"
+        for i, age in enumerate(ages_days)
+    )
+    return f'<?xml version="1.0"?><rss version="2.0"><channel><title>T</title>{items}</channel></rss>'
+
+
+def _json_feed(count):
+    return json.dumps({
+        "version": "https://jsonfeed.org/version/1.1",
+        "title": "T",
+        "items": [
+            {"id": f"j{i}", "url": f"https://e.com/j{i}", "title": f"条目 {i}",
+             "date_published": "2025-12-27T08:00:00Z", "summary": f"摘要 {i}"}
+            for i in range(count)
+        ],
+    })
+
+
+@pytest.mark.parametrize("stream", [False, True])
+@pytest.mark.parametrize("max_items", [0, 1, 3, 10])
+def test_without_cutoff_matches_parse(max_items, stream):
+    rss = RSSParser()
+    content = _rss([0, 1, 2, 3, 4])
+    full = rss.parse(content)
+    expected = full[:max_items] if max_items else full
+
+    result = rss.parse_incremental(content, max_items=max_items, stream=stream)
+    assert result.items == expected
+    assert result.seen_urls == []
+    assert result.stale_count == 0
+
+
+def test_json_feed_without_cutoff_matches_parse():
+    rss = RSSParser()
+    content = _json_feed(5)
+    assert rss.parse_incremental(content, max_items=3).items == rss.parse(content)[:3]
+
+
+def test_seen_entries_are_reported_not_converted():
+    rss = RSSParser()
+    cutoff = ParseCutoff(seen={"https://e.com/1", "g3"})
+    result = rss.parse_incremental(_rss([0, 0, 0, 0, 0]), cutoff=cutoff)
+
+    # URL 或 GUID 命中都算已见过；后面的新条目照常转换（不提前停止）
+    assert result.seen_urls == ["https://e.com/1", "https://e.com/3"]
+    assert [item.title for item in result.items] == ["标题 0", "标题 2", "标题 4"]
+
+
+def test_seen_entries_count_towards_max_items():
+    rss = RSSParser()
+    cutoff = ParseCutoff(seen={"https://e.com/0"})
+    result = rss.parse_incremental(_rss([0, 0, 0, 0]), max_items=2, cutoff=cutoff)
+    assert result.seen_urls == ["https://e.com/0"]
+    assert [item.title for item in result.items] == ["标题 1"]
+
+
+def test_json_seen_entries():
+    result = RSSParser().parse_incremental(_json_feed(3), cutoff=ParseCutoff(seen={"j1"}))
+    assert result.seen_urls == ["https://e.com/j1"]
+    assert [item.title for item in result.items] == ["条目 0", "条目 2"]
+
+
+@pytest.mark.parametrize("stream", [False, True])
+def test_freshness_horizon_skips_stale_entries(stream):
+    rss = RSSParser()
+    # 条目未按时间排序：过期条目之后的新条目仍被保留
+    content = _rss([0, 5, 1, 10, 2])
+    result = rss.parse_incremental(content, cutoff=ParseCutoff(max_age_days=3), stream=stream)
+
+    assert [item.title for item in result.items] == ["标题 0", "标题 2", "标题 4"]
+    assert result.stale_count == 2
+
+    # max_age_days=0 不按时间截止
+    assert rss.parse_incremental(content, cutoff=ParseCutoff()).items == rss.parse(content)
@@ -0,0 +1,98 @@
+# coding=utf-8
+"""RSS 流式解析测试"""
+
+import xml.etree.ElementTree as ET
+
+import pytest
+
+from trendradar.crawler.rss.parser import RSSParser
+from trendradar.crawler.rss.stream import StreamParseError, iter_xml_entries
+
+
+def _rss(count, tail="</channel></rss>"):
+    items = "".join(
+        f"<item><title>标题 {i}</title><link>https://e.com/{i}</link>"
+        f"<guid>g{i}</guid><pubDate>Sat, 27 Dec 2025 0{i % 10}:00:00 GMT</pubDate>"
+        f"<description>&lt;p&gt;摘要 {i}&lt;/p&gt;</description></item>"
+        for i in range(count)
+    )
+    return f'<?xml version="1.0"?><rss version="2.0"><channel><title>T</title>{items}{tail}'
+
+
+ATOM = """<?xml version="1.0" encoding="utf-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom">
+  <title>T</title>
+  <entry>
+    <title>Atom 条目</title>
+    <link rel="alternate" href="https://e.com/a"/>
+    <id>urn:a</id>
+    <updated>2025-12-27T08:00:00Z</updated>
+    <summary>摘要</summary>
+    <author><name>作者</name></author>
+  </entry>
+</feed>
+"""
+
+
+def test_entries_match_feedparser():
+    rss = RSSParser()
+    for content in (_rss(5), ATOM):
+        streamed = rss.parse_incremental(content, stream=True).items
+        assert streamed == rss.parse(content)
+        assert streamed
+
+
+def test_malformed_document_raises():
+    # 条目未闭合
+    with pytest.raises(StreamParseError):
+        list(iter_xml_entries(_rss(3, tail="<item><title>坏条目</title></channel></rss>")))
+
+
+def test_malformed_document_falls_back_to_feedparser(monkeypatch, capsys):
+    content = _rss(3, tail="<item><title>坏条目</title></channel></rss>")
+    fallback_calls = []
+    original = RSSParser._feedparser_entries
+
+    def feedparser_entries(self, *args, **kwargs):
+        fallback_calls.append(args)
+        return original(self, *args, **kwargs)
+
+    monkeypatch.setattr(RSSParser, "_feedparser_entries", feedparser_entries)
+    result = RSSParser().parse_incremental(content, "https://e.com/feed", stream=True)
+
+    assert fallback_calls
+    assert "流式解析失败，回退到 feedparser" in capsys.readouterr().out
+    # 回退结果从头开始，不包含流式解析已读取的部分条目的重复
+    titles = [item.title for item in result.items]
+    assert titles[:3] == ["标题 0", "标题 1", "标题 2"]
+    assert len(titles) == len(set(titles))
+
+
+def test_max_items_stops_before_rest_of_document(monkeypatch):
+    # 第 3 个条目之后的内容格式错误，达到 max_items 后不再解析，因此不会报错也不会回退
+    content = _rss(3, tail="<item><title>坏条目</title></channel></rss>")
+
+    def fail(*args, **kwargs):
+        raise AssertionError("不应回退到 feedparser")
+
+    monkeypatch.setattr(RSSParser, "_feedparser_entries", fail)
+    result = RSSParser().parse_incremental(content, max_items=2, stream=True)
+    assert [item.title for item in result.items] == ["标题 0", "标题 1"]
+
+
+def test_iteration_reads_only_needed_chunks(monkeypatch):
+    fed = []
+
+    class CountingParser(ET.XMLPullParser):
+        def feed(self, data):
+            fed.append(len(data))
+            super().feed(data)
+
+    monkeypatch.setattr(ET, "XMLPullParser", CountingParser)
+    content = _rss(2000)
+    entries = iter_xml_entries(content, chunk_size=1024)
+    first = [next(entries) for _ in range(2)]
+    entries.close()
+
+    assert [e["title"] for e in first] == ["标题 0", "标题 1"]
+    assert sum(fed) < len(content) // 10
@@ -0,0 +1,123 @@
+# coding=utf-8
+"""消息分批缓存测试"""
+
+import threading
+import time
+
+import pytest
+
+from trendradar.notification.batch import SplitCache
+
+
+class FakeSplitter:
+    """记录调用次数的分批函数"""
+
+    def __init__(self, delay=0.0, fail=False):
+        self.delay = delay
+        self.fail = fail
+        self.calls = []
+
+    def __call__(self, report_data, format_type, update_info=None, max_bytes=None, mode="daily", **kwargs):
+        self.calls.append((format_type, max_bytes, mode))
+        time.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("渲染失败")
+        return [f"{format_type}:{max_bytes}:{mode}:{len(report_data['stats'])}"]
+
+
+def _report():
+    return {"stats": [{"word": "AI", "titles": []}], "new_titles": [], "failed_ids": []}
+
+
+def test_same_objects_are_rendered_once():
+    splitter = FakeSplitter()
+    cache = SplitCache(splitter)
+    report, rss_items = _report(), [{"word": "AI", "titles": []}]
+
+    # 多账号推送：相同的报告对象和参数只渲染一次
+    first = cache(report, "feishu", None, max_bytes=30000, mode="daily", rss_items=rss_items)
+    second = cache(report, "feishu", None, max_bytes=30000, mode="daily", rss_items=rss_items)
+    assert first == second == ["feishu:30000:daily:1"]
+    assert (cache.renders, cache.hits) == (1, 1)
+
+
+@pytest.mark.parametrize("changed", [
+    {"format_type": "dingtalk"},
+    {"max_bytes": 4000},
+    {"mode": "current"},
+    {"update_info": {"remote_version": "2.0"}},
+])
+def test_different_parameters_render_again(changed):
+    splitter = FakeSplitter()
+    cache = SplitCache(splitter)
+    report = _report()
+    base = {"format_type": "feishu", "update_info": None, "max_bytes": 30000, "mode": "daily"}
+
+    cache(report, **base)
+    cache(report, **dict(base, **changed))
+    assert (cache.renders, cache.hits) == (2, 0)
+
+
+def test_report_data_is_keyed_by_identity():
+    cache = SplitCache(FakeSplitter())
+    # 内容相同的不同报告对象（如按台账过滤后的视图）分别渲染
+    cache(_report(), "feishu", max_bytes=30000)
+    cache(_report(), "feishu", max_bytes=30000)
+    assert (cache.renders, cache.hits) == (2, 0)
+
+    rss_items = [{"word": "AI"}]
+    report = _report()
+    cache(report, "feishu", rss_items=rss_items)
+    cache(report, "feishu", rss_items=[{"word": "AI"}])
+    assert cache.renders == 4
+
+
+def test_simple_dicts_are_keyed_by_value():
+    cache = SplitCache(FakeSplitter())
+    report = _report()
+    # 每个渠道单独构造的 AI 统计字典按内容比较
+    cache(report, "feishu", ai_stats={"total_news": 10, "analyzed_news": 8, "ai_mode": "daily"})
+    cache(report, "feishu", ai_stats={"ai_mode": "daily", "analyzed_news": 8, "total_news": 10})
+    cache(report, "feishu", ai_stats={"total_news": 10, "analyzed_news": 9, "ai_mode": "daily"})
+    assert (cache.renders, cache.hits) == (2, 1)
+
+
+def test_cached_batches_are_copied():
+    cache = SplitCache(FakeSplitter())
+    report = _report()
+    batches = cache(report, "feishu")
+    batches.append("附加内容")
+    assert cache(report, "feishu") == ["feishu:None:daily:1"]
+
+
+def test_failed_render_is_not_cached():
+    splitter = FakeSplitter(fail=True)
+    cache = SplitCache(splitter)
+    report = _report()
+
+    with pytest.raises(RuntimeError):
+        cache(report, "feishu")
+    splitter.fail = False
+    assert cache(report, "feishu") == ["feishu:None:daily:1"]
+    assert len(splitter.calls) == 2
+    assert (cache.renders, cache.hits) == (1, 0)
+
+
+def test_concurrent_callers_wait_for_one_render():
+    splitter = FakeSplitter(delay=0.1)
+    cache = SplitCache(splitter)
+    report = _report()
+    results = []
+
+    threads = [
+        threading.Thread(target=lambda: results.append(cache(report, "wework", max_bytes=4000)))
+        for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == [["wework:4000:daily:1"]] * 4
+    assert len(splitter.calls) == 1
+    assert (cache.renders, cache.hits) == (1, 3)
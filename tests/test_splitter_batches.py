@@ -0,0 +1,160 @@
+# coding=utf-8
+"""
+消息分批回归测试
+
+split_content_into_batches 改为 _BatchBuilder 增量拼接后，输出必须与原先
+"整段拼接 + 逐次计算字节数" 的实现逐字节一致。
+
+fixtures/legacy_batches.json 记录了旧实现（_BatchBuilder 引入之前的 splitter.py）
+对下面同一组随机报告的输出摘要；生成器使用固定种子，修改 _make_case 会使摘要失效，
+需要用旧实现重新生成。
+"""
+
+import hashlib
+import json
+import random
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from trendradar.notification.splitter import split_content_into_batches
+from trendradar.report.document import build_report_document
+
+
+FIXTURE = Path(__file__).parent / "fixtures" / "legacy_batches.json"
+
+SEED = 7
+CASE_COUNT = 400
+
+FORMATS = ["feishu", "dingtalk", "wework", "telegram", "ntfy", "bark", "slack"]
+MODES = ["daily", "incremental", "current"]
+WORDS = ["AI", "芯片", "Python", "新能源汽车", "🔥热点", "é", "long" * 20, "数据"]
+
+
+def _fixed_time():
+    return datetime(2025, 12, 27, 10, 0, 0)
+
+
+def _make_title(rnd, i):
+    return {
+        "title": rnd.choice(WORDS) + f" 标题 {i} " + "x" * rnd.randint(0, 120) + "中" * rnd.randint(0, 40),
+        "source_name": rnd.choice(["知乎", "微博", "HN", "百度"]),
+        "url": rnd.choice(["", f"https://e.com/{i}"]),
+        "mobile_url": rnd.choice(["", f"https://m.e.com/{i}"]),
+        "ranks": [rnd.randint(1, 50) for _ in range(rnd.randint(1, 3))],
+        "rank_threshold": 10,
+        "time_display": rnd.choice(["", "10:00~12:00"]),
+        "count": rnd.randint(1, 4),
+        "is_new": rnd.random() < 0.3,
+        "matched_keyword": "AI",
+        "published_at": rnd.choice(["", "2025-12-27T10:00:00+08:00"]),
+        "author": rnd.choice(["", "bob"]),
+    }
+
+
+def _make_stats(rnd, n):
+    stats = []
+    for _ in range(n):
+        word = rnd.choice(WORDS)
+        count = rnd.randint(0, 12)
+        stats.append({
+            "word": word,
+            "count": count,
+            "titles": [_make_title(rnd, j) for j in range(count)],
+        })
+    return stats
+
+
+def _make_standalone(rnd):
+    return {
+        "platforms": [{
+            "id": "zhihu",
+            "name": "知乎",
+            "items": [
+                dict(_make_title(rnd, j), rank=j + 1, first_time="10-00", last_time="11-00")
+                for j in range(rnd.randint(0, 8))
+            ],
+        }],
+        "rss_feeds": [{
+            "id": "hn",
+            "name": "HN",
+            "items": [_make_title(rnd, j) for j in range(rnd.randint(0, 5))],
+        }],
+    }
+
+
+def _make_case(rnd):
+    """生成一份随机报告和分批参数"""
+    report_data = {
+        "stats": _make_stats(rnd, rnd.randint(0, 6)) if rnd.random() < 0.8 else [],
+        "new_titles": [
+            {"source_name": f"源{k}", "titles": [_make_title(rnd, j) for j in range(rnd.randint(0, 6))]}
+            for k in range(rnd.randint(0, 4))
+        ],
+        "failed_ids": [f"id{k}" for k in range(rnd.randint(0, 3))] if rnd.random() < 0.4 else [],
+        "total_new_count": 5,
+    }
+    kwargs = {
+        "format_type": rnd.choice(FORMATS),
+        "update_info": rnd.choice([None, {"remote_version": "9.9", "current_version": "1.0"}]),
+        "max_bytes": rnd.choice([None, 120, 300, 600, 1500, 4000]),
+        "mode": rnd.choice(MODES),
+        "region_order": rnd.sample(
+            ["hotlist", "rss", "new_items", "standalone", "ai_analysis"], rnd.randint(1, 5)
+        ),
+        "rss_items": _make_stats(rnd, rnd.randint(0, 3)) if rnd.random() < 0.5 else None,
+        "rss_new_items": _make_stats(rnd, rnd.randint(0, 3)) if rnd.random() < 0.5 else None,
+        "display_mode": rnd.choice(["keyword", "platform"]),
+        "ai_content": rnd.choice([None, "", "AI 分析：" + "内容" * rnd.randint(1, 400)]),
+        "standalone_data": rnd.choice([None, {}, _make_standalone(rnd)]),
+        "ai_stats": rnd.choice([None, {"analyzed_news": 3}]),
+        "show_new_section": rnd.random() < 0.8,
+    }
+    return report_data, kwargs
+
+
+def make_cases():
+    """按固定种子生成全部用例（顺序固定，与 fixture 一一对应）"""
+    rnd = random.Random(SEED)
+    return [_make_case(rnd) for _ in range(CASE_COUNT)]
+
+
+def batches_digest(batches):
+    """分批结果摘要（批次数 + 内容哈希）"""
+    payload = "\x00".join(batches).encode("utf-8")
+    return f"{len(batches)}:{hashlib.sha1(payload).hexdigest()}"
+
+
+CASES = make_cases()
+EXPECTED = json.loads(FIXTURE.read_text(encoding="utf-8"))
+
+
+def test_fixture_matches_case_count():
+    assert len(EXPECTED) == CASE_COUNT
+
+
+def test_cases_cover_all_formats_and_modes():
+    seen = {(kw["format_type"], kw["mode"]) for _, kw in CASES}
+    assert seen == {(f, m) for f in FORMATS for m in MODES}
+
+
+@pytest.mark.parametrize("index", range(CASE_COUNT))
+def test_batches_match_legacy_output(index):
+    report_data, kwargs = CASES[index]
+    batches = split_content_into_batches(report_data, get_time_func=_fixed_time, **kwargs)
+    assert batches_digest(batches) == EXPECTED[index], kwargs
+
+
+@pytest.mark.parametrize("index", range(0, CASE_COUNT, 4))
+def test_report_document_input_matches_legacy_output(index):
+    report_data, kwargs = CASES[index]
+    doc_data, rss_items, rss_new_items = build_report_document(
+        report_data, kwargs["rss_items"], kwargs["rss_new_items"]
+    )
+    batches = split_content_into_batches(
+        doc_data,
+        get_time_func=_fixed_time,
+        **dict(kwargs, rss_items=rss_items, rss_new_items=rss_new_items),
+    )
+    assert batches_digest(batches) == EXPECTED[index], kwargs
@@ -0,0 +1,115 @@
+# coding=utf-8
+"""新闻事件聚类（MinHash / LSH）测试"""
+
+from array import array
+
+from trendradar.utils.story import (
+    LSH_BANDS,
+    LSH_ROWS,
+    NUM_PERM,
+    StoryIndex,
+    minhash_signature,
+    normalize_title,
+    signature_from_bytes,
+    signature_similarity,
+    signature_to_bytes,
+    title_shingles,
+)
+
+
+def test_normalize_and_shingles():
+    assert normalize_title(" OpenAI 发布 GPT-5！") == "openai发布gpt5"
+    assert normalize_title("") == ""
+    assert title_shingles("AB") == {"ab"}
+    assert title_shingles("abc") == {"ab", "bc"}
+    assert title_shingles("！？") == set()
+
+
+def test_signature_is_stable_and_ignores_punctuation():
+    sig = minhash_signature("华为发布新款手机")
+    assert len(sig) == NUM_PERM
+    assert sig == minhash_signature("华为 发布 新款手机！")
+    assert minhash_signature("") is None
+    assert minhash_signature("……") is None
+
+
+def test_similarity_estimates_jaccard():
+    a = minhash_signature("华为发布新款折叠屏手机")
+    b = minhash_signature("华为发布新款折叠屏手机引热议")
+    c = minhash_signature("美联储宣布降息25个基点")
+    assert signature_similarity(a, a) == 1.0
+    assert signature_similarity(a, b) > signature_similarity(a, c)
+    assert signature_similarity(a, None) == 0.0
+    assert signature_similarity(a, a[:-1]) == 0.0
+
+
+def test_signature_bytes_roundtrip():
+    sig = minhash_signature("标题")
+    assert signature_from_bytes(signature_to_bytes(sig)) == sig
+    assert signature_to_bytes(None) is None
+    assert signature_from_bytes(b"") is None
+    assert signature_from_bytes(b"\x00" * 8) is None
+
+
+def _signature_with_band(band, value):
+    """只有指定分段与 value 相同，其余位置各不相同的签名"""
+    sig = array("I", range(1000 + band * 100, 1000 + band * 100 + NUM_PERM))
+    for row in range(LSH_ROWS):
+        sig[band * LSH_ROWS + row] = value
+    return sig
+
+
+def test_candidates_require_a_shared_band():
+    index = StoryIndex()
+    base = array("I", [7] * NUM_PERM)
+    index.add(1, 1, base)
+
+    assert index.candidates(_signature_with_band(3, 7)) == {1}
+
+    # 每个分段都只有一行相同，不构成候选
+    half = array("I", range(5000, 5000 + NUM_PERM))
+    for band in range(LSH_BANDS):
+        half[band * LSH_ROWS] = 7
+    assert index.candidates(half) == set()
+    assert index.candidates(None) == set()
+
+
+def test_band_position_matters():
+    index = StoryIndex()
+    index.add(1, 1, _signature_with_band(0, 42))
+    # 值相同但位于不同分段
+    assert index.candidates(_signature_with_band(1, 42)) == set()
+
+
+def test_query_checks_similarity_threshold():
+    index = StoryIndex(threshold=0.5)
+    index.add(1, 1, array("I", [7] * NUM_PERM))
+    # 共享一个分段但相似度只有 2/32
+    assert index.query(_signature_with_band(0, 7)) is None
+
+
+def test_assign_keeps_story_ids_stable():
+    index = StoryIndex()
+    first = minhash_signature("华为发布新款折叠屏手机")
+    similar = minhash_signature("华为发布新款折叠屏手机引热议")
+    other = minhash_signature("美联储宣布降息25个基点")
+
+    assert index.assign(10, first) == 10
+    assert index.assign(11, similar) == 10
+    assert index.assign(12, other) == 12
+    assert index.assign(13, None) == 13
+    assert len(index) == 3
+
+
+def test_query_prefers_best_then_smallest_story():
+    index = StoryIndex(threshold=0.1)
+    sig = array("I", [7] * NUM_PERM)
+    index.add(1, 5, sig)
+    index.add(2, 3, sig)
+    assert index.query(sig) == 3
+
+    # 相似度更高的事件优先于更小的 story_id
+    partial = array("I", [7] * (NUM_PERM // 2)) + array("I", range(100, 100 + NUM_PERM // 2))
+    index.add(3, 1, partial)
+    assert signature_similarity(sig, partial) == 0.5
+    assert index.query(sig) == 3
@@ -0,0 +1,104 @@
+# coding=utf-8
+"""
+标题输出器回归测试
+
+format_title_for_platform 改为按 TITLE_EMITTERS 表输出后，结果必须与原先
+逐平台分支的实现逐字节一致，无论传入的是原始标题字典还是中间文档的 ReportItem。
+
+fixtures/legacy_titles.json 记录了旧实现（引入 TITLE_EMITTERS 之前的 formatter.py 和
+helpers.py）对下面同一组随机标题的输出摘要；生成器使用固定种子，修改 _make_title
+会使摘要失效，需要用旧实现重新生成。
+"""
+
+import hashlib
+import json
+import random
+from pathlib import Path
+
+import pytest
+
+from trendradar.report.document import ReportItem
+from trendradar.report.formatter import format_title_for_platform
+from trendradar.report.helpers import format_rank_display
+
+
+FIXTURE = Path(__file__).parent / "fixtures" / "legacy_titles.json"
+
+SEED = 11
+CASE_COUNT = 300
+
+PLATFORMS = ["feishu", "dingtalk", "wework", "bark", "telegram", "ntfy", "slack", "html", "email"]
+FLAGS = [(True, False), (False, True), (False, False), (True, True)]
+WORDS = ["AI", "芯片", "<b>粗体</b>", "A&B", '"引号"', "🔥热点", "多  空格", "换行\n标题", " 首尾 "]
+
+
+def _make_title(rnd, i):
+    title = {
+        "title": rnd.choice(WORDS) + f" 标题 {i} " + rnd.choice(WORDS),
+        "source_name": rnd.choice(["知乎", "微博", "H&N", "<百度>"]),
+        "url": rnd.choice(["", f"https://e.com/{i}?a=1&b=2"]),
+        "mobile_url": rnd.choice(["", f"https://m.e.com/{i}"]),
+        "ranks": [rnd.randint(1, 30) for _ in range(rnd.randint(0, 4))],
+        "rank_threshold": rnd.choice([0, 5, 10, 20]),
+        "time_display": rnd.choice(["", "10:00~12:00", "[10:00 ~ 12:00]"]),
+        "count": rnd.randint(1, 4),
+    }
+    if rnd.random() < 0.5:
+        title["is_new"] = rnd.random() < 0.5
+    if rnd.random() < 0.7:
+        title["matched_keyword"] = rnd.choice(["AI", "芯片 / 华为", "<kw>", ""])
+    return title
+
+
+def make_cases():
+    """按固定种子生成全部用例（顺序固定，与 fixture 一一对应）"""
+    rnd = random.Random(SEED)
+    return [_make_title(rnd, i) for i in range(CASE_COUNT)]
+
+
+def render_case(title_data):
+    """一条标题在所有平台和显示选项下的输出"""
+    outputs = []
+    for platform in PLATFORMS:
+        outputs.append(format_rank_display(title_data["ranks"], title_data["rank_threshold"], platform))
+        for show_source, show_keyword in FLAGS:
+            outputs.append(format_title_for_platform(platform, title_data, show_source, show_keyword))
+    return outputs
+
+
+def outputs_digest(outputs):
+    payload = "\x00".join(outputs).encode("utf-8")
+    return hashlib.sha1(payload).hexdigest()
+
+
+CASES = make_cases()
+EXPECTED = json.loads(FIXTURE.read_text(encoding="utf-8"))
+
+
+def test_fixture_matches_case_count():
+    assert len(EXPECTED) == CASE_COUNT
+
+
+@pytest.mark.parametrize("index", range(CASE_COUNT))
+def test_dict_titles_match_legacy_output(index):
+    assert outputs_digest(render_case(CASES[index])) == EXPECTED[index], CASES[index]
+
+
+@pytest.mark.parametrize("index", range(CASE_COUNT))
+def test_report_items_match_legacy_output(index):
+    item = ReportItem(CASES[index])
+    assert outputs_digest(render_case(item)) == EXPECTED[index], CASES[index]
+
+
+def test_report_item_recomputes_after_title_change():
+    title_data = dict(CASES[0])
+    item = ReportItem(title_data)
+    # 写入标题、链接、排名后重新计算预计算字段，与直接使用修改后的字典一致
+    item["title"] = "翻译后的 <标题>"
+    item["mobile_url"] = ""
+    item["ranks"] = [3, 1]
+    expected = dict(title_data, title="翻译后的 <标题>", mobile_url="", ranks=[3, 1])
+
+    assert render_case(item) == render_case(expected)
+    # 原标题数据不被修改
+    assert title_data == CASES[0]
@@ -4,10 +4,14 @@ TrendRadar 主程序
 
 热点新闻聚合与分析工具
 支持: python -m trendradar
+常驻模式: python -m trendradar --daemon（按 CRON_SCHEDULE 调度，见 trendradar.daemon）
 """
 
 import os
+import sys
+import time
 import webbrowser
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional
 
@@ -15,14 +19,27 @@ import requests
 
 from trendradar.context import AppContext
 from trendradar import __version__
-from trendradar.core import load_config
+from trendradar.core import load_config, shutdown_classify_pool
 from trendradar.core.analyzer import convert_keyword_stats_to_platform_stats
-from trendradar.crawler import DataFetcher
+from trendradar.crawler import DataFetcher, AdaptiveScheduler, CircuitBreaker, ProxyPool, hedge_delays
+from trendradar.notification import get_http_client, get_smtp_pool
+from trendradar.report import compute_render_digest
 from trendradar.storage import convert_crawl_results_to_news_data
 from trendradar.utils.time import is_within_days
 from trendradar.ai import AIAnalyzer, AIAnalysisResult
 
 
+def release_shared_resources() -> None:
+    """
+    关闭进程内共享的资源（单次运行结束或常驻模式退出时调用）
+
+    包括分类进程池、已登录的 SMTP 会话和推送 HTTP 会话；常驻模式下它们在各次运行间复用。
+    """
+    shutdown_classify_pool()
+    get_smtp_pool().close()
+    get_http_client().close()
+
+
 def check_version_update(
     current_version: str, version_url: str, proxy_url: Optional[str] = None
 ) -> Tuple[bool, Optional[str]]:
@@ -93,7 +110,11 @@ class NewsAnalyzer:
         },
     }
 
-    def __init__(self):
+    def __init__(self, daemon: bool = False):
+        """
+        Args:
+            daemon: 是否运行在常驻模式（由 trendradar.daemon 多次调用 run）
+        """
         # 加载配置
         print("正在加载配置...")
         config = load_config()
@@ -109,10 +130,16 @@ class NewsAnalyzer:
         self.rank_threshold = self.ctx.rank_threshold
         self.is_github_actions = os.environ.get("GITHUB_ACTIONS") == "true"
         self.is_docker_container = self._detect_docker_environment()
+        self.is_daemon = daemon
         self.update_info = None
         self.proxy_url = None
+        self.proxy_pool = None
         self._setup_proxy()
-        self.data_fetcher = DataFetcher(self.proxy_url)
+        self.data_fetcher = DataFetcher(self.proxy_url, proxy_pool=self.proxy_pool)
+        # RSS 请求会话，在多次运行之间复用
+        self.rss_session = None
+        # 本次运行熔断跳过的来源（报告失败列表中标注"熔断中"）
+        self.circuit_open_ids: List[str] = []
 
         # 初始化存储管理器（使用 AppContext）
         self._init_storage_manager()
@@ -150,13 +177,23 @@ class NewsAnalyzer:
 
     def _should_open_browser(self) -> bool:
         """判断是否应该打开浏览器"""
-        return not self.is_github_actions and not self.is_docker_container
+        return not self.is_github_actions and not self.is_docker_container and not self.is_daemon
 
     def _setup_proxy(self) -> None:
         """设置代理配置"""
         if not self.is_github_actions and self.ctx.config["USE_PROXY"]:
             self.proxy_url = self.ctx.config["DEFAULT_PROXY"]
-            print("本地环境，使用代理")
+            pool_config = self.ctx.config.get("PROXY_POOL", {})
+            if pool_config.get("PROXIES"):
+                self.proxy_pool = ProxyPool(
+                    pool_config["PROXIES"],
+                    max_concurrency=pool_config.get("MAX_CONCURRENCY", 4),
+                    failure_threshold=pool_config.get("FAILURE_THRESHOLD", 3),
+                    demote_seconds=pool_config.get("DEMOTE_SECONDS", 300),
+                )
+                print(f"本地环境，使用代理池（{len(self.proxy_pool)} 个代理）")
+            else:
+                print("本地环境，使用代理")
         elif not self.is_github_actions and not self.ctx.config["USE_PROXY"]:
             print("本地环境，未启用代理")
         else:
@@ -419,8 +456,8 @@ class NewsAnalyzer:
 
                 # 用于显示的排名范围：合并历史排名和当前排名
                 historical_ranks = meta.get("ranks", []) if meta else []
-                # 合并去重，保持顺序
-                all_ranks = historical_ranks.copy()
+                # 合并去重，保持顺序（历史排名可能是 array，统一转为列表）
+                all_ranks = list(historical_ranks)
                 for rank in current_ranks:
                     if rank not in all_ranks:
                         all_ranks.append(rank)
@@ -529,6 +566,9 @@ class NewsAnalyzer:
                 self.ctx.weight_config,
                 self.ctx.rank_threshold,
             )
+        elif stats and self.ctx.config.get("DISPLAY", {}).get("HEAT_TREND", False):
+            # keyword 模式：附加词组的小时热度走势（读取入库时维护的热度汇总）
+            self._attach_heat_trend(stats, word_groups)
 
         # AI 分析（如果启用，用于 HTML 报告）
         ai_result = None
@@ -556,10 +596,79 @@ class NewsAnalyzer:
                 rss_new_items=rss_new_items,
                 ai_analysis=ai_result,
                 standalone_data=standalone_data,
+                circuit_open_ids=self.circuit_open_ids,
             )
 
         return stats, html_file, ai_result
 
+    def _attach_heat_trend(self, stats: List[Dict], word_groups: List[Dict]) -> None:
+        """
+        为词组统计附加当天的小时热度走势（stat["heat_trend"]）
+
+        Args:
+            stats: 词组统计结果
+            word_groups: 词组配置列表
+        """
+        rows = self.storage_manager.get_keyword_heat(
+            self.ctx.format_date(), keyword_type="group"
+        )
+        if not rows:
+            return
+
+        # 按词组、小时合并各平台的热度
+        heat_by_group: Dict[str, Dict[str, List]] = {}
+        hours = set()
+        for row in rows:
+            hours.add(row["hour"])
+            group_heat = heat_by_group.setdefault(row["keyword"], {})
+            entry = group_heat.setdefault(row["hour"], [0, 0.0])
+            entry[0] += row["count"] or 0
+            entry[1] += row["weight_sum"] or 0
+
+        first_hour, last_hour = int(min(hours)), int(max(hours))
+        display_to_group_key = {
+            (group.get("display_name") or group["group_key"]): group["group_key"]
+            for group in word_groups
+        }
+
+        for stat in stats:
+            group_key = display_to_group_key.get(stat["word"], stat["word"])
+            group_heat = heat_by_group.get(group_key)
+            if not group_heat:
+                continue
+            stat["heat_trend"] = [
+                {
+                    "hour": f"{hour:02d}",
+                    "count": group_heat.get(f"{hour:02d}", [0, 0.0])[0],
+                    "weight": round(group_heat.get(f"{hour:02d}", [0, 0.0])[1], 1),
+                }
+                for hour in range(first_hour, last_hour + 1)
+            ]
+
+    @staticmethod
+    def _content_signature(groups: Optional[List[Dict]]) -> List:
+        """
+        分组内容的条目标识（分组名 + 来源、标题、链接），不含排名、次数和时间，与排序无关
+
+        Args:
+            groups: 分组列表（热榜 / RSS 统计分组、新增分组或独立展示区的平台 / 订阅源）
+
+        Returns:
+            可序列化的排序列表
+        """
+        signature = []
+        for group in groups or []:
+            name = group.get("word") or group.get("source_name") or group.get("name") or group.get("id", "")
+            items = group.get("titles") or group.get("items") or []
+            signature.append([
+                name,
+                sorted(
+                    [item.get("source_name", ""), item.get("title", ""), item.get("url", "")]
+                    for item in items
+                ),
+            ])
+        return sorted(signature)
+
     def _send_notification_if_needed(
         self,
         stats: List[Dict],
@@ -622,6 +731,35 @@ class NewsAnalyzer:
                     else:
                         print(f"推送窗口控制：今天首次推送")
 
+            # 准备报告数据
+            report_data = self.ctx.prepare_report(
+                stats, failed_ids, new_titles, id_to_name, mode,
+                circuit_open_ids=self.circuit_open_ids,
+            )
+
+            # 是否发送版本更新信息
+            update_info_to_send = self.update_info if cfg["SHOW_VERSION_UPDATE"] else None
+
+            # 推送条目与该模式当天上次推送相同（没有新内容）时跳过，不再做 AI 分析和消息分批
+            # 日期参与摘要，每天的第一次推送不受前一天影响
+            # 只比较条目本身（排名、次数和时间每次抓取都会变化）；AI 分析结果由同样的数据生成，不参与比较
+            push_digest = None
+            if cfg.get("SKIP_UNCHANGED_PUSH", False):
+                push_digest = compute_render_digest(
+                    self.ctx.format_date(),
+                    report_type,
+                    self._content_signature(report_data["stats"]),
+                    self._content_signature(report_data["new_titles"]),
+                    self._content_signature(rss_items),
+                    self._content_signature(rss_new_items),
+                    self._content_signature((standalone_data or {}).get("platforms")),
+                    self._content_signature((standalone_data or {}).get("rss_feeds")),
+                    update_info_to_send,
+                )
+                if self.ctx.get_render_state(mode).get("push_digest") == push_digest:
+                    print("[推送] 推送内容与上次推送相同，跳过推送")
+                    return False
+
             # AI 分析：优先使用传入的结果，避免重复分析
             if ai_result is None:
                 ai_config = cfg.get("AI_ANALYSIS", {})
@@ -630,14 +768,12 @@ class NewsAnalyzer:
                         stats, rss_items, mode, report_type, id_to_name
                     )
 
-            # 准备报告数据
-            report_data = self.ctx.prepare_report(stats, failed_ids, new_titles, id_to_name, mode)
-
-            # 是否发送版本更新信息
-            update_info_to_send = self.update_info if cfg["SHOW_VERSION_UPDATE"] else None
-
             # 使用 NotificationDispatcher 发送到所有渠道（合并热榜+RSS+AI分析+独立展示区）
-            dispatcher = self.ctx.create_notification_dispatcher()
+            # 启用通知发件箱时，批次先写入发件箱，在运行结束前统一投递
+            # 启用增量推送时，各渠道只推送台账中没有的条目
+            outbox = self.ctx.create_notification_outbox(self.proxy_url)
+            ledger = self.ctx.create_push_ledger()
+            dispatcher = self.ctx.create_notification_dispatcher(outbox=outbox, ledger=ledger)
             results = dispatcher.dispatch_all(
                 report_data=report_data,
                 report_type=report_type,
@@ -650,12 +786,15 @@ class NewsAnalyzer:
                 ai_analysis=ai_result,
                 standalone_data=standalone_data,
             )
+            # 发件箱、推送台账在分发过程中的写入统一上传一次
+            if outbox is not None or ledger is not None:
+                self.ctx.get_storage_manager().flush_uploads()
 
             if not results:
                 print("未配置任何通知渠道，跳过通知发送")
                 return False
 
-            # 如果成功发送了任何通知，且启用了每天只推一次，则记录推送
+            # 如果成功发送了任何通知（启用发件箱时为成功写入发件箱），且启用了每天只推一次，则记录推送
             if (
                 cfg["PUSH_WINDOW"]["ENABLED"]
                 and cfg["PUSH_WINDOW"]["ONCE_PER_DAY"]
@@ -664,6 +803,15 @@ class NewsAnalyzer:
                 push_manager = self.ctx.create_push_manager()
                 push_manager.record_push(report_type)
 
+            # 所有渠道都成功时才记录推送摘要：部分渠道失败时下次仍需推送相同内容，
+            # 否则失败的渠道会因内容未变化被跳过
+            if push_digest is not None:
+                if all(results.values()):
+                    self.ctx.update_render_state(mode, push_digest=push_digest)
+                else:
+                    failed = [channel for channel, ok in results.items() if not ok]
+                    print(f"[推送] 渠道 {', '.join(failed)} 推送失败，不记录推送摘要，下次运行将重新推送")
+
             return True
 
         elif cfg["ENABLE_NOTIFICATION"] and not has_notification:
@@ -712,10 +860,91 @@ class NewsAnalyzer:
         print(f"报告模式: {self.report_mode}")
         print(f"运行模式: {mode_strategy['description']}")
 
+    def _split_due_sources(
+        self, source_ids: List[str], activity_loader, log_prefix: str
+    ) -> Tuple[List[str], List[str]]:
+        """
+        按自适应调度将来源分为本次到期和未到期两组
+
+        Args:
+            source_ids: 来源 ID 列表
+            activity_loader: 读取当天抓取活动的函数
+            log_prefix: 日志前缀
+
+        Returns:
+            (到期的来源 ID 列表, 未到期的来源 ID 列表)；未启用调度时全部到期
+        """
+        schedule_config = self.ctx.config.get("SCHEDULE", {})
+        if not schedule_config.get("ENABLED", False) or not source_ids:
+            return source_ids, []
+
+        scheduler = AdaptiveScheduler(
+            min_interval=schedule_config.get("MIN_INTERVAL", 30),
+            max_interval=schedule_config.get("MAX_INTERVAL", 180),
+        )
+        now = self.ctx.get_time()
+        due_ids, not_due = scheduler.split_due(
+            source_ids, activity_loader(), now.hour * 60 + now.minute
+        )
+
+        if not_due:
+            details = ", ".join(f"{source_id}（{minutes} 分钟后）" for source_id, minutes in not_due.items())
+            print(f"{log_prefix} 未到期，本次跳过 {len(not_due)} 个来源（沿用上次数据）: {details}")
+
+        return due_ids, list(not_due.keys())
+
+    def _split_open_circuits(
+        self, source_ids: List[str], health_loader, log_prefix: str
+    ) -> Tuple[List[str], List[str]]:
+        """
+        按来源熔断状态过滤本次抓取的来源
+
+        Args:
+            source_ids: 来源 ID 列表
+            health_loader: 读取当天抓取健康状况的函数
+            log_prefix: 日志前缀
+
+        Returns:
+            (放行的来源 ID 列表（含探测）, 熔断跳过的来源 ID 列表)；未启用熔断时全部放行
+        """
+        breaker_config = self.ctx.config.get("CIRCUIT_BREAKER", {})
+        if not breaker_config.get("ENABLED", False) or not source_ids:
+            return source_ids, []
+
+        breaker = CircuitBreaker(
+            failure_threshold=breaker_config.get("FAILURE_THRESHOLD", 3),
+            probe_interval=breaker_config.get("PROBE_INTERVAL", 30),
+            max_probe_interval=breaker_config.get("MAX_PROBE_INTERVAL", 240),
+        )
+        now = self.ctx.get_time()
+        allowed_ids, opened = breaker.split(
+            source_ids, health_loader(), now.hour * 60 + now.minute
+        )
+
+        if opened:
+            details = ", ".join(f"{source_id}（{minutes} 分钟后探测）" for source_id, minutes in opened.items())
+            print(f"{log_prefix} 连续失败已熔断，本次跳过 {len(opened)} 个来源: {details}")
+
+        return allowed_ids, list(opened.keys())
+
     def _crawl_data(self) -> Tuple[Dict, Dict, List]:
         """执行数据爬取"""
+        allowed_ids, open_ids = self._split_open_circuits(
+            [platform["id"] for platform in self.ctx.platforms],
+            self.storage_manager.get_source_health,
+            "[熔断]",
+        )
+        due_ids, not_due_ids = self._split_due_sources(
+            allowed_ids,
+            self.storage_manager.get_source_activity,
+            "[调度]",
+        )
+        due_set = set(due_ids)
+
         ids = []
         for platform in self.ctx.platforms:
+            if platform["id"] not in due_set:
+                continue
             if "name" in platform:
                 ids.append((platform["id"], platform["name"]))
             else:
@@ -727,8 +956,15 @@ class NewsAnalyzer:
         print(f"开始爬取数据，请求间隔 {self.request_interval} 毫秒")
         Path("output").mkdir(parents=True, exist_ok=True)
 
+        hedge_after = None
+        if self.ctx.config.get("HEDGE_REQUESTS", False):
+            hedge_after = hedge_delays(self.storage_manager.get_source_latency())
+
         results, id_to_name, failed_ids = self.data_fetcher.crawl_websites(
-            ids, self.request_interval
+            ids,
+            self.request_interval,
+            deadline=self.ctx.config.get("CRAWL_DEADLINE", 0),
+            hedge_after=hedge_after,
         )
 
         # 转换为 NewsData 格式并保存到存储后端
@@ -737,6 +973,14 @@ class NewsAnalyzer:
         news_data = convert_crawl_results_to_news_data(
             results, id_to_name, failed_ids, crawl_time, crawl_date
         )
+        news_data.not_due_ids = not_due_ids
+        news_data.latencies = self.data_fetcher.last_latencies
+
+        # 入库时按频率词组汇总关键词小时热度
+        try:
+            self.storage_manager.set_keyword_groups(*self.ctx.load_frequency_words())
+        except FileNotFoundError:
+            pass
 
         # 保存到存储后端（SQLite）
         if self.storage_manager.save_news_data(news_data):
@@ -752,6 +996,9 @@ class NewsAnalyzer:
             title_file = self.ctx.save_titles(results, id_to_name, failed_ids)
             print(f"标题已保存到: {title_file}")
 
+        # 熔断跳过的平台不写入抓取状态（避免拉长探测间隔），只在报告的失败列表中标注
+        self.circuit_open_ids.extend(open_ids)
+
         return results, id_to_name, failed_ids
 
     def _crawl_rss_data(self) -> Tuple[Optional[List[Dict]], Optional[List[Dict]], Optional[List[Dict]]]:
@@ -801,6 +1048,7 @@ class NewsAnalyzer:
                     max_items=feed_config.get("max_items", 50),
                     enabled=feed_config.get("enabled", True),
                     max_age_days=max_age_days,  # None=使用全局，0=禁用，>0=覆盖
+                    timeout=feed_config.get("timeout"),  # None=使用全局
                 )
                 if feed.id and feed.url and feed.enabled:
                     feeds.append(feed)
@@ -809,6 +1057,23 @@ class NewsAnalyzer:
                 print("[RSS] 没有启用的 RSS 源")
                 return None, None, None
 
+            # 来源熔断：跳过连续失败的源
+            allowed_ids, open_ids = self._split_open_circuits(
+                [feed.id for feed in feeds],
+                self.storage_manager.get_rss_source_health,
+                "[RSS]",
+            )
+            self.circuit_open_ids.extend(open_ids)
+
+            # 自适应调度：跳过未到期的源
+            due_ids, not_due_ids = self._split_due_sources(
+                allowed_ids,
+                self.storage_manager.get_rss_source_activity,
+                "[RSS]",
+            )
+            due_set = set(due_ids)
+            feeds = [feed for feed in feeds if feed.id in due_set]
+
             # 创建抓取器
             rss_config = self.ctx.rss_config
             # RSS 代理：优先使用 RSS 专属代理，否则使用爬虫默认代理
@@ -829,10 +1094,32 @@ class NewsAnalyzer:
                 timezone=timezone,
                 freshness_enabled=freshness_enabled,
                 default_max_age_days=default_max_age_days,
+                max_workers=rss_config.get("MAX_WORKERS", 4),
+                # 当天上次成功抓取的 ETag / Last-Modified，用于条件请求
+                validators=self.storage_manager.get_rss_feed_validators(),
+                # 当天已保存的条目只标记在列表中，不再完整解析
+                seen_urls=self.storage_manager.get_rss_seen_urls(),
+                skip_stale_entries=freshness_config.get("SKIP_ON_FETCH", False),
+                stream_threshold_kb=rss_config.get("STREAM_THRESHOLD_KB", 0),
+                deadline=rss_config.get("DEADLINE", 0),
+                # 对冲等待时间：各源当天成功请求的 p90 延迟
+                hedge_after=(
+                    hedge_delays(self.storage_manager.get_rss_source_latency())
+                    if rss_config.get("HEDGE_REQUESTS", False) else None
+                ),
+                # 未设置 RSS 专属代理时使用共享代理池
+                proxy_pool=(
+                    self.proxy_pool
+                    if rss_config.get("USE_PROXY", False) and not rss_config.get("PROXY_URL", "")
+                    else None
+                ),
+                session=self.rss_session,
             )
+            self.rss_session = fetcher.session
 
             # 抓取数据
             rss_data = fetcher.fetch_all()
+            rss_data.not_due_ids = not_due_ids
 
             # 保存到存储后端
             if self.storage_manager.save_rss_data(rss_data):
@@ -884,6 +1171,7 @@ class NewsAnalyzer:
         timezone = self.ctx.timezone
         max_news_per_keyword = self.ctx.config.get("MAX_NEWS_PER_KEYWORD", 0)
         sort_by_position_first = self.ctx.config.get("SORT_BY_POSITION_FIRST", False)
+        classify_config = self.ctx.config.get("CLASSIFY")
 
         rss_stats = None
         rss_new_stats = None
@@ -934,6 +1222,7 @@ class NewsAnalyzer:
                 timezone=timezone,
                 rank_threshold=self.rank_threshold,
                 quiet=False,
+                classify_config=classify_config,
             )
             if not rss_stats:
                 print("[RSS] 增量模式：关键词匹配后没有内容")
@@ -958,6 +1247,7 @@ class NewsAnalyzer:
                 timezone=timezone,
                 rank_threshold=self.rank_threshold,
                 quiet=False,
+                classify_config=classify_config,
             )
             if not rss_stats:
                 print("[RSS] 当前榜单模式：关键词匹配后没有内容")
@@ -977,6 +1267,7 @@ class NewsAnalyzer:
                     timezone=timezone,
                     rank_threshold=self.rank_threshold,
                     quiet=True,
+                    classify_config=classify_config,
                 )
 
         else:
@@ -997,6 +1288,7 @@ class NewsAnalyzer:
                 timezone=timezone,
                 rank_threshold=self.rank_threshold,
                 quiet=False,
+                classify_config=classify_config,
             )
             if not rss_stats:
                 print("[RSS] 当日汇总模式：关键词匹配后没有内容")
@@ -1016,6 +1308,7 @@ class NewsAnalyzer:
                     timezone=timezone,
                     rank_threshold=self.rank_threshold,
                     quiet=True,
+                    classify_config=classify_config,
                 )
 
         return rss_stats, rss_new_stats, raw_rss_items
@@ -1311,39 +1604,106 @@ class NewsAnalyzer:
 
         return html_file
 
-    def run(self) -> None:
-        """执行分析流程"""
+    @staticmethod
+    def _run_timed_stage(name: str, func):
+        """执行流程中的一个阶段并输出耗时"""
+        start = time.monotonic()
+        try:
+            return func()
+        finally:
+            print(f"[耗时] {name}: {time.monotonic() - start:.1f} 秒")
+
+    def deliver_pending_notifications(self) -> Optional[Dict[str, int]]:
+        """
+        投递通知发件箱中到期的批次（包括之前运行未投递完的批次）
+
+        Returns:
+            投递统计 {"sent", "failed", "pending"}，未启用发件箱时返回 None
+        """
+        outbox = self.ctx.create_notification_outbox(self.proxy_url)
+        if outbox is None:
+            return None
+        return outbox.drain(timeout=self.ctx.config["OUTBOX"]["DRAIN_TIMEOUT"])
+
+    def run(self, keep_warm: bool = False) -> None:
+        """
+        执行分析流程
+
+        Args:
+            keep_warm: 结束后保留数据库连接和远程存储缓存（常驻模式使用）
+        """
         try:
             self._initialize_and_check_config()
 
             mode_strategy = self._get_mode_strategy()
 
-            # 抓取热榜数据
-            results, id_to_name, failed_ids = self._crawl_data()
+            # 热榜和 RSS 访问不同的主机、写入不同的数据库，两个抓取阶段并行执行：
+            # RSS 在后台线程中抓取，热榜在当前线程中抓取，全部完成后再进入分析推送
+            # 熔断跳过的热榜平台和 RSS 源（两个抓取阶段分别追加）
+            self.circuit_open_ids = []
+
+            crawl_start = time.monotonic()
+            with ThreadPoolExecutor(max_workers=1, thread_name_prefix="rss-crawl") as executor:
+                # 抓取 RSS 数据（如果启用），返回统计条目、新增条目和原始条目
+                rss_future = (
+                    executor.submit(self._run_timed_stage, "RSS 抓取", self._crawl_rss_data)
+                    if self.ctx.rss_enabled else None
+                )
 
-            # 抓取 RSS 数据（如果启用），返回统计条目、新增条目和原始条目
-            rss_items, rss_new_items, raw_rss_items = self._crawl_rss_data()
+                # 抓取热榜数据
+                results, id_to_name, failed_ids = self._run_timed_stage("热榜抓取", self._crawl_data)
+
+                rss_items, rss_new_items, raw_rss_items = (
+                    rss_future.result() if rss_future is not None else (None, None, None)
+                )
+            print(f"[耗时] 抓取阶段合计: {time.monotonic() - crawl_start:.1f} 秒")
+
+            # 熔断跳过的来源加入报告的失败列表，渲染时标注"熔断中"
+            failed_ids = failed_ids + [
+                source_id for source_id in self.circuit_open_ids if source_id not in failed_ids
+            ]
+
+            if self.proxy_pool is not None:
+                for stat in self.proxy_pool.stats():
+                    latency = f"{stat['latency_ms']}ms" if stat["latency_ms"] is not None else "-"
+                    demoted = "，已降级" if stat["demoted"] else ""
+                    print(f"[代理池] {stat['url']}: 请求 {stat['requests']} 次，"
+                          f"失败 {stat['failures']} 次，平均延迟 {latency}{demoted}")
 
             # 执行模式策略，传递 RSS 数据用于合并推送
-            self._execute_mode_strategy(
-                mode_strategy, results, id_to_name, failed_ids,
-                rss_items=rss_items, rss_new_items=rss_new_items,
-                raw_rss_items=raw_rss_items
+            self._run_timed_stage(
+                "分析与推送",
+                lambda: self._execute_mode_strategy(
+                    mode_strategy, results, id_to_name, failed_ids,
+                    rss_items=rss_items, rss_new_items=rss_new_items,
+                    raw_rss_items=raw_rss_items
+                ),
             )
 
+            if self.ctx.config["OUTBOX"]["ENABLED"]:
+                self._run_timed_stage("发件箱投递", self.deliver_pending_notifications)
+
         except Exception as e:
             print(f"分析流程执行出错: {e}")
             if self.ctx.config.get("DEBUG", False):
                 raise
         finally:
             # 清理资源（包括过期数据清理和数据库连接关闭）
-            self.ctx.cleanup()
+            self.ctx.cleanup(keep_connections=keep_warm)
+            if not keep_warm:
+                release_shared_resources()
 
 
 def main():
     """主程序入口"""
     debug_mode = False
     try:
+        # 常驻模式：单个进程按内置调度多次运行（docker RUN_MODE=daemon）
+        if "--daemon" in sys.argv[1:]:
+            from trendradar.daemon import run_daemon
+            run_daemon()
+            return
+
         analyzer = NewsAnalyzer()
         # 获取 debug 配置
         debug_mode = analyzer.ctx.config.get("DEBUG", False)
@@ -276,7 +276,8 @@ class AIAnalyzer:
                 if word and titles:
                     news_lines.append(f"\n**{word}** ({len(titles)}条)")
                     for t in titles:
-                        if not isinstance(t, dict):
+                        # 标题条目可能是字典或 MatchedTitle（字典兼容的匹配视图）
+                        if not hasattr(t, "get"):
                             continue
                         title = t.get("title", "")
                         if not title:
@@ -333,7 +334,8 @@ class AIAnalyzer:
                 if word and titles:
                     rss_lines.append(f"\n**{word}** ({len(titles)}条)")
                     for t in titles:
-                        if not isinstance(t, dict):
+                        # 标题条目可能是字典或 MatchedTitle（字典兼容的匹配视图）
+                        if not hasattr(t, "get"):
                             continue
                         title = t.get("title", "")
                         if not title:
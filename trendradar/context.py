@@ -5,9 +5,11 @@
 提供配置上下文类，封装所有依赖配置的操作，消除全局状态和包装函数。
 """
 
+import os
+import threading
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 from trendradar.utils.time import (
     get_configured_time,
@@ -28,14 +30,19 @@ from trendradar.report import (
     clean_title,
     prepare_report_data,
     generate_html_report,
-    render_html_content,
+    iter_html_content,
+    load_render_state,
+    save_render_state,
 )
 from trendradar.notification import (
     render_feishu_content,
     render_dingtalk_content,
     split_content_into_batches,
     NotificationDispatcher,
+    NotificationOutbox,
+    PushLedger,
     PushRecordManager,
+    collect_secrets,
 )
 from trendradar.ai import AITranslator
 from trendradar.storage import get_storage_manager
@@ -72,6 +79,10 @@ class AppContext:
         """
         self.config = config
         self._storage_manager = None
+        # 频率词缓存 {文件路径: (修改时间, 解析结果)}，常驻模式下文件未修改时不再重新解析
+        self._frequency_cache: Dict[str, Tuple[int, Tuple[List[Dict], List[str], List[str]]]] = {}
+        # 热榜和 RSS 在不同线程中抓取、入库，都会读取频率词
+        self._frequency_lock = threading.Lock()
 
     # === 配置访问 ===
 
@@ -218,8 +229,23 @@ class AppContext:
     def load_frequency_words(
         self, frequency_file: Optional[str] = None
     ) -> Tuple[List[Dict], List[str], List[str]]:
-        """加载频率词配置"""
-        return load_frequency_words(frequency_file)
+        """加载频率词配置（按文件修改时间缓存）"""
+        if frequency_file is None:
+            frequency_file = os.environ.get("FREQUENCY_WORDS_PATH", "config/frequency_words.txt")
+        try:
+            mtime = os.stat(frequency_file).st_mtime_ns
+        except OSError:
+            # 文件不存在时交给 load_frequency_words 抛出 FileNotFoundError
+            return load_frequency_words(frequency_file)
+
+        with self._frequency_lock:
+            cached = self._frequency_cache.get(frequency_file)
+            if cached is not None and cached[0] == mtime:
+                return cached[1]
+
+            result = load_frequency_words(frequency_file)
+            self._frequency_cache[frequency_file] = (mtime, result)
+            return result
 
     def matches_word_groups(
         self,
@@ -262,6 +288,8 @@ class AppContext:
             is_first_crawl_func=self.is_first_crawl,
             convert_time_func=self.convert_time_display,
             quiet=quiet,
+            collapse_same_story=self.config.get("COLLAPSE_SAME_STORY", False),
+            classify_config=self.config.get("CLASSIFY"),
         )
 
     # === 报告生成 ===
@@ -273,6 +301,7 @@ class AppContext:
         new_titles: Optional[Dict] = None,
         id_to_name: Optional[Dict] = None,
         mode: str = "daily",
+        circuit_open_ids: Optional[List[str]] = None,
     ) -> Dict:
         """准备报告数据"""
         return prepare_report_data(
@@ -285,6 +314,7 @@ class AppContext:
             matches_word_groups_func=self.matches_word_groups,
             load_frequency_words_func=self.load_frequency_words,
             show_new_section=self.show_new_section,
+            circuit_open_ids=circuit_open_ids,
         )
 
     def generate_html(
@@ -300,6 +330,7 @@ class AppContext:
         rss_new_items: Optional[List[Dict]] = None,
         ai_analysis: Optional[Any] = None,
         standalone_data: Optional[Dict] = None,
+        circuit_open_ids: Optional[List[str]] = None,
     ) -> str:
         """生成HTML报告"""
         return generate_html_report(
@@ -314,11 +345,29 @@ class AppContext:
             output_dir="output",
             date_folder=self.format_date(),
             time_filename=self.format_time(),
-            render_html_func=lambda *args, **kwargs: self.render_html(*args, rss_items=rss_items, rss_new_items=rss_new_items, ai_analysis=ai_analysis, standalone_data=standalone_data, **kwargs),
+            render_html_func=lambda *args, **kwargs: self.iter_html(*args, rss_items=rss_items, rss_new_items=rss_new_items, ai_analysis=ai_analysis, standalone_data=standalone_data, **kwargs),
             matches_word_groups_func=self.matches_word_groups,
             load_frequency_words_func=self.load_frequency_words,
+            render_inputs={
+                "rss_items": rss_items,
+                "rss_new_items": rss_new_items,
+                "ai_analysis": ai_analysis,
+                "standalone_data": standalone_data,
+                "region_order": self.region_order,
+                "display_mode": self.display_mode,
+                "show_new_section": self.show_new_section,
+            },
+            circuit_open_ids=circuit_open_ids,
         )
 
+    def get_render_state(self, mode: str) -> Dict:
+        """读取模式的渲染状态（上次渲染 / 推送的摘要）"""
+        return load_render_state("output", mode)
+
+    def update_render_state(self, mode: str, **updates: Any) -> None:
+        """更新模式的渲染状态"""
+        save_render_state("output", mode, **updates)
+
     def render_html(
         self,
         report_data: Dict,
@@ -331,7 +380,27 @@ class AppContext:
         standalone_data: Optional[Dict] = None,
     ) -> str:
         """渲染HTML内容"""
-        return render_html_content(
+        return "".join(self.iter_html(
+            report_data, total_titles, mode, update_info,
+            rss_items=rss_items,
+            rss_new_items=rss_new_items,
+            ai_analysis=ai_analysis,
+            standalone_data=standalone_data,
+        ))
+
+    def iter_html(
+        self,
+        report_data: Dict,
+        total_titles: int,
+        mode: str = "daily",
+        update_info: Optional[Dict] = None,
+        rss_items: Optional[List[Dict]] = None,
+        rss_new_items: Optional[List[Dict]] = None,
+        ai_analysis: Optional[Any] = None,
+        standalone_data: Optional[Dict] = None,
+    ) -> Iterator[str]:
+        """逐段生成HTML内容（生成报告文件时使用）"""
+        return iter_html_content(
             report_data=report_data,
             total_titles=total_titles,
             mode=mode,
@@ -441,8 +510,59 @@ class AppContext:
 
     # === 通知发送 ===
 
-    def create_notification_dispatcher(self) -> NotificationDispatcher:
-        """创建通知调度器"""
+    def create_notification_outbox(self, proxy_url: Optional[str] = None) -> Optional[NotificationOutbox]:
+        """
+        创建通知发件箱
+
+        Args:
+            proxy_url: 投递使用的代理 URL
+
+        Returns:
+            NotificationOutbox，未启用时返回 None
+        """
+        outbox_config = self.config.get("OUTBOX", {})
+        if not outbox_config.get("ENABLED", False):
+            return None
+
+        return NotificationOutbox(
+            storage_backend=self.get_storage_manager(),
+            secrets=collect_secrets(self.config),
+            proxy_url=proxy_url,
+            max_attempts=outbox_config.get("MAX_ATTEMPTS", 8),
+            backoff_base=outbox_config.get("BACKOFF_BASE", 30),
+            backoff_max=outbox_config.get("BACKOFF_MAX", 3600),
+            max_workers=self.config.get("NOTIFICATION_WORKERS", 4),
+            get_time_func=self.get_time,
+        )
+
+    def create_push_ledger(self) -> Optional[PushLedger]:
+        """
+        创建推送台账
+
+        Returns:
+            PushLedger，未启用增量推送时返回 None
+        """
+        delta_config = self.config.get("DELTA_PUSH", {})
+        if not delta_config.get("ENABLED", False):
+            return None
+
+        return PushLedger(
+            storage_backend=self.get_storage_manager(),
+            rank_change=delta_config.get("RANK_CHANGE", 5),
+        )
+
+    def create_notification_dispatcher(
+        self,
+        outbox: Optional[NotificationOutbox] = None,
+        ledger: Optional[PushLedger] = None,
+    ) -> NotificationDispatcher:
+        """
+        创建通知调度器
+
+        Args:
+            outbox: 通知发件箱（可选，提供时热榜推送写入发件箱）
+            ledger: 推送台账（可选，提供时只推送新增或排名明显变化的条目）
+        """
         # 创建翻译器（如果启用）
         translator = None
         trans_config = self.config.get("AI_TRANSLATION", {})
@@ -455,6 +575,8 @@ class AppContext:
             get_time_func=self.get_time,
             split_content_func=self.split_content,
             translator=translator,
+            outbox=outbox,
+            ledger=ledger,
         )
 
     def create_push_manager(self) -> PushRecordManager:
@@ -466,9 +588,19 @@ class AppContext:
 
     # === 资源清理 ===
 
-    def cleanup(self):
-        """清理资源"""
-        if self._storage_manager:
+    def cleanup(self, keep_connections: bool = False):
+        """
+        清理资源
+
+        Args:
+            keep_connections: 只清理过期数据，保留存储管理器及其数据库连接（常驻模式使用）
+
+        进程内共享的 SMTP 会话、推送 HTTP 会话和分类进程池不属于单个上下文，
+        由 release_shared_resources() 在进程结束前关闭。
+        """
+        if self._storage_manager and keep_connections:
+            self._storage_manager.cleanup_old_data()
+        elif self._storage_manager:
             self._storage_manager.cleanup_old_data()
             self._storage_manager.cleanup()
             self._storage_manager = None
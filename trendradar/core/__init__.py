@@ -10,7 +10,12 @@ from trendradar.core.config import (
     get_account_at_index,
 )
 from trendradar.core.loader import load_config
-from trendradar.core.frequency import load_frequency_words, matches_word_groups
+from trendradar.core.frequency import (
+    load_frequency_words,
+    matches_word_groups,
+    find_matching_group_index,
+)
+from trendradar.core.parallel import classify_titles, classify_workers, shutdown_classify_pool
 from trendradar.core.data import (
     save_titles_to_file,
     read_all_today_titles_from_storage,
@@ -18,8 +23,10 @@ from trendradar.core.data import (
     detect_latest_new_titles_from_storage,
     detect_latest_new_titles,
 )
+from trendradar.core.records import TitleRecord, MatchedTitle
 from trendradar.core.analyzer import (
     calculate_news_weight,
+    calculate_momentum_score,
     format_time_display,
     count_word_frequency,
     count_rss_frequency,
@@ -33,14 +40,22 @@ __all__ = [
     "load_config",
     "load_frequency_words",
     "matches_word_groups",
+    "find_matching_group_index",
+    "classify_titles",
+    "classify_workers",
+    "shutdown_classify_pool",
     # 数据处理
     "save_titles_to_file",
     "read_all_today_titles_from_storage",
     "read_all_today_titles",
     "detect_latest_new_titles_from_storage",
     "detect_latest_new_titles",
+    # 紧凑标题记录
+    "TitleRecord",
+    "MatchedTitle",
     # 统计分析
     "calculate_news_weight",
+    "calculate_momentum_score",
     "format_time_display",
     "count_word_frequency",
     "count_rss_frequency",
@@ -4,13 +4,155 @@
 
 提供新闻统计和分析功能：
 - calculate_news_weight: 计算新闻权重
+- calculate_momentum_score: 计算排名上升势头得分
 - format_time_display: 格式化时间显示
 - count_word_frequency: 统计词频
 """
 
 from typing import Dict, List, Tuple, Optional, Callable
 
-from trendradar.core.frequency import matches_word_groups, _word_matches
+from trendradar.core.frequency import find_matching_group_index
+from trendradar.core.parallel import classify_titles, classify_workers
+from trendradar.core.records import MatchedTitle, TitleRecord
+
+
+def _resolve_title_record(
+    title: str,
+    source_id: str,
+    source_name: str,
+    title_data: Dict,
+    info: Optional[Dict],
+) -> TitleRecord:
+    """
+    获取标题对应的 TitleRecord
+
+    从存储读取的数据中，title_data 与 info 是同一个 TitleRecord，直接按引用复用；
+    其他来源（当前抓取结果、新增标题等普通字典）按原有合并规则构建一条新记录。
+
+    Args:
+        title: 标题
+        source_id: 来源 ID
+        source_name: 来源名称
+        title_data: 抓取结果中的标题数据
+        info: title_info 中的标题统计信息（可选）
+
+    Returns:
+        TitleRecord: 标题记录
+    """
+    if (
+        isinstance(info, TitleRecord)
+        and info.ranks
+        and info.source_name == source_name
+    ):
+        return info
+
+    ranks = title_data.get("ranks", []) or []
+    url = title_data.get("url", "")
+    mobile_url = title_data.get("mobileUrl", "")
+    first_time = ""
+    last_time = ""
+    count = 1
+    rank_timeline = None
+    story_id = title_data.get("story_id")
+    momentum = title_data.get("momentum")
+
+    if info:
+        first_time = info.get("first_time", "")
+        last_time = info.get("last_time", "")
+        count = info.get("count", 1)
+        if "ranks" in info and info["ranks"]:
+            ranks = info["ranks"]
+        url = info.get("url", url)
+        mobile_url = info.get("mobileUrl", mobile_url)
+        rank_timeline = info.get("rank_timeline", [])
+        story_id = info.get("story_id", story_id)
+        momentum = info.get("momentum", momentum)
+
+    if not ranks:
+        ranks = [99]
+
+    return TitleRecord(
+        title=title,
+        source_id=source_id,
+        source_name=source_name,
+        url=url,
+        mobile_url=mobile_url,
+        first_time=first_time,
+        last_time=last_time,
+        count=count,
+        ranks=ranks,
+        rank_timeline=rank_timeline,
+        story_id=story_id,
+        momentum=momentum,
+    )
+
+
+def _collapse_same_story(titles: List) -> Tuple[List, int]:
+    """
+    合并同一事件（story_id 相同）的重复新闻
+
+    titles 已按权重排好序，每个事件只保留排在最前的一条，
+    被合并条目的来源名称记录到保留条目的 story_sources 中。
+
+    Args:
+        titles: 排序后的标题列表
+
+    Returns:
+        Tuple[List, int]: (合并后的标题列表, 被合并的条数)
+    """
+    kept = []
+    story_heads = {}
+    collapsed = 0
+
+    for item in titles:
+        story_id = item.get("story_id")
+        if story_id is None:
+            kept.append(item)
+            continue
+
+        head = story_heads.get(story_id)
+        if head is None:
+            story_heads[story_id] = item
+            kept.append(item)
+            continue
+
+        sources = head.get("story_sources") or []
+        source_name = item.get("source_name", "")
+        if source_name and source_name not in sources and source_name != head.get("source_name"):
+            head["story_sources"] = sources + [source_name]
+        collapsed += 1
+
+    return kept, collapsed
+
+
+def calculate_momentum_score(momentum) -> float:
+    """
+    计算排名上升势头得分（0-100）
+
+    上升速度（每次抓取上升的名次，封顶 10 名）和最大爬升幅度（封顶 50 名）
+    各占一半，再按在榜时长衰减（在榜 6 小时后减半），刚冲上来的新闻得分最高。
+
+    Args:
+        momentum: 排名动量（RankMomentum 或同名键的字典），None 表示没有动量数据
+
+    Returns:
+        float: 势头得分
+    """
+    if not momentum:
+        return 0.0
+
+    if isinstance(momentum, dict):
+        velocity = momentum.get("velocity", 0.0)
+        max_climb = momentum.get("max_climb", 0)
+        age_minutes = momentum.get("age_minutes", 0)
+    else:
+        velocity = momentum.velocity
+        max_climb = momentum.max_climb
+        age_minutes = momentum.age_minutes
+
+    score = min(max(velocity, 0.0), 10.0) * 5 + min(max(max_climb, 0), 50)
+    freshness = 1.0 / (1.0 + max(age_minutes, 0) / 360.0)
+    return score * freshness
 
 
 def calculate_news_weight(
@@ -22,9 +164,9 @@ def calculate_news_weight(
     计算新闻权重，用于排序
 
     Args:
-        title_data: 标题数据，包含 ranks 和 count
+        title_data: 标题数据，包含 ranks 和 count（可选 momentum）
         rank_threshold: 排名阈值
-        weight_config: 权重配置 {RANK_WEIGHT, FREQUENCY_WEIGHT, HOTNESS_WEIGHT}
+        weight_config: 权重配置 {RANK_WEIGHT, FREQUENCY_WEIGHT, HOTNESS_WEIGHT[, MOMENTUM_WEIGHT]}
 
     Returns:
         float: 计算出的权重值
@@ -57,6 +199,11 @@ def calculate_news_weight(
         + hotness_weight * weight_config["HOTNESS_WEIGHT"]
     )
 
+    # 上升势头加成（可选）：排名快速上升的新闻排在停滞的高位新闻前面
+    momentum_factor = weight_config.get("MOMENTUM_WEIGHT", 0)
+    if momentum_factor:
+        total_weight += calculate_momentum_score(title_data.get("momentum")) * momentum_factor
+
     return total_weight
 
 
@@ -103,6 +250,8 @@ def count_word_frequency(
     is_first_crawl_func: Optional[Callable[[], bool]] = None,
     convert_time_func: Optional[Callable[[str], str]] = None,
     quiet: bool = False,
+    collapse_same_story: bool = False,
+    classify_config: Optional[Dict] = None,
 ) -> Tuple[List[Dict], int]:
     """
     统计词频，支持必须词、频率词、过滤词、全局过滤词，并标记新增标题
@@ -123,6 +272,8 @@ def count_word_frequency(
         is_first_crawl_func: 检测是否是当天第一次爬取的函数
         convert_time_func: 时间格式转换函数
         quiet: 是否静默模式（不打印日志）
+        collapse_same_story: 是否合并同一事件的跨平台重复新闻（依赖入库时分配的 story_id）
+        classify_config: 并行分类配置（可选，{"WORKERS": 进程数, "MIN_ITEMS": 启用阈值}）
 
     Returns:
         Tuple[List[Dict], int]: (统计结果列表, 总标题数)
@@ -221,22 +372,39 @@ def count_word_frequency(
         group_key = group["group_key"]
         word_stats[group_key] = {"count": 0, "titles": {}}
 
+    # 标题数量很大时按平台分片并行匹配（未启用或失败时为 None，逐条匹配）
+    # 只有走并行路径时才复制标题列表作为分片
+    group_index_map = None
+    if classify_workers(classify_config, sum(len(t) for t in results_to_process.values())):
+        group_index_map = classify_titles(
+            {source_id: list(titles_data) for source_id, titles_data in results_to_process.items()},
+            word_groups,
+            filter_words,
+            global_filters,
+            classify_config,
+        )
+
     for source_id, titles_data in results_to_process.items():
         total_titles += len(titles_data)
 
         if source_id not in processed_titles:
             processed_titles[source_id] = {}
 
-        for title, title_data in titles_data.items():
+        source_group_indexes = group_index_map.get(source_id) if group_index_map else None
+
+        for title_idx, (title, title_data) in enumerate(titles_data.items()):
             if title in processed_titles.get(source_id, {}):
                 continue
 
-            # 使用统一的匹配逻辑
-            matches_frequency_words = matches_word_groups(
-                title, word_groups, filter_words, global_filters
-            )
+            # 使用统一的匹配逻辑，找到匹配的词组
+            if source_group_indexes is not None:
+                group_idx = source_group_indexes[title_idx]
+            else:
+                group_idx = find_matching_group_index(
+                    title, word_groups, filter_words, global_filters
+                )
 
-            if not matches_frequency_words:
+            if group_idx < 0:
                 continue
 
             # 如果是增量模式或 current 模式第一次，统计匹配的新增新闻数量
@@ -245,123 +413,38 @@ def count_word_frequency(
             ):
                 matched_new_count += 1
 
-            source_ranks = title_data.get("ranks", [])
-            source_url = title_data.get("url", "")
-            source_mobile_url = title_data.get("mobileUrl", "")
-
-            # 找到匹配的词组（防御性转换确保类型安全）
-            title_lower = str(title).lower() if not isinstance(title, str) else title.lower()
-            for group in word_groups:
-                required_words = group["required"]
-                normal_words = group["normal"]
-
-                # 如果是"全部新闻"模式，所有标题都匹配第一个（唯一的）词组
-                if len(word_groups) == 1 and word_groups[0]["group_key"] == "全部新闻":
-                    group_key = group["group_key"]
-                    word_stats[group_key]["count"] += 1
-                    if source_id not in word_stats[group_key]["titles"]:
-                        word_stats[group_key]["titles"][source_id] = []
-                else:
-                    # 原有的匹配逻辑（支持正则语法）
-                    if required_words:
-                        all_required_present = all(
-                            _word_matches(req_item, title_lower)
-                            for req_item in required_words
-                        )
-                        if not all_required_present:
-                            continue
-
-                    if normal_words:
-                        any_normal_present = any(
-                            _word_matches(normal_item, title_lower)
-                            for normal_item in normal_words
-                        )
-                        if not any_normal_present:
-                            continue
-
-                    group_key = group["group_key"]
-                    word_stats[group_key]["count"] += 1
-                    if source_id not in word_stats[group_key]["titles"]:
-                        word_stats[group_key]["titles"][source_id] = []
-
-                first_time = ""
-                last_time = ""
-                count_info = 1
-                ranks = source_ranks if source_ranks else []
-                url = source_url
-                mobile_url = source_mobile_url
-                rank_timeline = []
-
-                # 对于 current 模式，从历史统计信息中获取完整数据
-                if (
-                    mode == "current"
-                    and title_info
-                    and source_id in title_info
-                    and title in title_info[source_id]
-                ):
-                    info = title_info[source_id][title]
-                    first_time = info.get("first_time", "")
-                    last_time = info.get("last_time", "")
-                    count_info = info.get("count", 1)
-                    if "ranks" in info and info["ranks"]:
-                        ranks = info["ranks"]
-                    url = info.get("url", source_url)
-                    mobile_url = info.get("mobileUrl", source_mobile_url)
-                    rank_timeline = info.get("rank_timeline", [])
-                elif (
-                    title_info
-                    and source_id in title_info
-                    and title in title_info[source_id]
-                ):
-                    info = title_info[source_id][title]
-                    first_time = info.get("first_time", "")
-                    last_time = info.get("last_time", "")
-                    count_info = info.get("count", 1)
-                    if "ranks" in info and info["ranks"]:
-                        ranks = info["ranks"]
-                    url = info.get("url", source_url)
-                    mobile_url = info.get("mobileUrl", source_mobile_url)
-                    rank_timeline = info.get("rank_timeline", [])
-
-                if not ranks:
-                    ranks = [99]
-
-                time_display = format_time_display(first_time, last_time, convert_time_func)
-
-                source_name = id_to_name.get(source_id, source_id)
-
-                # 判断是否为新增
-                is_new = False
-                if all_news_are_new:
-                    # 增量模式下所有处理的新闻都是新增，或者当天第一次的所有新闻都是新增
-                    is_new = True
-                elif new_titles and source_id in new_titles:
-                    # 检查是否在新增列表中
-                    new_titles_for_source = new_titles[source_id]
-                    is_new = title in new_titles_for_source
-
-                word_stats[group_key]["titles"][source_id].append(
-                    {
-                        "title": title,
-                        "source_name": source_name,
-                        "first_time": first_time,
-                        "last_time": last_time,
-                        "time_display": time_display,
-                        "count": count_info,
-                        "ranks": ranks,
-                        "rank_threshold": rank_threshold,
-                        "url": url,
-                        "mobileUrl": mobile_url,
-                        "is_new": is_new,
-                        "rank_timeline": rank_timeline,
-                    }
-                )
+            group_key = word_groups[group_idx]["group_key"]
+            word_stats[group_key]["count"] += 1
+            if source_id not in word_stats[group_key]["titles"]:
+                word_stats[group_key]["titles"][source_id] = []
+
+            source_name = id_to_name.get(source_id, source_id)
 
-                if source_id not in processed_titles:
-                    processed_titles[source_id] = {}
-                processed_titles[source_id][title] = True
+            # 解析共享的标题记录（存储读取的数据直接复用，不再复制）
+            info = title_info.get(source_id, {}).get(title) if title_info else None
+            record = _resolve_title_record(
+                title, source_id, source_name, title_data, info
+            )
+
+            time_display = format_time_display(
+                record.first_time, record.last_time, convert_time_func
+            )
+
+            # 判断是否为新增
+            is_new = False
+            if all_news_are_new:
+                # 增量模式下所有处理的新闻都是新增，或者当天第一次的所有新闻都是新增
+                is_new = True
+            elif new_titles and source_id in new_titles:
+                # 检查是否在新增列表中
+                new_titles_for_source = new_titles[source_id]
+                is_new = title in new_titles_for_source
+
+            word_stats[group_key]["titles"][source_id].append(
+                MatchedTitle(record, time_display, rank_threshold, is_new)
+            )
 
-                break
+            processed_titles[source_id][title] = True
 
     # 最后统一打印汇总信息
     if mode == "incremental":
@@ -445,6 +528,12 @@ def count_word_frequency(
             ),
         )
 
+        # 合并同一事件的跨平台重复新闻（保留权重最高的一条）
+        group_count = data["count"]
+        if collapse_same_story:
+            sorted_titles, collapsed = _collapse_same_story(sorted_titles)
+            group_count -= collapsed
+
         # 应用最大显示数量限制（优先级：单独配置 > 全局配置）
         group_max_count = group_key_to_max_count.get(group_key, 0)
         if group_max_count == 0:
@@ -460,11 +549,11 @@ def count_word_frequency(
         stats.append(
             {
                 "word": display_word,
-                "count": data["count"],
+                "count": group_count,
                 "position": group_key_to_position.get(group_key, 999),
                 "titles": sorted_titles,
                 "percentage": (
-                    round(data["count"] / total_titles * 100, 2)
+                    round(group_count / total_titles * 100, 2)
                     if total_titles > 0
                     else 0
                 ),
@@ -499,6 +588,7 @@ def count_rss_frequency(
     timezone: str = "Asia/Shanghai",
     rank_threshold: int = 5,
     quiet: bool = False,
+    classify_config: Optional[Dict] = None,
 ) -> Tuple[List[Dict], int]:
     """
     按关键词分组统计 RSS 条目（与热榜统计格式一致）
@@ -518,6 +608,7 @@ def count_rss_frequency(
         sort_by_position_first: 是否优先按配置位置排序
         timezone: 时区名称（用于时间格式化）
         quiet: 是否静默模式
+        classify_config: 并行分类配置（可选，{"WORKERS": 进程数, "MIN_ITEMS": 启用阈值}）
 
     Returns:
         Tuple[List[Dict], int]: (统计结果列表, 总条目数)
@@ -581,7 +672,31 @@ def count_rss_frequency(
     )
     url_to_rank = {item.get("url", ""): idx + 1 for idx, item in enumerate(sorted_items)}
 
-    for item in rss_items:
+    # 条目数量很大时按 RSS 源分片并行匹配（未启用或失败时逐条匹配）
+    shard_positions: Dict[str, List[int]] = {}
+    shard_indexes = None
+    if classify_workers(classify_config, total_items):
+        for idx, item in enumerate(rss_items):
+            shard_positions.setdefault(item.get("feed_id", ""), []).append(idx)
+        shard_indexes = classify_titles(
+            {
+                feed_id: [rss_items[idx].get("title", "") for idx in positions]
+                for feed_id, positions in shard_positions.items()
+            },
+            word_groups,
+            filter_words,
+            global_filters,
+            classify_config,
+            log_prefix="[RSS]",
+        )
+    item_group_indexes: Optional[List[int]] = None
+    if shard_indexes is not None:
+        item_group_indexes = [-1] * total_items
+        for feed_id, positions in shard_positions.items():
+            for idx, group_idx in zip(positions, shard_indexes[feed_id]):
+                item_group_indexes[idx] = group_idx
+
+    for item_idx, item in enumerate(rss_items):
         title = item.get("title", "")
         url = item.get("url", "")
 
@@ -591,67 +706,42 @@ def count_rss_frequency(
         if url:
             processed_urls.add(url)
 
-        # 使用统一的匹配逻辑
-        if not matches_word_groups(title, word_groups, filter_words, global_filters):
-            continue
+        # 使用统一的匹配逻辑，找到匹配的词组（一个条目只匹配第一个词组）
+        if item_group_indexes is not None:
+            group_idx = item_group_indexes[item_idx]
+        else:
+            group_idx = find_matching_group_index(
+                title, word_groups, filter_words, global_filters
+            )
 
-        # 找到匹配的词组
-        title_lower = title.lower()
-        for group in word_groups:
-            required_words = group["required"]
-            normal_words = group["normal"]
-            group_key = group["group_key"]
+        if group_idx < 0:
+            continue
 
-            # "全部 RSS" 模式：所有条目都匹配
-            if len(word_groups) == 1 and word_groups[0]["group_key"] == "全部 RSS":
-                matched = True
-            else:
-                # 检查必须词（支持正则语法）
-                if required_words:
-                    all_required_present = all(
-                        _word_matches(req_item, title_lower)
-                        for req_item in required_words
-                    )
-                    if not all_required_present:
-                        continue
-
-                # 检查普通词（支持正则语法）
-                if normal_words:
-                    any_normal_present = any(
-                        _word_matches(normal_item, title_lower)
-                        for normal_item in normal_words
-                    )
-                    if not any_normal_present:
-                        continue
-
-                matched = True
-
-            if matched:
-                word_stats[group_key]["count"] += 1
-
-                # 格式化时间显示
-                published_at = item.get("published_at", "")
-                time_display = format_iso_time_friendly(published_at, timezone, include_date=True) if published_at else ""
-
-                # 判断是否为新增
-                is_new = url in new_urls if url else False
-
-                # 获取排名（基于发布时间顺序）
-                rank = url_to_rank.get(url, 99) if url else 99
-
-                title_data = {
-                    "title": title,
-                    "source_name": item.get("feed_name", item.get("feed_id", "RSS")),
-                    "time_display": time_display,
-                    "count": 1,  # RSS 条目通常只出现一次
-                    "ranks": [rank],
-                    "rank_threshold": rank_threshold,
-                    "url": url,
-                    "mobile_url": "",
-                    "is_new": is_new,
-                }
-                word_stats[group_key]["titles"].append(title_data)
-                break  # 一个条目只匹配第一个词组
+        group_key = word_groups[group_idx]["group_key"]
+        word_stats[group_key]["count"] += 1
+
+        # 格式化时间显示
+        published_at = item.get("published_at", "")
+        time_display = format_iso_time_friendly(published_at, timezone, include_date=True) if published_at else ""
+
+        # 判断是否为新增
+        is_new = url in new_urls if url else False
+
+        # 获取排名（基于发布时间顺序）
+        rank = url_to_rank.get(url, 99) if url else 99
+
+        title_data = {
+            "title": title,
+            "source_name": item.get("feed_name", item.get("feed_id", "RSS")),
+            "time_display": time_display,
+            "count": 1,  # RSS 条目通常只出现一次
+            "ranks": [rank],
+            "rank_threshold": rank_threshold,
+            "url": url,
+            "mobile_url": "",
+            "is_new": is_new,
+        }
+        word_stats[group_key]["titles"].append(title_data)
 
     # 构建统计结果
     stats = []
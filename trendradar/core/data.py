@@ -13,6 +13,8 @@ Author: TrendRadar Team
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional, Callable
 
+from trendradar.core.records import TitleRecord
+
 
 def save_titles_to_file(
     results: Dict,
@@ -96,6 +98,7 @@ def read_all_today_titles_from_storage(
 
     Returns:
         Tuple[Dict, Dict, Dict]: (all_results, id_to_name, title_info)
+        all_results 和 title_info 中的值是同一个 TitleRecord 对象
     """
     try:
         news_data = storage_manager.get_today_all_data()
@@ -120,29 +123,14 @@ def read_all_today_titles_from_storage(
                 all_results[source_id] = {}
                 title_info[source_id] = {}
 
-            for item in news_list:
-                title = item.title
-                ranks = getattr(item, 'ranks', [item.rank])
-                first_time = getattr(item, 'first_time', item.crawl_time)
-                last_time = getattr(item, 'last_time', item.crawl_time)
-                count = getattr(item, 'count', 1)
-                rank_timeline = getattr(item, 'rank_timeline', [])
+            source_results = all_results[source_id]
+            source_info = title_info[source_id]
 
-                all_results[source_id][title] = {
-                    "ranks": ranks,
-                    "url": item.url or "",
-                    "mobileUrl": item.mobile_url or "",
-                }
-
-                title_info[source_id][title] = {
-                    "first_time": first_time,
-                    "last_time": last_time,
-                    "count": count,
-                    "ranks": ranks,
-                    "url": item.url or "",
-                    "mobileUrl": item.mobile_url or "",
-                    "rank_timeline": rank_timeline,
-                }
+            for item in news_list:
+                # all_results 与 title_info 共享同一条紧凑记录，不再各自复制字典
+                record = TitleRecord.from_news_item(item, source_name)
+                source_results[item.title] = record
+                source_info[item.title] = record
 
         return all_results, final_id_to_name, title_info
 
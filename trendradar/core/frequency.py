@@ -300,3 +300,44 @@ def matches_word_groups(
         return True
 
     return False
+
+
+def find_matching_group_index(
+    title: str,
+    word_groups: List[Dict],
+    filter_words: List,
+    global_filters: Optional[List[str]] = None
+) -> int:
+    """
+    查找标题匹配的第一个词组
+
+    过滤规则与 matches_word_groups 一致，一个标题只归入第一个匹配的词组。
+
+    Args:
+        title: 标题文本
+        word_groups: 词组列表
+        filter_words: 过滤词列表
+        global_filters: 全局过滤词列表
+
+    Returns:
+        匹配词组的下标，不匹配返回 -1
+    """
+    if not matches_word_groups(title, word_groups, filter_words, global_filters):
+        return -1
+
+    title_lower = str(title).lower() if not isinstance(title, str) else title.lower()
+    for idx, group in enumerate(word_groups):
+        required_words = group["required"]
+        normal_words = group["normal"]
+
+        if required_words:
+            if not all(_word_matches(req_item, title_lower) for req_item in required_words):
+                continue
+
+        if normal_words:
+            if not any(_word_matches(normal_item, title_lower) for normal_item in normal_words):
+                continue
+
+        return idx
+
+    return -1
@@ -61,6 +61,22 @@ def _load_app_config(config_data: Dict) -> Dict:
     }
 
 
+def _load_proxy_pool_config(pool_config: Dict) -> Dict:
+    """加载代理池配置"""
+    pool_config = pool_config or {}
+    proxies_env = _get_env_str("PROXY_POOL")
+    proxies = (
+        [p.strip() for p in proxies_env.split(",") if p.strip()]
+        if proxies_env else pool_config.get("proxies", []) or []
+    )
+    return {
+        "PROXIES": proxies,
+        "MAX_CONCURRENCY": pool_config.get("max_concurrency", 4),
+        "FAILURE_THRESHOLD": pool_config.get("failure_threshold", 3),
+        "DEMOTE_SECONDS": pool_config.get("demote_seconds", 300),
+    }
+
+
 def _load_crawler_config(config_data: Dict) -> Dict:
     """加载爬虫配置"""
     advanced = config_data.get("advanced", {})
@@ -70,6 +86,9 @@ def _load_crawler_config(config_data: Dict) -> Dict:
         "REQUEST_INTERVAL": crawler_config.get("request_interval", 100),
         "USE_PROXY": crawler_config.get("use_proxy", False),
         "DEFAULT_PROXY": crawler_config.get("default_proxy", ""),
+        "CRAWL_DEADLINE": crawler_config.get("deadline", 0),
+        "HEDGE_REQUESTS": crawler_config.get("hedge_requests", False),
+        "PROXY_POOL": _load_proxy_pool_config(crawler_config.get("proxy_pool", {})),
         "ENABLE_CRAWLER": platforms_config.get("enabled", True),
     }
 
@@ -88,6 +107,7 @@ def _load_report_config(config_data: Dict) -> Dict:
         "RANK_THRESHOLD": report_config.get("rank_threshold", 10),
         "SORT_BY_POSITION_FIRST": sort_by_position_env if sort_by_position_env is not None else report_config.get("sort_by_position_first", False),
         "MAX_NEWS_PER_KEYWORD": max_news_env or report_config.get("max_news_per_keyword", 0),
+        "COLLAPSE_SAME_STORY": report_config.get("collapse_same_story", False),
     }
 
 
@@ -99,6 +119,7 @@ def _load_notification_config(config_data: Dict) -> Dict:
 
     return {
         "ENABLE_NOTIFICATION": notification.get("enabled", True),
+        "SKIP_UNCHANGED_PUSH": notification.get("skip_unchanged", False),
         "MESSAGE_BATCH_SIZE": batch_size.get("default", 4000),
         "DINGTALK_BATCH_SIZE": batch_size.get("dingtalk", 20000),
         "FEISHU_BATCH_SIZE": batch_size.get("feishu", 29000),
@@ -107,6 +128,33 @@ def _load_notification_config(config_data: Dict) -> Dict:
         "BATCH_SEND_INTERVAL": advanced.get("batch_send_interval", 1.0),
         "FEISHU_MESSAGE_SEPARATOR": advanced.get("feishu_message_separator", "---"),
         "MAX_ACCOUNTS_PER_CHANNEL": _get_env_int("MAX_ACCOUNTS_PER_CHANNEL") or advanced.get("max_accounts_per_channel", 3),
+        "NOTIFICATION_WORKERS": advanced.get("notification_workers", 4),
+        "CHANNEL_TIMEOUT": advanced.get("channel_timeout", 300),
+    }
+
+
+def _load_outbox_config(config_data: Dict) -> Dict:
+    """加载通知发件箱配置"""
+    advanced = config_data.get("advanced", {})
+    outbox = advanced.get("outbox", {})
+    enabled_env = _get_env_bool("NOTIFICATION_OUTBOX")
+    return {
+        "ENABLED": enabled_env if enabled_env is not None else outbox.get("enabled", False),
+        "MAX_ATTEMPTS": outbox.get("max_attempts", 8),
+        "BACKOFF_BASE": outbox.get("backoff_base", 30),
+        "BACKOFF_MAX": outbox.get("backoff_max", 3600),
+        "DRAIN_TIMEOUT": outbox.get("drain_timeout", 120),
+    }
+
+
+def _load_delta_push_config(config_data: Dict) -> Dict:
+    """加载增量推送配置"""
+    notification = config_data.get("notification", {})
+    delta_push = notification.get("delta_push", {})
+    enabled_env = _get_env_bool("DELTA_PUSH")
+    return {
+        "ENABLED": enabled_env if enabled_env is not None else delta_push.get("enabled", False),
+        "RANK_CHANGE": delta_push.get("rank_change", 5),
     }
 
 
@@ -136,6 +184,41 @@ def _load_weight_config(config_data: Dict) -> Dict:
         "RANK_WEIGHT": weight.get("rank", 0.6),
         "FREQUENCY_WEIGHT": weight.get("frequency", 0.3),
         "HOTNESS_WEIGHT": weight.get("hotness", 0.1),
+        "MOMENTUM_WEIGHT": weight.get("momentum", 0.0),
+    }
+
+
+def _load_classify_config(config_data: Dict) -> Dict:
+    """加载并行分类配置"""
+    advanced = config_data.get("advanced", {})
+    classify = advanced.get("classify", {})
+    return {
+        "WORKERS": _get_env_int("CLASSIFY_WORKERS") or classify.get("workers", 0),
+        "MIN_ITEMS": classify.get("min_items", 5000),
+    }
+
+
+def _load_schedule_config(config_data: Dict) -> Dict:
+    """加载自适应抓取调度配置"""
+    advanced = config_data.get("advanced", {})
+    schedule = advanced.get("schedule", {})
+    enabled_env = _get_env_bool("ADAPTIVE_SCHEDULE")
+    return {
+        "ENABLED": enabled_env if enabled_env is not None else schedule.get("enabled", False),
+        "MIN_INTERVAL": schedule.get("min_interval", 30),
+        "MAX_INTERVAL": schedule.get("max_interval", 180),
+    }
+
+
+def _load_circuit_breaker_config(config_data: Dict) -> Dict:
+    """加载来源熔断配置"""
+    advanced = config_data.get("advanced", {})
+    breaker = advanced.get("circuit_breaker", {})
+    return {
+        "ENABLED": breaker.get("enabled", False),
+        "FAILURE_THRESHOLD": breaker.get("failure_threshold", 3),
+        "PROBE_INTERVAL": breaker.get("probe_interval", 30),
+        "MAX_PROBE_INTERVAL": breaker.get("max_probe_interval", 240),
     }
 
 
@@ -168,12 +251,17 @@ def _load_rss_config(config_data: Dict) -> Dict:
         "ENABLED": rss.get("enabled", False),
         "REQUEST_INTERVAL": advanced_rss.get("request_interval", 2000),
         "TIMEOUT": advanced_rss.get("timeout", 15),
+        "MAX_WORKERS": advanced_rss.get("max_workers", 4),
+        "STREAM_THRESHOLD_KB": advanced_rss.get("stream_threshold_kb", 0),
+        "DEADLINE": advanced_rss.get("deadline", 0),
+        "HEDGE_REQUESTS": advanced_rss.get("hedge_requests", False),
         "USE_PROXY": advanced_rss.get("use_proxy", False),
         "PROXY_URL": rss_proxy_url,
         "FEEDS": rss.get("feeds", []),
         "FRESHNESS_FILTER": {
             "ENABLED": freshness_filter.get("enabled", True),  # 默认启用
             "MAX_AGE_DAYS": max_age_days,
+            "SKIP_ON_FETCH": freshness_filter.get("skip_on_fetch", False),
         },
     }
 
@@ -199,6 +287,8 @@ def _load_display_config(config_data: Dict) -> Dict:
     return {
         # 区域显示顺序
         "REGION_ORDER": region_order,
+        # HTML 报告中显示词组的小时热度走势
+        "HEAT_TREND": display.get("heat_trend", True),
         # 区域开关
         "REGIONS": {
             "HOTLIST": regions.get("hotlist", True),
@@ -334,6 +424,7 @@ def _load_webhook_config(config_data: Dict) -> Dict:
         "EMAIL_TO": _get_env_str("EMAIL_TO") or email.get("to", ""),
         "EMAIL_SMTP_SERVER": _get_env_str("EMAIL_SMTP_SERVER") or email.get("smtp_server", ""),
         "EMAIL_SMTP_PORT": _get_env_str("EMAIL_SMTP_PORT") or email.get("smtp_port", ""),
+        "EMAIL_ATTACH_REPORT": _get_env_bool("EMAIL_ATTACH_REPORT") if _get_env_bool("EMAIL_ATTACH_REPORT") is not None else email.get("attach_report", False),
         # ntfy
         "NTFY_SERVER_URL": _get_env_str("NTFY_SERVER_URL") or ntfy.get("server_url") or "https://ntfy.sh",
         "NTFY_TOPIC": _get_env_str("NTFY_TOPIC") or ntfy.get("topic", ""),
@@ -469,12 +560,27 @@ def load_config(config_path: Optional[str] = None) -> Dict[str, Any]:
     # 通知配置
     config.update(_load_notification_config(config_data))
 
+    # 通知发件箱配置
+    config["OUTBOX"] = _load_outbox_config(config_data)
+
+    # 增量推送配置
+    config["DELTA_PUSH"] = _load_delta_push_config(config_data)
+
     # 推送窗口配置
     config["PUSH_WINDOW"] = _load_push_window_config(config_data)
 
     # 权重配置
     config["WEIGHT_CONFIG"] = _load_weight_config(config_data)
 
+    # 并行分类配置
+    config["CLASSIFY"] = _load_classify_config(config_data)
+
+    # 自适应抓取调度配置
+    config["SCHEDULE"] = _load_schedule_config(config_data)
+
+    # 来源熔断配置
+    config["CIRCUIT_BREAKER"] = _load_circuit_breaker_config(config_data)
+
     # 平台配置
     platforms_config = config_data.get("platforms", {})
     config["PLATFORMS"] = platforms_config.get("sources", [])
@@ -0,0 +1,149 @@
+# coding=utf-8
+"""
+并行分类模块
+
+标题数量很大时（大量平台 + RSS），频率词匹配是单线程的主要开销。
+本模块把标题按平台/RSS 源分片交给进程池匹配：
+- 每个工作进程通过 initializer 只接收一次词组配置
+- 工作进程只返回紧凑的匹配结果（每个标题匹配的词组下标）
+- 主进程按分片的输入顺序合并结果，后续统计逻辑与单进程完全一致
+
+结果只包含词组下标，因此多进程与单进程的输出逐字节一致。
+
+进程池使用 forkserver（不支持时使用 spawn）启动工作进程：分类可能在 RSS 抓取线程中执行，
+多线程进程中 fork 会复制其他线程持有的锁，子进程可能死锁。
+进程池在第一次使用时创建，之后整个进程内复用（常驻模式不必每次运行都重新启动工作进程），
+词组配置随每个分片发送（频率词文件修改后无需重建进程池），进程退出前由 shutdown_classify_pool 关闭。
+"""
+
+import multiprocessing
+import threading
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import Dict, List, Optional, Tuple
+
+from trendradar.core.frequency import find_matching_group_index
+
+
+# 进程内共享的进程池（由 _get_pool 创建）
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_workers = 0
+_pool_lock = threading.Lock()
+
+
+def _get_mp_context() -> multiprocessing.context.BaseContext:
+    """获取进程池的启动方式（forkserver 优先，不支持时使用 spawn）"""
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("forkserver")
+    return multiprocessing.get_context("spawn")
+
+
+def _get_pool(workers: int) -> ProcessPoolExecutor:
+    """获取共享进程池（进程数变化时重建）"""
+    global _pool, _pool_workers
+    with _pool_lock:
+        if _pool is None or _pool_workers != workers:
+            if _pool is not None:
+                _pool.shutdown(wait=False)
+            _pool = ProcessPoolExecutor(max_workers=workers, mp_context=_get_mp_context())
+            _pool_workers = workers
+        return _pool
+
+
+def _discard_pool(pool: ProcessPoolExecutor) -> None:
+    """丢弃出错的进程池，下次使用时重建"""
+    global _pool
+    with _pool_lock:
+        if _pool is pool:
+            _pool = None
+    pool.shutdown(wait=False)
+
+
+def shutdown_classify_pool() -> None:
+    """关闭共享进程池（进程退出前调用，之后再次使用时重新创建）"""
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.shutdown(wait=True)
+
+
+def _classify_shard(
+    word_config: Tuple[List[Dict], List, Optional[List[str]]],
+    titles: List[str],
+) -> array:
+    """在工作进程中匹配一个分片的标题，返回每个标题匹配的词组下标（-1 表示不匹配）"""
+    word_groups, filter_words, global_filters = word_config
+    return array("i", [
+        find_matching_group_index(title, word_groups, filter_words, global_filters)
+        for title in titles
+    ])
+
+
+def classify_workers(classify_config: Optional[Dict], total_items: int) -> int:
+    """
+    计算并行分类使用的进程数
+
+    调用方据此决定是否需要构建分片，未启用时不必复制标题列表。
+
+    Args:
+        classify_config: 并行分类配置 {"WORKERS": 进程数, "MIN_ITEMS": 启用阈值}
+        total_items: 待匹配的标题总数
+
+    Returns:
+        进程数，0 表示使用单进程逐条匹配
+    """
+    if not classify_config:
+        return 0
+    workers = classify_config.get("WORKERS", 0) or 0
+    if workers <= 1 or total_items < classify_config.get("MIN_ITEMS", 0):
+        return 0
+    return workers
+
+
+def classify_titles(
+    shards: Dict[str, List[str]],
+    word_groups: List[Dict],
+    filter_words: List,
+    global_filters: Optional[List[str]] = None,
+    classify_config: Optional[Dict] = None,
+    log_prefix: str = "[分类]",
+) -> Optional[Dict[str, array]]:
+    """
+    按分片并行匹配标题
+
+    未启用多进程、标题数量低于阈值或进程池出错时返回 None，
+    调用方应回退到单进程逐条匹配。
+
+    Args:
+        shards: 分片 {分片键（平台 ID / RSS 源 ID）: 标题列表}
+        word_groups: 词组配置列表
+        filter_words: 过滤词列表
+        global_filters: 全局过滤词（可选）
+        classify_config: 并行分类配置 {"WORKERS": 进程数, "MIN_ITEMS": 启用阈值}
+        log_prefix: 日志前缀
+
+    Returns:
+        {分片键: 与标题列表一一对应的词组下标数组}，或 None
+    """
+    total = sum(len(titles) for titles in shards.values())
+    workers = classify_workers(classify_config, total)
+    if not workers or len(shards) <= 1:
+        return None
+
+    keys = list(shards.keys())
+    word_config = (word_groups, filter_words, global_filters)
+
+    pool = None
+    try:
+        pool = _get_pool(workers)
+        # map 按输入顺序返回结果，合并顺序与分片顺序一致
+        results = list(pool.map(_classify_shard, repeat(word_config), [shards[key] for key in keys]))
+    except Exception as e:
+        print(f"{log_prefix} 多进程分类失败，回退到单进程: {e}")
+        if pool is not None:
+            _discard_pool(pool)
+        return None
+
+    return dict(zip(keys, results))
@@ -0,0 +1,270 @@
+# coding=utf-8
+"""
+紧凑标题记录模块
+
+在「存储读取 → 词频统计 → 报告准备」之间共享同一份标题数据，避免逐层复制字典：
+- TitleRecord: 单条标题的紧凑记录（__slots__、驻留的平台字符串、数组存储的排名/时间线）
+- MatchedTitle: 标题在某个词组下的匹配视图（引用 TitleRecord，只保存匹配相关的少量字段）
+
+两者都提供与原有字典兼容的读取接口（record["ranks"]、record.get("url")、"count" in record），
+渲染、推送、AI 分析等下游代码无需感知数据结构的变化。
+"""
+
+import copy
+import sys
+from array import array
+from typing import Any, Dict, Iterator, List, Optional
+
+from trendradar.storage.base import RankMomentum, RankTimeline
+
+
+def _intern(value: Optional[str]) -> str:
+    """驻留字符串（空值返回空字符串）"""
+    return sys.intern(value) if value else ""
+
+
+class TitleRecord:
+    """
+    单条标题的紧凑记录
+
+    同一个 TitleRecord 同时作为 all_results 和 title_info 中的条目，
+    字典键 mobileUrl / mobile_url 都映射到 mobile_url 字段。
+    """
+
+    __slots__ = (
+        "title",
+        "source_id",
+        "source_name",
+        "url",
+        "mobile_url",
+        "first_time",
+        "last_time",
+        "count",
+        "ranks",
+        "rank_timeline",
+        "story_id",
+        "momentum",
+    )
+
+    # 字典键 → 属性名
+    _KEY_MAP = {
+        "title": "title",
+        "source_id": "source_id",
+        "source_name": "source_name",
+        "url": "url",
+        "mobileUrl": "mobile_url",
+        "mobile_url": "mobile_url",
+        "first_time": "first_time",
+        "last_time": "last_time",
+        "count": "count",
+        "ranks": "ranks",
+        "rank_timeline": "rank_timeline",
+        "story_id": "story_id",
+        "momentum": "momentum",
+    }
+
+    # 原 title_info / all_results 字典中始终存在的键（in / keys() 只报告这些键）
+    _DICT_KEYS = (
+        "first_time",
+        "last_time",
+        "count",
+        "ranks",
+        "url",
+        "mobileUrl",
+        "rank_timeline",
+    )
+
+    # 只在有值时存在的键（值为 None 时与字典中缺少该键一致）
+    _OPTIONAL_KEYS = ("story_id", "momentum")
+
+    def __init__(
+        self,
+        title: str,
+        source_id: str,
+        source_name: str = "",
+        url: str = "",
+        mobile_url: str = "",
+        first_time: str = "",
+        last_time: str = "",
+        count: int = 1,
+        ranks: Any = None,
+        rank_timeline: Any = None,
+        story_id: Optional[int] = None,
+        momentum: Optional[RankMomentum] = None,
+    ):
+        self.title = title
+        self.source_id = _intern(source_id)
+        self.source_name = _intern(source_name or source_id)
+        self.url = url or ""
+        self.mobile_url = mobile_url or ""
+        self.first_time = _intern(first_time)
+        self.last_time = _intern(last_time)
+        self.count = count
+        if isinstance(ranks, array):
+            self.ranks = ranks
+        else:
+            self.ranks = array("i", ranks or [])
+        if isinstance(rank_timeline, RankTimeline):
+            self.rank_timeline = rank_timeline
+        else:
+            self.rank_timeline = RankTimeline.from_list(rank_timeline or [])
+        self.story_id = story_id
+        self.momentum = momentum
+
+    @classmethod
+    def from_news_item(cls, item: Any, source_name: str) -> "TitleRecord":
+        """从 NewsItem 创建（排名数组和时间线按引用共享）"""
+        return cls(
+            title=item.title,
+            source_id=item.source_id,
+            source_name=source_name,
+            url=item.url,
+            mobile_url=item.mobile_url,
+            first_time=getattr(item, "first_time", item.crawl_time),
+            last_time=getattr(item, "last_time", item.crawl_time),
+            count=getattr(item, "count", 1),
+            ranks=getattr(item, "ranks", [item.rank]),
+            rank_timeline=getattr(item, "rank_timeline", None),
+            story_id=getattr(item, "story_id", None),
+            momentum=getattr(item, "momentum", None),
+        )
+
+    # === 字典兼容接口 ===
+    # title、source_name、mobile_url 等键也可以读取，但与原字典一致，不出现在 in / keys() 中
+
+    def __getitem__(self, key: str) -> Any:
+        attr = self._KEY_MAP.get(key)
+        if attr is None:
+            raise KeyError(key)
+        value = getattr(self, attr)
+        if value is None and key in self._OPTIONAL_KEYS:
+            raise KeyError(key)
+        return value
+
+    def get(self, key: str, default: Any = None) -> Any:
+        attr = self._KEY_MAP.get(key)
+        if attr is None:
+            return default
+        value = getattr(self, attr)
+        if value is None and key in self._OPTIONAL_KEYS:
+            return default
+        return value
+
+    def __contains__(self, key: str) -> bool:
+        if key in self._OPTIONAL_KEYS:
+            return getattr(self, key) is not None
+        return key in self._DICT_KEYS
+
+    def keys(self) -> List[str]:
+        keys = list(self._DICT_KEYS)
+        keys.extend(k for k in self._OPTIONAL_KEYS if getattr(self, k) is not None)
+        return keys
+
+    def to_dict(self) -> Dict[str, Any]:
+        """转换为字典（用于序列化）"""
+        return {
+            "first_time": self.first_time,
+            "last_time": self.last_time,
+            "count": self.count,
+            "ranks": list(self.ranks),
+            "url": self.url,
+            "mobileUrl": self.mobile_url,
+            "rank_timeline": self.rank_timeline.to_list(),
+            "story_id": self.story_id,
+            "momentum": self.momentum.to_dict() if self.momentum else None,
+        }
+
+    def __repr__(self) -> str:
+        return f"TitleRecord({self.source_id!r}, {self.title!r})"
+
+
+class MatchedTitle:
+    """
+    标题在某个词组下的匹配视图
+
+    只保存匹配相关的字段（time_display、rank_threshold、is_new），
+    其余字段从引用的 TitleRecord 读取。写入其他键（如翻译后的 title、
+    matched_keyword）时存入 extra，不会影响共享的 TitleRecord。
+    """
+
+    __slots__ = ("record", "time_display", "rank_threshold", "is_new", "extra")
+
+    _OWN_KEYS = frozenset(("time_display", "rank_threshold", "is_new"))
+
+    # 原匹配结果字典中来自标题记录、但 title_info 字典没有的键
+    _MATCH_KEYS = ("title", "source_name")
+
+    def __init__(
+        self,
+        record: TitleRecord,
+        time_display: str = "",
+        rank_threshold: int = 0,
+        is_new: bool = False,
+    ):
+        self.record = record
+        self.time_display = time_display
+        self.rank_threshold = rank_threshold
+        self.is_new = is_new
+        self.extra: Optional[Dict[str, Any]] = None
+
+    # === 字典兼容接口 ===
+
+    def __getitem__(self, key: str) -> Any:
+        extra = self.extra
+        if extra and key in extra:
+            return extra[key]
+        if key in self._OWN_KEYS:
+            return getattr(self, key)
+        return self.record[key]
+
+    def get(self, key: str, default: Any = None) -> Any:
+        extra = self.extra
+        if extra and key in extra:
+            return extra[key]
+        if key in self._OWN_KEYS:
+            return getattr(self, key)
+        return self.record.get(key, default)
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        if key in self._OWN_KEYS:
+            setattr(self, key, value)
+            return
+        if self.extra is None:
+            self.extra = {}
+        self.extra[key] = value
+
+    def __contains__(self, key: str) -> bool:
+        return (
+            key in self._OWN_KEYS
+            or key in self._MATCH_KEYS
+            or key in self.record
+            or bool(self.extra and key in self.extra)
+        )
+
+    def keys(self) -> List[str]:
+        keys = list(self._MATCH_KEYS) + list(self.record.keys()) + list(self._OWN_KEYS)
+        if self.extra:
+            keys.extend(k for k in self.extra if k not in keys)
+        return keys
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.keys())
+
+    def copy(self) -> "MatchedTitle":
+        """浅拷贝（共享 TitleRecord，复制匹配字段）"""
+        result = MatchedTitle(
+            self.record, self.time_display, self.rank_threshold, self.is_new
+        )
+        if self.extra:
+            result.extra = dict(self.extra)
+        return result
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "MatchedTitle":
+        # TitleRecord 只读共享，无需深拷贝；写入的键都落在 extra 中
+        result = self.copy()
+        if result.extra:
+            result.extra = copy.deepcopy(result.extra, memo)
+        return result
+
+    def __repr__(self) -> str:
+        return f"MatchedTitle({self.record!r})"
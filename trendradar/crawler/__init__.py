@@ -4,5 +4,17 @@
 """
 
 from trendradar.crawler.fetcher import DataFetcher
+from trendradar.crawler.schedule import AdaptiveScheduler
+from trendradar.crawler.breaker import CircuitBreaker
+from trendradar.crawler.latency import CrawlDeadline, hedge_delays, hedged_request
+from trendradar.crawler.proxy import ProxyPool
 
-__all__ = ["DataFetcher"]
+__all__ = [
+    "DataFetcher",
+    "AdaptiveScheduler",
+    "CircuitBreaker",
+    "CrawlDeadline",
+    "hedge_delays",
+    "hedged_request",
+    "ProxyPool",
+]
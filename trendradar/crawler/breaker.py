@@ -0,0 +1,156 @@
+# coding=utf-8
+"""
+来源熔断
+
+根据当天 crawl_source_status / rss_crawl_status 中的抓取状态判断来源是否已经失效：
+- 连续失败次数达到阈值后熔断（open），本次运行直接跳过，不再消耗重试和超时
+- 熔断后每隔一段时间放行一次探测请求（half_open），探测间隔随失败次数翻倍增长
+- 任意一次成功抓取即恢复（closed）
+
+熔断跳过的来源不写入抓取状态表，因此探测间隔只随真实的失败请求增长。
+状态按天统计，新的一天会重新探测所有来源。
+"""
+
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from trendradar.utils.time import crawl_time_to_minutes
+
+
+# 熔断状态
+STATE_CLOSED = "closed"
+STATE_OPEN = "open"
+STATE_HALF_OPEN = "half_open"
+
+
+def summarize_source_health(rows: Iterable[Tuple[str, str, str]]) -> Dict[str, Dict]:
+    """
+    汇总各来源的抓取健康状况
+
+    Args:
+        rows: (来源 ID, 抓取时间, 状态) 记录，需按抓取时间升序
+
+    Returns:
+        {来源 ID: {"consecutive_failures": 连续失败次数, "last_failure": 最近失败的分钟数,
+                   "last_success": 最近成功的分钟数}}
+    """
+    health: Dict[str, Dict] = {}
+    for source_id, crawl_time, status in rows:
+        minutes = crawl_time_to_minutes(crawl_time)
+        if minutes is None:
+            continue
+        entry = health.setdefault(source_id, {
+            "consecutive_failures": 0,
+            "last_failure": None,
+            "last_success": None,
+        })
+        if status == "success":
+            entry["consecutive_failures"] = 0
+            entry["last_success"] = minutes
+        else:
+            entry["consecutive_failures"] += 1
+            entry["last_failure"] = minutes
+    return health
+
+
+class CircuitBreaker:
+    """按连续失败次数跳过失效的来源"""
+
+    def __init__(
+        self,
+        failure_threshold: int = 3,
+        probe_interval: int = 30,
+        max_probe_interval: int = 240,
+    ):
+        """
+        初始化熔断器
+
+        Args:
+            failure_threshold: 触发熔断的连续失败次数
+            probe_interval: 熔断后首次探测的等待时间（分钟）
+            max_probe_interval: 探测等待时间上限（分钟）
+        """
+        self.failure_threshold = max(1, failure_threshold)
+        self.probe_interval = max(0, probe_interval)
+        self.max_probe_interval = max(self.probe_interval, max_probe_interval)
+
+    def probe_wait(self, failures: int) -> int:
+        """
+        计算熔断后距离下次探测的等待时间
+
+        Args:
+            failures: 连续失败次数
+
+        Returns:
+            等待时间（分钟），每多失败一次翻倍
+        """
+        exponent = max(0, failures - self.failure_threshold)
+        # 超过上限后不再继续计算，避免指数过大
+        if exponent >= 16:
+            return self.max_probe_interval
+        return min(self.probe_interval * (2 ** exponent), self.max_probe_interval)
+
+    def next_probe(self, health: Optional[Dict]) -> Optional[int]:
+        """
+        计算下次允许探测的时间
+
+        Args:
+            health: 来源的健康状况（summarize_source_health 的结果）
+
+        Returns:
+            当天的分钟数；未熔断时返回 None
+        """
+        if not health:
+            return None
+        failures = health.get("consecutive_failures", 0)
+        last_failure = health.get("last_failure")
+        if failures < self.failure_threshold or last_failure is None:
+            return None
+        return last_failure + self.probe_wait(failures)
+
+    def state(self, health: Optional[Dict], now_minutes: int) -> str:
+        """
+        获取来源当前的熔断状态
+
+        Args:
+            health: 来源的健康状况
+            now_minutes: 当前时间（当天的分钟数）
+
+        Returns:
+            STATE_CLOSED / STATE_OPEN / STATE_HALF_OPEN
+        """
+        next_probe = self.next_probe(health)
+        if next_probe is None:
+            return STATE_CLOSED
+        # 时间倒退（跨天、时区调整）时放行探测
+        if now_minutes >= next_probe or now_minutes < health["last_failure"]:
+            return STATE_HALF_OPEN
+        return STATE_OPEN
+
+    def split(
+        self,
+        source_ids: List[str],
+        health: Dict[str, Dict],
+        now_minutes: int,
+    ) -> Tuple[List[str], Dict[str, int]]:
+        """
+        将来源分为本次放行和熔断跳过两组
+
+        Args:
+            source_ids: 来源 ID 列表（保持顺序）
+            health: {来源 ID: 健康状况}
+            now_minutes: 当前时间（当天的分钟数）
+
+        Returns:
+            (放行的来源 ID 列表（含探测）, {熔断的来源 ID: 距离下次探测的分钟数})
+        """
+        allowed: List[str] = []
+        opened: Dict[str, int] = {}
+
+        for source_id in source_ids:
+            source_health = health.get(source_id)
+            if self.state(source_health, now_minutes) == STATE_OPEN:
+                opened[source_id] = self.next_probe(source_health) - now_minutes
+            else:
+                allowed.append(source_id)
+
+        return allowed, opened
@@ -7,15 +7,22 @@
 - 批量平台数据爬取
 - 自动重试机制
 - 代理支持
+- 抓取截止时间和对冲请求（见 latency 模块）
+- 代理池（见 proxy 模块）
 """
 
 import json
 import random
+import threading
 import time
 from typing import Dict, List, Tuple, Optional, Union
+from urllib.parse import urlparse
 
 import requests
 
+from trendradar.crawler.latency import CrawlDeadline, CrawlDeadlineExceeded, hedged_request
+from trendradar.crawler.proxy import ProxyPool
+
 
 class DataFetcher:
     """数据获取器"""
@@ -36,6 +43,7 @@ class DataFetcher:
         self,
         proxy_url: Optional[str] = None,
         api_url: Optional[str] = None,
+        proxy_pool: Optional[ProxyPool] = None,
     ):
         """
         初始化数据获取器
@@ -43,9 +51,45 @@ class DataFetcher:
         Args:
             proxy_url: 代理服务器 URL（可选）
             api_url: API 基础 URL（可选，默认使用 DEFAULT_API_URL）
+            proxy_pool: 代理池（可选，提供时代替 proxy_url）
         """
         self.proxy_url = proxy_url
         self.api_url = api_url or self.DEFAULT_API_URL
+        self.proxy_pool = proxy_pool
+        # 各平台最后一次请求的延迟（毫秒），crawl_websites 开始时清空
+        self.last_latencies: Dict[str, int] = {}
+        # 复用连接（常驻模式下跨多次运行保持）；对冲请求的线程使用独立的会话
+        self.session = self._create_session()
+        self._thread_local = threading.local()
+
+    def _create_session(self) -> requests.Session:
+        """创建请求会话"""
+        session = requests.Session()
+        session.headers.update(self.DEFAULT_HEADERS)
+        return session
+
+    def _get_session(self) -> requests.Session:
+        """获取当前线程的请求会话（主线程复用 self.session）"""
+        if threading.current_thread() is threading.main_thread():
+            return self.session
+        session = getattr(self._thread_local, "session", None)
+        if session is None:
+            session = self._create_session()
+            self._thread_local.session = session
+        return session
+
+    def _get(self, url: str, proxies: Optional[Dict[str, str]], timeout: float) -> requests.Response:
+        """发送 GET 请求（配置了代理池时从代理池租用代理）"""
+        session = self._get_session()
+        if self.proxy_pool is None:
+            return session.get(url, proxies=proxies, timeout=timeout)
+
+        with self.proxy_pool.lease(urlparse(url).netloc, timeout=timeout) as lease:
+            response = session.get(url, proxies=lease.proxies, timeout=timeout)
+            # 只有代理认证失败计入代理的失败率，源站的 HTTP 错误由调用方检查
+            if response.status_code == 407:
+                lease.mark_failed()
+        return response
 
     def fetch_data(
         self,
@@ -53,6 +97,9 @@ class DataFetcher:
         max_retries: int = 2,
         min_retry_wait: int = 3,
         max_retry_wait: int = 5,
+        timeout: float = 10,
+        deadline: Optional[CrawlDeadline] = None,
+        hedge_after: Optional[float] = None,
     ) -> Tuple[Optional[str], str, str]:
         """
         获取指定ID数据，支持重试
@@ -62,10 +109,14 @@ class DataFetcher:
             max_retries: 最大重试次数
             min_retry_wait: 最小重试等待时间（秒）
             max_retry_wait: 最大重试等待时间（秒）
+            timeout: 单次请求超时（秒）
+            deadline: 抓取截止时间（可选），请求超时不超过剩余时间，到期后不再重试
+            hedge_after: 对冲等待时间（秒，可选），单次请求超过该时间未返回时再发送一次
 
         Returns:
             (响应文本, 平台ID, 别名) 元组，失败时响应文本为 None
         """
+        deadline = deadline or CrawlDeadline()
         if isinstance(id_info, tuple):
             id_value, alias = id_info
         else:
@@ -81,12 +132,15 @@ class DataFetcher:
         retries = 0
         while retries <= max_retries:
             try:
-                response = requests.get(
-                    url,
-                    proxies=proxies,
-                    headers=self.DEFAULT_HEADERS,
-                    timeout=10,
+                request_timeout = deadline.clamp_timeout(timeout)
+                start = time.monotonic()
+                response = hedged_request(
+                    lambda: self._get(url, proxies, request_timeout),
+                    hedge_after,
+                    label=f"请求 {id_value}",
                 )
+                # 记录最后一次请求的延迟（不含重试等待）
+                self.last_latencies[id_value] = int((time.monotonic() - start) * 1000)
                 response.raise_for_status()
 
                 data_text = response.text
@@ -100,12 +154,21 @@ class DataFetcher:
                 print(f"获取 {id_value} 成功（{status_info}）")
                 return data_text, id_value, alias
 
+            except CrawlDeadlineExceeded as e:
+                print(f"请求 {id_value} 失败: {e}")
+                return None, id_value, alias
+
             except Exception as e:
+                self.last_latencies[id_value] = int((time.monotonic() - start) * 1000)
                 retries += 1
                 if retries <= max_retries:
                     base_wait = random.uniform(min_retry_wait, max_retry_wait)
                     additional_wait = (retries - 1) * random.uniform(1, 2)
                     wait_time = base_wait + additional_wait
+                    remaining = deadline.remaining()
+                    if remaining is not None and wait_time >= remaining:
+                        print(f"请求 {id_value} 失败: {e}. 剩余时间不足，不再重试")
+                        return None, id_value, alias
                     print(f"请求 {id_value} 失败: {e}. {wait_time:.2f}秒后重试...")
                     time.sleep(wait_time)
                 else:
@@ -118,13 +181,19 @@ class DataFetcher:
         self,
         ids_list: List[Union[str, Tuple[str, str]]],
         request_interval: int = 100,
+        deadline: Optional[float] = None,
+        hedge_after: Optional[Dict[str, float]] = None,
     ) -> Tuple[Dict, Dict, List]:
         """
         爬取多个网站数据
 
+        各平台最后一次请求的延迟（毫秒）记录在 self.last_latencies 中。
+
         Args:
             ids_list: 平台ID列表，每个元素可以是字符串或 (平台ID, 别名) 元组
             request_interval: 请求间隔（毫秒）
+            deadline: 抓取阶段截止时间（秒，可选），到期后未抓取的平台记为失败
+            hedge_after: 各平台的对冲等待时间 {平台ID: 秒}（可选）
 
         Returns:
             (结果字典, ID到名称的映射, 失败ID列表) 元组
@@ -132,6 +201,9 @@ class DataFetcher:
         results = {}
         id_to_name = {}
         failed_ids = []
+        crawl_deadline = CrawlDeadline(deadline)
+        hedge_after = hedge_after or {}
+        self.last_latencies = {}
 
         for i, id_info in enumerate(ids_list):
             if isinstance(id_info, tuple):
@@ -141,7 +213,15 @@ class DataFetcher:
                 name = id_value
 
             id_to_name[id_value] = name
-            response, _, _ = self.fetch_data(id_info)
+
+            if crawl_deadline.expired():
+                print(f"请求 {id_value} 跳过: 超出抓取截止时间 ({deadline:g}s)")
+                failed_ids.append(id_value)
+                continue
+
+            response, _, _ = self.fetch_data(
+                id_info, deadline=crawl_deadline, hedge_after=hedge_after.get(id_value)
+            )
 
             if response:
                 try:
@@ -175,7 +255,7 @@ class DataFetcher:
                 failed_ids.append(id_value)
 
             # 请求间隔（除了最后一个）
-            if i < len(ids_list) - 1:
+            if i < len(ids_list) - 1 and not crawl_deadline.expired():
                 actual_interval = request_interval + random.randint(-10, 20)
                 actual_interval = max(50, actual_interval)
                 time.sleep(actual_interval / 1000)
@@ -0,0 +1,153 @@
+# coding=utf-8
+"""
+抓取延迟控制
+
+整次运行的推送时间取决于最慢的来源，本模块提供两种尾延迟控制手段：
+- CrawlDeadline: 抓取阶段的截止时间，到期后未完成的来源本次记为失败，
+  单次请求的超时也不会超过剩余时间
+- hedged_request: 请求超过该来源历史 p90 延迟仍未返回时，再发送一次相同的请求，
+  取先成功返回的结果
+
+各来源的延迟随抓取状态保存在数据库中（crawl_source_status / rss_crawl_status 的 latency_ms），
+hedge_delays 根据当天的历史延迟计算每个来源的对冲等待时间。
+"""
+
+import math
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Callable, Dict, List, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class CrawlDeadlineExceeded(Exception):
+    """抓取阶段已超过截止时间"""
+
+
+class CrawlDeadline:
+    """抓取阶段的截止时间"""
+
+    def __init__(self, seconds: Optional[float] = None):
+        """
+        Args:
+            seconds: 距离截止的秒数（None 或 <= 0 表示不限制）
+        """
+        self.seconds = seconds if seconds and seconds > 0 else None
+        self._expires_at = time.monotonic() + self.seconds if self.seconds else None
+
+    def remaining(self) -> Optional[float]:
+        """剩余秒数（不限制时返回 None）"""
+        if self._expires_at is None:
+            return None
+        return max(0.0, self._expires_at - time.monotonic())
+
+    def expired(self) -> bool:
+        """是否已到截止时间"""
+        remaining = self.remaining()
+        return remaining is not None and remaining <= 0
+
+    def clamp_timeout(self, timeout: float) -> float:
+        """
+        将请求超时限制在剩余时间内
+
+        Args:
+            timeout: 原始超时（秒）
+
+        Returns:
+            调整后的超时（秒）
+
+        Raises:
+            CrawlDeadlineExceeded: 已到截止时间
+        """
+        remaining = self.remaining()
+        if remaining is None:
+            return timeout
+        if remaining <= 0:
+            raise CrawlDeadlineExceeded(f"超出抓取截止时间 ({self.seconds:g}s)")
+        return min(timeout, remaining)
+
+
+def percentile(values: List[float], q: float) -> Optional[float]:
+    """
+    计算分位数（最近秩法）
+
+    Args:
+        values: 样本
+        q: 分位（0-100）
+
+    Returns:
+        分位数，没有样本时返回 None
+    """
+    if not values:
+        return None
+    ordered = sorted(values)
+    index = max(0, math.ceil(q / 100 * len(ordered)) - 1)
+    return ordered[min(index, len(ordered) - 1)]
+
+
+def hedge_delays(
+    latencies: Dict[str, List[int]],
+    min_samples: int = 5,
+    q: float = 90,
+) -> Dict[str, float]:
+    """
+    根据历史延迟计算各来源的对冲等待时间
+
+    Args:
+        latencies: {来源 ID: 成功请求的延迟列表（毫秒）}
+        min_samples: 样本数少于该值的来源不做对冲
+        q: 分位（默认 p90）
+
+    Returns:
+        {来源 ID: 对冲等待时间（秒）}
+    """
+    delays = {}
+    for source_id, samples in latencies.items():
+        if len(samples) < max(1, min_samples):
+            continue
+        value = percentile(samples, q)
+        if value:
+            delays[source_id] = value / 1000
+    return delays
+
+
+def hedged_request(
+    send: Callable[[], T],
+    hedge_after: Optional[float] = None,
+    label: str = "",
+) -> T:
+    """
+    发送请求，超过 hedge_after 秒未返回时再发送一次，返回先成功的结果
+
+    两次请求都失败时抛出最后一个异常；未胜出的请求在后台自然结束，不会被等待。
+
+    Args:
+        send: 发送请求的函数（需线程安全）
+        hedge_after: 对冲等待时间（秒），None 或 <= 0 时直接发送
+        label: 日志中的来源名称
+
+    Returns:
+        send 的返回值
+    """
+    if not hedge_after or hedge_after <= 0:
+        return send()
+
+    executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="hedge")
+    try:
+        first = executor.submit(send)
+        done, _ = wait([first], timeout=hedge_after)
+        if done:
+            return first.result()
+
+        print(f"{label} 超过 p90 延迟 {hedge_after:.2f}s 未返回，发送对冲请求")
+        pending = {first, executor.submit(send)}
+        error: Optional[BaseException] = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    return future.result()
+                error = future.exception()
+        raise error
+    finally:
+        executor.shutdown(wait=False)
@@ -0,0 +1,222 @@
+# coding=utf-8
+"""
+代理池
+
+热榜和 RSS 抓取共用的代理池（线程安全）：
+- 每个代理有并发上限，已满时等待空闲槽位
+- 按请求延迟和失败率（指数平滑）给代理打分，新主机分配给当前得分最好、负载最低的代理
+- 同一主机固定使用同一个代理（粘性分配），代理被降级后才重新分配
+- 连续失败达到阈值的代理降级一段时间，所有代理都被降级时仍使用最早恢复的那个
+
+使用方式：
+
+    with pool.lease(host) as lease:
+        response = session.get(url, proxies=lease.proxies, timeout=timeout)
+        if response.status_code == 407:
+            lease.mark_failed()
+    response.raise_for_status()
+
+with 块内的连接错误、代理错误和超时记为该代理的一次失败（代理返回 407 时由调用方标记），
+其余情况记为成功并记录延迟。源站的 HTTP 错误（404、500 等）与代理无关，应在租用结束后再检查。
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Optional
+
+import requests
+
+
+class ProxyPoolTimeout(requests.Timeout):
+    """等待代理空闲槽位超时"""
+
+
+@dataclass
+class _ProxyState:
+    """单个代理的运行状态"""
+    url: str
+    active: int = 0                     # 正在进行的请求数
+    requests: int = 0                   # 累计请求数
+    failures: int = 0                   # 累计失败数
+    consecutive_failures: int = 0       # 连续失败数
+    latency: Optional[float] = None     # 平滑后的请求延迟（秒）
+    error_rate: float = 0.0             # 平滑后的失败率
+    demoted_until: float = 0.0          # 降级截止时间（time.monotonic）
+
+
+class ProxyLease:
+    """一次代理租用"""
+
+    def __init__(self, url: str):
+        self.url = url
+        self.failed = False
+
+    def mark_failed(self) -> None:
+        """将本次请求记为代理失败（如代理返回 407 认证失败）"""
+        self.failed = True
+
+    @property
+    def proxies(self) -> Dict[str, str]:
+        """requests 使用的 proxies 参数"""
+        return {"http": self.url, "https": self.url}
+
+
+class ProxyPool:
+    """按健康度分配代理的代理池"""
+
+    # 没有延迟样本的代理按该延迟（秒）估计得分
+    DEFAULT_LATENCY = 1.0
+
+    def __init__(
+        self,
+        proxies: List[str],
+        max_concurrency: int = 4,
+        failure_threshold: int = 3,
+        demote_seconds: float = 300,
+        smoothing: float = 0.3,
+    ):
+        """
+        初始化代理池
+
+        Args:
+            proxies: 代理 URL 列表
+            max_concurrency: 每个代理的最大并发请求数
+            failure_threshold: 连续失败多少次后降级
+            demote_seconds: 降级时长（秒）
+            smoothing: 延迟和失败率的指数平滑系数（越大越看重最近的请求）
+        """
+        urls = list(dict.fromkeys(p for p in proxies if p))
+        if not urls:
+            raise ValueError("代理池至少需要一个代理")
+
+        self.max_concurrency = max(1, max_concurrency)
+        self.failure_threshold = max(1, failure_threshold)
+        self.demote_seconds = max(0, demote_seconds)
+        self.smoothing = min(max(smoothing, 0.01), 1.0)
+
+        self._states = [_ProxyState(url) for url in urls]
+        self._sticky: Dict[str, _ProxyState] = {}
+        self._condition = threading.Condition()
+
+    def __len__(self) -> int:
+        return len(self._states)
+
+    def _score(self, state: _ProxyState) -> float:
+        """代理得分（越小越好）：延迟按失败率放大，再按当前负载放大"""
+        latency = state.latency if state.latency is not None else self.DEFAULT_LATENCY
+        load = state.active / self.max_concurrency
+        return latency * (1 + 4 * state.error_rate) * (1 + load)
+
+    def _select(self, host: str, now: float) -> _ProxyState:
+        """为主机选择代理（需持有锁）"""
+        healthy = [s for s in self._states if s.demoted_until <= now]
+        if not healthy:
+            # 全部降级时使用最早恢复的代理，避免完全不可用
+            healthy = [min(self._states, key=lambda s: s.demoted_until)]
+
+        sticky = self._sticky.get(host)
+        if sticky is not None and sticky in healthy:
+            return sticky
+
+        chosen = min(healthy, key=self._score)
+        self._sticky[host] = chosen
+        return chosen
+
+    def _acquire(self, host: str, timeout: Optional[float]) -> _ProxyState:
+        """租用代理槽位，已满时等待"""
+        deadline = time.monotonic() + timeout if timeout else None
+        with self._condition:
+            while True:
+                now = time.monotonic()
+                state = self._select(host, now)
+                if state.active < self.max_concurrency:
+                    state.active += 1
+                    return state
+
+                remaining = deadline - now if deadline is not None else None
+                if remaining is not None and remaining <= 0:
+                    raise ProxyPoolTimeout(f"等待代理 {state.url} 空闲超时")
+                # 降级状态可能随时间变化，定期重新选择
+                self._condition.wait(timeout=min(remaining, 1.0) if remaining is not None else 1.0)
+
+    def _release(self, state: _ProxyState, success: bool, latency: float) -> None:
+        """归还代理槽位并更新健康度"""
+        with self._condition:
+            state.active -= 1
+            state.requests += 1
+            alpha = self.smoothing
+            state.error_rate = (1 - alpha) * state.error_rate + alpha * (0.0 if success else 1.0)
+
+            if success:
+                state.consecutive_failures = 0
+                state.latency = latency if state.latency is None else (
+                    (1 - alpha) * state.latency + alpha * latency
+                )
+            else:
+                state.failures += 1
+                state.consecutive_failures += 1
+                if state.consecutive_failures >= self.failure_threshold:
+                    state.demoted_until = time.monotonic() + self.demote_seconds
+                    state.consecutive_failures = 0
+                    # 使用该代理的主机下次重新分配
+                    for host in [h for h, s in self._sticky.items() if s is state]:
+                        del self._sticky[host]
+                    print(f"[代理池] 代理 {state.url} 连续失败 {self.failure_threshold} 次，"
+                          f"降级 {self.demote_seconds:g} 秒")
+
+            self._condition.notify_all()
+
+    @contextmanager
+    def lease(self, host: str, timeout: Optional[float] = None) -> Iterator[ProxyLease]:
+        """
+        为主机租用一个代理
+
+        Args:
+            host: 请求的主机名
+            timeout: 等待空闲槽位的最长时间（秒，None 表示一直等待）
+
+        Yields:
+            ProxyLease
+
+        Raises:
+            ProxyPoolTimeout: 等待空闲槽位超时
+        """
+        state = self._acquire(host.lower(), timeout)
+        start = time.monotonic()
+        lease = ProxyLease(state.url)
+        success = False
+        try:
+            yield lease
+            success = not lease.failed
+        except (requests.ConnectionError, requests.Timeout):
+            # 连接失败、代理错误（ProxyError 是 ConnectionError 的子类）和超时才是代理的问题
+            raise
+        except Exception:
+            # 其他异常与代理无关，不计入失败率
+            success = not lease.failed
+            raise
+        finally:
+            self._release(state, success, time.monotonic() - start)
+
+    def stats(self) -> List[Dict]:
+        """
+        获取各代理的统计信息
+
+        Returns:
+            [{"url", "requests", "failures", "latency_ms", "error_rate", "demoted"}, ...]
+        """
+        now = time.monotonic()
+        with self._condition:
+            return [
+                {
+                    "url": s.url,
+                    "requests": s.requests,
+                    "failures": s.failures,
+                    "latency_ms": int(s.latency * 1000) if s.latency is not None else None,
+                    "error_rate": round(s.error_rate, 3),
+                    "demoted": s.demoted_until > now,
+                }
+                for s in self._states
+            ]
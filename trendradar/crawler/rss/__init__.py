@@ -5,7 +5,16 @@ RSS 抓取模块
 提供 RSS 2.0、Atom 和 JSON Feed 1.1 订阅源的解析和抓取功能
 """
 
-from .parser import RSSParser
+from .parser import RSSParser, ParseCutoff, ParseResult
+from .stream import StreamParseError, iter_xml_entries
 from .fetcher import RSSFetcher, RSSFeedConfig
 
-__all__ = ["RSSParser", "RSSFetcher", "RSSFeedConfig"]
+__all__ = [
+    "RSSParser",
+    "ParseCutoff",
+    "ParseResult",
+    "StreamParseError",
+    "iter_xml_entries",
+    "RSSFetcher",
+    "RSSFeedConfig",
+]
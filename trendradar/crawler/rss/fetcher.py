@@ -2,18 +2,28 @@
 """
 RSS 抓取器
 
-负责从配置的 RSS 源抓取数据并转换为标准格式
+负责从配置的 RSS 源抓取数据并转换为标准格式。
+max_workers > 1 时并发抓取：不同主机的源同时请求，同一主机的请求之间保持 request_interval 间隔。
+提供上次的 ETag / Last-Modified 时发送条件请求，304 未更新的源跳过解析。
+提供当天已保存的条目 URL 时增量解析，已见过的条目只记录 URL，不再完整转换。
+设置 deadline 时，到期后仍未完成的源本次记为失败；提供 hedge_after 时对慢请求发送对冲请求。
+提供 proxy_pool 时按主机从代理池租用代理，代替单个 proxy_url。
 """
 
 import time
 import random
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
 from dataclasses import dataclass
 from datetime import datetime
-from typing import List, Dict, Optional, Tuple, Callable
+from typing import List, Dict, Optional, Set, Tuple, Callable
+from urllib.parse import urlparse
 
 import requests
 
-from .parser import RSSParser, ParsedRSSItem
+from .parser import RSSParser, ParsedRSSItem, ParseCutoff
+from trendradar.crawler.latency import CrawlDeadline, CrawlDeadlineExceeded, hedged_request
+from trendradar.crawler.proxy import ProxyPool
 from trendradar.storage.base import RSSItem, RSSData
 from trendradar.utils.time import get_configured_time, is_within_days, DEFAULT_TIMEZONE
 
@@ -27,6 +37,39 @@ class RSSFeedConfig:
     max_items: int = 0          # 最大条目数（0=不限制）
     enabled: bool = True        # 是否启用
     max_age_days: Optional[int] = None  # 文章最大年龄（天），覆盖全局设置；None=使用全局，0=禁用过滤
+    timeout: Optional[int] = None       # 请求超时（秒），覆盖全局设置；None=使用全局
+
+
+class HostThrottle:
+    """
+    按主机的请求间隔控制（线程安全）
+
+    每个主机维护下一次允许请求的时间，调用 wait() 时预约该主机的下一个时间槽，
+    因此同一主机的请求按间隔依次进行，不同主机之间互不等待。
+    """
+
+    def __init__(self, interval_ms: int, jitter: float = 0.2):
+        """
+        Args:
+            interval_ms: 同一主机两次请求之间的间隔（毫秒）
+            jitter: 间隔的随机波动比例
+        """
+        self.interval = max(interval_ms, 0) / 1000
+        self.jitter = jitter
+        self._next_allowed: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def wait(self, host: str) -> None:
+        """等待直到允许请求该主机"""
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_allowed.get(host, now))
+            interval = self.interval + random.uniform(-self.jitter, self.jitter) * self.interval
+            self._next_allowed[host] = start + interval
+
+        delay = start - now
+        if delay > 0:
+            time.sleep(delay)
 
 
 class RSSFetcher:
@@ -42,6 +85,15 @@ class RSSFetcher:
         timezone: str = DEFAULT_TIMEZONE,
         freshness_enabled: bool = True,
         default_max_age_days: int = 3,
+        max_workers: int = 1,
+        validators: Optional[Dict[str, Dict[str, str]]] = None,
+        seen_urls: Optional[Dict[str, Set[str]]] = None,
+        skip_stale_entries: bool = False,
+        stream_threshold_kb: int = 0,
+        deadline: Optional[float] = None,
+        hedge_after: Optional[Dict[str, float]] = None,
+        proxy_pool: Optional[ProxyPool] = None,
+        session: Optional[requests.Session] = None,
     ):
         """
         初始化抓取器
@@ -55,6 +107,16 @@ class RSSFetcher:
             timezone: 时区配置（如 'Asia/Shanghai'）
             freshness_enabled: 是否启用新鲜度过滤
             default_max_age_days: 默认最大文章年龄（天）
+            max_workers: 并发抓取的线程数（1 = 顺序抓取，源之间统一间隔 request_interval；
+                         >1 = 并发抓取，仅同一主机的请求之间间隔 request_interval）
+            validators: 上次成功抓取的条件请求校验值 {feed_id: {"url", "etag", "last_modified"}}
+            seen_urls: 当天已保存的条目 URL {feed_id: {url, ...}}，这些条目解析时不再完整转换
+            skip_stale_entries: 解析时是否直接跳过超出新鲜度范围的条目（不存入数据库）
+            stream_threshold_kb: 响应超过该大小（KB）时使用流式解析（0=不使用）
+            deadline: 抓取阶段截止时间（秒，None 或 0 = 不限制），到期后未完成的源记为失败
+            hedge_after: 各源的对冲等待时间 {feed_id: 秒}，请求超过该时间未返回时再发送一次
+            proxy_pool: 代理池（可选，提供时代替 use_proxy / proxy_url）
+            session: 复用的主线程请求会话（可选，常驻模式下跨多次运行保持连接）
         """
         self.feeds = [f for f in feeds if f.enabled]
         self.request_interval = request_interval
@@ -64,9 +126,38 @@ class RSSFetcher:
         self.timezone = timezone
         self.freshness_enabled = freshness_enabled
         self.default_max_age_days = default_max_age_days
+        self.max_workers = max(1, max_workers or 1)
+        self.validators = validators or {}
+        self.seen_urls = seen_urls or {}
+        self.skip_stale_entries = skip_stale_entries
+        self.stream_threshold = max(stream_threshold_kb or 0, 0) * 1024
+        self.deadline = deadline
+        self.hedge_after = hedge_after or {}
+        self.proxy_pool = proxy_pool
+        self._deadline = CrawlDeadline(deadline)
+        # 本轮抓取中各源最后一次请求的延迟（毫秒）
+        self._latencies: Dict[str, int] = {}
+        # 本轮抓取中各源已见过、未重新转换的条目 URL
+        self._seen_in_crawl: Dict[str, List[str]] = {}
+        # 本轮抓取中各源的条件请求结果 {feed_id: {"not_modified", "url", "etag", "last_modified"}}
+        self._conditional_results: Dict[str, Dict] = {}
 
         self.parser = RSSParser()
-        self.session = self._create_session()
+        self.session = session or self._create_session()
+        # 并发模式下每个线程使用独立的会话（requests.Session 不保证线程安全）
+        self._thread_local = threading.local()
+        # 创建抓取器的线程（RSS 抓取阶段可能不在主线程中运行）
+        self._owner_thread = threading.current_thread()
+
+    def _get_session(self) -> requests.Session:
+        """获取当前线程的请求会话（创建抓取器的线程复用 self.session）"""
+        if threading.current_thread() is self._owner_thread:
+            return self.session
+        session = getattr(self._thread_local, "session", None)
+        if session is None:
+            session = self._create_session()
+            self._thread_local.session = session
+        return session
 
     def _create_session(self) -> requests.Session:
         """创建请求会话"""
@@ -85,6 +176,19 @@ class RSSFetcher:
 
         return session
 
+    def _get(self, feed: RSSFeedConfig, timeout: float, headers: Dict[str, str]) -> requests.Response:
+        """发送 GET 请求（配置了代理池时从代理池租用代理）"""
+        session = self._get_session()
+        if self.proxy_pool is None:
+            return session.get(feed.url, timeout=timeout, headers=headers)
+
+        with self.proxy_pool.lease(urlparse(feed.url).netloc, timeout=timeout) as lease:
+            response = session.get(feed.url, timeout=timeout, headers=headers, proxies=lease.proxies)
+            # 只有代理认证失败计入代理的失败率，源站的 HTTP 错误由调用方检查
+            if response.status_code == 407:
+                lease.mark_failed()
+        return response
+
     def _filter_by_freshness(
         self,
         items: List[RSSItem],
@@ -127,25 +231,95 @@ class RSSFetcher:
         filtered_count = len(items) - len(filtered)
         return filtered, filtered_count
 
+    def _parse_cutoff(self, feed: RSSFeedConfig) -> Optional[ParseCutoff]:
+        """构建增量解析的截止条件（没有已见条目且不跳过过期条目时返回 None）"""
+        max_age_days = 0
+        if self.skip_stale_entries and self.freshness_enabled:
+            max_age_days = feed.max_age_days
+            if max_age_days is None:
+                max_age_days = self.default_max_age_days
+
+        seen = self.seen_urls.get(feed.id)
+        if not seen and not max_age_days:
+            return None
+
+        return ParseCutoff(
+            seen=seen or set(),
+            max_age_days=max_age_days,
+            timezone=self.timezone,
+        )
+
+    def _conditional_headers(self, feed: RSSFeedConfig) -> Dict[str, str]:
+        """构建条件请求头（源 URL 变化后不再使用旧的校验值）"""
+        validator = self.validators.get(feed.id)
+        if not validator or validator.get("url") != feed.url:
+            return {}
+
+        headers = {}
+        if validator.get("etag"):
+            headers["If-None-Match"] = validator["etag"]
+        if validator.get("last_modified"):
+            headers["If-Modified-Since"] = validator["last_modified"]
+        return headers
+
+    def _record_conditional_result(
+        self,
+        feed: RSSFeedConfig,
+        response: requests.Response,
+        not_modified: bool,
+    ) -> None:
+        """记录响应中的校验值（304 响应未携带时沿用上次的值）"""
+        previous = self.validators.get(feed.id, {}) if not_modified else {}
+        self._conditional_results[feed.id] = {
+            "not_modified": not_modified,
+            "url": feed.url,
+            "etag": response.headers.get("ETag") or previous.get("etag"),
+            "last_modified": response.headers.get("Last-Modified") or previous.get("last_modified"),
+        }
+
     def fetch_feed(self, feed: RSSFeedConfig) -> Tuple[List[RSSItem], Optional[str]]:
         """
         抓取单个 RSS 源
 
+        源返回 304 未更新时不解析内容，返回空列表且无错误，
+        由 fetch_all 记入 not_modified_ids。
+
         Args:
             feed: RSS 源配置
 
         Returns:
             (条目列表, 错误信息) 元组
         """
+        timeout = feed.timeout or self.timeout
+        start = time.monotonic()
         try:
-            response = self.session.get(feed.url, timeout=self.timeout)
-            response.raise_for_status()
+            timeout = self._deadline.clamp_timeout(timeout)
+            headers = self._conditional_headers(feed)
+            start = time.monotonic()
+            response = hedged_request(
+                lambda: self._get(feed, timeout, headers),
+                self.hedge_after.get(feed.id),
+                label=f"[RSS] {feed.name}:",
+            )
+            self._latencies[feed.id] = int((time.monotonic() - start) * 1000)
 
-            parsed_items = self.parser.parse(response.text, feed.url)
+            if response.status_code == 304:
+                self._record_conditional_result(feed, response, not_modified=True)
+                print(f"[RSS] {feed.name}: 未更新 (304)")
+                return [], None
 
-            # 限制条目数量（0=不限制）
-            if feed.max_items > 0:
-                parsed_items = parsed_items[:feed.max_items]
+            response.raise_for_status()
+            self._record_conditional_result(feed, response, not_modified=False)
+
+            # 增量解析：max_items 在摘要清理前生效，已见过的条目只记录 URL
+            # 大文档使用流式解析，达到 max_items 后不再解析剩余内容
+            stream = 0 < self.stream_threshold <= len(response.content)
+            result = self.parser.parse_incremental(
+                response.text, feed.url, feed.max_items, self._parse_cutoff(feed), stream=stream
+            )
+            parsed_items = result.items
+            if result.seen_urls:
+                self._seen_in_crawl[feed.id] = result.seen_urls
 
             # 转换为 RSSItem（使用配置的时区）
             now = get_configured_time(self.timezone)
@@ -170,15 +344,28 @@ class RSSFetcher:
 
             # 注意：新鲜度过滤已移至推送阶段（_convert_rss_items_to_list）
             # 这样所有文章都会存入数据库，但旧文章不会推送
-            print(f"[RSS] {feed.name}: 获取 {len(items)} 条")
+            details = []
+            if result.seen_urls:
+                details.append(f"已存在 {len(result.seen_urls)} 条")
+            if result.stale_count:
+                details.append(f"跳过过期 {result.stale_count} 条")
+            suffix = f"（{'，'.join(details)}）" if details else ""
+            print(f"[RSS] {feed.name}: 获取 {len(items)} 条{suffix}")
             return items, None
 
+        except CrawlDeadlineExceeded as e:
+            error = str(e)
+            print(f"[RSS] {feed.name}: {error}")
+            return [], error
+
         except requests.Timeout:
-            error = f"请求超时 ({self.timeout}s)"
+            self._latencies[feed.id] = int((time.monotonic() - start) * 1000)
+            error = f"请求超时 ({timeout:.3g}s)"
             print(f"[RSS] {feed.name}: {error}")
             return [], error
 
         except requests.RequestException as e:
+            self._latencies[feed.id] = int((time.monotonic() - start) * 1000)
             error = f"请求失败: {e}"
             print(f"[RSS] {feed.name}: {error}")
             return [], error
@@ -203,6 +390,13 @@ class RSSFetcher:
         all_items: Dict[str, List[RSSItem]] = {}
         id_to_name: Dict[str, str] = {}
         failed_ids: List[str] = []
+        not_modified_ids: List[str] = []
+        validators: Dict[str, Dict[str, str]] = {}
+        self._conditional_results = {}
+        self._seen_in_crawl = {}
+        self._latencies = {}
+        self._deadline = CrawlDeadline(self.deadline)
+        seen_urls: Dict[str, List[str]] = {}
 
         # 使用配置的时区
         now = get_configured_time(self.timezone)
@@ -211,24 +405,40 @@ class RSSFetcher:
 
         print(f"[RSS] 开始抓取 {len(self.feeds)} 个 RSS 源...")
 
-        for i, feed in enumerate(self.feeds):
-            # 请求间隔（带随机波动）
-            if i > 0:
-                interval = self.request_interval / 1000
-                jitter = random.uniform(-0.2, 0.2) * interval
-                time.sleep(interval + jitter)
-
-            items, error = self.fetch_feed(feed)
+        if self.max_workers > 1 and len(self.feeds) > 1:
+            results = self._fetch_concurrently()
+        else:
+            results = self._fetch_sequentially()
 
+        # 按配置顺序合并结果，保证 RSSData 的顺序与抓取方式无关
+        for feed, (items, error) in zip(self.feeds, results):
             id_to_name[feed.id] = feed.name
 
             if error:
                 failed_ids.append(feed.id)
+                continue
+
+            result = self._conditional_results.get(feed.id, {})
+            if result.get("not_modified"):
+                not_modified_ids.append(feed.id)
             else:
                 all_items[feed.id] = items
+                if feed.id in self._seen_in_crawl:
+                    seen_urls[feed.id] = self._seen_in_crawl[feed.id]
+
+            if result.get("etag") or result.get("last_modified"):
+                validators[feed.id] = {
+                    "url": result["url"],
+                    "etag": result.get("etag"),
+                    "last_modified": result.get("last_modified"),
+                }
 
         total_items = sum(len(items) for items in all_items.values())
-        print(f"[RSS] 抓取完成: {len(all_items)} 个源成功, {len(failed_ids)} 个失败, 共 {total_items} 条")
+        success_count = len(all_items) + len(not_modified_ids)
+        summary = f"[RSS] 抓取完成: {success_count} 个源成功, {len(failed_ids)} 个失败, 共 {total_items} 条"
+        if not_modified_ids:
+            summary += f"（其中 {len(not_modified_ids)} 个源未更新）"
+        print(summary)
 
         return RSSData(
             date=crawl_date,
@@ -236,8 +446,71 @@ class RSSFetcher:
             items=all_items,
             id_to_name=id_to_name,
             failed_ids=failed_ids,
+            not_modified_ids=not_modified_ids,
+            validators=validators,
+            seen_urls=seen_urls,
+            latencies=dict(self._latencies),
         )
 
+    def _deadline_error(self) -> Tuple[List[RSSItem], str]:
+        """到截止时间仍未完成的源的结果"""
+        return [], f"超出抓取截止时间 ({self.deadline:g}s)"
+
+    def _fetch_sequentially(self) -> List[Tuple[List[RSSItem], Optional[str]]]:
+        """顺序抓取所有源（源之间统一间隔 request_interval）"""
+        results = []
+        for i, feed in enumerate(self.feeds):
+            if self._deadline.expired():
+                print(f"[RSS] {feed.name}: 跳过，超出抓取截止时间")
+                results.append(self._deadline_error())
+                continue
+
+            # 请求间隔（带随机波动）
+            if i > 0:
+                interval = self.request_interval / 1000
+                jitter = random.uniform(-0.2, 0.2) * interval
+                time.sleep(interval + jitter)
+
+            results.append(self.fetch_feed(feed))
+        return results
+
+    def _fetch_concurrently(self) -> List[Tuple[List[RSSItem], Optional[str]]]:
+        """
+        并发抓取所有源
+
+        线程池大小为 max_workers，同一主机的请求之间保持 request_interval 间隔。
+
+        Returns:
+            与 self.feeds 顺序一致的 (条目列表, 错误信息) 列表
+        """
+        throttle = HostThrottle(self.request_interval)
+
+        def fetch(feed: RSSFeedConfig) -> Tuple[List[RSSItem], Optional[str]]:
+            throttle.wait(urlparse(feed.url).netloc.lower())
+            return self.fetch_feed(feed)
+
+        workers = min(self.max_workers, len(self.feeds))
+        print(f"[RSS] 并发抓取（{workers} 线程，同一主机间隔 {self.request_interval}ms）")
+
+        executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="rss-fetch")
+        try:
+            # fetch_feed 内部捕获所有异常并返回错误信息；按输入顺序收集结果
+            futures = [executor.submit(fetch, feed) for feed in self.feeds]
+            wait(futures, timeout=self._deadline.remaining())
+
+            results = []
+            for feed, future in zip(self.feeds, futures):
+                if future.done():
+                    results.append(future.result())
+                else:
+                    future.cancel()
+                    print(f"[RSS] {feed.name}: 超出抓取截止时间，本次记为失败")
+                    results.append(self._deadline_error())
+            return results
+        finally:
+            # 截止时仍在进行的请求在后台自然结束（受请求超时限制），不再等待
+            executor.shutdown(wait=False)
+
     @classmethod
     def from_config(cls, config: Dict) -> "RSSFetcher":
         """
@@ -248,6 +521,7 @@ class RSSFetcher:
                 {
                     "enabled": true,
                     "request_interval": 2000,
+                    "max_workers": 4,
                     "freshness_filter": {
                         "enabled": true,
                         "max_age_days": 3
@@ -289,6 +563,7 @@ class RSSFetcher:
                 max_items=feed_config.get("max_items", 0),  # 0=不限制
                 enabled=feed_config.get("enabled", True),
                 max_age_days=max_age_days,  # None=使用全局，0=禁用，>0=覆盖
+                timeout=feed_config.get("timeout"),
             )
             if feed.id and feed.url:
                 feeds.append(feed)
@@ -302,4 +577,6 @@ class RSSFetcher:
             timezone=config.get("timezone", DEFAULT_TIMEZONE),
             freshness_enabled=freshness_enabled,
             default_max_age_days=default_max_age_days,
+            max_workers=config.get("max_workers", 1),
+            stream_threshold_kb=config.get("stream_threshold_kb", 0),
         )
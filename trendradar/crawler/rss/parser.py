@@ -2,17 +2,23 @@
 """
 RSS 解析器
 
-支持 RSS 2.0、Atom 和 JSON Feed 1.1 格式的解析
+支持 RSS 2.0、Atom 和 JSON Feed 1.1 格式的解析。
+parse_incremental 支持截止条件：已见过的条目和超出新鲜度范围的条目不做完整转换，
+max_items 在摘要清理之前生效。stream=True 时 RSS/Atom 使用流式解析（见 stream.py），
+达到 max_items 后不再解析剩余内容，格式错误时回退到 feedparser。
 """
 
 import re
 import html
 import json
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Iterable, Set, Tuple
 from email.utils import parsedate_to_datetime
 
+from trendradar.utils.time import DEFAULT_TIMEZONE, is_within_days
+from .stream import StreamParseError, iter_xml_entries
+
 try:
     import feedparser
     HAS_FEEDPARSER = True
@@ -32,6 +38,28 @@ class ParsedRSSItem:
     guid: Optional[str] = None
 
 
+@dataclass
+class ParseCutoff:
+    """
+    增量解析的截止条件
+
+    截止条件只决定条目是否做完整转换，不会提前停止读取 Feed（只有 max_items 会）：
+    已见过的条目仍需报告 URL，保存时据此更新其最后出现时间和出现次数；
+    Feed 也不保证按时间排序，遇到过期条目后仍可能有新条目。
+    """
+    seen: Set[str] = field(default_factory=set)  # 已见过的条目 GUID / URL
+    max_age_days: int = 0                        # 新鲜度范围（天），超出的条目跳过；0=不按时间截止
+    timezone: str = DEFAULT_TIMEZONE             # 新鲜度判断使用的时区
+
+
+@dataclass
+class ParseResult:
+    """增量解析结果"""
+    items: List[ParsedRSSItem]                   # 需要完整转换的新条目
+    seen_urls: List[str] = field(default_factory=list)  # max_items 范围内已见过的条目 URL（未转换）
+    stale_count: int = 0                         # 因超出新鲜度范围跳过的条目数
+
+
 class RSSParser:
     """RSS 解析器"""
 
@@ -47,20 +75,24 @@ class RSSParser:
 
         self.max_summary_length = max_summary_length
 
-    def parse(self, content: str, feed_url: str = "") -> List[ParsedRSSItem]:
+    def parse(self, content: str, feed_url: str = "", max_items: int = 0) -> List[ParsedRSSItem]:
         """
         解析 RSS/Atom/JSON Feed 内容
 
         Args:
             content: Feed 内容（XML 或 JSON）
             feed_url: Feed URL（用于错误提示）
+            max_items: 最大条目数（0=不限制）
 
         Returns:
             解析后的条目列表
         """
         # 先尝试检测 JSON Feed
         if self._is_json_feed(content):
-            return self._parse_json_feed(content, feed_url)
+            return self._parse_json_feed(content, feed_url, max_items)
+
+        if max_items > 0:
+            return self.parse_incremental(content, feed_url, max_items).items
 
         # 使用 feedparser 解析 RSS/Atom
         feed = feedparser.parse(content)
@@ -76,6 +108,119 @@ class RSSParser:
 
         return items
 
+    def parse_incremental(
+        self,
+        content: str,
+        feed_url: str = "",
+        max_items: int = 0,
+        cutoff: Optional[ParseCutoff] = None,
+        stream: bool = False,
+    ) -> ParseResult:
+        """
+        按截止条件增量解析 RSS/Atom/JSON Feed 内容
+
+        按 Feed 中的顺序处理有标题的条目，达到 max_items 后停止；范围内的条目中：
+        - 已见过的（URL 或 GUID 在 cutoff.seen 中）只记录 URL，不做日期、摘要、作者的转换
+        - 发布时间超出 cutoff.max_age_days 的跳过
+        - 其余条目完整转换
+
+        没有截止条件且 max_items=0 时，结果与 parse() 相同。
+
+        Args:
+            content: Feed 内容（XML 或 JSON）
+            feed_url: Feed URL（用于错误提示）
+            max_items: 最大条目数（0=不限制），在摘要清理之前生效
+            cutoff: 截止条件（可选）
+            stream: RSS/Atom 是否使用流式解析（格式错误时自动回退到 feedparser）
+
+        Returns:
+            ParseResult
+        """
+        if self._is_json_feed(content):
+            try:
+                entries = json.loads(content).get("items", []) or []
+            except json.JSONDecodeError as e:
+                raise ValueError(f"JSON Feed 解析失败 ({feed_url}): {e}")
+            return self._collect_entries(entries, True, max_items, cutoff)
+
+        if stream:
+            try:
+                return self._collect_entries(
+                    iter_xml_entries(content), False, max_items, cutoff
+                )
+            except StreamParseError as e:
+                print(f"[RSS] 流式解析失败，回退到 feedparser ({feed_url}): {e}")
+
+        return self._collect_entries(
+            self._feedparser_entries(content, feed_url), False, max_items, cutoff
+        )
+
+    def _feedparser_entries(self, content: str, feed_url: str = "") -> List[Any]:
+        """使用 feedparser 解析完整文档，返回条目列表"""
+        feed = feedparser.parse(content)
+        if feed.bozo and not feed.entries:
+            raise ValueError(f"RSS 解析失败 ({feed_url}): {feed.bozo_exception}")
+        return feed.entries
+
+    def _collect_entries(
+        self,
+        entries: Iterable[Any],
+        is_json: bool,
+        max_items: int = 0,
+        cutoff: Optional[ParseCutoff] = None,
+    ) -> ParseResult:
+        """
+        按截止条件转换条目（entries 可以是惰性迭代器，达到 max_items 后不再读取）
+
+        已见过和过期的条目同样计入 max_items，只是跳过完整转换；在此之前不会提前停止。
+
+        Args:
+            entries: 条目（feedparser 条目、流式解析的条目字典或 JSON Feed 条目）
+            is_json: 是否为 JSON Feed 条目
+            max_items: 最大条目数（0=不限制）
+            cutoff: 截止条件（可选）
+
+        Returns:
+            ParseResult
+        """
+        seen = cutoff.seen if cutoff else None
+        max_age_days = cutoff.max_age_days if cutoff else 0
+
+        result = ParseResult(items=[])
+        taken = 0
+        for entry in entries:
+            if max_items > 0 and taken >= max_items:
+                break
+
+            if is_json:
+                title, url, guid = self._json_item_identity(entry)
+            else:
+                title, url, guid = self._entry_identity(entry)
+            if not title:
+                continue
+            taken += 1
+
+            if seen and url and (url in seen or guid in seen):
+                result.seen_urls.append(url)
+                continue
+
+            if max_age_days > 0:
+                published_at = (
+                    self._json_item_date(entry) if is_json else self._parse_date(entry)
+                )
+                if published_at and not is_within_days(published_at, max_age_days, cutoff.timezone):
+                    result.stale_count += 1
+                    continue
+
+            if is_json:
+                item = self._parse_json_feed_item(entry)
+            else:
+                item = self._parse_entry(entry)
+            if item:
+                result.items.append(item)
+
+        return result
+
     def _is_json_feed(self, content: str) -> bool:
         """
         检测内容是否为 JSON Feed 格式
@@ -93,7 +238,12 @@ class RSSParser:
         except (json.JSONDecodeError, TypeError):
             return False
 
-    def _parse_json_feed(self, content: str, feed_url: str = "") -> List[ParsedRSSItem]:
+    def _parse_json_feed(
+        self,
+        content: str,
+        feed_url: str = "",
+        max_items: int = 0,
+    ) -> List[ParsedRSSItem]:
         """
         解析 JSON Feed 1.1 格式
 
@@ -102,6 +252,7 @@ class RSSParser:
         Args:
             content: JSON Feed 内容
             feed_url: Feed URL（用于错误提示）
+            max_items: 最大条目数（0=不限制），达到后不再转换剩余条目
 
         Returns:
             解析后的条目列表
@@ -120,11 +271,13 @@ class RSSParser:
             item = self._parse_json_feed_item(item_data)
             if item:
                 items.append(item)
+                if max_items > 0 and len(items) >= max_items:
+                    break
 
         return items
 
-    def _parse_json_feed_item(self, item_data: Dict[str, Any]) -> Optional[ParsedRSSItem]:
-        """解析单个 JSON Feed 条目"""
+    def _json_item_identity(self, item_data: Dict[str, Any]) -> Tuple[str, str, str]:
+        """获取 JSON Feed 条目的 (标题, URL, GUID)，不做其他字段的转换"""
         # 标题：优先 title，否则使用 content_text 的前 100 字符
         title = item_data.get("title", "")
         if not title:
@@ -133,17 +286,30 @@ class RSSParser:
                 title = content_text[:100] + ("..." if len(content_text) > 100 else "")
 
         title = self._clean_text(title)
-        if not title:
-            return None
 
         # URL
         url = item_data.get("url", "") or item_data.get("external_url", "")
 
-        # 发布时间（ISO 8601 格式）
-        published_at = None
+        # GUID
+        guid = item_data.get("id", "") or url
+
+        return title, url, guid
+
+    def _json_item_date(self, item_data: Dict[str, Any]) -> Optional[str]:
+        """解析 JSON Feed 条目的发布时间（ISO 8601 格式）"""
         date_str = item_data.get("date_published") or item_data.get("date_modified")
         if date_str:
-            published_at = self._parse_iso_date(date_str)
+            return self._parse_iso_date(date_str)
+        return None
+
+    def _parse_json_feed_item(self, item_data: Dict[str, Any]) -> Optional[ParsedRSSItem]:
+        """解析单个 JSON Feed 条目"""
+        title, url, guid = self._json_item_identity(item_data)
+        if not title:
+            return None
+
+        # 发布时间（ISO 8601 格式）
+        published_at = self._json_item_date(item_data)
 
         # 摘要：优先 summary，否则使用 content_text
         summary = item_data.get("summary", "")
@@ -165,9 +331,6 @@ class RSSParser:
             if names:
                 author = ", ".join(names)
 
-        # GUID
-        guid = item_data.get("id", "") or url
-
         return ParsedRSSItem(
             title=title,
             url=url,
@@ -213,11 +376,9 @@ class RSSParser:
 
         return self.parse(response.text, url)
 
-    def _parse_entry(self, entry: Any) -> Optional[ParsedRSSItem]:
-        """解析单个条目"""
+    def _entry_identity(self, entry: Any) -> Tuple[str, str, str]:
+        """获取条目的 (标题, URL, GUID)，不做其他字段的转换"""
         title = self._clean_text(entry.get("title", ""))
-        if not title:
-            return None
 
         url = entry.get("link", "")
         if not url:
@@ -230,10 +391,19 @@ class RSSParser:
             if not url and links:
                 url = links[0].get("href", "")
 
+        guid = entry.get("id") or entry.get("guid", {}).get("value") or url
+
+        return title, url, guid
+
+    def _parse_entry(self, entry: Any) -> Optional[ParsedRSSItem]:
+        """解析单个条目"""
+        title, url, guid = self._entry_identity(entry)
+        if not title:
+            return None
+
         published_at = self._parse_date(entry)
         summary = self._parse_summary(entry)
         author = self._parse_author(entry)
-        guid = entry.get("id") or entry.get("guid", {}).get("value") or url
 
         return ParsedRSSItem(
             title=title,
@@ -0,0 +1,177 @@
+# coding=utf-8
+"""
+RSS/Atom 流式解析
+
+基于 xml.etree.ElementTree.XMLPullParser 增量读取 XML 事件，
+每个 <item> / <entry> 结束时产出一个与 feedparser 条目字段兼容的字典，
+RSSParser 的条目转换逻辑（_entry_identity、_parse_entry 等）可以直接复用。
+
+调用方停止迭代后不再解析剩余内容，且已产出的元素会从树中移除，
+因此多兆字节的归档/播客 Feed 只需付出前 max_items 个条目的解析开销。
+文档格式错误时抛出 StreamParseError，由调用方回退到 feedparser。
+"""
+
+import time
+import xml.etree.ElementTree as ET
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Iterator, List, Optional
+
+# 每次送入解析器的字符数
+CHUNK_SIZE = 64 * 1024
+
+_ATOM_NS = "http://www.w3.org/2005/Atom"
+_CONTENT_NS = "http://purl.org/rss/1.0/modules/content/"
+_DC_NS = "http://purl.org/dc/elements/1.1/"
+
+# 条目元素（RSS 2.0 / RSS 1.0 / Atom）
+_ENTRY_TAGS = frozenset(("item", "entry"))
+
+
+class StreamParseError(ValueError):
+    """流式解析失败（文档格式错误或编码不受支持）"""
+
+
+def _split_tag(tag: str) -> tuple:
+    """拆分 {namespace}local 形式的标签名"""
+    if tag.startswith("{"):
+        namespace, _, local = tag[1:].partition("}")
+        return namespace, local
+    return "", tag
+
+
+def _element_text(elem: ET.Element) -> str:
+    """获取元素的全部文本（包括 Atom xhtml 内容中的子元素文本）"""
+    return "".join(elem.itertext()).strip()
+
+
+def _date_struct(date_str: str) -> Optional[time.struct_time]:
+    """
+    将 RFC 822 / ISO 8601 日期转换为 UTC 的 struct_time（与 feedparser 的 *_parsed 一致）
+    """
+    if not date_str:
+        return None
+
+    dt = None
+    try:
+        dt = parsedate_to_datetime(date_str)
+    except (TypeError, ValueError, IndexError):
+        try:
+            dt = datetime.fromisoformat(date_str.strip().replace("Z", "+00:00"))
+        except ValueError:
+            return None
+
+    if dt is None:
+        return None
+    if dt.tzinfo is not None:
+        dt = dt.astimezone(timezone.utc)
+    return dt.timetuple()
+
+
+def _build_entry(elem: ET.Element) -> Dict[str, Any]:
+    """将 <item> / <entry> 元素转换为 feedparser 风格的条目字典"""
+    entry: Dict[str, Any] = {}
+    links: List[Dict[str, str]] = []
+    content: List[Dict[str, str]] = []
+    authors: List[Dict[str, str]] = []
+
+    for child in elem:
+        namespace, name = _split_tag(child.tag)
+
+        if name == "title":
+            entry["title"] = _element_text(child)
+        elif name == "link":
+            href = child.get("href")
+            if href is not None:
+                # Atom: <link rel="alternate" href="..."/>
+                rel = child.get("rel", "alternate")
+                links.append({"rel": rel, "type": child.get("type", ""), "href": href})
+                if rel == "alternate" and "link" not in entry:
+                    entry["link"] = href
+            elif child.text:
+                entry["link"] = child.text.strip()
+        elif name in ("guid", "id"):
+            entry["id"] = (child.text or "").strip()
+        elif name in ("pubDate", "published", "issued") or (namespace == _DC_NS and name == "date"):
+            entry.setdefault("published", (child.text or "").strip())
+        elif name in ("updated", "modified"):
+            entry["updated"] = (child.text or "").strip()
+        elif name in ("description", "summary"):
+            entry["summary"] = child.text or _element_text(child)
+        elif namespace == _CONTENT_NS and name == "encoded":
+            content.append({"value": child.text or ""})
+        elif namespace == _ATOM_NS and name == "content":
+            content.append({"value": child.text or _element_text(child)})
+        elif name == "author":
+            # RSS: <author>文本</author>；Atom: <author><name>...</name></author>
+            author_name = next(
+                (_element_text(sub) for sub in child if _split_tag(sub.tag)[1] == "name"),
+                None,
+            )
+            if author_name is None:
+                author_name = _element_text(child)
+            if author_name:
+                authors.append({"name": author_name})
+                entry.setdefault("author", author_name)
+        elif namespace == _DC_NS and name == "creator":
+            entry["dc_creator"] = _element_text(child)
+
+    if links:
+        entry["links"] = links
+    if content:
+        entry["content"] = content
+    if authors:
+        entry["authors"] = authors
+
+    for key in ("published", "updated"):
+        if entry.get(key):
+            parsed = _date_struct(entry[key])
+            if parsed:
+                entry[f"{key}_parsed"] = parsed
+
+    return entry
+
+
+def iter_xml_entries(content: str, chunk_size: int = CHUNK_SIZE) -> Iterator[Dict[str, Any]]:
+    """
+    流式遍历 RSS/Atom 文档中的条目
+
+    Args:
+        content: Feed 内容（XML 字符串）
+        chunk_size: 每次送入解析器的字符数
+
+    Yields:
+        feedparser 风格的条目字典
+
+    Raises:
+        StreamParseError: 文档格式错误
+    """
+    parser = ET.XMLPullParser(events=("start", "end"))
+    stack: List[ET.Element] = []
+
+    try:
+        for offset in range(0, len(content), chunk_size):
+            parser.feed(content[offset:offset + chunk_size])
+            for event, elem in parser.read_events():
+                if event == "start":
+                    stack.append(elem)
+                    continue
+
+                stack.pop()
+                if _split_tag(elem.tag)[1] not in _ENTRY_TAGS:
+                    continue
+
+                # 只处理顶层条目（避免嵌套的同名元素被当作条目）
+                if any(_split_tag(parent.tag)[1] in _ENTRY_TAGS for parent in stack):
+                    continue
+
+                yield _build_entry(elem)
+
+                # 已产出的条目从树中移除，内存只与单个条目大小相关
+                if stack:
+                    stack[-1].remove(elem)
+                else:
+                    elem.clear()
+        parser.close()
+    except (ET.ParseError, ValueError) as e:
+        raise StreamParseError(str(e)) from e
@@ -0,0 +1,131 @@
+# coding=utf-8
+"""
+自适应抓取调度
+
+根据当天的抓取历史估计每个来源（热榜平台 / RSS 源）的更新节奏，
+跳过短时间内大概率没有变化的来源：
+- 热榜平台：新闻上榜（首次抓取）和脱榜（rank_history 中 rank=0）的抓取时间，排名互换不计
+- RSS 源：出现新增条目的抓取时间，以及最近条目 published_at 之间的间隔
+- 成功但内容未变化的抓取（304、没有新增条目）会拉长估计的变化间隔
+
+每个来源的抓取间隔取"预计变化间隔的一半"，并限制在 [min_interval, max_interval] 分钟内。
+当天还没有足够历史的来源总是到期；未到期的来源沿用上次的数据，报告为"未到期"而不是失败。
+"""
+
+from datetime import datetime
+from statistics import median
+from typing import Dict, List, Optional, Tuple
+
+
+# 估计发布间隔时使用的最近条目数
+PUBLISH_SAMPLE_SIZE = 10
+
+
+def _publish_gaps(published: List[str]) -> List[float]:
+    """
+    计算最近条目发布时间的相邻间隔
+
+    Args:
+        published: 条目发布时间（ISO 格式字符串）
+
+    Returns:
+        间隔列表（分钟）
+    """
+    times = []
+    for value in published:
+        try:
+            times.append(datetime.fromisoformat(value.replace("Z", "+00:00")))
+        except (AttributeError, ValueError):
+            continue
+
+    # 带时区与不带时区的时间无法比较，只保留与第一个条目一致的那一类
+    if times:
+        aware = times[0].tzinfo is not None
+        times = [t for t in times if (t.tzinfo is not None) == aware]
+
+    times = sorted(times, reverse=True)[:PUBLISH_SAMPLE_SIZE]
+    return [
+        (newer - older).total_seconds() / 60
+        for newer, older in zip(times, times[1:])
+        if newer > older
+    ]
+
+
+class AdaptiveScheduler:
+    """按来源的更新节奏决定本次是否抓取"""
+
+    def __init__(self, min_interval: int = 30, max_interval: int = 180):
+        """
+        初始化调度器
+
+        Args:
+            min_interval: 最短抓取间隔（分钟）
+            max_interval: 最长抓取间隔（分钟）
+        """
+        self.min_interval = max(0, min_interval)
+        self.max_interval = max(self.min_interval, max_interval)
+
+    def estimate_interval(self, activity: Optional[Dict]) -> int:
+        """
+        估计来源的抓取间隔
+
+        Args:
+            activity: 来源当天的抓取活动
+                {"checks": [成功抓取的分钟数], "changes": [有变化的分钟数], "published": [发布时间]}
+
+        Returns:
+            抓取间隔（分钟）
+        """
+        checks = sorted((activity or {}).get("checks", []))
+        if len(checks) < 2:
+            return self.min_interval
+
+        # 当天第一次抓取的条目全部是"新增"，不作为变化计入
+        first, last = checks[0], checks[-1]
+        changes = {t for t in activity.get("changes", []) if first < t <= last}
+        span = last - first
+
+        # 变化越少（未变化的抓取越多），预计的变化间隔越长；从未变化时按观察时长的两倍退避
+        expected = span / len(changes) if changes else span * 2
+
+        gaps = _publish_gaps(activity.get("published", []))
+        if gaps:
+            expected = min(expected, median(gaps))
+
+        return int(min(max(expected / 2, self.min_interval), self.max_interval))
+
+    def split_due(
+        self,
+        source_ids: List[str],
+        activity: Dict[str, Dict],
+        now_minutes: int,
+    ) -> Tuple[List[str], Dict[str, int]]:
+        """
+        将来源分为本次到期和未到期两组
+
+        Args:
+            source_ids: 来源 ID 列表（保持顺序）
+            activity: {来源 ID: 抓取活动}
+            now_minutes: 当前时间（当天的分钟数）
+
+        Returns:
+            (到期的来源 ID 列表, {未到期的来源 ID: 距离到期的分钟数})
+        """
+        due: List[str] = []
+        not_due: Dict[str, int] = {}
+
+        for source_id in source_ids:
+            source_activity = activity.get(source_id)
+            checks = (source_activity or {}).get("checks", [])
+            if not checks:
+                due.append(source_id)
+                continue
+
+            elapsed = now_minutes - max(checks)
+            interval = self.estimate_interval(source_activity)
+            if elapsed < 0 or elapsed >= interval:
+                due.append(source_id)
+            else:
+                not_due[source_id] = interval - elapsed
+
+        return due, not_due
@@ -0,0 +1,353 @@
+# coding=utf-8
+"""
+常驻调度模式
+
+RUN_MODE=daemon 时容器只启动一个进程，按内置的 cron 调度多次执行分析流程，
+避免每次运行都重新启动解释器、导入依赖、解析配置、下载远程数据库和建立 HTTP 连接。
+
+多次运行之间保留的状态：
+- NewsAnalyzer 实例（配置、HTTP 会话、代理池）
+- 存储管理器及其 SQLite 连接、远程存储下载的数据库
+- 频率词解析结果（按文件修改时间缓存）
+
+配置文件修改或日期变化时重建 NewsAnalyzer。收到 SIGTERM / SIGINT 后等待当前运行结束再退出。
+启用通知发件箱时，两次运行之间的空闲时间继续投递等待重试的批次。
+运行状态写入状态文件（默认 /tmp/trendradar_daemon.json），供 docker/manage.py status 查看。
+"""
+
+import json
+import os
+import signal
+import tempfile
+import threading
+import time
+import traceback
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, Optional, Set
+
+from trendradar.utils.time import DEFAULT_TIMEZONE, get_configured_time
+
+
+# 默认调度（与 cron 模式的 CRON_SCHEDULE 默认值一致）
+DEFAULT_SCHEDULE = "*/30 * * * *"
+
+# 默认状态文件路径
+DEFAULT_STATUS_FILE = os.path.join(tempfile.gettempdir(), "trendradar_daemon.json")
+
+
+class CronSchedule:
+    """
+    标准 5 字段 cron 表达式：分 时 日 月 周
+
+    支持 *、数字、范围（a-b）、步长（*/n、a-b/n）和列表（a,b,c）；
+    周字段 0 和 7 都表示周日。日和周都被限制时，满足任意一个即可（与 cron 一致）。
+    """
+
+    # (最小值, 最大值)
+    FIELD_RANGES = [(0, 59), (0, 23), (1, 31), (1, 12), (0, 7)]
+
+    def __init__(self, expression: str):
+        """
+        Args:
+            expression: cron 表达式，如 "*/30 * * * *"
+
+        Raises:
+            ValueError: 表达式格式错误
+        """
+        fields = expression.split()
+        if len(fields) != 5:
+            raise ValueError(f"cron 表达式需要 5 个字段: {expression}")
+
+        self.expression = expression
+        parsed = [self._parse_field(field, lo, hi) for field, (lo, hi) in zip(fields, self.FIELD_RANGES)]
+        self.minutes, self.hours, self.days, self.months, weekdays = parsed
+        # 统一为 Python 的 weekday（周一=0 ... 周日=6）
+        self.weekdays = {(w - 1) % 7 for w in weekdays}
+        self.day_restricted = fields[2] != "*"
+        self.weekday_restricted = fields[4] != "*"
+
+    @staticmethod
+    def _parse_field(field: str, lo: int, hi: int) -> Set[int]:
+        """解析单个字段为取值集合"""
+        values: Set[int] = set()
+        for part in field.split(","):
+            step = 1
+            if "/" in part:
+                part, step_str = part.split("/", 1)
+                step = int(step_str)
+                if step <= 0:
+                    raise ValueError(f"cron 步长必须为正数: {field}")
+
+            if part == "*":
+                start, end = lo, hi
+            elif "-" in part:
+                start_str, end_str = part.split("-", 1)
+                start, end = int(start_str), int(end_str)
+            else:
+                start = int(part)
+                # "a/n" 表示从 a 开始到最大值
+                end = hi if step > 1 else start
+
+            if start < lo or end > hi or start > end:
+                raise ValueError(f"cron 字段超出范围 [{lo}-{hi}]: {field}")
+            values.update(range(start, end + 1, step))
+        return values
+
+    def _day_matches(self, dt: datetime) -> bool:
+        """日期是否匹配日 / 周字段"""
+        day_ok = dt.day in self.days
+        weekday_ok = dt.weekday() in self.weekdays
+        if self.day_restricted and self.weekday_restricted:
+            return day_ok or weekday_ok
+        return day_ok and weekday_ok
+
+    def next_run(self, after: datetime) -> datetime:
+        """
+        计算 after 之后（不含）的下一次执行时间
+
+        Args:
+            after: 起始时间（可带时区）
+
+        Returns:
+            下一次执行时间（与 after 同一时区）
+
+        Raises:
+            ValueError: 5 年内没有匹配的时间（如 2 月 30 日）
+        """
+        dt = after.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        limit = after + timedelta(days=366 * 5)
+
+        while dt <= limit:
+            if dt.month not in self.months:
+                # 跳到下个月 1 日 0 点
+                dt = (dt.replace(day=1, hour=0, minute=0) + timedelta(days=32)).replace(day=1)
+                continue
+            if not self._day_matches(dt):
+                dt = dt.replace(hour=0, minute=0) + timedelta(days=1)
+                continue
+            if dt.hour not in self.hours:
+                dt = dt.replace(minute=0) + timedelta(hours=1)
+                continue
+            if dt.minute not in self.minutes:
+                dt += timedelta(minutes=1)
+                continue
+            return self._normalize(dt)
+
+        raise ValueError(f"cron 表达式没有可执行的时间: {self.expression}")
+
+    @staticmethod
+    def _normalize(dt: datetime) -> datetime:
+        """规范化带 pytz 时区的时间（跨夏令时的加减运算后需要重新计算偏移）"""
+        tz = dt.tzinfo
+        if tz is not None and hasattr(tz, "normalize"):
+            return tz.normalize(dt)
+        return dt
+
+
+class TrendRadarDaemon:
+    """常驻调度进程"""
+
+    def __init__(
+        self,
+        schedule: str = DEFAULT_SCHEDULE,
+        immediate_run: bool = False,
+        status_file: str = DEFAULT_STATUS_FILE,
+    ):
+        """
+        Args:
+            schedule: cron 表达式
+            immediate_run: 启动后是否立即执行一次
+            status_file: 状态文件路径
+        """
+        self.schedule = CronSchedule(schedule)
+        self.immediate_run = immediate_run
+        self.status_file = Path(status_file)
+        self.config_path = os.environ.get("CONFIG_PATH", "config/config.yaml")
+
+        self._stop = threading.Event()
+        self._analyzer = None
+        self._config_mtime: Optional[int] = None
+        self._analyzer_date: Optional[str] = None
+        self._timezone = DEFAULT_TIMEZONE
+        self._status: Dict = {
+            "pid": os.getpid(),
+            "schedule": schedule,
+            "state": "starting",
+            "started_at": None,
+            "runs": 0,
+            "failures": 0,
+            "last_run_start": None,
+            "last_run_seconds": None,
+            "last_error": None,
+            "next_run": None,
+            "config_loaded_at": None,
+            "updated_at": None,
+        }
+
+    # === 状态 ===
+
+    def _now(self) -> datetime:
+        """配置时区的当前时间"""
+        return get_configured_time(self._timezone)
+
+    def _write_status(self, **updates) -> None:
+        """更新并写入状态文件（先写临时文件再替换，避免读到一半的内容）"""
+        self._status.update(updates)
+        self._status["updated_at"] = self._now().isoformat(timespec="seconds")
+        try:
+            self.status_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.status_file.with_name(self.status_file.name + ".tmp")
+            tmp_path.write_text(json.dumps(self._status, ensure_ascii=False, indent=2), encoding="utf-8")
+            os.replace(tmp_path, self.status_file)
+        except OSError as e:
+            print(f"[常驻] 写入状态文件失败: {e}")
+
+    # === 信号 ===
+
+    def _install_signal_handlers(self) -> None:
+        """SIGTERM / SIGINT 只设置停止标记，当前运行结束后退出"""
+
+        def handle(signum, frame):
+            if not self._stop.is_set():
+                print(f"[常驻] 收到信号 {signal.Signals(signum).name}，当前运行结束后退出")
+            self._stop.set()
+
+        for sig in (signal.SIGTERM, signal.SIGINT):
+            signal.signal(sig, handle)
+
+    # === 分析器 ===
+
+    def _get_config_mtime(self) -> Optional[int]:
+        try:
+            return os.stat(self.config_path).st_mtime_ns
+        except OSError:
+            return None
+
+    def _release_analyzer(self) -> None:
+        """关闭当前分析器的存储资源"""
+        if self._analyzer is not None:
+            try:
+                self._analyzer.ctx.cleanup()
+            except Exception as e:
+                print(f"[常驻] 清理资源失败: {e}")
+            self._analyzer = None
+
+    def _ensure_analyzer(self):
+        """
+        获取分析器，配置文件修改或日期变化时重建
+
+        日期变化时重建可以关闭前一天的数据库连接，并让远程存储重新下载当天的数据库。
+        """
+        from trendradar.__main__ import NewsAnalyzer
+
+        mtime = self._get_config_mtime()
+        today = self._now().strftime("%Y-%m-%d")
+
+        if self._analyzer is not None:
+            if mtime != self._config_mtime:
+                print("[常驻] 配置文件已修改，重新加载")
+            elif today != self._analyzer_date:
+                print("[常驻] 日期已变化，重新初始化存储")
+            else:
+                return self._analyzer
+            self._release_analyzer()
+
+        self._analyzer = NewsAnalyzer(daemon=True)
+        self._config_mtime = mtime
+        self._timezone = self._analyzer.ctx.timezone
+        self._analyzer_date = self._now().strftime("%Y-%m-%d")
+        self._write_status(config_loaded_at=self._now().isoformat(timespec="seconds"))
+        return self._analyzer
+
+    def _run_once(self) -> None:
+        """执行一次分析流程"""
+        started = time.monotonic()
+        self._write_status(state="running", last_run_start=self._now().isoformat(timespec="seconds"))
+        error = None
+        try:
+            analyzer = self._ensure_analyzer()
+            analyzer.run(keep_warm=True)
+        except Exception as e:
+            # 单次运行失败不影响后续调度
+            error = str(e)
+            print(f"[常驻] 运行出错: {e}")
+            traceback.print_exc()
+            # 出错后下次运行重新初始化
+            self._release_analyzer()
+
+        elapsed = time.monotonic() - started
+        print(f"[常驻] 本次运行耗时 {elapsed:.1f} 秒")
+        self._write_status(
+            state="idle",
+            runs=self._status["runs"] + 1,
+            failures=self._status["failures"] + (1 if error else 0),
+            last_run_seconds=round(elapsed, 1),
+            last_error=error,
+        )
+
+    def _deliver_outbox(self) -> None:
+        """空闲时投递通知发件箱中到期的批次（未启用发件箱时不执行）"""
+        if self._analyzer is None:
+            return
+        try:
+            self._analyzer.deliver_pending_notifications()
+        except Exception as e:
+            print(f"[常驻] 投递通知发件箱失败: {e}")
+
+    # === 主循环 ===
+
+    def run(self) -> None:
+        """运行调度循环，直到收到停止信号"""
+        self._install_signal_handlers()
+        print(f"[常驻] 启动常驻模式 (PID {os.getpid()})，调度: {self.schedule.expression}")
+
+        try:
+            # 启动时即加载配置（调度按配置的时区计算），配置错误时直接退出
+            self._ensure_analyzer()
+            self._write_status(state="idle", started_at=self._now().isoformat(timespec="seconds"))
+
+            if self.immediate_run and not self._stop.is_set():
+                print("[常驻] 立即执行一次")
+                self._run_once()
+
+            while not self._stop.is_set():
+                now = self._now()
+                next_run = self.schedule.next_run(now)
+                self._write_status(next_run=next_run.isoformat(timespec="seconds"))
+                print(f"[常驻] 下次运行: {next_run.strftime('%Y-%m-%d %H:%M')}")
+
+                # 分段等待，系统休眠或时钟调整后仍能按墙上时间触发
+                while not self._stop.is_set():
+                    remaining = (next_run - self._now()).total_seconds()
+                    if remaining <= 0:
+                        break
+                    self._deliver_outbox()
+                    remaining = (next_run - self._now()).total_seconds()
+                    if remaining > 0:
+                        self._stop.wait(min(remaining, 60))
+
+                if self._stop.is_set():
+                    break
+                self._run_once()
+        finally:
+            self._release_analyzer()
+            # 分类进程池、SMTP 和推送 HTTP 会话在各次运行间复用，退出时关闭
+            from trendradar.__main__ import release_shared_resources
+            release_shared_resources()
+            self._write_status(state="stopped", next_run=None)
+            print("[常驻] 已退出")
+
+
+def run_daemon() -> None:
+    """
+    常驻模式入口
+
+    调度和立即执行分别读取环境变量 CRON_SCHEDULE 和 IMMEDIATE_RUN（与 cron 模式一致），
+    状态文件路径可通过 DAEMON_STATUS_FILE 覆盖。
+    """
+    schedule = os.environ.get("CRON_SCHEDULE", "").strip() or DEFAULT_SCHEDULE
+    immediate_run = os.environ.get("IMMEDIATE_RUN", "").strip().lower() in ("true", "1", "yes")
+    status_file = os.environ.get("DAEMON_STATUS_FILE", "").strip() or DEFAULT_STATUS_FILE
+
+    TrendRadarDaemon(schedule, immediate_run=immediate_run, status_file=status_file).run()
@@ -13,6 +13,10 @@
 - batch: 批次处理工具
 - renderer: 通知内容渲染
 - splitter: 消息分批拆分
+- client: 共用 HTTP 客户端（连接复用、按平台频率限制限速）
+- outbox: 通知发件箱（批次持久化、失败重试）
+- mailer: SMTP 会话复用
+- ledger: 推送台账（增量推送）
 - senders: 消息发送器（各渠道发送函数）
 - dispatcher: 多账号通知调度器
 """
@@ -27,6 +31,7 @@ from trendradar.notification.batch import (
     get_max_batch_header_size,
     truncate_to_bytes,
     add_batch_headers,
+    SplitCache,
 )
 from trendradar.notification.renderer import (
     render_feishu_content,
@@ -36,6 +41,26 @@ from trendradar.notification.splitter import (
     split_content_into_batches,
     DEFAULT_BATCH_SIZES,
 )
+from trendradar.notification.client import (
+    NotificationClient,
+    TokenBucket,
+    CHANNEL_RATE_LIMITS,
+    get_http_client,
+)
+from trendradar.notification.outbox import (
+    NotificationOutbox,
+    OutboxMessage,
+    collect_secrets,
+)
+from trendradar.notification.ledger import (
+    PushLedger,
+    DeltaView,
+    item_key,
+)
+from trendradar.notification.mailer import (
+    SMTPSessionPool,
+    get_smtp_pool,
+)
 from trendradar.notification.senders import (
     send_to_feishu,
     send_to_dingtalk,
@@ -60,12 +85,29 @@ __all__ = [
     "get_max_batch_header_size",
     "truncate_to_bytes",
     "add_batch_headers",
+    "SplitCache",
     # 内容渲染
     "render_feishu_content",
     "render_dingtalk_content",
     # 消息分批
     "split_content_into_batches",
     "DEFAULT_BATCH_SIZES",
+    # HTTP 客户端
+    "NotificationClient",
+    "TokenBucket",
+    "CHANNEL_RATE_LIMITS",
+    "get_http_client",
+    # 通知发件箱
+    "NotificationOutbox",
+    "OutboxMessage",
+    "collect_secrets",
+    # 推送台账
+    "PushLedger",
+    "DeltaView",
+    "item_key",
+    # SMTP 会话
+    "SMTPSessionPool",
+    "get_smtp_pool",
     # 消息发送器
     "send_to_feishu",
     "send_to_dingtalk",
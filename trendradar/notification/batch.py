@@ -5,7 +5,8 @@
 提供消息分批发送的辅助函数
 """
 
-from typing import List
+import threading
+from typing import Any, Callable, Dict, List, Tuple
 
 
 def get_batch_header(format_type: str, batch_num: int, total_batches: int) -> str:
@@ -113,3 +114,97 @@ def add_batch_headers(
         result.append(header + content)
 
     return result
+
+
+def _cache_key_part(value: Any) -> Any:
+    """
+    生成缓存键的一部分
+
+    字符串、数字、None 按值比较；只含简单值的字典（如 AI 统计数据，每个渠道单独构造）按内容比较；
+    其他对象（报告数据、RSS 条目等）按对象身份比较，同一次分发中各渠道共享这些对象。
+    """
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    if isinstance(value, dict) and all(
+        v is None or isinstance(v, (str, int, float, bool)) for v in value.values()
+    ):
+        return ("dict", tuple(sorted(value.items())))
+    return ("id", id(value))
+
+
+class SplitCache:
+    """
+    单次分发内的消息分批结果缓存
+
+    多账号推送时每个账号都会用相同的报告数据调用一次分批函数，只有 Webhook 地址不同；
+    不同渠道的格式和批次大小相同时（如企业微信和通用 Webhook）分批结果也相同。
+    缓存按 (格式类型, 批次大小, 模式, 区域数据) 复用分批结果，每种格式只渲染一次。
+
+    缓存只在一次分发内有效，期间持有各参数对象的引用，保证按身份比较的对象不会被回收后复用 id。
+    线程安全：并行发送的渠道请求同一结果时，后到的渠道等待先到的渠道渲染完成。
+    """
+
+    def __init__(self, split_content_func: Callable[..., List[str]]):
+        """
+        Args:
+            split_content_func: 原始分批函数
+        """
+        self.split_content_func = split_content_func
+        self.renders = 0
+        self.hits = 0
+        self._entries: Dict[Tuple, Dict] = {}
+        self._lock = threading.Lock()
+
+    def __call__(
+        self,
+        report_data: Dict,
+        format_type: str,
+        update_info: Any = None,
+        max_bytes: Any = None,
+        mode: str = "daily",
+        **kwargs,
+    ) -> List[str]:
+        key = (
+            format_type,
+            max_bytes,
+            mode,
+            _cache_key_part(report_data),
+            _cache_key_part(update_info),
+            tuple((name, _cache_key_part(value)) for name, value in sorted(kwargs.items())),
+        )
+
+        with self._lock:
+            entry = self._entries.get(key)
+            owner = entry is None
+            if owner:
+                entry = {
+                    "lock": threading.Lock(),
+                    "batches": None,
+                    # 持有参数引用，避免按身份比较的对象被回收
+                    "args": (report_data, update_info, kwargs),
+                }
+                entry["lock"].acquire()
+                self._entries[key] = entry
+
+        if owner:
+            try:
+                entry["batches"] = self.split_content_func(
+                    report_data, format_type, update_info,
+                    max_bytes=max_bytes, mode=mode, **kwargs,
+                )
+                self.renders += 1
+            finally:
+                entry["lock"].release()
+                if entry["batches"] is None:
+                    # 渲染失败时不缓存，后续调用重新渲染
+                    with self._lock:
+                        self._entries.pop(key, None)
+        else:
+            with entry["lock"]:
+                pass
+            if entry["batches"] is None:
+                return self(report_data, format_type, update_info, max_bytes=max_bytes, mode=mode, **kwargs)
+            with self._lock:
+                self.hits += 1
+
+        return list(entry["batches"])
@@ -0,0 +1,233 @@
+# coding=utf-8
+"""
+通知 HTTP 客户端
+
+所有通知渠道共用的 HTTP 客户端（线程安全）：
+- 按主机复用 requests.Session，同一 webhook 的多个批次、多次运行之间保持长连接
+- 每个 webhook 一个令牌桶，按平台文档的频率限制控制发送速度，取代固定的批次间隔
+- 收到 429 时按 Retry-After（Telegram 为响应中的 retry_after）等待后重试
+
+使用方式：
+
+    client = get_http_client()
+    response = client.post("feishu", webhook_url, json=payload, proxies=proxies, timeout=30)
+"""
+
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+# 各平台的频率限制：渠道 → (每秒补充的令牌数, 桶容量)
+# 任意 T 秒内最多发送 容量 + 速率 × T 条，按文档限制取值
+CHANNEL_RATE_LIMITS: Dict[str, Tuple[float, int]] = {
+    "feishu": (1.5, 3),         # 自定义机器人 100 次/分钟、5 次/秒
+    "dingtalk": (10 / 60, 10),  # 每个机器人 20 条/分钟，超出后限流 10 分钟
+    "wework": (10 / 60, 10),    # 每个机器人 20 条/分钟
+    "telegram": (1.0, 1),       # 同一会话 1 条/秒（群组 20 条/分钟，超出时返回 429）
+    "slack": (1.0, 1),          # Incoming Webhook 1 条/秒
+}
+
+
+class TokenBucket:
+    """令牌桶（线程安全，令牌不足时预约并等待）"""
+
+    def __init__(self, rate: float, capacity: int = 1):
+        """
+        Args:
+            rate: 每秒补充的令牌数
+            capacity: 桶容量（允许的突发数量）
+        """
+        self.rate = rate
+        self.capacity = max(1, capacity)
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """
+        获取一个令牌，必要时等待
+
+        Returns:
+            等待的秒数
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            # 令牌可以为负，表示已被预约，后来者依次顺延
+            self._tokens -= 1
+            wait = max(-self._tokens / self.rate, self._blocked_until - now, 0.0)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    def pause(self, seconds: float) -> None:
+        """暂停发放令牌（收到 429 时使用）"""
+        with self._lock:
+            self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+
+
+def _retry_after(response: requests.Response) -> Optional[float]:
+    """解析 429 响应中的等待时间（秒），无法解析时返回 None"""
+    value = response.headers.get("Retry-After")
+    if value:
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            try:
+                retry_at = parsedate_to_datetime(value)
+                return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+            except (TypeError, ValueError):
+                pass
+
+    # Telegram: {"ok": false, "parameters": {"retry_after": 5}}
+    try:
+        parameters = response.json().get("parameters") or {}
+        if parameters.get("retry_after") is not None:
+            return max(0.0, float(parameters["retry_after"]))
+    except (ValueError, AttributeError, TypeError):
+        pass
+    return None
+
+
+class NotificationClient:
+    """通知渠道共用的 HTTP 客户端"""
+
+    def __init__(
+        self,
+        rate_limits: Optional[Dict[str, Tuple[float, int]]] = None,
+        max_retries: int = 3,
+        default_retry_wait: float = 10,
+        max_retry_wait: float = 60,
+        pool_maxsize: int = 4,
+    ):
+        """
+        Args:
+            rate_limits: 各渠道的频率限制（默认 CHANNEL_RATE_LIMITS）
+            max_retries: 429 最多重试次数
+            default_retry_wait: 429 响应没有给出等待时间时的等待秒数
+            max_retry_wait: 等待时间超过该值时不再重试，直接返回 429 响应
+            pool_maxsize: 每个主机的连接池大小
+        """
+        self.rate_limits = CHANNEL_RATE_LIMITS if rate_limits is None else rate_limits
+        self.max_retries = max(0, max_retries)
+        self.default_retry_wait = default_retry_wait
+        self.max_retry_wait = max_retry_wait
+        self.pool_maxsize = pool_maxsize
+
+        self._sessions: Dict[str, requests.Session] = {}
+        self._buckets: Dict[Tuple[str, str], TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def _session(self, url: str) -> requests.Session:
+        """获取主机对应的会话"""
+        parts = urlsplit(url)
+        host = f"{parts.scheme}://{parts.netloc}".lower()
+        with self._lock:
+            session = self._sessions.get(host)
+            if session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_maxsize)
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                self._sessions[host] = session
+            return session
+
+    def _bucket(self, channel: str, url: str, min_interval: float) -> Optional[TokenBucket]:
+        """获取 webhook 对应的令牌桶（频率限制按机器人 / webhook 计算）"""
+        limit = self.rate_limits.get(channel)
+        if limit is None:
+            if not min_interval or min_interval <= 0:
+                return None
+            limit = (1 / min_interval, 1)
+
+        key = (channel, url)
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = TokenBucket(*limit)
+                self._buckets[key] = bucket
+            return bucket
+
+    def request(
+        self,
+        method: str,
+        channel: str,
+        url: str,
+        min_interval: float = 0,
+        **kwargs,
+    ) -> requests.Response:
+        """
+        发送请求（按渠道限速，429 时等待后重试）
+
+        Args:
+            method: HTTP 方法
+            channel: 渠道名（决定频率限制）
+            url: 请求地址
+            min_interval: 没有文档限制的渠道的最小发送间隔（秒），0 表示不限速
+            **kwargs: 传给 requests 的参数（json、data、headers、proxies、timeout 等）
+
+        Returns:
+            最后一次请求的响应
+        """
+        session = self._session(url)
+        bucket = self._bucket(channel, url, min_interval)
+
+        attempt = 0
+        while True:
+            if bucket is not None:
+                bucket.acquire()
+            response = session.request(method, url, **kwargs)
+            if response.status_code != 429 or attempt >= self.max_retries:
+                return response
+
+            wait = _retry_after(response)
+            if wait is None:
+                wait = self.default_retry_wait
+            if bucket is not None:
+                bucket.pause(wait)
+            if wait > self.max_retry_wait:
+                print(f"[推送] {channel} 速率限制，需等待 {wait:.0f} 秒，放弃重试")
+                return response
+
+            attempt += 1
+            print(f"[推送] {channel} 速率限制，{wait:.1f} 秒后重试 ({attempt}/{self.max_retries})")
+            if bucket is None:
+                time.sleep(wait)
+
+    def post(self, channel: str, url: str, **kwargs) -> requests.Response:
+        """发送 POST 请求"""
+        return self.request("POST", channel, url, **kwargs)
+
+    def get(self, channel: str, url: str, **kwargs) -> requests.Response:
+        """发送 GET 请求"""
+        return self.request("GET", channel, url, **kwargs)
+
+    def close(self) -> None:
+        """关闭所有会话"""
+        with self._lock:
+            sessions = list(self._sessions.values())
+            self._sessions.clear()
+        for session in sessions:
+            session.close()
+
+
+_default_client: Optional[NotificationClient] = None
+_default_lock = threading.Lock()
+
+
+def get_http_client() -> NotificationClient:
+    """获取进程内共用的通知客户端（常驻模式下多次运行之间复用连接和限速状态）"""
+    global _default_client
+    with _default_lock:
+        if _default_client is None:
+            _default_client = NotificationClient()
+        return _default_client
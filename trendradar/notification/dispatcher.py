@@ -12,7 +12,10 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional
+import time
+from functools import partial
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
 
 from trendradar.core.config import (
     get_account_at_index,
@@ -20,6 +23,7 @@ from trendradar.core.config import (
     parse_multi_account_config,
     validate_paired_configs,
 )
+from trendradar.report.document import build_report_document
 
 from .senders import (
     send_to_bark,
@@ -32,6 +36,10 @@ from .senders import (
     send_to_wework,
     send_to_generic_webhook,
 )
+from .batch import SplitCache
+from .client import get_http_client
+from .ledger import DeltaView, PushLedger
+from .outbox import NotificationOutbox
 from .renderer import (
     render_rss_feishu_content,
     render_rss_dingtalk_content,
@@ -57,6 +65,8 @@ class NotificationDispatcher:
         get_time_func: Callable,
         split_content_func: Callable,
         translator: Optional["AITranslator"] = None,
+        outbox: Optional[NotificationOutbox] = None,
+        ledger: Optional[PushLedger] = None,
     ):
         """
         初始化通知调度器
@@ -66,12 +76,26 @@ class NotificationDispatcher:
             get_time_func: 获取当前时间的函数
             split_content_func: 内容分批函数
             translator: AI 翻译器实例（可选）
+            outbox: 通知发件箱（可选，提供时热榜推送的批次写入发件箱，由发件箱投递）
+            ledger: 推送台账（可选，提供时当日汇总和当前榜单模式只推送新增或排名明显变化的条目）
         """
         self.config = config
         self.get_time_func = get_time_func
         self.split_content_func = split_content_func
         self.max_accounts = config.get("MAX_ACCOUNTS_PER_CHANNEL", 3)
         self.translator = translator
+        self.outbox = outbox
+        self.ledger = ledger
+        # 渠道并行发送的线程数（<= 1 为顺序发送）和单个渠道的超时时间（秒，0 = 不限制）
+        self.max_workers = config.get("NOTIFICATION_WORKERS", 4)
+        self.channel_timeout = config.get("CHANNEL_TIMEOUT", 300)
+        # 当前分发的分批结果缓存（dispatch_all 期间有效）
+        self._split_cache: Optional[SplitCache] = None
+
+    @property
+    def _split_func(self) -> Callable:
+        """热榜推送使用的分批函数（分发期间使用缓存）"""
+        return self._split_cache or self.split_content_func
 
     def _translate_content(
         self,
@@ -190,7 +214,8 @@ class NotificationDispatcher:
         Returns:
             Dict[str, bool]: 每个渠道的发送结果，key 为渠道名，value 为是否成功
         """
-        results = {}
+        # 发送函数接收 (report_data, rss_items)，启用增量推送时各渠道传入各自过滤后的内容
+        jobs: List[Tuple[str, Callable[[Dict, Optional[List[Dict]]], bool]]] = []
 
         # 获取区域显示配置
         display_regions = self.config.get("DISPLAY", {}).get("REGIONS", {})
@@ -200,61 +225,66 @@ class NotificationDispatcher:
             report_data, rss_items, rss_new_items
         )
 
+        # 构建与渠道无关的中间文档，各渠道共用预计算的标题、链接和排名
+        report_data, rss_items, rss_new_items = build_report_document(
+            report_data, rss_items, rss_new_items
+        )
+
         # 飞书
         if self.config.get("FEISHU_WEBHOOK_URL"):
-            results["feishu"] = self._send_feishu(
+            jobs.append(("feishu", lambda report_data, rss_items: self._send_feishu(
                 report_data, report_type, update_info, proxy_url, mode, rss_items, rss_new_items,
                 ai_analysis, display_regions, standalone_data
-            )
+            )))
 
         # 钉钉
         if self.config.get("DINGTALK_WEBHOOK_URL"):
-            results["dingtalk"] = self._send_dingtalk(
+            jobs.append(("dingtalk", lambda report_data, rss_items: self._send_dingtalk(
                 report_data, report_type, update_info, proxy_url, mode, rss_items, rss_new_items,
                 ai_analysis, display_regions, standalone_data
-            )
+            )))
 
         # 企业微信
         if self.config.get("WEWORK_WEBHOOK_URL"):
-            results["wework"] = self._send_wework(
+            jobs.append(("wework", lambda report_data, rss_items: self._send_wework(
                 report_data, report_type, update_info, proxy_url, mode, rss_items, rss_new_items,
                 ai_analysis, display_regions, standalone_data
-            )
+            )))
 
         # Telegram（需要配对验证）
         if self.config.get("TELEGRAM_BOT_TOKEN") and self.config.get("TELEGRAM_CHAT_ID"):
-            results["telegram"] = self._send_telegram(
+            jobs.append(("telegram", lambda report_data, rss_items: self._send_telegram(
                 report_data, report_type, update_info, proxy_url, mode, rss_items, rss_new_items,
                 ai_analysis, display_regions, standalone_data
-            )
+            )))
 
         # ntfy（需要配对验证）
         if self.config.get("NTFY_SERVER_URL") and self.config.get("NTFY_TOPIC"):
-            results["ntfy"] = self._send_ntfy(
+            jobs.append(("ntfy", lambda report_data, rss_items: self._send_ntfy(
                 report_data, report_type, update_info, proxy_url, mode, rss_items, rss_new_items,
                 ai_analysis, display_regions, standalone_data
-            )
+            )))
 
         # Bark
         if self.config.get("BARK_URL"):
-            results["bark"] = self._send_bark(
+            jobs.append(("bark", lambda report_data, rss_items: self._send_bark(
                 report_data, report_type, update_info, proxy_url, mode, rss_items, rss_new_items,
                 ai_analysis, display_regions, standalone_data
-            )
+            )))
 
         # Slack
         if self.config.get("SLACK_WEBHOOK_URL"):
-            results["slack"] = self._send_slack(
+            jobs.append(("slack", lambda report_data, rss_items: self._send_slack(
                 report_data, report_type, update_info, proxy_url, mode, rss_items, rss_new_items,
                 ai_analysis, display_regions, standalone_data
-            )
+            )))
 
         # 通用 Webhook
         if self.config.get("GENERIC_WEBHOOK_URL"):
-            results["generic_webhook"] = self._send_generic_webhook(
+            jobs.append(("generic_webhook", lambda report_data, rss_items: self._send_generic_webhook(
                 report_data, report_type, update_info, proxy_url, mode, rss_items, rss_new_items,
                 ai_analysis, display_regions, standalone_data
-            )
+            )))
 
         # 邮件（保持原有逻辑，已支持多收件人，AI 分析已嵌入 HTML）
         if (
@@ -262,10 +292,143 @@ class NotificationDispatcher:
             and self.config.get("EMAIL_PASSWORD")
             and self.config.get("EMAIL_TO")
         ):
-            results["email"] = self._send_email(report_type, html_file_path)
+            # 邮件发送完整的 HTML 报告，不参与增量推送
+            jobs.append(("email", lambda report_data, rss_items: self._send_email(report_type, html_file_path)))
+
+        # 同一份报告在各渠道、各账号之间只按格式分批一次
+        split_cache = SplitCache(self.split_content_func)
+        self._split_cache = split_cache
+        try:
+            return self._run_delta_channels(jobs, report_data, rss_items, mode)
+        finally:
+            self._split_cache = None
+            if split_cache.hits:
+                print(f"[推送] 消息分批渲染 {split_cache.renders} 次，复用 {split_cache.hits} 次")
+
+    def _run_delta_channels(
+        self,
+        jobs: List[Tuple[str, Callable[[Dict, Optional[List[Dict]]], bool]]],
+        report_data: Dict,
+        rss_items: Optional[List[Dict]],
+        mode: str,
+    ) -> Dict[str, bool]:
+        """
+        按推送台账过滤各渠道的内容后发送，发送成功的渠道记录已推送的条目
+
+        未启用增量推送（或为增量模式、邮件渠道）时所有渠道发送完整内容。
+        过滤结果相同的渠道共用同一份内容，分批缓存仍然生效。
+
+        Args:
+            jobs: [(渠道名, 发送函数(report_data, rss_items))]
+            report_data: 完整的报告数据
+            rss_items: 完整的 RSS 统计分组列表
+            mode: 报告模式
+
+        Returns:
+            Dict[str, bool]: 每个渠道的发送结果（没有新内容而跳过的渠道为 False）
+        """
+        if self.ledger is None or mode not in ("daily", "current"):
+            return self._run_channels(
+                [(name, partial(func, report_data, rss_items)) for name, func in jobs]
+            )
+
+        channels = [name for name, _ in jobs if name != "email"]
+        self.ledger.load(channels)
+
+        views: Dict[str, DeltaView] = {}
+        shared: Dict[Tuple, DeltaView] = {}
+        bound: List[Tuple[str, Callable[[], bool]]] = []
+        for name, func in jobs:
+            if name == "email":
+                bound.append((name, partial(func, report_data, rss_items)))
+                continue
+
+            view = self.ledger.filter(name, report_data, rss_items)
+            if view.is_empty:
+                print(f"[推送] {name} 没有新增或排名明显变化的条目，跳过（已推送 {view.skipped} 条）")
+                bound.append((name, lambda: False))
+                continue
+
+            signature = tuple((e["item_key"], e["group_word"]) for e in view.entries)
+            view = shared.setdefault(signature, view)
+            views[name] = view
+            if view.skipped:
+                print(f"[推送] {name} 增量推送 {len(view.entries)} 条，省略已推送 {view.skipped} 条")
+            bound.append((name, partial(func, view.report_data, view.rss_items)))
 
+        results = self._run_channels(bound)
+
+        for name, view in views.items():
+            if results.get(name):
+                self.ledger.record(name, view.entries)
         return results
 
+    def _run_channels(self, jobs: List[Tuple[str, Callable[[], bool]]]) -> Dict[str, bool]:
+        """
+        并行发送各渠道
+
+        渠道之间使用有界线程池并行发送；同一渠道内的账号和批次仍在同一线程中按顺序发送。
+        单个渠道开始发送后超过 channel_timeout 秒仍未完成时记为失败，不再等待
+        （该线程在后台自然结束），避免一个卡住的 Webhook 拖住其他渠道。
+
+        Args:
+            jobs: [(渠道名, 发送函数)]，按原有渠道顺序排列
+
+        Returns:
+            Dict[str, bool]: 每个渠道的发送结果（键顺序与 jobs 一致）
+        """
+        if not jobs:
+            return {}
+
+        workers = min(self.max_workers or 1, len(jobs))
+        if workers <= 1:
+            return {name: func() for name, func in jobs}
+
+        started: Dict[str, float] = {}
+
+        def run(name: str, func: Callable[[], bool]) -> bool:
+            started[name] = time.monotonic()
+            return func()
+
+        executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="notify")
+        futures = {name: executor.submit(run, name, func) for name, func in jobs}
+        results: Dict[str, bool] = {}
+
+        try:
+            pending = set(futures.values())
+            while pending:
+                timeout = None
+                if self.channel_timeout and self.channel_timeout > 0:
+                    now = time.monotonic()
+                    waits = []
+                    for name, future in futures.items():
+                        if future not in pending or name not in started:
+                            continue
+                        remaining = started[name] + self.channel_timeout - now
+                        if remaining <= 0:
+                            print(f"❌ {name} 发送超过 {self.channel_timeout} 秒未完成，记为失败")
+                            results[name] = False
+                            pending.discard(future)
+                        else:
+                            waits.append(remaining)
+                    if not pending:
+                        break
+                    # 排队中的渠道在其他渠道完成后才开始，此时 wait 会因 FIRST_COMPLETED 返回
+                    timeout = min(waits) if waits else self.channel_timeout
+
+                done, pending = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+                for name, future in futures.items():
+                    if future in done:
+                        try:
+                            results[name] = bool(future.result())
+                        except Exception as e:
+                            print(f"❌ {name} 发送出错: {e}")
+                            results[name] = False
+        finally:
+            executor.shutdown(wait=False)
+
+        return {name: results.get(name, False) for name, _ in jobs}
+
     def _send_to_multi_accounts(
         self,
         channel_name: str,
@@ -332,7 +495,8 @@ class NotificationDispatcher:
                 account_label=account_label,
                 batch_size=self.config.get("FEISHU_BATCH_SIZE", 29000),
                 batch_interval=self.config.get("BATCH_SEND_INTERVAL", 1.0),
-                split_content_func=self.split_content_func,
+                split_content_func=self._split_func,
+                outbox=self.outbox,
                 get_time_func=self.get_time_func,
                 rss_items=rss_items if display_regions.get("RSS", True) else None,
                 rss_new_items=rss_new_items if display_regions.get("RSS", True) else None,
@@ -373,7 +537,8 @@ class NotificationDispatcher:
                 account_label=account_label,
                 batch_size=self.config.get("DINGTALK_BATCH_SIZE", 20000),
                 batch_interval=self.config.get("BATCH_SEND_INTERVAL", 1.0),
-                split_content_func=self.split_content_func,
+                split_content_func=self._split_func,
+                outbox=self.outbox,
                 rss_items=rss_items if display_regions.get("RSS", True) else None,
                 rss_new_items=rss_new_items if display_regions.get("RSS", True) else None,
                 ai_analysis=ai_analysis if display_regions.get("AI_ANALYSIS", True) else None,
@@ -414,7 +579,8 @@ class NotificationDispatcher:
                 batch_size=self.config.get("MESSAGE_BATCH_SIZE", 4000),
                 batch_interval=self.config.get("BATCH_SEND_INTERVAL", 1.0),
                 msg_type=self.config.get("WEWORK_MSG_TYPE", "markdown"),
-                split_content_func=self.split_content_func,
+                split_content_func=self._split_func,
+                outbox=self.outbox,
                 rss_items=rss_items if display_regions.get("RSS", True) else None,
                 rss_new_items=rss_new_items if display_regions.get("RSS", True) else None,
                 ai_analysis=ai_analysis if display_regions.get("AI_ANALYSIS", True) else None,
@@ -477,7 +643,8 @@ class NotificationDispatcher:
                     account_label=account_label,
                     batch_size=self.config.get("MESSAGE_BATCH_SIZE", 4000),
                     batch_interval=self.config.get("BATCH_SEND_INTERVAL", 1.0),
-                    split_content_func=self.split_content_func,
+                    split_content_func=self._split_func,
+                    outbox=self.outbox,
                     rss_items=rss_items if display_regions.get("RSS", True) else None,
                     rss_new_items=rss_new_items if display_regions.get("RSS", True) else None,
                     ai_analysis=ai_analysis if display_regions.get("AI_ANALYSIS", True) else None,
@@ -541,7 +708,8 @@ class NotificationDispatcher:
                     mode=mode,
                     account_label=account_label,
                     batch_size=3800,
-                    split_content_func=self.split_content_func,
+                    split_content_func=self._split_func,
+                    outbox=self.outbox,
                     rss_items=rss_items if display_regions.get("RSS", True) else None,
                     rss_new_items=rss_new_items if display_regions.get("RSS", True) else None,
                     ai_analysis=ai_analysis if display_regions.get("AI_ANALYSIS", True) else None,
@@ -583,7 +751,8 @@ class NotificationDispatcher:
                 account_label=account_label,
                 batch_size=self.config.get("BARK_BATCH_SIZE", 3600),
                 batch_interval=self.config.get("BATCH_SEND_INTERVAL", 1.0),
-                split_content_func=self.split_content_func,
+                split_content_func=self._split_func,
+                outbox=self.outbox,
                 rss_items=rss_items if display_regions.get("RSS", True) else None,
                 rss_new_items=rss_new_items if display_regions.get("RSS", True) else None,
                 ai_analysis=ai_analysis if display_regions.get("AI_ANALYSIS", True) else None,
@@ -623,7 +792,8 @@ class NotificationDispatcher:
                 account_label=account_label,
                 batch_size=self.config.get("SLACK_BATCH_SIZE", 4000),
                 batch_interval=self.config.get("BATCH_SEND_INTERVAL", 1.0),
-                split_content_func=self.split_content_func,
+                split_content_func=self._split_func,
+                outbox=self.outbox,
                 rss_items=rss_items if display_regions.get("RSS", True) else None,
                 rss_new_items=rss_new_items if display_regions.get("RSS", True) else None,
                 ai_analysis=ai_analysis if display_regions.get("AI_ANALYSIS", True) else None,
@@ -683,7 +853,8 @@ class NotificationDispatcher:
                 account_label=account_label,
                 batch_size=self.config.get("MESSAGE_BATCH_SIZE", 4000),
                 batch_interval=self.config.get("BATCH_SEND_INTERVAL", 1.0),
-                split_content_func=self.split_content_func,
+                split_content_func=self._split_func,
+                outbox=self.outbox,
                 rss_items=rss_items if display_regions.get("RSS", True) else None,
                 rss_new_items=rss_new_items if display_regions.get("RSS", True) else None,
                 ai_analysis=ai_analysis if display_regions.get("AI_ANALYSIS", True) else None,
@@ -713,6 +884,7 @@ class NotificationDispatcher:
             custom_smtp_server=self.config.get("EMAIL_SMTP_SERVER", ""),
             custom_smtp_port=self.config.get("EMAIL_SMTP_PORT", ""),
             get_time_func=self.get_time_func,
+            attach_report=self.config.get("EMAIL_ATTACH_REPORT", False),
         )
 
     # === RSS 通知方法 ===
@@ -747,50 +919,50 @@ class NotificationDispatcher:
             print("[RSS通知] 没有 RSS 内容，跳过通知")
             return {}
 
-        results = {}
+        jobs: List[Tuple[str, Callable[[], bool]]] = []
         report_type = "RSS 订阅更新"
 
         # 飞书
         if self.config.get("FEISHU_WEBHOOK_URL"):
-            results["feishu"] = self._send_rss_feishu(
+            jobs.append(("feishu", lambda: self._send_rss_feishu(
                 rss_items, feeds_info, proxy_url
-            )
+            )))
 
         # 钉钉
         if self.config.get("DINGTALK_WEBHOOK_URL"):
-            results["dingtalk"] = self._send_rss_dingtalk(
+            jobs.append(("dingtalk", lambda: self._send_rss_dingtalk(
                 rss_items, feeds_info, proxy_url
-            )
+            )))
 
         # 企业微信
         if self.config.get("WEWORK_WEBHOOK_URL"):
-            results["wework"] = self._send_rss_markdown(
+            jobs.append(("wework", lambda: self._send_rss_markdown(
                 rss_items, feeds_info, proxy_url, "wework"
-            )
+            )))
 
         # Telegram
         if self.config.get("TELEGRAM_BOT_TOKEN") and self.config.get("TELEGRAM_CHAT_ID"):
-            results["telegram"] = self._send_rss_markdown(
+            jobs.append(("telegram", lambda: self._send_rss_markdown(
                 rss_items, feeds_info, proxy_url, "telegram"
-            )
+            )))
 
         # ntfy
         if self.config.get("NTFY_SERVER_URL") and self.config.get("NTFY_TOPIC"):
-            results["ntfy"] = self._send_rss_markdown(
+            jobs.append(("ntfy", lambda: self._send_rss_markdown(
                 rss_items, feeds_info, proxy_url, "ntfy"
-            )
+            )))
 
         # Bark
         if self.config.get("BARK_URL"):
-            results["bark"] = self._send_rss_markdown(
+            jobs.append(("bark", lambda: self._send_rss_markdown(
                 rss_items, feeds_info, proxy_url, "bark"
-            )
+            )))
 
         # Slack
         if self.config.get("SLACK_WEBHOOK_URL"):
-            results["slack"] = self._send_rss_markdown(
+            jobs.append(("slack", lambda: self._send_rss_markdown(
                 rss_items, feeds_info, proxy_url, "slack"
-            )
+            )))
 
         # 邮件
         if (
@@ -798,9 +970,9 @@ class NotificationDispatcher:
             and self.config.get("EMAIL_PASSWORD")
             and self.config.get("EMAIL_TO")
         ):
-            results["email"] = self._send_email(report_type, html_file_path)
+            jobs.append(("email", lambda: self._send_email(report_type, html_file_path)))
 
-        return results
+        return self._run_channels(jobs)
 
     def _send_rss_feishu(
         self,
@@ -809,7 +981,6 @@ class NotificationDispatcher:
         proxy_url: Optional[str],
     ) -> bool:
         """发送 RSS 到飞书"""
-        import requests
 
         content = render_rss_feishu_content(
             rss_items=rss_items,
@@ -850,7 +1021,7 @@ class NotificationDispatcher:
                     }
 
                     proxies = {"http": proxy_url, "https": proxy_url} if proxy_url else None
-                    resp = requests.post(webhook_url, json=payload, proxies=proxies, timeout=30)
+                    resp = get_http_client().post("feishu", webhook_url, json=payload, proxies=proxies, timeout=30)
                     resp.raise_for_status()
 
                 print(f"✅ 飞书{account_label} RSS 通知发送成功")
@@ -868,7 +1039,6 @@ class NotificationDispatcher:
         proxy_url: Optional[str],
     ) -> bool:
         """发送 RSS 到钉钉"""
-        import requests
 
         content = render_rss_dingtalk_content(
             rss_items=rss_items,
@@ -901,7 +1071,7 @@ class NotificationDispatcher:
                     }
 
                     proxies = {"http": proxy_url, "https": proxy_url} if proxy_url else None
-                    resp = requests.post(webhook_url, json=payload, proxies=proxies, timeout=30)
+                    resp = get_http_client().post("dingtalk", webhook_url, json=payload, proxies=proxies, timeout=30)
                     resp.raise_for_status()
 
                 print(f"✅ 钉钉{account_label} RSS 通知发送成功")
@@ -920,7 +1090,6 @@ class NotificationDispatcher:
         channel: str,
     ) -> bool:
         """发送 RSS 到 Markdown 兼容渠道（企业微信、Telegram、ntfy、Bark、Slack）"""
-        import requests
 
         content = render_rss_markdown_content(
             rss_items=rss_items,
@@ -947,7 +1116,6 @@ class NotificationDispatcher:
 
     def _send_rss_wework(self, content: str, proxy_url: Optional[str]) -> bool:
         """发送 RSS 到企业微信"""
-        import requests
 
         webhooks = parse_multi_account_config(self.config["WEWORK_WEBHOOK_URL"])
         webhooks = limit_accounts(webhooks, self.max_accounts, "企业微信")
@@ -970,7 +1138,7 @@ class NotificationDispatcher:
                     }
 
                     proxies = {"http": proxy_url, "https": proxy_url} if proxy_url else None
-                    resp = requests.post(webhook_url, json=payload, proxies=proxies, timeout=30)
+                    resp = get_http_client().post("wework", webhook_url, json=payload, proxies=proxies, timeout=30)
                     resp.raise_for_status()
 
                 print(f"✅ 企业微信{account_label} RSS 通知发送成功")
@@ -983,7 +1151,6 @@ class NotificationDispatcher:
 
     def _send_rss_telegram(self, content: str, proxy_url: Optional[str]) -> bool:
         """发送 RSS 到 Telegram"""
-        import requests
 
         tokens = parse_multi_account_config(self.config["TELEGRAM_BOT_TOKEN"])
         chat_ids = parse_multi_account_config(self.config["TELEGRAM_CHAT_ID"])
@@ -1014,7 +1181,7 @@ class NotificationDispatcher:
                     }
 
                     proxies = {"http": proxy_url, "https": proxy_url} if proxy_url else None
-                    resp = requests.post(url, json=payload, proxies=proxies, timeout=30)
+                    resp = get_http_client().post("telegram", url, json=payload, proxies=proxies, timeout=30)
                     resp.raise_for_status()
 
                 print(f"✅ Telegram{account_label} RSS 通知发送成功")
@@ -1027,7 +1194,6 @@ class NotificationDispatcher:
 
     def _send_rss_ntfy(self, content: str, proxy_url: Optional[str]) -> bool:
         """发送 RSS 到 ntfy"""
-        import requests
 
         server_url = self.config["NTFY_SERVER_URL"]
         topics = parse_multi_account_config(self.config["NTFY_TOPIC"])
@@ -1056,8 +1222,8 @@ class NotificationDispatcher:
                         headers["Authorization"] = f"Bearer {token}"
 
                     proxies = {"http": proxy_url, "https": proxy_url} if proxy_url else None
-                    resp = requests.post(
-                        url, data=batch_content.encode("utf-8"),
+                    resp = get_http_client().post(
+                        "ntfy", url, data=batch_content.encode("utf-8"),
                         headers=headers, proxies=proxies, timeout=30
                     )
                     resp.raise_for_status()
@@ -1072,7 +1238,6 @@ class NotificationDispatcher:
 
     def _send_rss_bark(self, content: str, proxy_url: Optional[str]) -> bool:
         """发送 RSS 到 Bark"""
-        import requests
         import urllib.parse
 
         urls = parse_multi_account_config(self.config["BARK_URL"])
@@ -1095,7 +1260,7 @@ class NotificationDispatcher:
                     url = f"{bark_url.rstrip('/')}/{title}/{body}"
 
                     proxies = {"http": proxy_url, "https": proxy_url} if proxy_url else None
-                    resp = requests.get(url, proxies=proxies, timeout=30)
+                    resp = get_http_client().get("bark", url, proxies=proxies, timeout=30)
                     resp.raise_for_status()
 
                 print(f"✅ Bark{account_label} RSS 通知发送成功")
@@ -1108,7 +1273,6 @@ class NotificationDispatcher:
 
     def _send_rss_slack(self, content: str, proxy_url: Optional[str]) -> bool:
         """发送 RSS 到 Slack"""
-        import requests
 
         webhooks = parse_multi_account_config(self.config["SLACK_WEBHOOK_URL"])
         webhooks = limit_accounts(webhooks, self.max_accounts, "Slack")
@@ -1138,7 +1302,7 @@ class NotificationDispatcher:
                     }
 
                     proxies = {"http": proxy_url, "https": proxy_url} if proxy_url else None
-                    resp = requests.post(webhook_url, json=payload, proxies=proxies, timeout=30)
+                    resp = get_http_client().post("slack", webhook_url, json=payload, proxies=proxies, timeout=30)
                     resp.raise_for_status()
 
                 print(f"✅ Slack{account_label} RSS 通知发送成功")
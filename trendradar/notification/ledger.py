@@ -0,0 +1,189 @@
+# coding=utf-8
+"""
+推送台账
+
+记录各渠道当天已推送的条目（来源 + 规范化 URL / 标题、匹配词组）和推送时的最高排名，
+用于增量推送：当日汇总和当前榜单模式下，每次推送只发送
+- 本渠道今天还没推送过的条目
+- 匹配到新词组的条目
+- 排名比上次推送时上升至少 rank_change 名的条目
+
+HTML 报告和邮件仍然是完整报告，只有消息推送按台账过滤。
+台账保存在当天的数据库中，每天重新开始。
+
+使用方式：
+
+    ledger = PushLedger(storage_backend, rank_change=5)
+    ledger.load(["feishu", "dingtalk"])
+    view = ledger.filter("feishu", report_data, rss_items)
+    ...（发送 view.report_data / view.rss_items）
+    ledger.record("feishu", view.entries)
+"""
+
+import hashlib
+import re
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def item_key(title_data: Any) -> str:
+    """
+    计算条目标识：来源 + 规范化 URL（忽略协议、主机大小写、锚点和末尾斜杠），
+    没有 URL 时使用规范化标题（合并空白、忽略大小写）
+
+    Args:
+        title_data: 标题数据（dict、MatchedTitle 或 ReportItem）
+
+    Returns:
+        16 位十六进制摘要
+    """
+    url = title_data.get("url") or title_data.get("mobile_url") or ""
+    if url:
+        parts = urlsplit(url.strip())
+        path = parts.path.rstrip("/")
+        identity = f"{parts.netloc.lower()}{path}"
+        if parts.query:
+            identity += f"?{parts.query}"
+    else:
+        identity = _WHITESPACE_RE.sub(" ", str(title_data.get("title", ""))).strip().lower()
+
+    source = title_data.get("source_name", "")
+    return hashlib.sha1(f"{source}\n{identity}".encode("utf-8")).hexdigest()[:16]
+
+
+def _best_rank(title_data: Any) -> Optional[int]:
+    """条目的最高排名（数值最小），没有排名时返回 None"""
+    ranks = title_data.get("ranks") or []
+    return min(ranks) if ranks else None
+
+
+@dataclass
+class DeltaView:
+    """某个渠道本次需要推送的内容"""
+
+    report_data: Dict
+    rss_items: Optional[List[Dict]]
+    # 推送成功后写入台账的条目
+    entries: List[Dict] = field(default_factory=list)
+    # 因已推送而省略的条目数
+    skipped: int = 0
+
+    @property
+    def is_empty(self) -> bool:
+        """没有任何需要推送的条目"""
+        return not self.entries and not self.report_data.get("new_titles")
+
+
+class PushLedger:
+    """各渠道已推送条目的台账"""
+
+    def __init__(self, storage_backend: Any, rank_change: int = 5):
+        """
+        Args:
+            storage_backend: 存储后端（提供 get_push_ledger / record_push_ledger）
+            rank_change: 排名上升至少多少名时重新推送（<= 0 表示排名变化不重新推送）
+        """
+        self.storage_backend = storage_backend
+        self.rank_change = rank_change
+        self._ledger: Dict[str, Dict[Tuple[str, str], Optional[int]]] = {}
+
+    def load(self, channels: List[str]) -> None:
+        """读取各渠道的台账（每次分发前调用一次）"""
+        self._ledger = self.storage_backend.get_push_ledger(channels)
+
+    def _is_delta(self, delivered: Dict, key: Tuple[str, str], rank: Optional[int]) -> bool:
+        """条目是否需要推送（未推送过，或排名明显上升）"""
+        if key not in delivered:
+            return True
+        last_rank = delivered[key]
+        if self.rank_change <= 0 or rank is None or last_rank is None:
+            return False
+        return rank <= last_rank - self.rank_change
+
+    def _filter_groups(
+        self,
+        groups: Optional[List[Dict]],
+        delivered: Dict,
+        entries: List[Dict],
+    ) -> Tuple[Optional[List[Dict]], int]:
+        """过滤统计分组中的条目，返回 (过滤后的分组, 省略的条目数)"""
+        if not groups:
+            return groups, 0
+
+        filtered = []
+        skipped = 0
+        for group in groups:
+            word = group.get("word", "")
+            titles = []
+            for title_data in group.get("titles", []):
+                key = item_key(title_data)
+                rank = _best_rank(title_data)
+                if not self._is_delta(delivered, (key, word), rank):
+                    skipped += 1
+                    continue
+                titles.append(title_data)
+                entries.append({
+                    "item_key": key,
+                    "group_word": word,
+                    "source_name": title_data.get("source_name", ""),
+                    "title": title_data.get("title", ""),
+                    "rank": rank,
+                })
+            if titles:
+                filtered.append({**group, "titles": titles, "count": len(titles)})
+        return filtered, skipped
+
+    def filter(
+        self,
+        channel: str,
+        report_data: Dict,
+        rss_items: Optional[List[Dict]] = None,
+    ) -> DeltaView:
+        """
+        过滤出渠道本次需要推送的内容（热榜统计和 RSS 统计区块；新增热点区块本身就是增量，保持不变）
+
+        Args:
+            channel: 渠道名
+            report_data: 报告数据
+            rss_items: RSS 统计分组列表
+
+        Returns:
+            DeltaView
+        """
+        delivered = self._ledger.get(channel, {})
+        entries: List[Dict] = []
+
+        stats, skipped_stats = self._filter_groups(report_data.get("stats"), delivered, entries)
+        rss, skipped_rss = self._filter_groups(rss_items, delivered, entries)
+
+        view_data = dict(report_data)
+        if "stats" in view_data:
+            view_data["stats"] = stats
+        return DeltaView(
+            report_data=view_data,
+            rss_items=rss if rss_items is not None else None,
+            entries=entries,
+            skipped=skipped_stats + skipped_rss,
+        )
+
+    def record(self, channel: str, entries: List[Dict]) -> bool:
+        """
+        记录推送成功的条目
+
+        Args:
+            channel: 渠道名
+            entries: DeltaView.entries
+
+        Returns:
+            是否记录成功
+        """
+        if not entries:
+            return True
+        delivered = self._ledger.setdefault(channel, {})
+        for entry in entries:
+            delivered[(entry["item_key"], entry["group_word"])] = entry["rank"]
+        return self.storage_backend.record_push_ledger(channel, entries)
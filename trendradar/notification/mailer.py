@@ -0,0 +1,152 @@
+# coding=utf-8
+"""
+SMTP 会话复用
+
+邮件渠道共用的 SMTP 会话（线程安全）：
+- 按 (服务器, 端口, 账号) 保存已登录的会话，进程内多次发送（热榜和 RSS 推送、
+  常驻模式的多次运行）只做一次 TLS 握手和登录
+- 发送前用 NOOP 检查会话，服务器已断开空闲连接时重新连接
+- 复用的会话在发送中途断开时重新连接并重试一次
+
+使用方式：
+
+    refused = get_smtp_pool().send(
+        msg, from_email, recipients,
+        server=smtp_server, port=smtp_port, use_tls=use_tls, user=from_email, password=password,
+    )
+"""
+
+import smtplib
+import threading
+from email.message import Message
+from typing import Dict, List, Optional, Tuple
+
+
+class SMTPSessionPool:
+    """已登录 SMTP 会话的复用池"""
+
+    def __init__(self, timeout: float = 30):
+        """
+        Args:
+            timeout: 连接和命令超时（秒）
+        """
+        self.timeout = timeout
+        self._sessions: Dict[Tuple[str, int, str], smtplib.SMTP] = {}
+        # SMTP 会话不支持并发命令，同一时间只进行一次发送
+        self._lock = threading.Lock()
+
+    def _connect(self, server: str, port: int, use_tls: bool, user: str, password: str) -> smtplib.SMTP:
+        """建立连接并登录"""
+        if use_tls:
+            # TLS 模式（STARTTLS）
+            session = smtplib.SMTP(server, port, timeout=self.timeout)
+            session.ehlo()
+            session.starttls()
+            session.ehlo()
+        else:
+            # SSL 模式
+            session = smtplib.SMTP_SSL(server, port, timeout=self.timeout)
+            session.ehlo()
+
+        try:
+            session.login(user, password)
+        except Exception:
+            session.close()
+            raise
+        return session
+
+    @staticmethod
+    def _is_alive(session: smtplib.SMTP) -> bool:
+        """NOOP 检查会话是否可用"""
+        try:
+            return session.noop()[0] == 250
+        except (smtplib.SMTPException, OSError):
+            return False
+
+    @staticmethod
+    def _quit(session: smtplib.SMTP) -> None:
+        try:
+            session.quit()
+        except (smtplib.SMTPException, OSError):
+            session.close()
+
+    def send(
+        self,
+        message: Message,
+        from_addr: str,
+        to_addrs: List[str],
+        *,
+        server: str,
+        port: int,
+        use_tls: bool,
+        user: str,
+        password: str,
+    ) -> Dict[str, Tuple[int, bytes]]:
+        """
+        发送一封邮件（所有收件人共用同一份 MIME 消息）
+
+        Args:
+            message: 邮件
+            from_addr: 信封发件人
+            to_addrs: 信封收件人列表
+            server: SMTP 服务器
+            port: SMTP 端口
+            use_tls: True 使用 STARTTLS，False 使用 SSL
+            user: 登录账号
+            password: 密码或授权码
+
+        Returns:
+            被拒绝的收件人 {地址: (状态码, 响应)}，全部接受时为空
+
+        Raises:
+            smtplib.SMTPException: 连接、认证或发送失败
+        """
+        key = (server, port, user)
+        with self._lock:
+            session = self._sessions.get(key)
+            if session is not None and not self._is_alive(session):
+                print("[邮件] SMTP 会话已断开，重新连接")
+                self._sessions.pop(key, None)
+                session.close()
+                session = None
+
+            reused = session is not None
+            if session is None:
+                session = self._connect(server, port, use_tls, user, password)
+                self._sessions[key] = session
+            else:
+                print(f"[邮件] 复用 SMTP 会话 {server}:{port}")
+
+            try:
+                return session.send_message(message, from_addr, to_addrs)
+            except smtplib.SMTPServerDisconnected:
+                self._sessions.pop(key, None)
+                session.close()
+                if not reused:
+                    raise
+                # 复用的会话在 NOOP 之后被断开，重新连接后重试一次
+                print("[邮件] SMTP 会话在发送时断开，重新连接后重试")
+                session = self._connect(server, port, use_tls, user, password)
+                self._sessions[key] = session
+                return session.send_message(message, from_addr, to_addrs)
+
+    def close(self) -> None:
+        """退出所有会话"""
+        with self._lock:
+            sessions = list(self._sessions.values())
+            self._sessions.clear()
+        for session in sessions:
+            self._quit(session)
+
+
+_default_pool: Optional[SMTPSessionPool] = None
+_default_lock = threading.Lock()
+
+
+def get_smtp_pool() -> SMTPSessionPool:
+    """获取进程内共用的 SMTP 会话池"""
+    global _default_pool
+    with _default_lock:
+        if _default_pool is None:
+            _default_pool = SMTPSessionPool()
+        return _default_pool
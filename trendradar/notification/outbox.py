@@ -0,0 +1,422 @@
+# coding=utf-8
+"""
+通知发件箱
+
+启用后，各渠道渲染好的批次不再直接发送，而是先写入当天数据库的 notification_outbox 表，
+再由 drain() 逐条投递：
+- 同一渠道同一账号的批次按顺序投递，某一批失败后该组暂停，按指数退避等待后重试
+- 超过最大尝试次数的批次标记为失败并跳过，组内后续批次继续投递
+- drain() 可限制投递时长，未投递完的批次留在发件箱，下次运行或常驻模式空闲时继续投递
+- drain() 同时读取前几天（默认前一天）的数据库，跨过零点时仍在等待退避的批次不会被遗漏
+
+发件箱随数据库一起保存（远程存储时在写入发件箱后和 drain() 结束时各上传一次），写入前把 Webhook 地址、Token 等凭据
+替换为占位符，投递时再用当前配置还原。
+
+使用方式：
+
+    outbox = NotificationOutbox(storage_manager, secrets=collect_secrets(config))
+    send_to_feishu(..., outbox=outbox)   # 写入发件箱
+    outbox.drain(timeout=120)            # 投递到期的批次
+"""
+
+import json
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+
+import requests
+
+from trendradar.core.config import parse_multi_account_config
+
+from .client import get_http_client
+
+
+# 包含凭据的配置项（多账号用 ; 分隔），写入发件箱前替换为占位符
+SECRET_CONFIG_KEYS = (
+    "FEISHU_WEBHOOK_URL",
+    "DINGTALK_WEBHOOK_URL",
+    "WEWORK_WEBHOOK_URL",
+    "TELEGRAM_BOT_TOKEN",
+    "NTFY_TOPIC",
+    "NTFY_TOKEN",
+    "BARK_URL",
+    "SLACK_WEBHOOK_URL",
+    "GENERIC_WEBHOOK_URL",
+)
+
+# 过短的值不作为凭据处理（避免替换掉正文中的普通词语）
+_MIN_SECRET_LENGTH = 8
+
+_PLACEHOLDER_PREFIX = "{{SECRET:"
+
+
+def collect_secrets(config: Dict) -> Dict[str, str]:
+    """
+    从配置中收集需要脱敏的凭据
+
+    Args:
+        config: 完整的配置字典
+
+    Returns:
+        {占位符: 凭据值}
+    """
+    secrets: Dict[str, str] = {}
+    for key in SECRET_CONFIG_KEYS:
+        for i, value in enumerate(parse_multi_account_config(config.get(key) or "")):
+            if len(value) >= _MIN_SECRET_LENGTH:
+                secrets[f"{_PLACEHOLDER_PREFIX}{key}:{i}}}}}"] = value
+            if key == "BARK_URL":
+                # Bark 请求中使用的是 URL 中的 device_key
+                path = urlparse(value).path.strip("/")
+                device_key = path.split("/")[0] if path else ""
+                if len(device_key) >= _MIN_SECRET_LENGTH:
+                    secrets[f"{_PLACEHOLDER_PREFIX}BARK_DEVICE_KEY:{i}}}}}"] = device_key
+    return secrets
+
+
+def _json_escape(value: str) -> str:
+    """字符串在 JSON 文本中的形式"""
+    return json.dumps(value, ensure_ascii=False)[1:-1]
+
+
+@dataclass
+class OutboxMessage:
+    """一个待投递的批次请求"""
+    channel: str                          # 渠道名（决定频率限制和响应检查）
+    url: str
+    sequence: int                         # 投递顺序（从 1 开始）
+    batch_no: int                         # 用户看到的批次编号
+    total: int                            # 批次总数
+    label: str = ""                       # 日志前缀（渠道名 + 账号标签）
+    account: str = ""                     # 账号标签
+    report_type: str = ""
+    method: str = "POST"
+    headers: Optional[Dict[str, str]] = None
+    payload: Any = None                   # JSON 请求体
+    body: Optional[str] = None            # 文本请求体（ntfy）
+    min_interval: float = 0               # 没有文档限制的渠道的最小发送间隔（秒）
+
+    def to_request(self) -> Dict:
+        """转换为发件箱中保存的请求字典"""
+        request = {
+            "method": self.method,
+            "url": self.url,
+            "headers": self.headers or {},
+            "label": self.label,
+            "min_interval": self.min_interval,
+        }
+        if self.payload is not None:
+            request["json"] = self.payload
+        if self.body is not None:
+            request["data"] = self.body
+        return request
+
+
+def check_response(channel: str, response: requests.Response) -> Optional[str]:
+    """
+    按渠道检查响应是否表示发送成功
+
+    Args:
+        channel: 渠道名
+        response: HTTP 响应
+
+    Returns:
+        错误信息，成功时返回 None
+    """
+    status = response.status_code
+    if channel == "slack":
+        # Slack Incoming Webhooks 成功时返回 "ok" 文本
+        if status == 200 and response.text == "ok":
+            return None
+        return f"错误：{response.text}" if response.text else f"状态码：{status}"
+    if channel == "generic_webhook":
+        return None if 200 <= status < 300 else f"状态码：{status}, 响应: {response.text}"
+    if channel == "ntfy":
+        return None if status == 200 else f"状态码：{status}"
+    if status != 200:
+        return f"状态码：{status}"
+
+    try:
+        result = response.json()
+    except ValueError:
+        return f"响应格式错误：{response.text[:200]}"
+
+    if channel == "feishu":
+        if result.get("StatusCode") == 0 or result.get("code") == 0:
+            return None
+        return f"错误：{result.get('msg') or result.get('StatusMessage', '未知错误')}"
+    if channel in ("dingtalk", "wework"):
+        return None if result.get("errcode") == 0 else f"错误：{result.get('errmsg')}"
+    if channel == "telegram":
+        return None if result.get("ok") else f"错误：{result.get('description')}"
+    if channel == "bark":
+        return None if result.get("code") == 200 else f"错误：{result.get('message', '未知错误')}"
+    return None
+
+
+class NotificationOutbox:
+    """通知发件箱（线程安全）"""
+
+    def __init__(
+        self,
+        storage_backend: Any,
+        secrets: Optional[Dict[str, str]] = None,
+        proxy_url: Optional[str] = None,
+        max_attempts: int = 8,
+        backoff_base: float = 30,
+        backoff_max: float = 3600,
+        max_workers: int = 4,
+        get_time_func: Optional[Callable[[], datetime]] = None,
+        lookback_days: int = 1,
+    ):
+        """
+        Args:
+            storage_backend: 存储管理器或存储后端
+            secrets: {占位符: 凭据值}（由 collect_secrets 生成）
+            proxy_url: 投递使用的代理 URL
+            max_attempts: 每个批次最多尝试次数
+            backoff_base: 首次重试前的等待时间（秒），之后每次翻倍
+            backoff_max: 重试等待时间上限（秒）
+            max_workers: 并行投递的渠道数（同一渠道内按顺序投递）
+            get_time_func: 获取当前时间的函数（决定读取哪几天的数据库）
+            lookback_days: 除今天外还要读取前几天的发件箱
+        """
+        self.storage = storage_backend
+        self.proxy_url = proxy_url
+        self.max_attempts = max(1, max_attempts)
+        self.backoff_base = max(0, backoff_base)
+        self.backoff_max = max(self.backoff_base, backoff_max)
+        self.max_workers = max(1, max_workers or 1)
+        self.get_time_func = get_time_func or datetime.now
+        self.lookback_days = max(0, lookback_days)
+
+        # 长的凭据先替换，避免被其中包含的短凭据拆开
+        self._secrets = sorted(
+            ((placeholder, _json_escape(value)) for placeholder, value in (secrets or {}).items()),
+            key=lambda item: len(item[1]),
+            reverse=True,
+        )
+        # 存储连接在线程间共用，发件箱的读写串行执行
+        self._lock = threading.Lock()
+
+    # === 凭据脱敏 ===
+
+    def _redact(self, text: str) -> str:
+        for placeholder, value in self._secrets:
+            text = text.replace(value, placeholder)
+        return text
+
+    def _restore(self, text: str) -> Optional[str]:
+        """还原占位符，凭据已从配置中移除时返回 None"""
+        if _PLACEHOLDER_PREFIX not in text:
+            return text
+        for placeholder, value in self._secrets:
+            text = text.replace(placeholder, value)
+        return None if _PLACEHOLDER_PREFIX in text else text
+
+    # === 写入 ===
+
+    def enqueue(self, messages: List[OutboxMessage]) -> bool:
+        """
+        将一次发送（同一渠道同一账号）的所有批次写入发件箱
+
+        Args:
+            messages: 按投递顺序排列的批次
+
+        Returns:
+            是否写入成功
+        """
+        if not messages:
+            return False
+
+        group_id = uuid.uuid4().hex
+        rows = [
+            {
+                "group_id": group_id,
+                "channel": m.channel,
+                "account": m.account,
+                "sequence": m.sequence,
+                "batch_no": m.batch_no,
+                "total": m.total,
+                "report_type": m.report_type,
+                "request": self._redact(json.dumps(m.to_request(), ensure_ascii=False)),
+            }
+            for m in messages
+        ]
+
+        with self._lock:
+            success = self.storage.enqueue_notifications(rows)
+
+        label = messages[0].label or messages[0].channel
+        if success:
+            print(f"[发件箱] {label} {len(rows)} 个批次已加入发件箱 [{messages[0].report_type}]")
+        else:
+            print(f"[发件箱] {label} 批次写入发件箱失败 [{messages[0].report_type}]")
+        return success
+
+    # === 投递 ===
+
+    def _send(self, row: Dict) -> Tuple[Optional[str], bool]:
+        """
+        投递单个批次
+
+        Returns:
+            (错误信息, 是否可重试)，成功时错误信息为 None
+        """
+        text = self._restore(row["request"])
+        if text is None:
+            return "凭据已从配置中移除，无法投递", False
+
+        request = json.loads(text)
+        kwargs: Dict[str, Any] = {"headers": request.get("headers"), "timeout": 30}
+        if self.proxy_url:
+            kwargs["proxies"] = {"http": self.proxy_url, "https": self.proxy_url}
+        if "json" in request:
+            kwargs["json"] = request["json"]
+        if "data" in request:
+            kwargs["data"] = request["data"].encode("utf-8")
+
+        try:
+            response = get_http_client().request(
+                request.get("method", "POST"),
+                row["channel"],
+                request["url"],
+                min_interval=request.get("min_interval", 0),
+                **kwargs,
+            )
+        except requests.RequestException as e:
+            return f"请求出错：{e}", True
+
+        error = check_response(row["channel"], response)
+        # 4xx（超时和限流除外）说明请求本身有问题，重试也不会成功
+        retryable = not (400 <= response.status_code < 500 and response.status_code not in (408, 429))
+        return error, retryable
+
+    def _deliver_group(self, group: List[Dict], deadline: Optional[float]) -> Dict[str, int]:
+        """
+        按顺序投递一组批次，遇到需要重试的批次时停止
+
+        Returns:
+            {"sent": 成功数, "failed": 放弃数, "retry": 等待重试数}
+        """
+        counts = {"sent": 0, "failed": 0, "retry": 0}
+        updates = []
+        for row in group:
+            now = time.time()
+            if row["next_attempt_at"] > now:
+                # 等待退避
+                break
+            if deadline is not None and time.monotonic() >= deadline:
+                break
+
+            label = json.loads(row["request"]).get("label") or row["channel"]
+            batch = f"第 {row['batch_no']}/{row['total']} 批次"
+            report_type = row["report_type"] or ""
+            attempts = row["attempts"] + 1
+
+            try:
+                error, retryable = self._send(row)
+            except Exception as e:
+                error, retryable = f"投递出错：{e}", True
+
+            if error is None:
+                print(f"{label}{batch}发送成功 [{report_type}]")
+                updates.append({"id": row["id"], "status": "sent", "attempts": attempts})
+                counts["sent"] += 1
+                continue
+
+            if not retryable or attempts >= self.max_attempts:
+                print(f"{label}{batch}发送失败 [{report_type}]，{error}，已尝试 {attempts} 次，放弃投递")
+                updates.append({
+                    "id": row["id"], "status": "failed", "attempts": attempts, "last_error": error,
+                })
+                counts["failed"] += 1
+                continue
+
+            delay = min(self.backoff_base * 2 ** (attempts - 1), self.backoff_max)
+            print(
+                f"{label}{batch}发送失败 [{report_type}]，{error}，"
+                f"{delay:g} 秒后重试 ({attempts}/{self.max_attempts})"
+            )
+            updates.append({
+                "id": row["id"], "status": "pending", "attempts": attempts,
+                "next_attempt_at": now + delay, "last_error": error,
+            })
+            counts["retry"] += 1
+            break
+
+        if updates:
+            with self._lock:
+                self.storage.update_notifications(updates, group[0]["date"])
+        return counts
+
+    def _outbox_dates(self) -> List[str]:
+        """需要读取发件箱的日期（从早到晚）"""
+        today = self.get_time_func()
+        return [
+            (today - timedelta(days=offset)).strftime("%Y-%m-%d")
+            for offset in range(self.lookback_days, -1, -1)
+        ]
+
+    def drain(self, timeout: Optional[float] = None) -> Dict[str, int]:
+        """
+        投递发件箱中到期的批次
+
+        各渠道并行投递，同一渠道内的各组、组内的各批次按顺序投递。
+        先投递前几天遗留的批次，再投递今天的批次。
+
+        Args:
+            timeout: 投递时长上限（秒），到期后不再开始新的批次（None 或 0 表示不限制）
+
+        Returns:
+            {"sent": 本次投递成功数, "failed": 本次放弃数, "pending": 仍待投递数}
+        """
+        counts = {"sent": 0, "failed": 0, "pending": 0}
+        rows = []
+        with self._lock:
+            for date in self._outbox_dates():
+                for row in self.storage.get_pending_notifications(date):
+                    row["date"] = date
+                    rows.append(row)
+        if not rows:
+            return counts
+
+        groups: Dict[str, List[Dict]] = {}
+        for row in rows:
+            groups.setdefault(row["group_id"], []).append(row)
+
+        by_channel: Dict[str, List[List[Dict]]] = {}
+        for group in groups.values():
+            group.sort(key=lambda r: r["sequence"])
+            by_channel.setdefault(group[0]["channel"], []).append(group)
+
+        deadline = time.monotonic() + timeout if timeout and timeout > 0 else None
+
+        def run(channel_groups: List[List[Dict]]) -> List[Dict[str, int]]:
+            return [self._deliver_group(group, deadline) for group in channel_groups]
+
+        workers = min(self.max_workers, len(by_channel))
+        if workers <= 1:
+            results = [run(channel_groups) for channel_groups in by_channel.values()]
+        else:
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="outbox") as executor:
+                results = list(executor.map(run, by_channel.values()))
+
+        with self._lock:
+            self.storage.flush_uploads()
+
+        group_counts = [c for channel_counts in results for c in channel_counts]
+        counts["sent"] = sum(c["sent"] for c in group_counts)
+        counts["failed"] = sum(c["failed"] for c in group_counts)
+        counts["pending"] = len(rows) - counts["sent"] - counts["failed"]
+
+        # 没有尝试任何投递时（都在等待退避）不输出，避免常驻模式空闲时重复输出
+        attempted = counts["sent"] + counts["failed"] + sum(c["retry"] for c in group_counts)
+        if attempted and counts["pending"]:
+            print(f"[发件箱] 还有 {counts['pending']} 个批次待投递，将在下次运行时继续投递")
+        return counts
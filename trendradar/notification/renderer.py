@@ -9,6 +9,7 @@ from datetime import datetime
 from typing import Dict, List, Optional, Callable
 
 from trendradar.report.formatter import format_title_for_platform
+from trendradar.report.helpers import format_failed_source
 
 
 # 默认区域顺序
@@ -133,7 +134,7 @@ def render_feishu_content(
 
         text_content += "⚠️ **数据获取失败的平台：**\n\n"
         for i, id_value in enumerate(report_data["failed_ids"], 1):
-            text_content += f"  • <font color='red'>{id_value}</font>\n"
+            text_content += f"  • <font color='red'>{format_failed_source(id_value, report_data)}</font>\n"
 
     # 获取当前时间
     now = get_time_func() if get_time_func else datetime.now()
@@ -274,7 +275,7 @@ def render_dingtalk_content(
 
         text_content += "⚠️ **数据获取失败的平台：**\n\n"
         for i, id_value in enumerate(report_data["failed_ids"], 1):
-            text_content += f"  • **{id_value}**\n"
+            text_content += f"  • **{format_failed_source(id_value, report_data)}**\n"
 
     text_content += f"\n\n> 更新时间：{now.strftime('%Y-%m-%d %H:%M:%S')}"
 
@@ -13,13 +13,16 @@
 - Slack
 
 每个发送函数都支持分批发送，并通过参数化配置实现与 CONFIG 的解耦。
+HTTP 请求统一通过 client.get_http_client() 发送，复用连接并按平台频率限制限速。
+传入 outbox 时不直接发送，渲染好的批次写入通知发件箱，由发件箱负责投递和重试。
 """
 
+import gzip
 import smtplib
-import time
 import json
 from datetime import datetime
 from email.header import Header
+from email.mime.application import MIMEApplication
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 from email.utils import formataddr, formatdate, make_msgid
@@ -30,7 +33,10 @@ from urllib.parse import urlparse
 import requests
 
 from .batch import add_batch_headers, get_max_batch_header_size
+from .client import get_http_client
 from .formatters import convert_markdown_to_mrkdwn, strip_markdown
+from .mailer import get_smtp_pool
+from .outbox import NotificationOutbox, OutboxMessage
 
 
 def _render_ai_analysis(ai_analysis: Any, channel: str) -> str:
@@ -92,6 +98,7 @@ def send_to_feishu(
     ai_analysis: Any = None,
     display_regions: Optional[Dict] = None,
     standalone_data: Optional[Dict] = None,
+    outbox: Optional[NotificationOutbox] = None,
 ) -> bool:
     """
     发送到飞书（支持分批发送，支持热榜+RSS合并+独立展示区）
@@ -105,11 +112,12 @@ def send_to_feishu(
         mode: 报告模式 (daily/current)
         account_label: 账号标签（多账号时显示）
         batch_size: 批次大小（字节）
-        batch_interval: 批次发送间隔（秒）
+        batch_interval: 批次发送间隔（秒，已按平台频率限制限速，仅保留兼容）
         split_content_func: 内容分批函数
         get_time_func: 获取当前时间的函数
         rss_items: RSS 统计条目列表（可选，用于合并推送）
         rss_new_items: RSS 新增条目列表（可选，用于新增区块）
+        outbox: 通知发件箱（可选，提供时批次写入发件箱，由发件箱投递）
 
     Returns:
         bool: 发送是否成功
@@ -159,6 +167,7 @@ def send_to_feishu(
     print(f"{log_prefix}消息分为 {len(batches)} 批次发送 [{report_type}]")
 
     # 逐批发送
+    messages: List[OutboxMessage] = []
     for i, batch_content in enumerate(batches, 1):
         content_size = len(batch_content.encode("utf-8"))
         print(
@@ -173,18 +182,22 @@ def send_to_feishu(
             },
         }
 
+        if outbox is not None:
+            messages.append(OutboxMessage(
+                "feishu", webhook_url, i, i, len(batches), label=log_prefix, account=account_label,
+                report_type=report_type, headers=headers, payload=payload,
+            ))
+            continue
+
         try:
-            response = requests.post(
-                webhook_url, headers=headers, json=payload, proxies=proxies, timeout=30
+            response = get_http_client().post(
+                "feishu", webhook_url, headers=headers, json=payload, proxies=proxies, timeout=30
             )
             if response.status_code == 200:
                 result = response.json()
                 # 检查飞书的响应状态
                 if result.get("StatusCode") == 0 or result.get("code") == 0:
                     print(f"{log_prefix}第 {i}/{len(batches)} 批次发送成功 [{report_type}]")
-                    # 批次间间隔
-                    if i < len(batches):
-                        time.sleep(batch_interval)
                 else:
                     error_msg = result.get("msg") or result.get("StatusMessage", "未知错误")
                     print(
@@ -200,6 +213,9 @@ def send_to_feishu(
             print(f"{log_prefix}第 {i}/{len(batches)} 批次发送出错 [{report_type}]：{e}")
             return False
 
+    if outbox is not None:
+        return outbox.enqueue(messages)
+
     print(f"{log_prefix}所有 {len(batches)} 批次发送完成 [{report_type}]")
 
     return True
@@ -222,6 +238,7 @@ def send_to_dingtalk(
     ai_analysis: Any = None,
     display_regions: Optional[Dict] = None,
     standalone_data: Optional[Dict] = None,
+    outbox: Optional[NotificationOutbox] = None,
 ) -> bool:
     """
     发送到钉钉（支持分批发送，支持热榜+RSS合并+独立展示区）
@@ -235,10 +252,11 @@ def send_to_dingtalk(
         mode: 报告模式 (daily/current)
         account_label: 账号标签（多账号时显示）
         batch_size: 批次大小（字节）
-        batch_interval: 批次发送间隔（秒）
+        batch_interval: 批次发送间隔（秒，已按平台频率限制限速，仅保留兼容）
         split_content_func: 内容分批函数
         rss_items: RSS 统计条目列表（可选，用于合并推送）
         rss_new_items: RSS 新增条目列表（可选，用于新增区块）
+        outbox: 通知发件箱（可选，提供时批次写入发件箱，由发件箱投递）
 
     Returns:
         bool: 发送是否成功
@@ -288,6 +306,7 @@ def send_to_dingtalk(
     print(f"{log_prefix}消息分为 {len(batches)} 批次发送 [{report_type}]")
 
     # 逐批发送
+    messages: List[OutboxMessage] = []
     for i, batch_content in enumerate(batches, 1):
         content_size = len(batch_content.encode("utf-8"))
         print(
@@ -302,17 +321,21 @@ def send_to_dingtalk(
             },
         }
 
+        if outbox is not None:
+            messages.append(OutboxMessage(
+                "dingtalk", webhook_url, i, i, len(batches), label=log_prefix, account=account_label,
+                report_type=report_type, headers=headers, payload=payload,
+            ))
+            continue
+
         try:
-            response = requests.post(
-                webhook_url, headers=headers, json=payload, proxies=proxies, timeout=30
+            response = get_http_client().post(
+                "dingtalk", webhook_url, headers=headers, json=payload, proxies=proxies, timeout=30
             )
             if response.status_code == 200:
                 result = response.json()
                 if result.get("errcode") == 0:
                     print(f"{log_prefix}第 {i}/{len(batches)} 批次发送成功 [{report_type}]")
-                    # 批次间间隔
-                    if i < len(batches):
-                        time.sleep(batch_interval)
                 else:
                     print(
                         f"{log_prefix}第 {i}/{len(batches)} 批次发送失败 [{report_type}]，错误：{result.get('errmsg')}"
@@ -327,6 +350,9 @@ def send_to_dingtalk(
             print(f"{log_prefix}第 {i}/{len(batches)} 批次发送出错 [{report_type}]：{e}")
             return False
 
+    if outbox is not None:
+        return outbox.enqueue(messages)
+
     print(f"{log_prefix}所有 {len(batches)} 批次发送完成 [{report_type}]")
 
     return True
@@ -350,6 +376,7 @@ def send_to_wework(
     ai_analysis: Any = None,
     display_regions: Optional[Dict] = None,
     standalone_data: Optional[Dict] = None,
+    outbox: Optional[NotificationOutbox] = None,
 ) -> bool:
     """
     发送到企业微信（支持分批发送，支持 markdown 和 text 两种格式，支持热榜+RSS合并+独立展示区）
@@ -363,11 +390,12 @@ def send_to_wework(
         mode: 报告模式 (daily/current)
         account_label: 账号标签（多账号时显示）
         batch_size: 批次大小（字节）
-        batch_interval: 批次发送间隔（秒）
+        batch_interval: 批次发送间隔（秒，已按平台频率限制限速，仅保留兼容）
         msg_type: 消息类型 (markdown/text)
         split_content_func: 内容分批函数
         rss_items: RSS 统计条目列表（可选，用于合并推送）
         rss_new_items: RSS 新增条目列表（可选，用于新增区块）
+        outbox: 通知发件箱（可选，提供时批次写入发件箱，由发件箱投递）
 
     Returns:
         bool: 发送是否成功
@@ -424,6 +452,7 @@ def send_to_wework(
     print(f"{log_prefix}消息分为 {len(batches)} 批次发送 [{report_type}]")
 
     # 逐批发送
+    messages: List[OutboxMessage] = []
     for i, batch_content in enumerate(batches, 1):
         # 根据消息类型构建 payload
         if is_text_mode:
@@ -440,17 +469,21 @@ def send_to_wework(
             f"发送{log_prefix}第 {i}/{len(batches)} 批次，大小：{content_size} 字节 [{report_type}]"
         )
 
+        if outbox is not None:
+            messages.append(OutboxMessage(
+                "wework", webhook_url, i, i, len(batches), label=log_prefix, account=account_label,
+                report_type=report_type, headers=headers, payload=payload,
+            ))
+            continue
+
         try:
-            response = requests.post(
-                webhook_url, headers=headers, json=payload, proxies=proxies, timeout=30
+            response = get_http_client().post(
+                "wework", webhook_url, headers=headers, json=payload, proxies=proxies, timeout=30
             )
             if response.status_code == 200:
                 result = response.json()
                 if result.get("errcode") == 0:
                     print(f"{log_prefix}第 {i}/{len(batches)} 批次发送成功 [{report_type}]")
-                    # 批次间间隔
-                    if i < len(batches):
-                        time.sleep(batch_interval)
                 else:
                     print(
                         f"{log_prefix}第 {i}/{len(batches)} 批次发送失败 [{report_type}]，错误：{result.get('errmsg')}"
@@ -465,6 +498,9 @@ def send_to_wework(
             print(f"{log_prefix}第 {i}/{len(batches)} 批次发送出错 [{report_type}]：{e}")
             return False
 
+    if outbox is not None:
+        return outbox.enqueue(messages)
+
     print(f"{log_prefix}所有 {len(batches)} 批次发送完成 [{report_type}]")
 
     return True
@@ -488,6 +524,7 @@ def send_to_telegram(
     ai_analysis: Any = None,
     display_regions: Optional[Dict] = None,
     standalone_data: Optional[Dict] = None,
+    outbox: Optional[NotificationOutbox] = None,
 ) -> bool:
     """
     发送到 Telegram（支持分批发送，支持热榜+RSS合并+独立展示区）
@@ -502,10 +539,11 @@ def send_to_telegram(
         mode: 报告模式 (daily/current)
         account_label: 账号标签（多账号时显示）
         batch_size: 批次大小（字节）
-        batch_interval: 批次发送间隔（秒）
+        batch_interval: 批次发送间隔（秒，已按平台频率限制限速，仅保留兼容）
         split_content_func: 内容分批函数
         rss_items: RSS 统计条目列表（可选，用于合并推送）
         rss_new_items: RSS 新增条目列表（可选，用于新增区块）
+        outbox: 通知发件箱（可选，提供时批次写入发件箱，由发件箱投递）
 
     Returns:
         bool: 发送是否成功
@@ -553,6 +591,7 @@ def send_to_telegram(
     print(f"{log_prefix}消息分为 {len(batches)} 批次发送 [{report_type}]")
 
     # 逐批发送
+    messages: List[OutboxMessage] = []
     for i, batch_content in enumerate(batches, 1):
         content_size = len(batch_content.encode("utf-8"))
         print(
@@ -566,17 +605,21 @@ def send_to_telegram(
             "disable_web_page_preview": True,
         }
 
+        if outbox is not None:
+            messages.append(OutboxMessage(
+                "telegram", url, i, i, len(batches), label=log_prefix, account=account_label,
+                report_type=report_type, headers=headers, payload=payload,
+            ))
+            continue
+
         try:
-            response = requests.post(
-                url, headers=headers, json=payload, proxies=proxies, timeout=30
+            response = get_http_client().post(
+                "telegram", url, headers=headers, json=payload, proxies=proxies, timeout=30
             )
             if response.status_code == 200:
                 result = response.json()
                 if result.get("ok"):
                     print(f"{log_prefix}第 {i}/{len(batches)} 批次发送成功 [{report_type}]")
-                    # 批次间间隔
-                    if i < len(batches):
-                        time.sleep(batch_interval)
                 else:
                     print(
                         f"{log_prefix}第 {i}/{len(batches)} 批次发送失败 [{report_type}]，错误：{result.get('description')}"
@@ -591,6 +634,9 @@ def send_to_telegram(
             print(f"{log_prefix}第 {i}/{len(batches)} 批次发送出错 [{report_type}]：{e}")
             return False
 
+    if outbox is not None:
+        return outbox.enqueue(messages)
+
     print(f"{log_prefix}所有 {len(batches)} 批次发送完成 [{report_type}]")
 
     return True
@@ -606,9 +652,10 @@ def send_to_email(
     custom_smtp_port: Optional[int] = None,
     *,
     get_time_func: Callable = None,
+    attach_report: bool = False,
 ) -> bool:
     """
-    发送邮件通知
+    发送邮件通知（所有收件人共用一封邮件，SMTP 会话在进程内复用）
 
     Args:
         from_email: 发件人邮箱
@@ -619,6 +666,7 @@ def send_to_email(
         custom_smtp_server: 自定义 SMTP 服务器（可选）
         custom_smtp_port: 自定义 SMTP 端口（可选）
         get_time_func: 获取当前时间的函数
+        attach_report: 报告以 gzip 压缩附件发送，正文只保留摘要（报告较大时减小邮件体积）
 
     Returns:
         bool: 发送是否成功
@@ -661,18 +709,15 @@ def send_to_email(
             smtp_port = 587
             use_tls = True
 
-        msg = MIMEMultipart("alternative")
+        msg = MIMEMultipart("mixed" if attach_report else "alternative")
 
         # 严格按照 RFC 标准设置 From header
         sender_name = "TrendRadar"
         msg["From"] = formataddr((sender_name, from_email))
 
-        # 设置收件人
-        recipients = [addr.strip() for addr in to_email.split(",")]
-        if len(recipients) == 1:
-            msg["To"] = recipients[0]
-        else:
-            msg["To"] = ", ".join(recipients)
+        # 设置收件人（信封收件人与 To 一致，一次发送到所有收件人）
+        recipients = [addr.strip() for addr in to_email.split(",") if addr.strip()]
+        msg["To"] = ", ".join(recipients)
 
         # 设置邮件主题
         now = get_time_func() if get_time_func else datetime.now()
@@ -693,36 +738,46 @@ TrendRadar 热点分析报告
 
 请使用支持HTML的邮件客户端查看完整报告内容。
         """
+        if attach_report:
+            text_content = text_content.replace(
+                "请使用支持HTML的邮件客户端查看完整报告内容。",
+                "完整报告见附件（gzip 压缩的 HTML 文件，解压后用浏览器打开）。",
+            )
         text_part = MIMEText(text_content, "plain", "utf-8")
         msg.attach(text_part)
 
-        html_part = MIMEText(html_content, "html", "utf-8")
-        msg.attach(html_part)
+        if attach_report:
+            compressed = gzip.compress(html_content.encode("utf-8"))
+            attachment = MIMEApplication(compressed, "gzip")
+            attachment.add_header(
+                "Content-Disposition",
+                "attachment",
+                filename=f"TrendRadar-{now.strftime('%Y%m%d-%H%M')}.html.gz",
+            )
+            msg.attach(attachment)
+            print(f"报告附件：{len(html_content.encode('utf-8'))} 字节压缩为 {len(compressed)} 字节")
+        else:
+            html_part = MIMEText(html_content, "html", "utf-8")
+            msg.attach(html_part)
 
         print(f"正在发送邮件到 {to_email}...")
         print(f"SMTP 服务器: {smtp_server}:{smtp_port}")
         print(f"发件人: {from_email}")
 
         try:
-            if use_tls:
-                # TLS 模式
-                server = smtplib.SMTP(smtp_server, smtp_port, timeout=30)
-                server.set_debuglevel(0)  # 设为1可以查看详细调试信息
-                server.ehlo()
-                server.starttls()
-                server.ehlo()
-            else:
-                # SSL 模式
-                server = smtplib.SMTP_SSL(smtp_server, smtp_port, timeout=30)
-                server.set_debuglevel(0)
-                server.ehlo()
-
-            # 登录
-            server.login(from_email, password)
-
-            # 发送邮件
-            server.send_message(msg)
-            server.quit()
+            # 复用已登录的 SMTP 会话，所有收件人作为信封收件人一次发送
+            refused = get_smtp_pool().send(
+                msg,
+                from_email,
+                recipients,
+                server=smtp_server,
+                port=smtp_port,
+                use_tls=use_tls,
+                user=from_email,
+                password=password,
+            )
+            if refused:
+                print(f"以下收件人被拒绝：{', '.join(refused)}")
 
             print(f"邮件发送成功 [{report_type}] -> {to_email}")
             return True
@@ -773,6 +828,7 @@ def send_to_ntfy(
     ai_analysis: Any = None,
     display_regions: Optional[Dict] = None,
     standalone_data: Optional[Dict] = None,
+    outbox: Optional[NotificationOutbox] = None,
 ) -> bool:
     """
     发送到 ntfy（支持分批发送，严格遵守4KB限制，支持热榜+RSS合并+独立展示区）
@@ -791,6 +847,7 @@ def send_to_ntfy(
         split_content_func: 内容分批函数
         rss_items: RSS 统计条目列表（可选，用于合并推送）
         rss_new_items: RSS 新增条目列表（可选，用于新增区块）
+        outbox: 通知发件箱（可选，提供时批次写入发件箱，由发件箱投递）
 
     Returns:
         bool: 发送是否成功
@@ -868,8 +925,12 @@ def send_to_ntfy(
 
     print(f"{log_prefix}将按反向顺序推送（最后批次先推送），确保客户端显示顺序正确")
 
+    # 批次最小间隔：公共服务器建议 2-3 秒，自托管可以更短（429 由客户端等待后重试）
+    ntfy_interval = 2 if "ntfy.sh" in server_url else 1
+
     # 逐批发送（反向顺序）
     success_count = 0
+    messages: List[OutboxMessage] = []
     for idx, batch_content in enumerate(reversed_batches, 1):
         # 计算正确的批次编号（用户视角的编号）
         actual_batch_num = total_batches - idx + 1
@@ -888,9 +949,19 @@ def send_to_ntfy(
         if total_batches > 1:
             current_headers["Title"] = f"{report_type_en} ({actual_batch_num}/{total_batches})"
 
+        if outbox is not None:
+            messages.append(OutboxMessage(
+                "ntfy", url, idx, actual_batch_num, total_batches, label=log_prefix,
+                account=account_label, report_type=report_type, headers=current_headers,
+                body=batch_content, min_interval=ntfy_interval,
+            ))
+            continue
+
         try:
-            response = requests.post(
+            response = get_http_client().post(
+                "ntfy",
                 url,
+                min_interval=ntfy_interval,
                 headers=current_headers,
                 data=batch_content.encode("utf-8"),
                 proxies=proxies,
@@ -900,30 +971,10 @@ def send_to_ntfy(
             if response.status_code == 200:
                 print(f"{log_prefix}第 {actual_batch_num}/{total_batches} 批次发送成功 [{report_type}]")
                 success_count += 1
-                if idx < total_batches:
-                    # 公共服务器建议 2-3 秒，自托管可以更短
-                    interval = 2 if "ntfy.sh" in server_url else 1
-                    time.sleep(interval)
             elif response.status_code == 429:
                 print(
-                    f"{log_prefix}第 {actual_batch_num}/{total_batches} 批次速率限制 [{report_type}]，等待后重试"
-                )
-                time.sleep(10)  # 等待10秒后重试
-                # 重试一次
-                retry_response = requests.post(
-                    url,
-                    headers=current_headers,
-                    data=batch_content.encode("utf-8"),
-                    proxies=proxies,
-                    timeout=30,
+                    f"{log_prefix}第 {actual_batch_num}/{total_batches} 批次速率限制，重试后仍失败 [{report_type}]"
                 )
-                if retry_response.status_code == 200:
-                    print(f"{log_prefix}第 {actual_batch_num}/{total_batches} 批次重试成功 [{report_type}]")
-                    success_count += 1
-                else:
-                    print(
-                        f"{log_prefix}第 {actual_batch_num}/{total_batches} 批次重试失败，状态码：{retry_response.status_code}"
-                    )
             elif response.status_code == 413:
                 print(
                     f"{log_prefix}第 {actual_batch_num}/{total_batches} 批次消息过大被拒绝 [{report_type}]，消息大小：{content_size} 字节"
@@ -946,6 +997,9 @@ def send_to_ntfy(
         except Exception as e:
             print(f"{log_prefix}第 {actual_batch_num}/{total_batches} 批次发送异常 [{report_type}]：{e}")
 
+    if outbox is not None:
+        return outbox.enqueue(messages)
+
     # 判断整体发送是否成功
     if success_count == total_batches:
         print(f"{log_prefix}所有 {total_batches} 批次发送完成 [{report_type}]")
@@ -975,6 +1029,7 @@ def send_to_bark(
     ai_analysis: Any = None,
     display_regions: Optional[Dict] = None,
     standalone_data: Optional[Dict] = None,
+    outbox: Optional[NotificationOutbox] = None,
 ) -> bool:
     """
     发送到 Bark（支持分批发送，使用 markdown 格式，支持热榜+RSS合并+独立展示区）
@@ -988,10 +1043,11 @@ def send_to_bark(
         mode: 报告模式 (daily/current)
         account_label: 账号标签（多账号时显示）
         batch_size: 批次大小（字节）
-        batch_interval: 批次发送间隔（秒）
+        batch_interval: 最小批次发送间隔（秒）
         split_content_func: 内容分批函数
         rss_items: RSS 统计条目列表（可选，用于合并推送）
         rss_new_items: RSS 新增条目列表（可选，用于新增区块）
+        outbox: 通知发件箱（可选，提供时批次写入发件箱，由发件箱投递）
 
     Returns:
         bool: 发送是否成功
@@ -1056,6 +1112,7 @@ def send_to_bark(
 
     # 逐批发送（反向顺序）
     success_count = 0
+    messages: List[OutboxMessage] = []
     for idx, batch_content in enumerate(reversed_batches, 1):
         # 计算正确的批次编号（用户视角的编号）
         actual_batch_num = total_batches - idx + 1
@@ -1081,9 +1138,19 @@ def send_to_bark(
             "action": "none",  # 点击推送跳到 APP 不弹出弹框,方便阅读
         }
 
+        if outbox is not None:
+            messages.append(OutboxMessage(
+                "bark", api_endpoint, idx, actual_batch_num, total_batches, label=log_prefix,
+                account=account_label, report_type=report_type, payload=payload,
+                min_interval=batch_interval,
+            ))
+            continue
+
         try:
-            response = requests.post(
+            response = get_http_client().post(
+                "bark",
                 api_endpoint,
+                min_interval=batch_interval,
                 json=payload,
                 proxies=proxies,
                 timeout=30,
@@ -1094,9 +1161,6 @@ def send_to_bark(
                 if result.get("code") == 200:
                     print(f"{log_prefix}第 {actual_batch_num}/{total_batches} 批次发送成功 [{report_type}]")
                     success_count += 1
-                    # 批次间间隔
-                    if idx < total_batches:
-                        time.sleep(batch_interval)
                 else:
                     print(
                         f"{log_prefix}第 {actual_batch_num}/{total_batches} 批次发送失败 [{report_type}]，错误：{result.get('message', '未知错误')}"
@@ -1119,6 +1183,9 @@ def send_to_bark(
         except Exception as e:
             print(f"{log_prefix}第 {actual_batch_num}/{total_batches} 批次发送异常 [{report_type}]：{e}")
 
+    if outbox is not None:
+        return outbox.enqueue(messages)
+
     # 判断整体发送是否成功
     if success_count == total_batches:
         print(f"{log_prefix}所有 {total_batches} 批次发送完成 [{report_type}]")
@@ -1148,6 +1215,7 @@ def send_to_slack(
     ai_analysis: Any = None,
     display_regions: Optional[Dict] = None,
     standalone_data: Optional[Dict] = None,
+    outbox: Optional[NotificationOutbox] = None,
 ) -> bool:
     """
     发送到 Slack（支持分批发送，使用 mrkdwn 格式，支持热榜+RSS合并+独立展示区）
@@ -1161,10 +1229,11 @@ def send_to_slack(
         mode: 报告模式 (daily/current)
         account_label: 账号标签（多账号时显示）
         batch_size: 批次大小（字节）
-        batch_interval: 批次发送间隔（秒）
+        batch_interval: 批次发送间隔（秒，已按平台频率限制限速，仅保留兼容）
         split_content_func: 内容分批函数
         rss_items: RSS 统计条目列表（可选，用于合并推送）
         rss_new_items: RSS 新增条目列表（可选，用于新增区块）
+        outbox: 通知发件箱（可选，提供时批次写入发件箱，由发件箱投递）
 
     Returns:
         bool: 发送是否成功
@@ -1210,6 +1279,7 @@ def send_to_slack(
     print(f"{log_prefix}消息分为 {len(batches)} 批次发送 [{report_type}]")
 
     # 逐批发送
+    messages: List[OutboxMessage] = []
     for i, batch_content in enumerate(batches, 1):
         # 转换 Markdown 到 mrkdwn 格式
         mrkdwn_content = convert_markdown_to_mrkdwn(batch_content)
@@ -1222,17 +1292,21 @@ def send_to_slack(
         # 构建 Slack payload（使用简单的 text 字段，支持 mrkdwn）
         payload = {"text": mrkdwn_content}
 
+        if outbox is not None:
+            messages.append(OutboxMessage(
+                "slack", webhook_url, i, i, len(batches), label=log_prefix, account=account_label,
+                report_type=report_type, headers=headers, payload=payload,
+            ))
+            continue
+
         try:
-            response = requests.post(
-                webhook_url, headers=headers, json=payload, proxies=proxies, timeout=30
+            response = get_http_client().post(
+                "slack", webhook_url, headers=headers, json=payload, proxies=proxies, timeout=30
             )
 
             # Slack Incoming Webhooks 成功时返回 "ok" 文本
             if response.status_code == 200 and response.text == "ok":
                 print(f"{log_prefix}第 {i}/{len(batches)} 批次发送成功 [{report_type}]")
-                # 批次间间隔
-                if i < len(batches):
-                    time.sleep(batch_interval)
             else:
                 error_msg = response.text if response.text else f"状态码：{response.status_code}"
                 print(
@@ -1243,6 +1317,9 @@ def send_to_slack(
             print(f"{log_prefix}第 {i}/{len(batches)} 批次发送出错 [{report_type}]：{e}")
             return False
 
+    if outbox is not None:
+        return outbox.enqueue(messages)
+
     print(f"{log_prefix}所有 {len(batches)} 批次发送完成 [{report_type}]")
 
     return True
@@ -1266,6 +1343,7 @@ def send_to_generic_webhook(
     ai_analysis: Any = None,
     display_regions: Optional[Dict] = None,
     standalone_data: Optional[Dict] = None,
+    outbox: Optional[NotificationOutbox] = None,
 ) -> bool:
     """
     发送到通用 Webhook（支持分批发送，支持自定义 JSON 模板，支持热榜+RSS合并+独立展示区）
@@ -1280,10 +1358,11 @@ def send_to_generic_webhook(
         mode: 报告模式 (daily/current)
         account_label: 账号标签（多账号时显示）
         batch_size: 批次大小（字节）
-        batch_interval: 批次发送间隔（秒）
+        batch_interval: 最小批次发送间隔（秒）
         split_content_func: 内容分批函数
         rss_items: RSS 统计条目列表（可选，用于合并推送）
         rss_new_items: RSS 新增条目列表（可选，用于新增区块）
+        outbox: 通知发件箱（可选，提供时批次写入发件箱，由发件箱投递）
 
     Returns:
         bool: 发送是否成功
@@ -1335,6 +1414,7 @@ def send_to_generic_webhook(
     print(f"{log_prefix}消息分为 {len(batches)} 批次发送 [{report_type}]")
 
     # 逐批发送
+    messages: List[OutboxMessage] = []
     for i, batch_content in enumerate(batches, 1):
         content_size = len(batch_content.encode("utf-8"))
         print(
@@ -1362,14 +1442,21 @@ def send_to_generic_webhook(
                 # 默认格式
                 payload = {"title": report_type, "content": batch_content}
 
-            response = requests.post(
-                webhook_url, headers=headers, json=payload, proxies=proxies, timeout=30
+            if outbox is not None:
+                messages.append(OutboxMessage(
+                    "generic_webhook", webhook_url, i, i, len(batches), label=log_prefix,
+                    account=account_label, report_type=report_type, headers=headers,
+                    payload=payload, min_interval=batch_interval,
+                ))
+                continue
+
+            response = get_http_client().post(
+                "generic_webhook", webhook_url, min_interval=batch_interval,
+                headers=headers, json=payload, proxies=proxies, timeout=30,
             )
             
             if response.status_code >= 200 and response.status_code < 300:
                 print(f"{log_prefix}第 {i}/{len(batches)} 批次发送成功 [{report_type}]")
-                if i < len(batches):
-                    time.sleep(batch_interval)
             else:
                 print(
                     f"{log_prefix}第 {i}/{len(batches)} 批次发送失败 [{report_type}]，状态码：{response.status_code}, 响应: {response.text}"
@@ -1379,6 +1466,9 @@ def send_to_generic_webhook(
             print(f"{log_prefix}第 {i}/{len(batches)} 批次发送出错 [{report_type}]：{e}")
             return False
 
+    if outbox is not None:
+        return outbox.enqueue(messages)
+
     print(f"{log_prefix}所有 {len(batches)} 批次发送完成 [{report_type}]")
 
     return True
@@ -9,7 +9,7 @@ from datetime import datetime
 from typing import Dict, List, Optional, Callable
 
 from trendradar.report.formatter import format_title_for_platform
-from trendradar.report.helpers import format_rank_display
+from trendradar.report.helpers import format_failed_source, format_rank_display
 from trendradar.utils.time import format_iso_time_friendly, convert_time_for_display
 
 
@@ -25,6 +25,88 @@ DEFAULT_BATCH_SIZES = {
 DEFAULT_REGION_ORDER = ["hotlist", "rss", "new_items", "standalone", "ai_analysis"]
 
 
+def _utf8_len(text: str) -> int:
+    """字符串的 UTF-8 字节数（纯 ASCII 时无需编码）"""
+    return len(text) if text.isascii() else len(text.encode("utf-8"))
+
+
+class _BatchBuilder:
+    """
+    批次构建器
+
+    增量累计当前批次的 UTF-8 字节数，尾部字节数只计算一次，
+    批次内容以片段列表保存、完成时拼接一次，避免每追加一行都重新编码整个批次。
+
+    判断规则与逐行拼接后整体编码一致：当前字节数 + 新内容字节数 + 尾部字节数 < max_bytes 时放入当前批次。
+    """
+
+    def __init__(self, header: str, footer: str, max_bytes: int):
+        """
+        Args:
+            header: 每个批次的头部
+            footer: 每个批次的尾部
+            max_bytes: 单个批次的最大字节数
+        """
+        self.header = header
+        self.footer = footer
+        self.max_bytes = max_bytes
+        self.batches: List[str] = []
+        self.has_content = False
+        self._footer_size = _utf8_len(footer)
+        self._parts: List[str] = [header]
+        self._size = _utf8_len(header)
+
+    def _push(self, text: str, size: int) -> None:
+        if text:
+            self._parts.append(text)
+            self._size += size
+
+    def append(self, text: str) -> None:
+        """无条件追加内容（不改变是否有内容的标记）"""
+        self._push(text, _utf8_len(text))
+
+    def try_append(self, text: str) -> bool:
+        """放得下时追加内容（用于分隔符），返回是否已追加"""
+        size = _utf8_len(text)
+        if self._size + size + self._footer_size < self.max_bytes:
+            self._push(text, size)
+            return True
+        return False
+
+    def add(self, text: str, *restart: str) -> None:
+        """
+        追加内容，当前批次放不下时结束当前批次，以头部 + restart 开启新批次
+
+        Args:
+            text: 要追加的内容
+            restart: 新批次中头部之后的内容片段（通常是区块标题 + 分组标题 + 当前行）
+        """
+        size = _utf8_len(text)
+        if self._size + size + self._footer_size >= self.max_bytes:
+            self._flush()
+            self._parts = [self.header]
+            self._size = _utf8_len(self.header)
+            for part in restart:
+                self.append(part)
+        else:
+            self._push(text, size)
+        self.has_content = True
+
+    def _flush(self) -> None:
+        if self.has_content:
+            self._parts.append(self.footer)
+            self.batches.append("".join(self._parts))
+
+    def state(self) -> tuple:
+        """当前状态，内容变化时必然不同（用于判断某个区域是否产生了内容）"""
+        return len(self.batches), self.has_content, len(self._parts), self._size
+
+    def finish(self) -> List[str]:
+        """完成最后批次，返回所有批次"""
+        self._flush()
+        return self.batches
+
+
 def split_content_into_batches(
     report_data: Dict,
     format_type: str,
@@ -89,8 +171,6 @@ def split_content_into_batches(
         else:
             max_bytes = sizes.get("default", 4000)
 
-    batches = []
-
     total_hotlist_count = sum(
         len(stat["titles"]) for stat in report_data["stats"] if stat["count"] > 0
     )
@@ -193,8 +273,7 @@ def split_content_into_batches(
         elif format_type == "slack":
             stats_header = f"📊 *{stats_title}* (共 {total_hotlist_count} 条)\n\n"
 
-    current_batch = base_header
-    current_batch_has_content = False
+    batch = _BatchBuilder(base_header, base_footer, max_bytes)
 
     # 当没有热榜数据时的处理
     # 注意：如果有 ai_content，不应该返回"暂无匹配"消息，而应该继续处理 AI 内容
@@ -214,20 +293,19 @@ def split_content_into_batches(
             mode_text = "暂无匹配的热点词汇"
         simple_content = f"📭 {mode_text}\n\n"
         final_content = base_header + simple_content + base_footer
-        batches.append(final_content)
-        return batches
+        return [final_content]
 
     # 定义处理热点词汇统计的函数
-    def process_stats_section(current_batch, current_batch_has_content, batches, add_separator=True):
+    def process_stats_section(add_separator=True):
         """处理热点词汇统计"""
         if not report_data["stats"]:
-            return current_batch, current_batch_has_content, batches
+            return
 
         total_count = len(report_data["stats"])
 
         # 根据 add_separator 决定是否添加前置分割线
         actual_stats_header = ""
-        if add_separator and current_batch_has_content:
+        if add_separator and batch.has_content:
             # 需要添加分割线
             if format_type == "feishu":
                 actual_stats_header = f"\n{feishu_separator}\n\n{stats_header}"
@@ -242,19 +320,7 @@ def split_content_into_batches(
             actual_stats_header = stats_header
 
         # 添加统计标题
-        test_content = current_batch + actual_stats_header
-        if (
-            len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
-            < max_bytes
-        ):
-            current_batch = test_content
-            current_batch_has_content = True
-        else:
-            if current_batch_has_content:
-                batches.append(current_batch + base_footer)
-            # 新批次开头不需要分割线，使用原始 stats_header
-            current_batch = base_header + stats_header
-            current_batch_has_content = True
+        batch.add(actual_stats_header, stats_header)
 
         # 逐个处理词组（确保词组标题+第一条新闻的原子性）
         for i, stat in enumerate(report_data["stats"]):
@@ -363,22 +429,8 @@ def split_content_into_batches(
 
             # 原子性检查：词组标题+第一条新闻必须一起处理
             word_with_first_news = word_header + first_news_line
-            test_content = current_batch + word_with_first_news
-
-            if (
-                len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
-                >= max_bytes
-            ):
-                # 当前批次容纳不下，开启新批次
-                if current_batch_has_content:
-                    batches.append(current_batch + base_footer)
-                current_batch = base_header + stats_header + word_with_first_news
-                current_batch_has_content = True
-                start_index = 1
-            else:
-                current_batch = test_content
-                current_batch_has_content = True
-                start_index = 1
+            batch.add(word_with_first_news, stats_header, word_with_first_news)
+            start_index = 1
 
             # 处理剩余新闻条目
             for j in range(start_index, len(stat["titles"])):
@@ -414,18 +466,7 @@ def split_content_into_batches(
                 if j < len(stat["titles"]) - 1:
                     news_line += "\n"
 
-                test_content = current_batch + news_line
-                if (
-                    len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
-                    >= max_bytes
-                ):
-                    if current_batch_has_content:
-                        batches.append(current_batch + base_footer)
-                    current_batch = base_header + stats_header + word_header + news_line
-                    current_batch_has_content = True
-                else:
-                    current_batch = test_content
-                    current_batch_has_content = True
+                batch.add(news_line, stats_header, word_header, news_line)
 
             # 词组间分隔符
             if i < len(report_data["stats"]) - 1:
@@ -443,24 +484,17 @@ def split_content_into_batches(
                 elif format_type == "slack":
                     separator = f"\n\n"
 
-                test_content = current_batch + separator
-                if (
-                    len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
-                    < max_bytes
-                ):
-                    current_batch = test_content
-
-        return current_batch, current_batch_has_content, batches
+                batch.try_append(separator)
 
     # 定义处理新增新闻的函数
-    def process_new_titles_section(current_batch, current_batch_has_content, batches, add_separator=True):
+    def process_new_titles_section(add_separator=True):
         """处理新增新闻"""
         if not show_new_section or not report_data["new_titles"]:
-            return current_batch, current_batch_has_content, batches
+            return
 
         # 根据 add_separator 决定是否添加前置分割线
         new_header = ""
-        if add_separator and current_batch_has_content:
+        if add_separator and batch.has_content:
             # 需要添加分割线
             if format_type in ("wework", "bark"):
                 new_header = f"\n\n\n\n🆕 **本次新增热点新闻** (共 {report_data['total_new_count']} 条)\n\n"
@@ -491,18 +525,7 @@ def split_content_into_batches(
             elif format_type == "slack":
                 new_header = f"🆕 *本次新增热点新闻* (共 {report_data['total_new_count']} 条)\n\n"
 
-        test_content = current_batch + new_header
-        if (
-            len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
-            >= max_bytes
-        ):
-            if current_batch_has_content:
-                batches.append(current_batch + base_footer)
-            current_batch = base_header + new_header
-            current_batch_has_content = True
-        else:
-            current_batch = test_content
-            current_batch_has_content = True
+        batch.add(new_header, new_header)
 
         # 逐个处理新增新闻来源
         for source_data in report_data["new_titles"]:
@@ -554,21 +577,8 @@ def split_content_into_batches(
 
             # 原子性检查：来源标题+第一条新闻
             source_with_first_news = source_header + first_news_line
-            test_content = current_batch + source_with_first_news
-
-            if (
-                len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
-                >= max_bytes
-            ):
-                if current_batch_has_content:
-                    batches.append(current_batch + base_footer)
-                current_batch = base_header + new_header + source_with_first_news
-                current_batch_has_content = True
-                start_index = 1
-            else:
-                current_batch = test_content
-                current_batch_has_content = True
-                start_index = 1
+            batch.add(source_with_first_news, new_header, source_with_first_news)
+            start_index = 1
 
             # 处理剩余新增新闻
             for j in range(start_index, len(source_data["titles"])):
@@ -601,33 +611,20 @@ def split_content_into_batches(
 
                 news_line = f"  {j + 1}. {formatted_title}\n"
 
-                test_content = current_batch + news_line
-                if (
-                    len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
-                    >= max_bytes
-                ):
-                    if current_batch_has_content:
-                        batches.append(current_batch + base_footer)
-                    current_batch = base_header + new_header + source_header + news_line
-                    current_batch_has_content = True
-                else:
-                    current_batch = test_content
-                    current_batch_has_content = True
-
-            current_batch += "\n"
+                batch.add(news_line, new_header, source_header, news_line)
 
-        return current_batch, current_batch_has_content, batches
+            batch.append("\n")
 
     # 定义处理 AI 分析的函数
-    def process_ai_section(current_batch, current_batch_has_content, batches, add_separator=True):
+    def process_ai_section(add_separator=True):
         """处理 AI 分析内容"""
         nonlocal ai_content
         if not ai_content:
-            return current_batch, current_batch_has_content, batches
+            return
 
         # 根据 add_separator 决定是否添加前置分割线
         ai_separator = ""
-        if add_separator and current_batch_has_content:
+        if add_separator and batch.has_content:
             # 需要添加分割线
             if format_type == "feishu":
                 ai_separator = f"\n{feishu_separator}\n\n"
@@ -639,56 +636,35 @@ def split_content_into_batches(
                 ai_separator = "\n\n"
         # 如果不需要分割线，ai_separator 保持为空字符串
 
-        # 尝试将 AI 内容添加到当前批次
-        test_content = current_batch + ai_separator + ai_content
-        if (
-            len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
-            < max_bytes
-        ):
-            current_batch = test_content
-            current_batch_has_content = True
-        else:
-            # 当前批次容纳不下，开启新批次
-            if current_batch_has_content:
-                batches.append(current_batch + base_footer)
-            # AI 内容可能很长，需要考虑是否需要进一步分割
-            ai_with_header = base_header + ai_content
-            current_batch = ai_with_header
-            current_batch_has_content = True
-
-        return current_batch, current_batch_has_content, batches
+        # 尝试将 AI 内容添加到当前批次，容纳不下时开启新批次
+        # AI 内容可能很长，需要考虑是否需要进一步分割
+        batch.add(ai_separator + ai_content, ai_content)
 
     # 定义处理独立展示区的函数
-    def process_standalone_section_wrapper(current_batch, current_batch_has_content, batches, add_separator=True):
+    def process_standalone_section_wrapper(add_separator=True):
         """处理独立展示区"""
         if not standalone_data:
-            return current_batch, current_batch_has_content, batches
-        return _process_standalone_section(
-            standalone_data, format_type, feishu_separator, base_header, base_footer,
-            max_bytes, current_batch, current_batch_has_content, batches, timezone,
-            rank_threshold, add_separator
+            return
+        _process_standalone_section(
+            standalone_data, format_type, feishu_separator, batch, timezone, rank_threshold, add_separator
         )
 
     # 定义处理 RSS 统计的函数
-    def process_rss_stats_wrapper(current_batch, current_batch_has_content, batches, add_separator=True):
+    def process_rss_stats_wrapper(add_separator=True):
         """处理 RSS 统计"""
         if not rss_items:
-            return current_batch, current_batch_has_content, batches
-        return _process_rss_stats_section(
-            rss_items, format_type, feishu_separator, base_header, base_footer,
-            max_bytes, current_batch, current_batch_has_content, batches, timezone,
-            add_separator
+            return
+        _process_rss_stats_section(
+            rss_items, format_type, feishu_separator, batch, timezone, add_separator
         )
 
     # 定义处理 RSS 新增的函数
-    def process_rss_new_wrapper(current_batch, current_batch_has_content, batches, add_separator=True):
+    def process_rss_new_wrapper(add_separator=True):
         """处理 RSS 新增"""
         if not rss_new_items:
-            return current_batch, current_batch_has_content, batches
-        return _process_rss_new_titles_section(
-            rss_new_items, format_type, feishu_separator, base_header, base_footer,
-            max_bytes, current_batch, current_batch_has_content, batches, timezone,
-            add_separator
+            return
+        _process_rss_new_titles_section(
+            rss_new_items, format_type, feishu_separator, batch, timezone, add_separator
         )
 
     # 按 region_order 顺序处理各区域
@@ -697,56 +673,34 @@ def split_content_into_batches(
 
     for region in region_order:
         # 记录处理前的状态，用于判断该区域是否产生了内容
-        batch_before = current_batch
-        has_content_before = current_batch_has_content
-        batches_len_before = len(batches)
+        state_before = batch.state()
 
         # 决定是否需要添加分割线（第一个有内容的区域不需要）
         add_separator = has_region_content
 
         if region == "hotlist":
             # 处理热榜统计
-            current_batch, current_batch_has_content, batches = process_stats_section(
-                current_batch, current_batch_has_content, batches, add_separator
-            )
+            process_stats_section(add_separator)
         elif region == "rss":
             # 处理 RSS 统计
-            current_batch, current_batch_has_content, batches = process_rss_stats_wrapper(
-                current_batch, current_batch_has_content, batches, add_separator
-            )
+            process_rss_stats_wrapper(add_separator)
         elif region == "new_items":
             # 处理热榜新增
-            current_batch, current_batch_has_content, batches = process_new_titles_section(
-                current_batch, current_batch_has_content, batches, add_separator
-            )
+            process_new_titles_section(add_separator)
             # 处理 RSS 新增（跟随 new_items，继承 add_separator 逻辑）
             # 如果热榜新增产生了内容，RSS 新增需要分割线
-            new_batch_changed = (
-                current_batch != batch_before or
-                current_batch_has_content != has_content_before or
-                len(batches) != batches_len_before
-            )
+            new_batch_changed = batch.state() != state_before
             rss_new_separator = new_batch_changed or has_region_content
-            current_batch, current_batch_has_content, batches = process_rss_new_wrapper(
-                current_batch, current_batch_has_content, batches, rss_new_separator
-            )
+            process_rss_new_wrapper(rss_new_separator)
         elif region == "standalone":
             # 处理独立展示区
-            current_batch, current_batch_has_content, batches = process_standalone_section_wrapper(
-                current_batch, current_batch_has_content, batches, add_separator
-            )
+            process_standalone_section_wrapper(add_separator)
         elif region == "ai_analysis":
             # 处理 AI 分析
-            current_batch, current_batch_has_content, batches = process_ai_section(
-                current_batch, current_batch_has_content, batches, add_separator
-            )
+            process_ai_section(add_separator)
 
         # 检查该区域是否产生了内容
-        region_produced_content = (
-            current_batch != batch_before or
-            current_batch_has_content != has_content_before or
-            len(batches) != batches_len_before
-        )
+        region_produced_content = batch.state() != state_before
         if region_produced_content:
             has_region_content = True
 
@@ -763,20 +717,10 @@ def split_content_into_batches(
         elif format_type == "dingtalk":
             failed_header = f"\n---\n\n⚠️ **数据获取失败的平台：**\n\n"
 
-        test_content = current_batch + failed_header
-        if (
-            len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
-            >= max_bytes
-        ):
-            if current_batch_has_content:
-                batches.append(current_batch + base_footer)
-            current_batch = base_header + failed_header
-            current_batch_has_content = True
-        else:
-            current_batch = test_content
-            current_batch_has_content = True
+        batch.add(failed_header, failed_header)
 
         for i, id_value in enumerate(report_data["failed_ids"], 1):
+            id_value = format_failed_source(id_value, report_data)
             if format_type == "feishu":
                 failed_line = f"  • <font color='red'>{id_value}</font>\n"
             elif format_type == "dingtalk":
@@ -784,39 +728,20 @@ def split_content_into_batches(
             else:
                 failed_line = f"  • {id_value}\n"
 
-            test_content = current_batch + failed_line
-            if (
-                len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
-                >= max_bytes
-            ):
-                if current_batch_has_content:
-                    batches.append(current_batch + base_footer)
-                current_batch = base_header + failed_header + failed_line
-                current_batch_has_content = True
-            else:
-                current_batch = test_content
-                current_batch_has_content = True
+            batch.add(failed_line, failed_header, failed_line)
 
     # 完成最后批次
-    if current_batch_has_content:
-        batches.append(current_batch + base_footer)
-
-    return batches
+    return batch.finish()
 
 
 def _process_rss_stats_section(
     rss_stats: list,
     format_type: str,
     feishu_separator: str,
-    base_header: str,
-    base_footer: str,
-    max_bytes: int,
-    current_batch: str,
-    current_batch_has_content: bool,
-    batches: List[str],
+    batch: "_BatchBuilder",
     timezone: str = "Asia/Shanghai",
     add_separator: bool = True,
-) -> tuple:
+) -> None:
     """处理 RSS 统计区块（按关键词分组，与热榜统计格式一致）
 
     Args:
@@ -824,20 +749,12 @@ def _process_rss_stats_section(
             [{"word": "AI", "count": 5, "titles": [...]}]
         format_type: 格式类型
         feishu_separator: 飞书分隔符
-        base_header: 基础头部
-        base_footer: 基础尾部
-        max_bytes: 最大字节数
-        current_batch: 当前批次内容
-        current_batch_has_content: 当前批次是否有内容
-        batches: 已完成的批次列表
+        batch: 批次构建器
         timezone: 时区名称
         add_separator: 是否在区块前添加分割线（第一个区域时为 False）
-
-    Returns:
-        (current_batch, current_batch_has_content, batches) 元组
     """
     if not rss_stats:
-        return current_batch, current_batch_has_content, batches
+        return
 
     # 计算总条目数
     total_items = sum(stat["count"] for stat in rss_stats)
@@ -845,7 +762,7 @@ def _process_rss_stats_section(
 
     # RSS 统计区块标题（根据 add_separator 决定是否添加前置分割线）
     rss_header = ""
-    if add_separator and current_batch_has_content:
+    if add_separator and batch.has_content:
         # 需要添加分割线
         if format_type == "feishu":
             rss_header = f"\n{feishu_separator}\n\n📰 **RSS 订阅统计** (共 {total_items} 条)\n\n"
@@ -873,15 +790,7 @@ def _process_rss_stats_section(
             rss_header = f"📰 **RSS 订阅统计** (共 {total_items} 条)\n\n"
 
     # 添加 RSS 标题
-    test_content = current_batch + rss_header
-    if len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8")) < max_bytes:
-        current_batch = test_content
-        current_batch_has_content = True
-    else:
-        if current_batch_has_content:
-            batches.append(current_batch + base_footer)
-        current_batch = base_header + rss_header
-        current_batch_has_content = True
+    batch.add(rss_header, rss_header)
 
     # 逐个处理关键词组（与热榜一致）
     for i, stat in enumerate(rss_stats):
@@ -959,18 +868,8 @@ def _process_rss_stats_section(
 
         # 原子性检查：关键词标题 + 第一条新闻必须一起处理
         word_with_first_news = word_header + first_news_line
-        test_content = current_batch + word_with_first_news
-
-        if len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8")) >= max_bytes:
-            if current_batch_has_content:
-                batches.append(current_batch + base_footer)
-            current_batch = base_header + rss_header + word_with_first_news
-            current_batch_has_content = True
-            start_index = 1
-        else:
-            current_batch = test_content
-            current_batch_has_content = True
-            start_index = 1
+        batch.add(word_with_first_news, rss_header, word_with_first_news)
+        start_index = 1
 
         # 处理剩余新闻条目
         for j in range(start_index, len(stat["titles"])):
@@ -994,15 +893,7 @@ def _process_rss_stats_section(
             if j < len(stat["titles"]) - 1:
                 news_line += "\n"
 
-            test_content = current_batch + news_line
-            if len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8")) >= max_bytes:
-                if current_batch_has_content:
-                    batches.append(current_batch + base_footer)
-                current_batch = base_header + rss_header + word_header + news_line
-                current_batch_has_content = True
-            else:
-                current_batch = test_content
-                current_batch_has_content = True
+            batch.add(news_line, rss_header, word_header, news_line)
 
         # 关键词间分隔符
         if i < len(rss_stats) - 1:
@@ -1020,26 +911,17 @@ def _process_rss_stats_section(
             elif format_type == "slack":
                 separator = "\n\n"
 
-            test_content = current_batch + separator
-            if len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8")) < max_bytes:
-                current_batch = test_content
-
-    return current_batch, current_batch_has_content, batches
+            batch.try_append(separator)
 
 
 def _process_rss_new_titles_section(
     rss_new_stats: list,
     format_type: str,
     feishu_separator: str,
-    base_header: str,
-    base_footer: str,
-    max_bytes: int,
-    current_batch: str,
-    current_batch_has_content: bool,
-    batches: List[str],
+    batch: "_BatchBuilder",
     timezone: str = "Asia/Shanghai",
     add_separator: bool = True,
-) -> tuple:
+) -> None:
     """处理 RSS 新增区块（按来源分组，与热榜新增格式一致）
 
     Args:
@@ -1047,20 +929,12 @@ def _process_rss_new_titles_section(
             [{"word": "AI", "count": 5, "titles": [...]}]
         format_type: 格式类型
         feishu_separator: 飞书分隔符
-        base_header: 基础头部
-        base_footer: 基础尾部
-        max_bytes: 最大字节数
-        current_batch: 当前批次内容
-        current_batch_has_content: 当前批次是否有内容
-        batches: 已完成的批次列表
+        batch: 批次构建器
         timezone: 时区名称
         add_separator: 是否在区块前添加分割线（第一个区域时为 False）
-
-    Returns:
-        (current_batch, current_batch_has_content, batches) 元组
     """
     if not rss_new_stats:
-        return current_batch, current_batch_has_content, batches
+        return
 
     # 从关键词分组中提取所有条目，重新按来源分组
     source_map = {}
@@ -1072,14 +946,14 @@ def _process_rss_new_titles_section(
             source_map[source_name].append(title_data)
 
     if not source_map:
-        return current_batch, current_batch_has_content, batches
+        return
 
     # 计算总条目数
     total_items = sum(len(titles) for titles in source_map.values())
 
     # RSS 新增区块标题（根据 add_separator 决定是否添加前置分割线）
     new_header = ""
-    if add_separator and current_batch_has_content:
+    if add_separator and batch.has_content:
         # 需要添加分割线
         if format_type in ("wework", "bark"):
             new_header = f"\n\n\n\n🆕 **RSS 本次新增** (共 {total_items} 条)\n\n"
@@ -1109,15 +983,7 @@ def _process_rss_new_titles_section(
             new_header = f"🆕 *RSS 本次新增* (共 {total_items} 条)\n\n"
 
     # 添加 RSS 新增标题
-    test_content = current_batch + new_header
-    if len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8")) >= max_bytes:
-        if current_batch_has_content:
-            batches.append(current_batch + base_footer)
-        current_batch = base_header + new_header
-        current_batch_has_content = True
-    else:
-        current_batch = test_content
-        current_batch_has_content = True
+    batch.add(new_header, new_header)
 
     # 按来源分组显示（与热榜新增格式一致）
     source_list = list(source_map.items())
@@ -1163,18 +1029,8 @@ def _process_rss_new_titles_section(
 
         # 原子性检查：来源标题 + 第一条新闻必须一起处理
         source_with_first_news = source_header + first_news_line
-        test_content = current_batch + source_with_first_news
-
-        if len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8")) >= max_bytes:
-            if current_batch_has_content:
-                batches.append(current_batch + base_footer)
-            current_batch = base_header + new_header + source_with_first_news
-            current_batch_has_content = True
-            start_index = 1
-        else:
-            current_batch = test_content
-            current_batch_has_content = True
-            start_index = 1
+        batch.add(source_with_first_news, new_header, source_with_first_news)
+        start_index = 1
 
         # 处理剩余新闻条目（禁用 new emoji）
         for j in range(start_index, len(titles)):
@@ -1197,20 +1053,10 @@ def _process_rss_new_titles_section(
 
             news_line = f"  {j + 1}. {formatted_title}\n"
 
-            test_content = current_batch + news_line
-            if len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8")) >= max_bytes:
-                if current_batch_has_content:
-                    batches.append(current_batch + base_footer)
-                current_batch = base_header + new_header + source_header + news_line
-                current_batch_has_content = True
-            else:
-                current_batch = test_content
-                current_batch_has_content = True
+            batch.add(news_line, new_header, source_header, news_line)
 
         # 来源间添加空行（与热榜新增格式一致）
-        current_batch += "\n"
-
-    return current_batch, current_batch_has_content, batches
+        batch.append("\n")
 
 
 def _format_rss_item_line(
@@ -1271,16 +1117,11 @@ def _process_standalone_section(
     standalone_data: Dict,
     format_type: str,
     feishu_separator: str,
-    base_header: str,
-    base_footer: str,
-    max_bytes: int,
-    current_batch: str,
-    current_batch_has_content: bool,
-    batches: List[str],
+    batch: "_BatchBuilder",
     timezone: str = "Asia/Shanghai",
     rank_threshold: int = 10,
     add_separator: bool = True,
-) -> tuple:
+) -> None:
     """处理独立展示区区块
 
     独立展示区显示指定平台的完整热榜或 RSS 源内容，不受关键词过滤影响。
@@ -1294,27 +1135,19 @@ def _process_standalone_section(
             }
         format_type: 格式类型
         feishu_separator: 飞书分隔符
-        base_header: 基础头部
-        base_footer: 基础尾部
-        max_bytes: 最大字节数
-        current_batch: 当前批次内容
-        current_batch_has_content: 当前批次是否有内容
-        batches: 已完成的批次列表
+        batch: 批次构建器
         timezone: 时区名称
         rank_threshold: 排名高亮阈值
         add_separator: 是否在区块前添加分割线（第一个区域时为 False）
-
-    Returns:
-        (current_batch, current_batch_has_content, batches) 元组
     """
     if not standalone_data:
-        return current_batch, current_batch_has_content, batches
+        return
 
     platforms = standalone_data.get("platforms", [])
     rss_feeds = standalone_data.get("rss_feeds", [])
 
     if not platforms and not rss_feeds:
-        return current_batch, current_batch_has_content, batches
+        return
 
     # 计算总条目数
     total_platform_items = sum(len(p.get("items", [])) for p in platforms)
@@ -1323,7 +1156,7 @@ def _process_standalone_section(
 
     # 独立展示区标题（根据 add_separator 决定是否添加前置分割线）
     section_header = ""
-    if add_separator and current_batch_has_content:
+    if add_separator and batch.has_content:
         # 需要添加分割线
         if format_type == "feishu":
             section_header = f"\n{feishu_separator}\n\n📋 **独立展示区** (共 {total_items} 条)\n\n"
@@ -1351,15 +1184,7 @@ def _process_standalone_section(
             section_header = f"📋 **独立展示区** (共 {total_items} 条)\n\n"
 
     # 添加区块标题
-    test_content = current_batch + section_header
-    if len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8")) < max_bytes:
-        current_batch = test_content
-        current_batch_has_content = True
-    else:
-        if current_batch_has_content:
-            batches.append(current_batch + base_footer)
-        current_batch = base_header + section_header
-        current_batch_has_content = True
+    batch.add(section_header, section_header)
 
     # 处理热榜平台
     for platform in platforms:
@@ -1390,34 +1215,16 @@ def _process_standalone_section(
 
         # 原子性检查
         platform_with_first = platform_header + first_item_line
-        test_content = current_batch + platform_with_first
-
-        if len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8")) >= max_bytes:
-            if current_batch_has_content:
-                batches.append(current_batch + base_footer)
-            current_batch = base_header + section_header + platform_with_first
-            current_batch_has_content = True
-            start_index = 1
-        else:
-            current_batch = test_content
-            current_batch_has_content = True
-            start_index = 1
+        batch.add(platform_with_first, section_header, platform_with_first)
+        start_index = 1
 
         # 处理剩余条目
         for j in range(start_index, len(items)):
             item_line = _format_standalone_platform_item(items[j], j + 1, format_type, rank_threshold)
 
-            test_content = current_batch + item_line
-            if len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8")) >= max_bytes:
-                if current_batch_has_content:
-                    batches.append(current_batch + base_footer)
-                current_batch = base_header + section_header + platform_header + item_line
-                current_batch_has_content = True
-            else:
-                current_batch = test_content
-                current_batch_has_content = True
+            batch.add(item_line, section_header, platform_header, item_line)
 
-        current_batch += "\n"
+        batch.append("\n")
 
     # 处理 RSS 源
     for feed in rss_feeds:
@@ -1448,36 +1255,16 @@ def _process_standalone_section(
 
         # 原子性检查
         feed_with_first = feed_header + first_item_line
-        test_content = current_batch + feed_with_first
-
-        if len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8")) >= max_bytes:
-            if current_batch_has_content:
-                batches.append(current_batch + base_footer)
-            current_batch = base_header + section_header + feed_with_first
-            current_batch_has_content = True
-            start_index = 1
-        else:
-            current_batch = test_content
-            current_batch_has_content = True
-            start_index = 1
+        batch.add(feed_with_first, section_header, feed_with_first)
+        start_index = 1
 
         # 处理剩余条目
         for j in range(start_index, len(items)):
             item_line = _format_standalone_rss_item(items[j], j + 1, format_type, timezone)
 
-            test_content = current_batch + item_line
-            if len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8")) >= max_bytes:
-                if current_batch_has_content:
-                    batches.append(current_batch + base_footer)
-                current_batch = base_header + section_header + feed_header + item_line
-                current_batch_has_content = True
-            else:
-                current_batch = test_content
-                current_batch_has_content = True
-
-        current_batch += "\n"
+            batch.add(item_line, section_header, feed_header, item_line)
 
-    return current_batch, current_batch_has_content, batches
+        batch.append("\n")
 
 
 def _format_standalone_platform_item(item: Dict, index: int, format_type: str, rank_threshold: int = 10) -> str:
@@ -8,7 +8,8 @@
 
 模块结构：
 - helpers: 报告辅助函数（清理、转义、格式化）
-- formatter: 平台标题格式化
+- document: 与渠道无关的中间文档
+- formatter: 平台标题格式化（各平台输出器）
 - html: HTML 报告渲染
 - generator: 报告生成器
 """
@@ -17,11 +18,16 @@ from trendradar.report.helpers import (
     clean_title,
     html_escape,
     format_rank_display,
+    format_failed_source,
 )
-from trendradar.report.formatter import format_title_for_platform
-from trendradar.report.html import render_html_content
+from trendradar.report.document import ReportItem, build_report_document
+from trendradar.report.formatter import TITLE_EMITTERS, format_title_for_platform
+from trendradar.report.html import iter_html_content, render_html_content
 from trendradar.report.generator import (
     prepare_report_data,
+    compute_render_digest,
+    load_render_state,
+    save_render_state,
     generate_html_report,
 )
 
@@ -30,11 +36,20 @@ __all__ = [
     "clean_title",
     "html_escape",
     "format_rank_display",
+    "format_failed_source",
+    # 中间文档
+    "ReportItem",
+    "build_report_document",
     # 格式化函数
+    "TITLE_EMITTERS",
     "format_title_for_platform",
     # HTML 渲染
     "render_html_content",
+    "iter_html_content",
     # 报告生成器
     "prepare_report_data",
+    "compute_render_digest",
+    "load_render_state",
+    "save_render_state",
     "generate_html_report",
 ]
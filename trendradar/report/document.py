@@ -0,0 +1,158 @@
+# coding=utf-8
+"""
+报告中间文档模块
+
+推送前把报告数据转换为与渠道无关的中间文档：区块（stats / new_titles / RSS）→ 分组 → 条目。
+文档结构与 prepare_report_data 的结果一致，只是标题条目替换为 ReportItem，
+预先计算清理后的标题、链接和排名摘要。
+
+各平台的标题输出器（formatter.TITLE_EMITTERS）直接使用这些预计算字段，
+同一份报告推送到多个渠道时，每条标题只清理、汇总一次，各渠道只做字符串拼接。
+"""
+
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from trendradar.core.records import MatchedTitle
+from trendradar.report.helpers import clean_title, summarize_ranks
+
+
+# 标题条目必须包含的字段（缺少时保持原样，由格式化函数按原逻辑处理）
+_REQUIRED_KEYS = (
+    "title",
+    "source_name",
+    "time_display",
+    "count",
+    "ranks",
+    "rank_threshold",
+    "url",
+    "mobile_url",
+)
+
+# 影响预计算字段的键，写入后重新计算
+_DERIVED_FROM = frozenset(("title", "url", "mobile_url", "ranks"))
+
+
+class ReportItem:
+    """
+    中间文档中的标题条目
+
+    引用原标题数据（dict 或 MatchedTitle），并保存与渠道无关的展示字段：
+    - cleaned_title: 清理后的标题
+    - link_url: 链接（移动端优先）
+    - rank_summary: 排名摘要 (最小排名, 最大排名, 趋势箭头)
+
+    提供与字典兼容的读写接口，写入的键存入 extra，不修改原标题数据。
+    """
+
+    __slots__ = ("source", "cleaned_title", "link_url", "rank_summary", "extra")
+
+    def __init__(self, source: Any):
+        self.source = source
+        self.extra: Optional[Dict[str, Any]] = None
+        self._compute()
+
+    def _compute(self) -> None:
+        self.cleaned_title = clean_title(self["title"])
+        self.link_url = self["mobile_url"] or self["url"]
+        self.rank_summary = summarize_ranks(self["ranks"])
+
+    # === 字典兼容接口 ===
+
+    def __getitem__(self, key: str) -> Any:
+        extra = self.extra
+        if extra and key in extra:
+            return extra[key]
+        return self.source[key]
+
+    def get(self, key: str, default: Any = None) -> Any:
+        extra = self.extra
+        if extra and key in extra:
+            return extra[key]
+        return self.source.get(key, default)
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        if self.extra is None:
+            self.extra = {}
+        self.extra[key] = value
+        if key in _DERIVED_FROM:
+            self._compute()
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.source or bool(self.extra and key in self.extra)
+
+    def keys(self) -> List[str]:
+        keys = list(self.source.keys())
+        if self.extra:
+            keys.extend(k for k in self.extra if k not in keys)
+        return keys
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.keys())
+
+    def copy(self) -> "ReportItem":
+        """浅拷贝（共享原标题数据和预计算字段）"""
+        result = ReportItem.__new__(ReportItem)
+        result.source = self.source
+        result.cleaned_title = self.cleaned_title
+        result.link_url = self.link_url
+        result.rank_summary = self.rank_summary
+        result.extra = dict(self.extra) if self.extra else None
+        return result
+
+    def __repr__(self) -> str:
+        return f"ReportItem({self.cleaned_title!r})"
+
+
+def _wrap_groups(groups: Optional[List[Dict]], items: Dict[int, Any]) -> Optional[List[Dict]]:
+    """将分组中的标题条目替换为 ReportItem（同一条目只转换一次）"""
+    if not groups:
+        return groups
+
+    wrapped = []
+    for group in groups:
+        titles = group.get("titles") if isinstance(group, dict) else None
+        if not titles:
+            wrapped.append(group)
+            continue
+
+        new_titles = []
+        for title_data in titles:
+            key = id(title_data)
+            if key not in items:
+                if isinstance(title_data, ReportItem) or not (
+                    # MatchedTitle 可以读取全部字段（mobile_url 等不在 in 的结果中）
+                    isinstance(title_data, MatchedTitle)
+                    or all(k in title_data for k in _REQUIRED_KEYS)
+                ):
+                    items[key] = title_data
+                else:
+                    items[key] = ReportItem(title_data)
+            new_titles.append(items[key])
+        wrapped.append({**group, "titles": new_titles})
+    return wrapped
+
+
+def build_report_document(
+    report_data: Dict,
+    rss_items: Optional[List[Dict]] = None,
+    rss_new_items: Optional[List[Dict]] = None,
+) -> Tuple[Dict, Optional[List[Dict]], Optional[List[Dict]]]:
+    """
+    构建与渠道无关的中间文档（遍历一次报告数据）
+
+    Args:
+        report_data: 报告数据（由 prepare_report_data 生成）
+        rss_items: RSS 统计分组列表
+        rss_new_items: RSS 新增分组列表
+
+    Returns:
+        (report_data, rss_items, rss_new_items) 元组，结构与输入一致，标题条目替换为 ReportItem
+    """
+    items: Dict[int, Any] = {}
+
+    document = dict(report_data)
+    for section in ("stats", "new_titles"):
+        if section in document:
+            document[section] = _wrap_groups(document[section], items)
+
+    return document, _wrap_groups(rss_items, items), _wrap_groups(rss_new_items, items)
@@ -3,214 +3,118 @@
 平台标题格式化模块
 
 提供多平台标题格式化功能
-"""
-
-from typing import Dict
-
-from trendradar.report.helpers import clean_title, html_escape, format_rank_display
-
-
-def format_title_for_platform(
-    platform: str, title_data: Dict, show_source: bool = True, show_keyword: bool = False
-) -> str:
-    """统一的标题格式化方法
-
-    为不同平台生成对应格式的标题字符串。
 
-    Args:
-        platform: 目标平台，支持:
-            - "feishu": 飞书
-            - "dingtalk": 钉钉
-            - "wework": 企业微信
-            - "bark": Bark
-            - "telegram": Telegram
-            - "ntfy": ntfy
-            - "slack": Slack
-            - "html": HTML 报告
-        title_data: 标题数据字典，包含以下字段:
-            - title: 标题文本
-            - source_name: 来源名称
-            - time_display: 时间显示
-            - count: 出现次数
-            - ranks: 排名列表
-            - rank_threshold: 高亮阈值
-            - url: PC端链接
-            - mobile_url: 移动端链接（优先使用）
-            - is_new: 是否为新增标题（可选）
-            - matched_keyword: 匹配的关键词（可选，platform 模式使用）
-        show_source: 是否显示来源名称（keyword 模式使用）
-        show_keyword: 是否显示关键词标签（platform 模式使用）
+各平台的差异只在标记上，由 TITLE_EMITTERS 中的输出器描述；清理后的标题、链接和排名摘要
+与平台无关，条目为 ReportItem 时直接使用其预计算字段。
+"""
 
-    Returns:
-        格式化后的标题字符串
-    """
-    rank_display = format_rank_display(
-        title_data["ranks"], title_data["rank_threshold"], platform
+from typing import Any, Dict, Optional, Tuple
+
+from trendradar.report.document import ReportItem
+from trendradar.report.helpers import (
+    clean_title,
+    html_escape,
+    format_rank_summary,
+    summarize_ranks,
+)
+
+
+def _neutral_fields(title_data: Any) -> Tuple[str, str, Optional[Tuple[int, int, str]]]:
+    """获取与平台无关的展示字段 (清理后的标题, 链接, 排名摘要)"""
+    if isinstance(title_data, ReportItem):
+        return title_data.cleaned_title, title_data.link_url, title_data.rank_summary
+    return (
+        clean_title(title_data["title"]),
+        title_data["mobile_url"] or title_data["url"],
+        summarize_ranks(title_data["ranks"]),
     )
 
-    link_url = title_data["mobile_url"] or title_data["url"]
-    cleaned_title = clean_title(title_data["title"])
 
-    # 获取关键词标签（platform 模式使用）
-    keyword = title_data.get("matched_keyword", "") if show_keyword else ""
+class TitleEmitter:
+    """markdown 类平台的标题输出器：[来源] 🆕 标题 排名 时间 次数"""
+
+    def __init__(
+        self,
+        rank_format: str,
+        link: str,
+        source: str,
+        keyword: str,
+        time: str,
+        count: str,
+        escape_link_title: bool = False,
+        escape_keyword: bool = False,
+        also_on: str = " (同时出现在：{sources})",
+    ):
+        """
+        Args:
+            rank_format: 排名高亮使用的平台类型（见 helpers.RANK_HIGHLIGHTS）
+            link: 带链接标题的模板，占位符 {url}、{title}
+            source: 来源前缀模板，占位符 {source}
+            keyword: 关键词前缀模板，占位符 {keyword}
+            time: 时间后缀模板，占位符 {time}
+            count: 次数后缀模板，占位符 {count}
+            escape_link_title: 链接中的标题是否 HTML 转义
+            escape_keyword: 关键词（以及同事件来源）是否 HTML 转义
+            also_on: 同一事件其他来源的后缀模板，占位符 {sources}
+        """
+        self.rank_format = rank_format
+        self.link = link
+        self.source = source
+        self.keyword = keyword
+        self.time = time
+        self.count = count
+        self.escape_link_title = escape_link_title
+        self.escape_keyword = escape_keyword
+        self.also_on = also_on
+
+    def emit(self, title_data: Any, show_source: bool, show_keyword: bool) -> str:
+        cleaned_title, link_url, rank_summary = _neutral_fields(title_data)
 
-    if platform == "feishu":
         if link_url:
-            formatted_title = f"[{cleaned_title}]({link_url})"
+            link_title = html_escape(cleaned_title) if self.escape_link_title else cleaned_title
+            formatted_title = self.link.format(url=link_url, title=link_title)
         else:
             formatted_title = cleaned_title
 
         title_prefix = "🆕 " if title_data.get("is_new") else ""
 
-        if show_source:
-            result = f"<font color='grey'>[{title_data['source_name']}]</font> {title_prefix}{formatted_title}"
-        elif show_keyword and keyword:
-            result = f"<font color='blue'>[{keyword}]</font> {title_prefix}{formatted_title}"
-        else:
-            result = f"{title_prefix}{formatted_title}"
-
-        if rank_display:
-            result += f" {rank_display}"
-        if title_data["time_display"]:
-            result += f" <font color='grey'>- {title_data['time_display']}</font>"
-        if title_data["count"] > 1:
-            result += f" <font color='green'>({title_data['count']}次)</font>"
-
-        return result
-
-    elif platform == "dingtalk":
-        if link_url:
-            formatted_title = f"[{cleaned_title}]({link_url})"
-        else:
-            formatted_title = cleaned_title
-
-        title_prefix = "🆕 " if title_data.get("is_new") else ""
+        # 获取关键词标签（platform 模式使用）
+        keyword = title_data.get("matched_keyword", "") if show_keyword else ""
 
         if show_source:
-            result = f"[{title_data['source_name']}] {title_prefix}{formatted_title}"
+            result = self.source.format(source=title_data["source_name"]) + title_prefix + formatted_title
         elif show_keyword and keyword:
-            result = f"[{keyword}] {title_prefix}{formatted_title}"
+            if self.escape_keyword:
+                keyword = html_escape(keyword)
+            result = self.keyword.format(keyword=keyword) + title_prefix + formatted_title
         else:
-            result = f"{title_prefix}{formatted_title}"
+            result = title_prefix + formatted_title
 
+        rank_display = format_rank_summary(rank_summary, title_data["rank_threshold"], self.rank_format)
         if rank_display:
             result += f" {rank_display}"
         if title_data["time_display"]:
-            result += f" - {title_data['time_display']}"
+            result += self.time.format(time=title_data["time_display"])
         if title_data["count"] > 1:
-            result += f" ({title_data['count']}次)"
-
-        return result
+            result += self.count.format(count=title_data["count"])
 
-    elif platform in ("wework", "bark"):
-        # WeWork 和 Bark 使用 markdown 格式
-        if link_url:
-            formatted_title = f"[{cleaned_title}]({link_url})"
-        else:
-            formatted_title = cleaned_title
-
-        title_prefix = "🆕 " if title_data.get("is_new") else ""
-
-        if show_source:
-            result = f"[{title_data['source_name']}] {title_prefix}{formatted_title}"
-        elif show_keyword and keyword:
-            result = f"[{keyword}] {title_prefix}{formatted_title}"
-        else:
-            result = f"{title_prefix}{formatted_title}"
-
-        if rank_display:
-            result += f" {rank_display}"
-        if title_data["time_display"]:
-            result += f" - {title_data['time_display']}"
-        if title_data["count"] > 1:
-            result += f" ({title_data['count']}次)"
+        # 合并的同一事件在其他平台的来源
+        story_sources = title_data.get("story_sources")
+        if story_sources:
+            sources = "、".join(story_sources)
+            if self.escape_keyword:
+                sources = html_escape(sources)
+            result += self.also_on.format(sources=sources)
 
         return result
 
-    elif platform == "telegram":
-        if link_url:
-            formatted_title = f'<a href="{link_url}">{html_escape(cleaned_title)}</a>'
-        else:
-            formatted_title = cleaned_title
 
-        title_prefix = "🆕 " if title_data.get("is_new") else ""
+class HtmlTitleEmitter:
+    """HTML 报告的标题输出器（全部字段转义，新增标题包裹在 new-title 中）"""
 
-        if show_source:
-            result = f"[{title_data['source_name']}] {title_prefix}{formatted_title}"
-        elif show_keyword and keyword:
-            result = f"<b>[{html_escape(keyword)}]</b> {title_prefix}{formatted_title}"
-        else:
-            result = f"{title_prefix}{formatted_title}"
-
-        if rank_display:
-            result += f" {rank_display}"
-        if title_data["time_display"]:
-            result += f" <code>- {title_data['time_display']}</code>"
-        if title_data["count"] > 1:
-            result += f" <code>({title_data['count']}次)</code>"
-
-        return result
-
-    elif platform == "ntfy":
-        if link_url:
-            formatted_title = f"[{cleaned_title}]({link_url})"
-        else:
-            formatted_title = cleaned_title
-
-        title_prefix = "🆕 " if title_data.get("is_new") else ""
-
-        if show_source:
-            result = f"[{title_data['source_name']}] {title_prefix}{formatted_title}"
-        elif show_keyword and keyword:
-            result = f"[{keyword}] {title_prefix}{formatted_title}"
-        else:
-            result = f"{title_prefix}{formatted_title}"
-
-        if rank_display:
-            result += f" {rank_display}"
-        if title_data["time_display"]:
-            result += f" `- {title_data['time_display']}`"
-        if title_data["count"] > 1:
-            result += f" `({title_data['count']}次)`"
-
-        return result
-
-    elif platform == "slack":
-        # Slack 使用 mrkdwn 格式
-        if link_url:
-            # Slack 链接格式: <url|text>
-            formatted_title = f"<{link_url}|{cleaned_title}>"
-        else:
-            formatted_title = cleaned_title
-
-        title_prefix = "🆕 " if title_data.get("is_new") else ""
-
-        if show_source:
-            result = f"[{title_data['source_name']}] {title_prefix}{formatted_title}"
-        elif show_keyword and keyword:
-            result = f"*[{keyword}]* {title_prefix}{formatted_title}"
-        else:
-            result = f"{title_prefix}{formatted_title}"
-
-        # 排名（使用 * 加粗）
-        rank_display = format_rank_display(
-            title_data["ranks"], title_data["rank_threshold"], "slack"
-        )
-        if rank_display:
-            result += f" {rank_display}"
-        if title_data["time_display"]:
-            result += f" `- {title_data['time_display']}`"
-        if title_data["count"] > 1:
-            result += f" `({title_data['count']}次)`"
-
-        return result
-
-    elif platform == "html":
-        rank_display = format_rank_display(
-            title_data["ranks"], title_data["rank_threshold"], "html"
-        )
-
-        link_url = title_data["mobile_url"] or title_data["url"]
+    def emit(self, title_data: Any, show_source: bool, show_keyword: bool) -> str:
+        cleaned_title, link_url, rank_summary = _neutral_fields(title_data)
+        keyword = title_data.get("matched_keyword", "") if show_keyword else ""
 
         escaped_title = html_escape(cleaned_title)
         escaped_source_name = html_escape(title_data["source_name"])
@@ -230,6 +134,7 @@ def format_title_for_platform(
         else:
             formatted_title = f'{prefix}<span class="no-link">{escaped_title}</span>'
 
+        rank_display = format_rank_summary(rank_summary, title_data["rank_threshold"], "html")
         if rank_display:
             formatted_title += f" {rank_display}"
         if title_data["time_display"]:
@@ -237,11 +142,114 @@ def format_title_for_platform(
             formatted_title += f" <font color='grey'>- {escaped_time}</font>"
         if title_data["count"] > 1:
             formatted_title += f" <font color='green'>({title_data['count']}次)</font>"
+        story_sources = title_data.get("story_sources")
+        if story_sources:
+            formatted_title += f" <font color='grey'>(同时出现在：{html_escape('、'.join(story_sources))})</font>"
 
         if title_data.get("is_new"):
             formatted_title = f"<div class='new-title'>🆕 {formatted_title}</div>"
 
         return formatted_title
 
-    else:
-        return cleaned_title
+
+# WeWork 和 Bark 使用 markdown 格式（排名高亮相同）
+_WEWORK_EMITTER = TitleEmitter(
+    rank_format="wework",
+    link="[{title}]({url})",
+    source="[{source}] ",
+    keyword="[{keyword}] ",
+    time=" - {time}",
+    count=" ({count}次)",
+)
+
+# 各平台的标题输出器
+TITLE_EMITTERS = {
+    "feishu": TitleEmitter(
+        rank_format="feishu",
+        link="[{title}]({url})",
+        source="<font color='grey'>[{source}]</font> ",
+        keyword="<font color='blue'>[{keyword}]</font> ",
+        time=" <font color='grey'>- {time}</font>",
+        count=" <font color='green'>({count}次)</font>",
+        also_on=" <font color='grey'>(同时出现在：{sources})</font>",
+    ),
+    "dingtalk": TitleEmitter(
+        rank_format="dingtalk",
+        link="[{title}]({url})",
+        source="[{source}] ",
+        keyword="[{keyword}] ",
+        time=" - {time}",
+        count=" ({count}次)",
+    ),
+    "wework": _WEWORK_EMITTER,
+    "bark": _WEWORK_EMITTER,
+    "telegram": TitleEmitter(
+        rank_format="telegram",
+        link='<a href="{url}">{title}</a>',
+        source="[{source}] ",
+        keyword="<b>[{keyword}]</b> ",
+        time=" <code>- {time}</code>",
+        count=" <code>({count}次)</code>",
+        escape_link_title=True,
+        escape_keyword=True,
+    ),
+    "ntfy": TitleEmitter(
+        rank_format="ntfy",
+        link="[{title}]({url})",
+        source="[{source}] ",
+        keyword="[{keyword}] ",
+        time=" `- {time}`",
+        count=" `({count}次)`",
+    ),
+    # Slack 使用 mrkdwn 格式，链接格式: <url|text>
+    "slack": TitleEmitter(
+        rank_format="slack",
+        link="<{url}|{title}>",
+        source="[{source}] ",
+        keyword="*[{keyword}]* ",
+        time=" `- {time}`",
+        count=" `({count}次)`",
+    ),
+    "html": HtmlTitleEmitter(),
+}
+
+
+def format_title_for_platform(
+    platform: str, title_data: Dict, show_source: bool = True, show_keyword: bool = False
+) -> str:
+    """统一的标题格式化方法
+
+    为不同平台生成对应格式的标题字符串。
+
+    Args:
+        platform: 目标平台，支持:
+            - "feishu": 飞书
+            - "dingtalk": 钉钉
+            - "wework": 企业微信
+            - "bark": Bark
+            - "telegram": Telegram
+            - "ntfy": ntfy
+            - "slack": Slack
+            - "html": HTML 报告
+        title_data: 标题数据字典，包含以下字段:
+            - title: 标题文本
+            - source_name: 来源名称
+            - time_display: 时间显示
+            - count: 出现次数
+            - ranks: 排名列表
+            - rank_threshold: 高亮阈值
+            - url: PC端链接
+            - mobile_url: 移动端链接（优先使用）
+            - is_new: 是否为新增标题（可选）
+            - matched_keyword: 匹配的关键词（可选，platform 模式使用）
+            - story_sources: 合并的同一事件的其他来源名称（可选）
+        show_source: 是否显示来源名称（keyword 模式使用）
+        show_keyword: 是否显示关键词标签（platform 模式使用）
+
+    Returns:
+        格式化后的标题字符串
+    """
+    emitter = TITLE_EMITTERS.get(platform)
+    if emitter is None:
+        return _neutral_fields(title_data)[0]
+    return emitter.emit(title_data, show_source, show_keyword)
@@ -4,11 +4,37 @@
 
 提供报告数据准备和 HTML 生成功能：
 - prepare_report_data: 准备报告数据
+- compute_render_digest: 计算渲染输入的摘要（内容未变化时复用上次的报告、跳过推送）
 - generate_html_report: 生成 HTML 报告
 """
 
+import dataclasses
+import hashlib
+import json
+import os
+import shutil
+from array import array
 from pathlib import Path
-from typing import Dict, List, Optional, Callable
+from typing import Any, Callable, Dict, Iterable, List, Optional, Union
+
+from trendradar.core.records import MatchedTitle
+from trendradar.report.html import HTML_TEMPLATE_VERSION
+
+
+# 标题条目参与摘要的字段（报告和推送中展示的字段）
+_DIGEST_TITLE_KEYS = (
+    "title",
+    "source_name",
+    "time_display",
+    "count",
+    "ranks",
+    "rank_threshold",
+    "url",
+    "mobile_url",
+    "is_new",
+    "matched_keyword",
+    "story_sources",
+)
 
 
 def prepare_report_data(
@@ -21,6 +47,7 @@ def prepare_report_data(
     matches_word_groups_func: Optional[Callable] = None,
     load_frequency_words_func: Optional[Callable] = None,
     show_new_section: bool = True,
+    circuit_open_ids: Optional[List[str]] = None,
 ) -> Dict:
     """
     准备报告数据
@@ -35,6 +62,7 @@ def prepare_report_data(
         matches_word_groups_func: 词组匹配函数
         load_frequency_words_func: 加载频率词函数
         show_new_section: 是否显示新增热点区域
+        circuit_open_ids: 熔断跳过的来源 ID 列表（同时在 failed_ids 中，渲染时标注）
 
     Returns:
         Dict: 准备好的报告数据
@@ -107,6 +135,11 @@ def prepare_report_data(
 
         processed_titles = []
         for title_data in stat["titles"]:
+            if isinstance(title_data, MatchedTitle):
+                # 紧凑匹配视图已包含报告所需的全部字段，按引用共享
+                processed_titles.append(title_data)
+                continue
+
             processed_title = {
                 "title": title_data["title"],
                 "source_name": title_data["source_name"],
@@ -118,27 +151,141 @@ def prepare_report_data(
                 "mobile_url": title_data.get("mobileUrl", ""),
                 "is_new": title_data.get("is_new", False),
             }
+            if title_data.get("story_sources"):
+                processed_title["story_sources"] = title_data["story_sources"]
             processed_titles.append(processed_title)
 
-        processed_stats.append(
-            {
-                "word": stat["word"],
-                "count": stat["count"],
-                "percentage": stat.get("percentage", 0),
-                "titles": processed_titles,
-            }
-        )
+        processed_stat = {
+            "word": stat["word"],
+            "count": stat["count"],
+            "percentage": stat.get("percentage", 0),
+            "titles": processed_titles,
+        }
+        if stat.get("heat_trend"):
+            processed_stat["heat_trend"] = stat["heat_trend"]
+        processed_stats.append(processed_stat)
 
     return {
         "stats": processed_stats,
         "new_titles": processed_new_titles,
         "failed_ids": failed_ids or [],
+        "circuit_open_ids": circuit_open_ids or [],
         "total_new_count": sum(
             len(source["titles"]) for source in processed_new_titles
         ),
     }
 
 
+def _digest_default(value: Any) -> Any:
+    """摘要序列化时转换 JSON 不支持的对象"""
+    if isinstance(value, array):
+        return value.tolist()
+    if isinstance(value, (set, frozenset)):
+        return sorted(value, key=str)
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return dataclasses.asdict(value)
+    if hasattr(value, "keys") and hasattr(value, "get"):
+        # 标题条目（MatchedTitle 等）只取展示字段，其余对象按键展开
+        if "title" in value and "ranks" in value:
+            return {key: value.get(key) for key in _DIGEST_TITLE_KEYS}
+        return {key: value[key] for key in value.keys()}
+    return str(value)
+
+
+def compute_render_digest(*inputs: Any) -> str:
+    """
+    计算渲染输入的摘要（与生成时间无关）
+
+    输入相同则渲染结果相同：HTML 报告可以直接复用上次的文件，推送内容与上次相同时可以跳过。
+
+    Args:
+        *inputs: 渲染输入（报告数据、RSS、独立展示区、AI 分析结果等）
+
+    Returns:
+        十六进制摘要
+    """
+    payload = json.dumps(
+        [HTML_TEMPLATE_VERSION, *inputs],
+        ensure_ascii=False,
+        sort_keys=True,
+        default=_digest_default,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _render_state_path(output_dir: str, mode: str) -> Path:
+    return Path(output_dir) / "html" / "latest" / f"{mode}.state.json"
+
+
+def load_render_state(output_dir: str, mode: str) -> Dict:
+    """
+    读取模式的渲染状态（上次渲染的摘要和快照路径、上次推送的摘要）
+
+    Args:
+        output_dir: 输出目录
+        mode: 报告模式
+
+    Returns:
+        状态字典，不存在或无法读取时为空字典
+    """
+    try:
+        with open(_render_state_path(output_dir, mode), encoding="utf-8") as f:
+            state = json.load(f)
+        return state if isinstance(state, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+
+def save_render_state(output_dir: str, mode: str, **updates: Any) -> None:
+    """
+    更新模式的渲染状态（与已有字段合并）
+
+    Args:
+        output_dir: 输出目录
+        mode: 报告模式
+        **updates: 要更新的字段（render_digest、snapshot、push_digest）
+    """
+    path = _render_state_path(output_dir, mode)
+    state = load_render_state(output_dir, mode)
+    state.update(updates)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        _write_chunks_atomic(path, (json.dumps(state, ensure_ascii=False, indent=2),))
+    except OSError as e:
+        print(f"[报告] 保存渲染状态失败: {e}")
+
+
+def _write_chunks_atomic(path: Path, chunks: Iterable[str]) -> None:
+    """逐段写入临时文件，完成后原子替换目标文件（读者不会看到写了一半的报告）"""
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            for chunk in chunks:
+                f.write(chunk)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def _publish_copy(source: Path, target: Path) -> None:
+    """
+    发布报告副本：优先硬链接到已写好的文件，跨文件系统等无法链接时复制文件，
+    都先放在临时文件再原子替换目标文件
+    """
+    tmp_path = target.with_name(f".{target.name}.{os.getpid()}.tmp")
+    tmp_path.unlink(missing_ok=True)
+    try:
+        try:
+            os.link(source, tmp_path)
+        except OSError:
+            shutil.copyfile(source, tmp_path)
+        os.replace(tmp_path, target)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
 def generate_html_report(
     stats: List[Dict],
     total_titles: int,
@@ -154,6 +301,8 @@ def generate_html_report(
     render_html_func: Optional[Callable] = None,
     matches_word_groups_func: Optional[Callable] = None,
     load_frequency_words_func: Optional[Callable] = None,
+    render_inputs: Optional[Dict] = None,
+    circuit_open_ids: Optional[List[str]] = None,
 ) -> str:
     """
     生成 HTML 报告
@@ -163,6 +312,12 @@ def generate_html_report(
     2. 复制到 output/html/latest/{mode}.html（最新报告）
     3. 复制到 output/index.html 和根目录 index.html（入口）
 
+    渲染函数可以返回字符串，也可以返回 HTML 片段的可迭代对象（逐段写入快照文件）。
+    快照写入临时文件后原子替换；其余三个文件硬链接到快照（无法链接时复制文件），不再重复写入。
+
+    提供 render_inputs 时按渲染输入的摘要缓存：摘要与该模式当天上次渲染相同且快照仍在时，
+    不重新渲染，直接把上次的快照发布为最新报告并返回其路径（日期文件夹参与摘要，不会跨天复用）。
+
     Args:
         stats: 统计结果列表
         total_titles: 总标题数
@@ -175,12 +330,15 @@ def generate_html_report(
         output_dir: 输出目录
         date_folder: 日期文件夹名称
         time_filename: 时间文件名
-        render_html_func: HTML 渲染函数
+        render_html_func: HTML 渲染函数（返回字符串或 HTML 片段的可迭代对象）
         matches_word_groups_func: 词组匹配函数
         load_frequency_words_func: 加载频率词函数
+        render_inputs: 渲染函数使用的其他输入（RSS、独立展示区、AI 分析结果、显示配置等），
+                       提供时启用渲染缓存
+        circuit_open_ids: 熔断跳过的来源 ID 列表
 
     Returns:
-        str: 生成的 HTML 文件路径（时间戳快照路径）
+        str: 生成的 HTML 文件路径（时间戳快照路径，复用时为上次的快照路径）
     """
     # 时间戳快照文件名
     snapshot_filename = f"{time_filename}.html"
@@ -188,7 +346,7 @@ def generate_html_report(
     # 构建输出路径（扁平化结构：output/html/日期/）
     snapshot_path = Path(output_dir) / "html" / date_folder
     snapshot_path.mkdir(parents=True, exist_ok=True)
-    snapshot_file = str(snapshot_path / snapshot_filename)
+    snapshot_file = snapshot_path / snapshot_filename
 
     # 准备报告数据
     report_data = prepare_report_data(
@@ -200,9 +358,33 @@ def generate_html_report(
         rank_threshold,
         matches_word_groups_func,
         load_frequency_words_func,
+        circuit_open_ids=circuit_open_ids,
     )
 
+    latest_dir = Path(output_dir) / "html" / "latest"
+
+    # 渲染输入未变化时复用上次的快照
+    render_digest = None
+    if render_inputs is not None:
+        render_digest = compute_render_digest(
+            date_folder, report_data, total_titles, mode, update_info, render_inputs
+        )
+        state = load_render_state(output_dir, mode)
+        previous = Path(state.get("snapshot") or "")
+        if (
+            state.get("render_digest") == render_digest
+            and previous.parent == snapshot_path
+            and previous.is_file()
+        ):
+            print(f"[报告] 报告内容未变化，复用上次的 HTML 报告: {previous}")
+            latest_dir.mkdir(parents=True, exist_ok=True)
+            _publish_copy(previous, latest_dir / f"{mode}.html")
+            _publish_copy(previous, Path(output_dir) / "index.html")
+            _publish_copy(previous, Path("index.html"))
+            return str(previous)
+
     # 渲染 HTML 内容
+    html_content: Union[str, Iterable[str]]
     if render_html_func:
         html_content = render_html_func(
             report_data, total_titles, mode, update_info
@@ -211,26 +393,24 @@ def generate_html_report(
         # 默认简单 HTML
         html_content = f"<html><body><h1>Report</h1><pre>{report_data}</pre></body></html>"
 
-    # 1. 保存时间戳快照（历史记录）
-    with open(snapshot_file, "w", encoding="utf-8") as f:
-        f.write(html_content)
+    if isinstance(html_content, str):
+        html_content = (html_content,)
+
+    # 1. 保存时间戳快照（历史记录，渲染结果逐段写入）
+    _write_chunks_atomic(snapshot_file, html_content)
 
     # 2. 复制到 html/latest/{mode}.html（最新报告）
-    latest_dir = Path(output_dir) / "html" / "latest"
     latest_dir.mkdir(parents=True, exist_ok=True)
-    latest_file = latest_dir / f"{mode}.html"
-    with open(latest_file, "w", encoding="utf-8") as f:
-        f.write(html_content)
+    _publish_copy(snapshot_file, latest_dir / f"{mode}.html")
 
     # 3. 复制到 index.html（入口）
     # output/index.html（供 Docker Volume 挂载访问）
-    output_index = Path(output_dir) / "index.html"
-    with open(output_index, "w", encoding="utf-8") as f:
-        f.write(html_content)
+    _publish_copy(snapshot_file, Path(output_dir) / "index.html")
 
     # 根目录 index.html（供 GitHub Pages 访问）
-    root_index = Path("index.html")
-    with open(root_index, "w", encoding="utf-8") as f:
-        f.write(html_content)
+    _publish_copy(snapshot_file, Path("index.html"))
+
+    if render_digest is not None:
+        save_render_state(output_dir, mode, render_digest=render_digest, snapshot=str(snapshot_file))
 
-    return snapshot_file
+    return str(snapshot_file)
@@ -6,7 +6,7 @@
 """
 
 import re
-from typing import List
+from typing import Dict, List, Optional, Tuple
 
 
 def clean_title(title: str) -> str:
@@ -59,71 +59,49 @@ def html_escape(text: str) -> str:
     )
 
 
-def format_rank_display(ranks: List[int], rank_threshold: int, format_type: str) -> str:
-    """格式化排名显示
+def format_failed_source(source_id: str, report_data: Dict) -> str:
+    """格式化失败列表中的来源
 
-    根据不同平台类型生成对应格式的排名字符串。
-    当最小排名小于等于阈值时，使用高亮格式。
+    熔断跳过的来源（report_data["circuit_open_ids"]）标注为"熔断中"，
+    其余来源原样返回。
 
     Args:
-        ranks: 排名列表（可能包含重复值）
-        rank_threshold: 高亮阈值，小于等于此值的排名会高亮显示
-        format_type: 平台类型，支持:
-            - "html": HTML格式
-            - "feishu": 飞书格式
-            - "dingtalk": 钉钉格式
-            - "wework": 企业微信格式
-            - "telegram": Telegram格式
-            - "slack": Slack格式
-            - 其他: 默认markdown格式
+        source_id: 来源 ID
+        report_data: 报告数据字典
 
     Returns:
-        格式化后的排名字符串，如 "[1]" 或 "[1 - 5]"
-        如果排名列表为空，返回空字符串
+        显示用的来源文本
+    """
+    if source_id in report_data.get("circuit_open_ids", ()):
+        return f"{source_id}（熔断中）"
+    return source_id
+
+
+# 各平台排名高亮标记 (开始, 结束)，未列出的平台使用默认 markdown 格式
+RANK_HIGHLIGHTS = {
+    "html": ("<font color='red'><strong>", "</strong></font>"),
+    "feishu": ("<font color='red'>**", "**</font>"),
+    "dingtalk": ("**", "**"),
+    "wework": ("**", "**"),
+    "telegram": ("<b>", "</b>"),
+    "slack": ("*", "*"),
+}
+DEFAULT_RANK_HIGHLIGHT = ("**", "**")
+
+
+def summarize_ranks(ranks: List[int]) -> Optional[Tuple[int, int, str]]:
+    """汇总排名（与平台无关的部分）
+
+    Args:
+        ranks: 排名列表（可能包含重复值，按时间顺序）
+
+    Returns:
+        (最小排名, 最大排名, 趋势箭头) 元组，排名列表为空时返回 None
     """
     if not ranks:
-        return ""
+        return None
 
     unique_ranks = sorted(set(ranks))
-    min_rank = unique_ranks[0]
-    max_rank = unique_ranks[-1]
-
-    # 根据平台类型选择高亮格式
-    if format_type == "html":
-        highlight_start = "<font color='red'><strong>"
-        highlight_end = "</strong></font>"
-    elif format_type == "feishu":
-        highlight_start = "<font color='red'>**"
-        highlight_end = "**</font>"
-    elif format_type == "dingtalk":
-        highlight_start = "**"
-        highlight_end = "**"
-    elif format_type == "wework":
-        highlight_start = "**"
-        highlight_end = "**"
-    elif format_type == "telegram":
-        highlight_start = "<b>"
-        highlight_end = "</b>"
-    elif format_type == "slack":
-        highlight_start = "*"
-        highlight_end = "*"
-    else:
-        # 默认 markdown 格式
-        highlight_start = "**"
-        highlight_end = "**"
-
-    # 生成排名显示
-    rank_str = ""
-    if min_rank <= rank_threshold:
-        if min_rank == max_rank:
-            rank_str = f"{highlight_start}[{min_rank}]{highlight_end}"
-        else:
-            rank_str = f"{highlight_start}[{min_rank} - {max_rank}]{highlight_end}"
-    else:
-        if min_rank == max_rank:
-            rank_str = f"[{min_rank}]"
-        else:
-            rank_str = f"[{min_rank} - {max_rank}]"
 
     # 计算热度趋势
     trend_arrow = ""
@@ -138,4 +116,59 @@ def format_rank_display(ranks: List[int], rank_threshold: int, format_type: str)
             trend_arrow = "➖"  # 排名持平
     # len(ranks) == 1 时不显示趋势箭头（新上榜由 is_new 字段在 formatter.py 中处理）
 
+    return unique_ranks[0], unique_ranks[-1], trend_arrow
+
+
+def format_rank_summary(
+    summary: Optional[Tuple[int, int, str]], rank_threshold: int, format_type: str
+) -> str:
+    """按平台格式输出排名摘要
+
+    Args:
+        summary: summarize_ranks 的结果
+        rank_threshold: 高亮阈值，小于等于此值的排名会高亮显示
+        format_type: 平台类型（见 RANK_HIGHLIGHTS）
+
+    Returns:
+        格式化后的排名字符串，摘要为空时返回空字符串
+    """
+    if summary is None:
+        return ""
+
+    min_rank, max_rank, trend_arrow = summary
+
+    if min_rank == max_rank:
+        rank_str = f"[{min_rank}]"
+    else:
+        rank_str = f"[{min_rank} - {max_rank}]"
+
+    if min_rank <= rank_threshold:
+        highlight_start, highlight_end = RANK_HIGHLIGHTS.get(format_type, DEFAULT_RANK_HIGHLIGHT)
+        rank_str = f"{highlight_start}{rank_str}{highlight_end}"
+
     return f"{rank_str} {trend_arrow}" if trend_arrow else rank_str
+
+
+def format_rank_display(ranks: List[int], rank_threshold: int, format_type: str) -> str:
+    """格式化排名显示
+
+    根据不同平台类型生成对应格式的排名字符串。
+    当最小排名小于等于阈值时，使用高亮格式。
+
+    Args:
+        ranks: 排名列表（可能包含重复值）
+        rank_threshold: 高亮阈值，小于等于此值的排名会高亮显示
+        format_type: 平台类型，支持:
+            - "html": HTML格式
+            - "feishu": 飞书格式
+            - "dingtalk": 钉钉格式
+            - "wework": 企业微信格式
+            - "telegram": Telegram格式
+            - "slack": Slack格式
+            - 其他: 默认markdown格式
+
+    Returns:
+        格式化后的排名字符串，如 "[1]" 或 "[1 - 5]"
+        如果排名列表为空，返回空字符串
+    """
+    return format_rank_summary(summarize_ranks(ranks), rank_threshold, format_type)
@@ -6,14 +6,50 @@ HTML 报告渲染模块
 """
 
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Callable
+from typing import Any, Callable, Dict, Iterator, List, Optional
 
-from trendradar.report.helpers import html_escape
+from trendradar.report.helpers import format_failed_source, html_escape
 from trendradar.utils.time import convert_time_for_display
 from trendradar.ai.formatter import render_ai_analysis_html_rich
 
 
-def render_html_content(
+# HTML 模板版本：修改报告模板（结构、样式、脚本）时递增，使缓存的报告失效
+HTML_TEMPLATE_VERSION = 1
+
+
+def render_heat_trend(heat_trend: Optional[List[Dict]]) -> str:
+    """
+    渲染词组的小时热度走势（迷你柱状图，使用内联样式）
+
+    Args:
+        heat_trend: [{"hour": "HH", "count": 条数, "weight": 排名权重和}, ...]
+
+    Returns:
+        HTML 片段，无数据时返回空字符串
+    """
+    if not heat_trend:
+        return ""
+
+    max_weight = max(point["weight"] for point in heat_trend) or 1
+    bars = []
+    for point in heat_trend:
+        height = max(2, round(16 * point["weight"] / max_weight))
+        color = "#4f46e5" if point["weight"] == max_weight else "#c7d2fe"
+        bars.append(
+            f'<span title="{point["hour"]}时 {point["count"]} 条" '
+            f'style="display:inline-block;width:3px;height:{height}px;'
+            f'background:{color};border-radius:1px;"></span>'
+        )
+
+    return (
+        '<div class="word-trend" title="小时热度走势" '
+        'style="display:flex;align-items:flex-end;gap:1px;height:16px;">'
+        + "".join(bars)
+        + "</div>"
+    )
+
+
+def iter_html_content(
     report_data: Dict,
     total_titles: int,
     mode: str = "daily",
@@ -27,8 +63,8 @@ def render_html_content(
     standalone_data: Optional[Dict] = None,
     ai_analysis: Optional[Any] = None,
     show_new_section: bool = True,
-) -> str:
-    """渲染HTML内容
+) -> Iterator[str]:
+    """按顺序逐段生成 HTML 内容（写入文件时不必在内存中拼接整份报告）
 
     Args:
         report_data: 报告数据字典，包含 stats, new_titles, failed_ids, total_new_count
@@ -44,15 +80,15 @@ def render_html_content(
         ai_analysis: AI 分析结果对象（可选），AIAnalysisResult 实例
         show_new_section: 是否显示新增热点区域
 
-    Returns:
-        渲染后的 HTML 字符串
+    Yields:
+        HTML 片段，依次拼接即为完整报告
     """
     # 默认区域顺序
     default_region_order = ["hotlist", "rss", "new_items", "standalone", "ai_analysis"]
     if region_order is None:
         region_order = default_region_order
 
-    html = """
+    yield """
     <!DOCTYPE html>
     <html>
     <head>
@@ -749,32 +785,32 @@ def render_html_content(
 
     # 处理报告类型显示（根据 mode 直接显示）
     if mode == "current":
-        html += "当前榜单"
+        yield "当前榜单"
     elif mode == "incremental":
-        html += "增量分析"
+        yield "增量分析"
     else:
-        html += "全天汇总"
+        yield "全天汇总"
 
-    html += """</span>
+    yield """</span>
                     </div>
                     <div class="info-item">
                         <span class="info-label">新闻总数</span>
                         <span class="info-value">"""
 
-    html += f"{total_titles} 条"
+    yield f"{total_titles} 条"
 
     # 计算筛选后的热点新闻数量
     hot_news_count = sum(len(stat["titles"]) for stat in report_data["stats"])
 
-    html += """</span>
+    yield """</span>
                     </div>
                     <div class="info-item">
                         <span class="info-label">热点新闻</span>
                         <span class="info-value">"""
 
-    html += f"{hot_news_count} 条"
+    yield f"{hot_news_count} 条"
 
-    html += """</span>
+    yield """</span>
                     </div>
                     <div class="info-item">
                         <span class="info-label">生成时间</span>
@@ -785,9 +821,9 @@ def render_html_content(
         now = get_time_func()
     else:
         now = datetime.now()
-    html += now.strftime("%m-%d %H:%M")
+    yield now.strftime("%m-%d %H:%M")
 
-    html += """</span>
+    yield """</span>
                     </div>
                 </div>
             </div>
@@ -796,18 +832,18 @@ def render_html_content(
 
     # 处理失败ID错误信息
     if report_data["failed_ids"]:
-        html += """
+        yield """
                 <div class="error-section">
                     <div class="error-title">⚠️ 请求失败的平台</div>
                     <ul class="error-list">"""
         for id_value in report_data["failed_ids"]:
-            html += f'<li class="error-item">{html_escape(id_value)}</li>'
-        html += """
+            yield f'<li class="error-item">{html_escape(format_failed_source(id_value, report_data))}</li>'
+        yield """
                     </ul>
                 </div>"""
 
     # 生成热点词汇统计部分的HTML
-    stats_html = ""
+    stats_html: List[str] = []
     if report_data["stats"]:
         total_count = len(report_data["stats"])
 
@@ -824,36 +860,36 @@ def render_html_content(
 
             escaped_word = html_escape(stat["word"])
 
-            stats_html += f"""
+            stats_html.append(f"""
                 <div class="word-group">
                     <div class="word-header">
                         <div class="word-info">
                             <div class="word-name">{escaped_word}</div>
-                            <div class="word-count {count_class}">{count} 条</div>
+                            <div class="word-count {count_class}">{count} 条</div>{render_heat_trend(stat.get("heat_trend"))}
                         </div>
                         <div class="word-index">{i}/{total_count}</div>
-                    </div>"""
+                    </div>""")
 
             # 处理每个词组下的新闻标题，给每条新闻标上序号
             for j, title_data in enumerate(stat["titles"], 1):
                 is_new = title_data.get("is_new", False)
                 new_class = "new" if is_new else ""
 
-                stats_html += f"""
+                stats_html.append(f"""
                     <div class="news-item {new_class}">
                         <div class="news-number">{j}</div>
                         <div class="news-content">
-                            <div class="news-header">"""
+                            <div class="news-header">""")
 
                 # 根据 display_mode 决定显示来源还是关键词
                 if display_mode == "keyword":
                     # keyword 模式：显示来源
-                    stats_html += f'<span class="source-name">{html_escape(title_data["source_name"])}</span>'
+                    stats_html.append(f'<span class="source-name">{html_escape(title_data["source_name"])}</span>')
                 else:
                     # platform 模式：显示关键词
                     matched_keyword = title_data.get("matched_keyword", "")
                     if matched_keyword:
-                        stats_html += f'<span class="keyword-tag">[{html_escape(matched_keyword)}]</span>'
+                        stats_html.append(f'<span class="keyword-tag">[{html_escape(matched_keyword)}]</span>')
 
                 # 处理排名显示
                 ranks = title_data.get("ranks", [])
@@ -875,7 +911,7 @@ def render_html_content(
                     else:
                         rank_text = f"{min_rank}-{max_rank}"
 
-                    stats_html += f'<span class="rank-num {rank_class}">{rank_text}</span>'
+                    stats_html.append(f'<span class="rank-num {rank_class}">{rank_text}</span>')
 
                 # 处理时间显示
                 time_display = title_data.get("time_display", "")
@@ -886,18 +922,25 @@ def render_html_content(
                         .replace("[", "")
                         .replace("]", "")
                     )
-                    stats_html += (
+                    stats_html.append(
                         f'<span class="time-info">{html_escape(simplified_time)}</span>'
                     )
 
                 # 处理出现次数
                 count_info = title_data.get("count", 1)
                 if count_info > 1:
-                    stats_html += f'<span class="count-info">{count_info}次</span>'
+                    stats_html.append(f'<span class="count-info">{count_info}次</span>')
+
+                # 合并的同一事件在其他平台的来源（复用 time-info 样式）
+                story_sources = title_data.get("story_sources")
+                if story_sources:
+                    stats_html.append(
+                        f'<span class="time-info">同时出现在：{html_escape("、".join(story_sources))}</span>'
+                    )
 
-                stats_html += """
+                stats_html.append("""
                             </div>
-                            <div class="news-title">"""
+                            <div class="news-title">""")
 
                 # 处理标题和链接
                 escaped_title = html_escape(title_data["title"])
@@ -905,38 +948,39 @@ def render_html_content(
 
                 if link_url:
                     escaped_url = html_escape(link_url)
-                    stats_html += f'<a href="{escaped_url}" target="_blank" class="news-link">{escaped_title}</a>'
+                    stats_html.append(f'<a href="{escaped_url}" target="_blank" class="news-link">{escaped_title}</a>')
                 else:
-                    stats_html += escaped_title
+                    stats_html.append(escaped_title)
 
-                stats_html += """
+                stats_html.append("""
                             </div>
                         </div>
-                    </div>"""
+                    </div>""")
 
-            stats_html += """
-                </div>"""
+            stats_html.append("""
+                </div>""")
 
     # 给热榜统计添加外层包装
     if stats_html:
-        stats_html = f"""
-                <div class="hotlist-section">{stats_html}
-                </div>"""
+        stats_html.insert(0, """
+                <div class="hotlist-section">""")
+        stats_html.append("""
+                </div>""")
 
     # 生成新增新闻区域的HTML
-    new_titles_html = ""
+    new_titles_html: List[str] = []
     if show_new_section and report_data["new_titles"]:
-        new_titles_html += f"""
+        new_titles_html.append(f"""
                 <div class="new-section">
-                    <div class="new-section-title">本次新增热点 (共 {report_data['total_new_count']} 条)</div>"""
+                    <div class="new-section-title">本次新增热点 (共 {report_data['total_new_count']} 条)</div>""")
 
         for source_data in report_data["new_titles"]:
             escaped_source = html_escape(source_data["source_name"])
             titles_count = len(source_data["titles"])
 
-            new_titles_html += f"""
+            new_titles_html.append(f"""
                     <div class="new-source-group">
-                        <div class="new-source-title">{escaped_source} · {titles_count}条</div>"""
+                        <div class="new-source-title">{escaped_source} · {titles_count}条</div>""")
 
             # 为新增新闻也添加序号
             for idx, title_data in enumerate(source_data["titles"], 1):
@@ -958,12 +1002,12 @@ def render_html_content(
                 else:
                     rank_text = "?"
 
-                new_titles_html += f"""
+                new_titles_html.append(f"""
                         <div class="new-item">
                             <div class="new-item-number">{idx}</div>
                             <div class="new-item-rank {rank_class}">{rank_text}</div>
                             <div class="new-item-content">
-                                <div class="new-item-title">"""
+                                <div class="new-item-title">""")
 
                 # 处理新增新闻的链接
                 escaped_title = html_escape(title_data["title"])
@@ -971,23 +1015,23 @@ def render_html_content(
 
                 if link_url:
                     escaped_url = html_escape(link_url)
-                    new_titles_html += f'<a href="{escaped_url}" target="_blank" class="news-link">{escaped_title}</a>'
+                    new_titles_html.append(f'<a href="{escaped_url}" target="_blank" class="news-link">{escaped_title}</a>')
                 else:
-                    new_titles_html += escaped_title
+                    new_titles_html.append(escaped_title)
 
-                new_titles_html += """
+                new_titles_html.append("""
                                 </div>
                             </div>
-                        </div>"""
+                        </div>""")
 
-            new_titles_html += """
-                    </div>"""
+            new_titles_html.append("""
+                    </div>""")
 
-        new_titles_html += """
-                </div>"""
+        new_titles_html.append("""
+                </div>""")
 
     # 生成 RSS 统计内容
-    def render_rss_stats_html(stats: List[Dict], title: str = "RSS 订阅更新") -> str:
+    def render_rss_stats_html(stats: List[Dict], title: str = "RSS 订阅更新") -> List[str]:
         """渲染 RSS 统计区块 HTML
 
         Args:
@@ -1010,22 +1054,22 @@ def render_html_content(
             title: 区块标题
 
         Returns:
-            渲染后的 HTML 字符串
+            HTML 片段列表，无内容时为空列表
         """
         if not stats:
-            return ""
+            return []
 
         # 计算总条目数
         total_count = sum(stat.get("count", 0) for stat in stats)
         if total_count == 0:
-            return ""
+            return []
 
-        rss_html = f"""
+        rss_html = [f"""
                 <div class="rss-section">
                     <div class="rss-section-header">
                         <div class="rss-section-title">{title}</div>
                         <div class="rss-section-count">{total_count} 条</div>
-                    </div>"""
+                    </div>"""]
 
         # 按关键词分组渲染（与热榜格式一致）
         for stat in stats:
@@ -1036,12 +1080,12 @@ def render_html_content(
 
             keyword_count = len(titles)
 
-            rss_html += f"""
+            rss_html.append(f"""
                     <div class="feed-group">
                         <div class="feed-header">
                             <div class="feed-name">{html_escape(keyword)}</div>
                             <div class="feed-count">{keyword_count} 条</div>
-                        </div>"""
+                        </div>""")
 
             for title_data in titles:
                 item_title = title_data.get("title", "")
@@ -1050,43 +1094,43 @@ def render_html_content(
                 source_name = title_data.get("source_name", "")
                 is_new = title_data.get("is_new", False)
 
-                rss_html += """
+                rss_html.append("""
                         <div class="rss-item">
-                            <div class="rss-meta">"""
+                            <div class="rss-meta">""")
 
                 if time_display:
-                    rss_html += f'<span class="rss-time">{html_escape(time_display)}</span>'
+                    rss_html.append(f'<span class="rss-time">{html_escape(time_display)}</span>')
 
                 if source_name:
-                    rss_html += f'<span class="rss-author">{html_escape(source_name)}</span>'
+                    rss_html.append(f'<span class="rss-author">{html_escape(source_name)}</span>')
 
                 if is_new:
-                    rss_html += '<span class="rss-author" style="color: #dc2626;">NEW</span>'
+                    rss_html.append('<span class="rss-author" style="color: #dc2626;">NEW</span>')
 
-                rss_html += """
+                rss_html.append("""
                             </div>
-                            <div class="rss-title">"""
+                            <div class="rss-title">""")
 
                 escaped_title = html_escape(item_title)
                 if url:
                     escaped_url = html_escape(url)
-                    rss_html += f'<a href="{escaped_url}" target="_blank" class="rss-link">{escaped_title}</a>'
+                    rss_html.append(f'<a href="{escaped_url}" target="_blank" class="rss-link">{escaped_title}</a>')
                 else:
-                    rss_html += escaped_title
+                    rss_html.append(escaped_title)
 
-                rss_html += """
+                rss_html.append("""
                             </div>
-                        </div>"""
+                        </div>""")
 
-            rss_html += """
-                    </div>"""
+            rss_html.append("""
+                    </div>""")
 
-        rss_html += """
-                </div>"""
+        rss_html.append("""
+                </div>""")
         return rss_html
 
     # 生成独立展示区内容
-    def render_standalone_html(data: Optional[Dict]) -> str:
+    def render_standalone_html(data: Optional[Dict]) -> List[str]:
         """渲染独立展示区 HTML（复用热点词汇统计区样式）
 
         Args:
@@ -1126,16 +1170,16 @@ def render_html_content(
                 }
 
         Returns:
-            渲染后的 HTML 字符串
+            HTML 片段列表，无内容时为空列表
         """
         if not data:
-            return ""
+            return []
 
         platforms = data.get("platforms", [])
         rss_feeds = data.get("rss_feeds", [])
 
         if not platforms and not rss_feeds:
-            return ""
+            return []
 
         # 计算总条目数
         total_platform_items = sum(len(p.get("items", [])) for p in platforms)
@@ -1143,14 +1187,14 @@ def render_html_content(
         total_count = total_platform_items + total_rss_items
 
         if total_count == 0:
-            return ""
+            return []
 
-        standalone_html = f"""
+        standalone_html = [f"""
                 <div class="standalone-section">
                     <div class="standalone-section-header">
                         <div class="standalone-section-title">独立展示区</div>
                         <div class="standalone-section-count">{total_count} 条</div>
-                    </div>"""
+                    </div>"""]
 
         # 渲染热榜平台（复用 word-group 结构）
         for platform in platforms:
@@ -1159,12 +1203,12 @@ def render_html_content(
             if not items:
                 continue
 
-            standalone_html += f"""
+            standalone_html.append(f"""
                     <div class="standalone-group">
                         <div class="standalone-header">
                             <div class="standalone-name">{html_escape(platform_name)}</div>
                             <div class="standalone-count">{len(items)} 条</div>
-                        </div>"""
+                        </div>""")
 
             # 渲染每个条目（复用 news-item 结构）
             for j, item in enumerate(items, 1):
@@ -1176,11 +1220,11 @@ def render_html_content(
                 last_time = item.get("last_time", "")
                 count = item.get("count", 1)
 
-                standalone_html += f"""
+                standalone_html.append(f"""
                         <div class="news-item">
                             <div class="news-number">{j}</div>
                             <div class="news-content">
-                                <div class="news-header">"""
+                                <div class="news-header">""")
 
                 # 排名显示（复用 rank-num 样式，无 # 前缀）
                 if ranks:
@@ -1200,7 +1244,7 @@ def render_html_content(
                     else:
                         rank_text = f"{min_rank}-{max_rank}"
 
-                    standalone_html += f'<span class="rank-num {rank_class}">{rank_text}</span>'
+                    standalone_html.append(f'<span class="rank-num {rank_class}">{rank_text}</span>')
                 elif rank > 0:
                     if rank <= 3:
                         rank_class = "top"
@@ -1208,40 +1252,40 @@ def render_html_content(
                         rank_class = "high"
                     else:
                         rank_class = ""
-                    standalone_html += f'<span class="rank-num {rank_class}">{rank}</span>'
+                    standalone_html.append(f'<span class="rank-num {rank_class}">{rank}</span>')
 
                 # 时间显示（复用 time-info 样式，将 HH-MM 转换为 HH:MM）
                 if first_time and last_time and first_time != last_time:
                     first_time_display = convert_time_for_display(first_time)
                     last_time_display = convert_time_for_display(last_time)
-                    standalone_html += f'<span class="time-info">{html_escape(first_time_display)}~{html_escape(last_time_display)}</span>'
+                    standalone_html.append(f'<span class="time-info">{html_escape(first_time_display)}~{html_escape(last_time_display)}</span>')
                 elif first_time:
                     first_time_display = convert_time_for_display(first_time)
-                    standalone_html += f'<span class="time-info">{html_escape(first_time_display)}</span>'
+                    standalone_html.append(f'<span class="time-info">{html_escape(first_time_display)}</span>')
 
                 # 出现次数（复用 count-info 样式）
                 if count > 1:
-                    standalone_html += f'<span class="count-info">{count}次</span>'
+                    standalone_html.append(f'<span class="count-info">{count}次</span>')
 
-                standalone_html += """
+                standalone_html.append("""
                                 </div>
-                                <div class="news-title">"""
+                                <div class="news-title">""")
 
                 # 标题和链接（复用 news-link 样式）
                 escaped_title = html_escape(title)
                 if url:
                     escaped_url = html_escape(url)
-                    standalone_html += f'<a href="{escaped_url}" target="_blank" class="news-link">{escaped_title}</a>'
+                    standalone_html.append(f'<a href="{escaped_url}" target="_blank" class="news-link">{escaped_title}</a>')
                 else:
-                    standalone_html += escaped_title
+                    standalone_html.append(escaped_title)
 
-                standalone_html += """
+                standalone_html.append("""
                                 </div>
                             </div>
-                        </div>"""
+                        </div>""")
 
-            standalone_html += """
-                    </div>"""
+            standalone_html.append("""
+                    </div>""")
 
         # 渲染 RSS 源（复用相同结构）
         for feed in rss_feeds:
@@ -1250,12 +1294,12 @@ def render_html_content(
             if not items:
                 continue
 
-            standalone_html += f"""
+            standalone_html.append(f"""
                     <div class="standalone-group">
                         <div class="standalone-header">
                             <div class="standalone-name">{html_escape(feed_name)}</div>
                             <div class="standalone-count">{len(items)} 条</div>
-                        </div>"""
+                        </div>""")
 
             for j, item in enumerate(items, 1):
                 title = item.get("title", "")
@@ -1263,11 +1307,11 @@ def render_html_content(
                 published_at = item.get("published_at", "")
                 author = item.get("author", "")
 
-                standalone_html += f"""
+                standalone_html.append(f"""
                         <div class="news-item">
                             <div class="news-number">{j}</div>
                             <div class="news-content">
-                                <div class="news-header">"""
+                                <div class="news-header">""")
 
                 # 时间显示（格式化 ISO 时间）
                 if published_at:
@@ -1281,44 +1325,45 @@ def render_html_content(
                     except:
                         time_display = published_at
 
-                    standalone_html += f'<span class="time-info">{html_escape(time_display)}</span>'
+                    standalone_html.append(f'<span class="time-info">{html_escape(time_display)}</span>')
 
                 # 作者显示
                 if author:
-                    standalone_html += f'<span class="source-name">{html_escape(author)}</span>'
+                    standalone_html.append(f'<span class="source-name">{html_escape(author)}</span>')
 
-                standalone_html += """
+                standalone_html.append("""
                                 </div>
-                                <div class="news-title">"""
+                                <div class="news-title">""")
 
                 escaped_title = html_escape(title)
                 if url:
                     escaped_url = html_escape(url)
-                    standalone_html += f'<a href="{escaped_url}" target="_blank" class="news-link">{escaped_title}</a>'
+                    standalone_html.append(f'<a href="{escaped_url}" target="_blank" class="news-link">{escaped_title}</a>')
                 else:
-                    standalone_html += escaped_title
+                    standalone_html.append(escaped_title)
 
-                standalone_html += """
+                standalone_html.append("""
                                 </div>
                             </div>
-                        </div>"""
+                        </div>""")
 
-            standalone_html += """
-                    </div>"""
+            standalone_html.append("""
+                    </div>""")
 
-        standalone_html += """
-                </div>"""
+        standalone_html.append("""
+                </div>""")
         return standalone_html
 
     # 生成 RSS 统计和新增 HTML
-    rss_stats_html = render_rss_stats_html(rss_items, "RSS 订阅更新") if rss_items else ""
-    rss_new_html = render_rss_stats_html(rss_new_items, "RSS 新增更新") if rss_new_items else ""
+    rss_stats_html = render_rss_stats_html(rss_items, "RSS 订阅更新") if rss_items else []
+    rss_new_html = render_rss_stats_html(rss_new_items, "RSS 新增更新") if rss_new_items else []
 
     # 生成独立展示区 HTML
     standalone_html = render_standalone_html(standalone_data)
 
     # 生成 AI 分析 HTML
     ai_html = render_ai_analysis_html_rich(ai_analysis) if ai_analysis else ""
+    ai_html = [ai_html] if ai_html else []
 
     # 准备各区域内容映射
     region_contents = {
@@ -1329,40 +1374,39 @@ def render_html_content(
         "ai_analysis": ai_html,
     }
 
-    def add_section_divider(content: str) -> str:
-        """为内容的外层 div 添加 section-divider 类"""
-        if not content or 'class="' not in content:
+    def add_section_divider(content: List[str]) -> List[str]:
+        """为内容的外层 div（第一个片段中的第一个 class）添加 section-divider 类"""
+        first = content[0]
+        first_class_pos = first.find('class="')
+        if first_class_pos == -1:
             return content
-        first_class_pos = content.find('class="')
-        if first_class_pos != -1:
-            insert_pos = first_class_pos + len('class="')
-            return content[:insert_pos] + "section-divider " + content[insert_pos:]
-        return content
+        insert_pos = first_class_pos + len('class="')
+        return [first[:insert_pos] + "section-divider " + first[insert_pos:]] + content[1:]
 
-    # 按 region_order 顺序组装内容，动态添加分割线
+    # 按 region_order 顺序输出内容，动态添加分割线
     has_previous_content = False
     for region in region_order:
-        content = region_contents.get(region, "")
+        content = region_contents.get(region, [])
         if region == "new_items":
             # 特殊处理 new_items 区域（包含热榜新增和 RSS 新增两部分）
             new_html, rss_new = content
             if new_html:
                 if has_previous_content:
                     new_html = add_section_divider(new_html)
-                html += new_html
+                yield from new_html
                 has_previous_content = True
             if rss_new:
                 if has_previous_content:
                     rss_new = add_section_divider(rss_new)
-                html += rss_new
+                yield from rss_new
                 has_previous_content = True
         elif content:
             if has_previous_content:
                 content = add_section_divider(content)
-            html += content
+            yield from content
             has_previous_content = True
 
-    html += """
+    yield """
             </div>
 
             <div class="footer">
@@ -1373,13 +1417,13 @@ def render_html_content(
                     </a>"""
 
     if update_info:
-        html += f"""
+        yield f"""
                     <br>
                     <span style="color: #ea580c; font-weight: 500;">
                         发现新版本 {update_info['remote_version']}，当前版本 {update_info['current_version']}
                     </span>"""
 
-    html += """
+    yield """
                 </div>
             </div>
         </div>
@@ -1695,4 +1739,24 @@ def render_html_content(
     </html>
     """
 
-    return html
+
+def render_html_content(
+    report_data: Dict,
+    total_titles: int,
+    mode: str = "daily",
+    update_info: Optional[Dict] = None,
+    **kwargs,
+) -> str:
+    """渲染HTML内容
+
+    Args:
+        report_data: 报告数据字典，包含 stats, new_titles, failed_ids, total_new_count
+        total_titles: 新闻总数
+        mode: 报告模式 ("daily", "current", "incremental")
+        update_info: 更新信息（可选）
+        **kwargs: 其他参数，见 iter_html_content
+
+    Returns:
+        渲染后的 HTML 字符串
+    """
+    return "".join(iter_html_content(report_data, total_titles, mode, update_info, **kwargs))
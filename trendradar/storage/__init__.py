@@ -12,6 +12,8 @@ from trendradar.storage.base import (
     StorageBackend,
     NewsItem,
     NewsData,
+    RankMomentum,
+    RankTimeline,
     RSSItem,
     RSSData,
     convert_crawl_results_to_news_data,
@@ -34,6 +36,8 @@ __all__ = [
     "StorageBackend",
     "NewsItem",
     "NewsData",
+    "RankMomentum",
+    "RankTimeline",
     "RSSItem",
     "RSSData",
     # Mixin
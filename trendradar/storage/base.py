@@ -5,9 +5,103 @@
 定义统一的存储接口，所有存储后端都需要实现这些方法
 """
 
+import sys
 from abc import ABC, abstractmethod
+from array import array
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterator, List, Optional, Any, Union
+
+
+class RankTimeline:
+    """
+    紧凑的排名时间线
+
+    以「时间列表 + 排名数组」存储，替代 [{"time": "09:30", "rank": 1}, ...] 字典列表：
+    - times: 抓取时间（HH:MM，驻留字符串，同一批次的时间只存一份）
+    - ranks: 排名数组（0 表示脱榜）
+
+    迭代时按需生成 {"time": ..., "rank": ...} 字典（脱榜的 rank 为 None），
+    与原有字典列表的读取方式兼容。
+    """
+
+    __slots__ = ("times", "ranks")
+
+    def __init__(self, times: Optional[List[str]] = None, ranks: Optional[array] = None):
+        self.times: List[str] = times if times is not None else []
+        self.ranks: array = ranks if ranks is not None else array("i")
+
+    def append(self, time_str: str, rank: Optional[int]) -> None:
+        """追加一个时间点（rank 为 None 或 0 表示脱榜）"""
+        self.times.append(sys.intern(time_str))
+        self.ranks.append(rank or 0)
+
+    def __len__(self) -> int:
+        return len(self.times)
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        for time_str, rank in zip(self.times, self.ranks):
+            yield {"time": time_str, "rank": rank or None}
+
+    def __getitem__(self, index: int) -> Dict[str, Any]:
+        rank = self.ranks[index]
+        return {"time": self.times[index], "rank": rank or None}
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, RankTimeline):
+            return self.times == other.times and self.ranks == other.ranks
+        if isinstance(other, list):
+            return self.to_list() == other
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"RankTimeline({self.to_list()!r})"
+
+    def to_list(self) -> List[Dict[str, Any]]:
+        """转换为字典列表（用于序列化）"""
+        return list(self)
+
+    @classmethod
+    def from_list(cls, timeline: List[Dict[str, Any]]) -> "RankTimeline":
+        """从字典列表创建"""
+        result = cls()
+        for point in timeline:
+            result.append(point.get("time", ""), point.get("rank"))
+        return result
+
+
+@dataclass
+class RankMomentum:
+    """
+    排名动量（入库时按抓取增量维护）
+
+    排名数值越小越靠前，因此「上升」记为正数。
+    """
+
+    rank_delta: int = 0                 # 最近一次抓取的排名变化（上次排名 - 本次排名）
+    velocity: float = 0.0               # 每次抓取的平均排名上升速度（指数平滑）
+    max_climb: int = 0                  # 最大爬升幅度（此前最差排名 - 之后的排名）
+    age_minutes: int = 0                # 首次出现至最近一次抓取的分钟数
+
+    def to_dict(self) -> Dict[str, Any]:
+        """转换为字典"""
+        return {
+            "rank_delta": self.rank_delta,
+            "velocity": self.velocity,
+            "max_climb": self.max_climb,
+            "age_minutes": self.age_minutes,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Optional[Dict[str, Any]]) -> Optional["RankMomentum"]:
+        """从字典创建（空值返回 None）"""
+        if not data:
+            return None
+        return cls(
+            rank_delta=data.get("rank_delta", 0),
+            velocity=data.get("velocity", 0.0),
+            max_climb=data.get("max_climb", 0),
+            age_minutes=data.get("age_minutes", 0),
+        )
 
 
 @dataclass
@@ -23,13 +117,16 @@ class NewsItem:
     crawl_time: str = ""                # 抓取时间（HH:MM 格式）
 
     # 统计信息（用于分析）
-    ranks: List[int] = field(default_factory=list)  # 历史排名列表
+    ranks: List[int] = field(default_factory=list)  # 历史排名列表（从存储读取时为 array）
     first_time: str = ""                # 首次出现时间
     last_time: str = ""                 # 最后出现时间
     count: int = 1                      # 出现次数
-    rank_timeline: List[Dict[str, Any]] = field(default_factory=list)  # 完整排名时间线
+    rank_timeline: Union[RankTimeline, List[Dict[str, Any]]] = field(default_factory=list)  # 完整排名时间线
                                         # 格式: [{"time": "09:30", "rank": 1}, {"time": "10:00", "rank": 2}, ...]
                                         # None 表示脱榜: [{"time": "11:00", "rank": None}]
+                                        # 从存储读取时为紧凑的 RankTimeline
+    story_id: Optional[int] = None      # 事件 ID（入库聚类分配，同一事件的跨平台新闻相同）
+    momentum: Optional[RankMomentum] = None  # 排名动量（入库时增量维护）
 
     def to_dict(self) -> Dict[str, Any]:
         """转换为字典"""
@@ -41,11 +138,13 @@ class NewsItem:
             "url": self.url,
             "mobile_url": self.mobile_url,
             "crawl_time": self.crawl_time,
-            "ranks": self.ranks,
+            "ranks": list(self.ranks),
             "first_time": self.first_time,
             "last_time": self.last_time,
             "count": self.count,
-            "rank_timeline": self.rank_timeline,
+            "rank_timeline": list(self.rank_timeline),
+            "story_id": self.story_id,
+            "momentum": self.momentum.to_dict() if self.momentum else None,
         }
 
     @classmethod
@@ -64,6 +163,8 @@ class NewsItem:
             last_time=data.get("last_time", ""),
             count=data.get("count", 1),
             rank_timeline=data.get("rank_timeline", []),
+            story_id=data.get("story_id"),
+            momentum=RankMomentum.from_dict(data.get("momentum")),
         )
 
 
@@ -130,6 +231,11 @@ class RSSData:
     - items: 按 feed_id 分组的 RSS 条目
     - id_to_name: feed_id 到名称的映射
     - failed_ids: 失败的 feed_id 列表
+    - not_modified_ids: 条件请求返回 304 的 feed_id 列表（内容未变化，沿用已保存的条目）
+    - validators: 成功抓取的源的条件请求校验值 {feed_id: {"url", "etag", "last_modified"}}
+    - seen_urls: 本次抓取中已保存过、未重新解析的条目 URL {feed_id: [url, ...]}
+    - not_due_ids: 自适应调度未到期、本次未抓取的 feed_id 列表（沿用已保存的条目）
+    - latencies: 各源本次请求的延迟（毫秒）{feed_id: latency_ms}
     """
 
     date: str                                   # 日期
@@ -137,6 +243,11 @@ class RSSData:
     items: Dict[str, List[RSSItem]]             # 按 feed_id 分组的条目
     id_to_name: Dict[str, str] = field(default_factory=dict)   # ID到名称映射
     failed_ids: List[str] = field(default_factory=list)        # 失败的ID
+    not_modified_ids: List[str] = field(default_factory=list)  # 未更新（304）的ID
+    validators: Dict[str, Dict[str, str]] = field(default_factory=dict)  # 条件请求校验值
+    seen_urls: Dict[str, List[str]] = field(default_factory=dict)       # 已存在的条目URL
+    not_due_ids: List[str] = field(default_factory=list)       # 未到期的ID
+    latencies: Dict[str, int] = field(default_factory=dict)    # 请求延迟（毫秒）
 
     def to_dict(self) -> Dict[str, Any]:
         """转换为字典"""
@@ -150,6 +261,11 @@ class RSSData:
             "items": items_dict,
             "id_to_name": self.id_to_name,
             "failed_ids": self.failed_ids,
+            "not_modified_ids": self.not_modified_ids,
+            "validators": self.validators,
+            "seen_urls": self.seen_urls,
+            "not_due_ids": self.not_due_ids,
+            "latencies": self.latencies,
         }
 
     @classmethod
@@ -166,6 +282,11 @@ class RSSData:
             items=items,
             id_to_name=data.get("id_to_name", {}),
             failed_ids=data.get("failed_ids", []),
+            not_modified_ids=data.get("not_modified_ids", []),
+            validators=data.get("validators", {}),
+            seen_urls=data.get("seen_urls", {}),
+            not_due_ids=data.get("not_due_ids", []),
+            latencies=data.get("latencies", {}),
         )
 
     def get_total_count(self) -> int:
@@ -184,6 +305,8 @@ class NewsData:
     - items: 按来源ID分组的新闻条目
     - id_to_name: 来源ID到名称的映射
     - failed_ids: 失败的来源ID列表
+    - not_due_ids: 自适应调度未到期、本次未抓取的来源ID列表（沿用上次抓取的条目）
+    - latencies: 各来源本次请求的延迟（毫秒）{source_id: latency_ms}
     """
 
     date: str                                   # 日期
@@ -191,6 +314,8 @@ class NewsData:
     items: Dict[str, List[NewsItem]]            # 按来源分组的新闻
     id_to_name: Dict[str, str] = field(default_factory=dict)   # ID到名称映射
     failed_ids: List[str] = field(default_factory=list)        # 失败的ID
+    not_due_ids: List[str] = field(default_factory=list)       # 未到期的ID
+    latencies: Dict[str, int] = field(default_factory=dict)    # 请求延迟（毫秒）
 
     def to_dict(self) -> Dict[str, Any]:
         """转换为字典"""
@@ -204,6 +329,8 @@ class NewsData:
             "items": items_dict,
             "id_to_name": self.id_to_name,
             "failed_ids": self.failed_ids,
+            "not_due_ids": self.not_due_ids,
+            "latencies": self.latencies,
         }
 
     @classmethod
@@ -220,6 +347,8 @@ class NewsData:
             items=items,
             id_to_name=data.get("id_to_name", {}),
             failed_ids=data.get("failed_ids", []),
+            not_due_ids=data.get("not_due_ids", []),
+            latencies=data.get("latencies", {}),
         )
 
     def get_total_count(self) -> int:
@@ -464,6 +593,89 @@ class StorageBackend(ABC):
         """
         pass
 
+    # === 通知发件箱相关方法 ===
+
+    @abstractmethod
+    def enqueue_notifications(self, messages: List[Dict], date: Optional[str] = None) -> bool:
+        """
+        批次写入通知发件箱
+
+        Args:
+            messages: 批次列表（group_id、channel、account、sequence、batch_no、total、report_type、request）
+            date: 日期字符串（YYYY-MM-DD），默认为今天
+
+        Returns:
+            是否写入成功
+        """
+        pass
+
+    @abstractmethod
+    def get_pending_notifications(self, date: Optional[str] = None) -> List[Dict]:
+        """
+        获取通知发件箱中待投递的批次
+
+        Args:
+            date: 日期字符串（YYYY-MM-DD），默认为今天
+
+        Returns:
+            批次列表（按写入顺序）
+        """
+        pass
+
+    @abstractmethod
+    def update_notifications(self, updates: List[Dict], date: Optional[str] = None) -> bool:
+        """
+        更新通知发件箱批次的投递状态
+
+        Args:
+            updates: 更新列表（id、status、attempts、next_attempt_at、last_error）
+            date: 日期字符串（YYYY-MM-DD），默认为今天
+
+        Returns:
+            是否更新成功
+        """
+        pass
+
+    # === 推送台账相关方法 ===
+
+    @abstractmethod
+    def get_push_ledger(self, channels: List[str], date: Optional[str] = None) -> Dict[str, Dict]:
+        """
+        读取推送台账
+
+        Args:
+            channels: 渠道名列表
+            date: 日期字符串（YYYY-MM-DD），默认为今天
+
+        Returns:
+            {渠道名: {(item_key, group_word): last_rank}}
+        """
+        pass
+
+    @abstractmethod
+    def record_push_ledger(self, channel: str, entries: List[Dict], date: Optional[str] = None) -> bool:
+        """
+        记录已推送的条目
+
+        Args:
+            channel: 渠道名
+            entries: 条目列表（item_key、group_word、source_name、title、rank）
+            date: 日期字符串（YYYY-MM-DD），默认为今天
+
+        Returns:
+            是否记录成功
+        """
+        pass
+
+    def flush_uploads(self) -> bool:
+        """
+        同步发件箱、推送台账的写入（远程存储在此统一上传，本地存储无需处理）
+
+        Returns:
+            是否同步成功
+        """
+        return True
+
 
 def convert_crawl_results_to_news_data(
     results: Dict[str, Dict],
@@ -53,6 +53,9 @@ class LocalStorageBackend(SQLiteStorageMixin, StorageBackend):
         self.enable_html = enable_html
         self.timezone = timezone
         self._db_connections: Dict[str, sqlite3.Connection] = {}
+        # 热度汇总使用的频率词组（见 set_keyword_groups）
+        self._keyword_groups = None
+        self._heat_keyword_cache = None
 
     @property
     def backend_name(self) -> str:
@@ -112,7 +115,9 @@ class LocalStorageBackend(SQLiteStorageMixin, StorageBackend):
         db_path = str(self._get_db_path(date, db_type))
 
         if db_path not in self._db_connections:
-            conn = sqlite3.connect(db_path)
+            # 热榜和 RSS 在不同线程中抓取，抓取线程创建的连接之后由主线程继续使用；
+            # 同一数据库同一时间只在一个线程中访问
+            conn = sqlite3.connect(db_path, check_same_thread=False)
             conn.row_factory = sqlite3.Row
             self._init_tables(conn, db_type)
             self._db_connections[db_path] = conn
@@ -178,6 +183,18 @@ class LocalStorageBackend(SQLiteStorageMixin, StorageBackend):
             return []
         return self._get_crawl_times_impl(date)
 
+    def get_keyword_heat(
+        self,
+        date: Optional[str] = None,
+        keyword_type: Optional[str] = None,
+        keywords: Optional[List[str]] = None,
+    ) -> List[Dict]:
+        """获取指定日期的关键词小时热度汇总"""
+        db_path = self._get_db_path(date)
+        if not db_path.exists():
+            return []
+        return self._get_keyword_heat_impl(date, keyword_type, keywords)
+
     def has_pushed_today(self, date: Optional[str] = None) -> bool:
         """检查指定日期是否已推送过"""
         return self._has_pushed_today_impl(date)
@@ -190,6 +207,32 @@ class LocalStorageBackend(SQLiteStorageMixin, StorageBackend):
             print(f"[本地存储] 推送记录已保存: {report_type} at {now_str}")
         return success
 
+    def enqueue_notifications(self, messages: List[Dict], date: Optional[str] = None) -> bool:
+        """批次写入通知发件箱"""
+        return self._enqueue_notifications_impl(messages, date)
+
+    def get_pending_notifications(self, date: Optional[str] = None) -> List[Dict]:
+        """获取通知发件箱中待投递的批次"""
+        db_path = self._get_db_path(date)
+        if not db_path.exists():
+            return []
+        return self._get_pending_notifications_impl(date)
+
+    def update_notifications(self, updates: List[Dict], date: Optional[str] = None) -> bool:
+        """更新通知发件箱批次的投递状态"""
+        return self._update_notifications_impl(updates, date)
+
+    def get_push_ledger(self, channels: List[str], date: Optional[str] = None) -> Dict[str, Dict]:
+        """读取推送台账"""
+        db_path = self._get_db_path(date)
+        if not db_path.exists():
+            return {channel: {} for channel in channels}
+        return self._get_push_ledger_impl(channels, date)
+
+    def record_push_ledger(self, channel: str, entries: List[Dict], date: Optional[str] = None) -> bool:
+        """记录已推送的条目"""
+        return self._record_push_ledger_impl(channel, entries, date)
+
     # ========================================
     # RSS 数据存储方法
     # ========================================
@@ -222,6 +265,62 @@ class LocalStorageBackend(SQLiteStorageMixin, StorageBackend):
             return None
         return self._get_latest_rss_data_impl(date)
 
+    def get_rss_seen_urls(self, date: Optional[str] = None) -> Dict[str, set]:
+        """获取当天已保存的 RSS 条目 URL（用于增量解析）"""
+        db_path = self._get_db_path(date, db_type="rss")
+        if not db_path.exists():
+            return {}
+        return self._get_rss_seen_urls_impl(date)
+
+    def get_rss_feed_validators(self, date: Optional[str] = None) -> Dict[str, Dict[str, str]]:
+        """获取各 RSS 源的条件请求校验值（ETag / Last-Modified）"""
+        db_path = self._get_db_path(date, db_type="rss")
+        if not db_path.exists():
+            return {}
+        return self._get_rss_feed_validators_impl(date)
+
+    def get_source_activity(self, date: Optional[str] = None) -> Dict[str, Dict[str, List]]:
+        """获取各平台当天的抓取活动（用于自适应调度）"""
+        db_path = self._get_db_path(date)
+        if not db_path.exists():
+            return {}
+        return self._get_source_activity_impl(date)
+
+    def get_rss_source_activity(self, date: Optional[str] = None) -> Dict[str, Dict[str, List]]:
+        """获取各 RSS 源当天的抓取活动（用于自适应调度）"""
+        db_path = self._get_db_path(date, db_type="rss")
+        if not db_path.exists():
+            return {}
+        return self._get_rss_source_activity_impl(date)
+
+    def get_source_health(self, date: Optional[str] = None) -> Dict[str, Dict]:
+        """获取各平台当天的抓取健康状况（用于来源熔断）"""
+        db_path = self._get_db_path(date)
+        if not db_path.exists():
+            return {}
+        return self._get_source_health_impl(date)
+
+    def get_rss_source_health(self, date: Optional[str] = None) -> Dict[str, Dict]:
+        """获取各 RSS 源当天的抓取健康状况（用于来源熔断）"""
+        db_path = self._get_db_path(date, db_type="rss")
+        if not db_path.exists():
+            return {}
+        return self._get_rss_source_health_impl(date)
+
+    def get_source_latency(self, date: Optional[str] = None) -> Dict[str, List[int]]:
+        """获取各平台当天成功请求的延迟（用于对冲请求）"""
+        db_path = self._get_db_path(date)
+        if not db_path.exists():
+            return {}
+        return self._get_source_latency_impl(date)
+
+    def get_rss_source_latency(self, date: Optional[str] = None) -> Dict[str, List[int]]:
+        """获取各 RSS 源当天成功请求的延迟（用于对冲请求）"""
+        db_path = self._get_db_path(date, db_type="rss")
+        if not db_path.exists():
+            return {}
+        return self._get_rss_source_latency_impl(date)
+
     # ========================================
     # 本地特有功能：TXT/HTML 快照
     # ========================================
@@ -6,7 +6,7 @@
 """
 
 import os
-from typing import Optional
+from typing import Dict, List, Optional
 
 from trendradar.storage.base import StorageBackend, NewsData, RSSData
 
@@ -201,6 +201,24 @@ class StorageManager:
         """保存新闻数据"""
         return self.get_backend().save_news_data(data)
 
+    def set_keyword_groups(
+        self,
+        word_groups: List[Dict],
+        filter_words: List,
+        global_filters: Optional[List[str]] = None,
+    ) -> None:
+        """设置入库热度汇总使用的频率词组"""
+        self.get_backend().set_keyword_groups(word_groups, filter_words, global_filters)
+
+    def get_keyword_heat(
+        self,
+        date: Optional[str] = None,
+        keyword_type: Optional[str] = None,
+        keywords: Optional[List[str]] = None,
+    ) -> List[Dict]:
+        """获取关键词小时热度汇总"""
+        return self.get_backend().get_keyword_heat(date, keyword_type, keywords)
+
     def save_rss_data(self, data: RSSData) -> bool:
         """保存 RSS 数据"""
         return self.get_backend().save_rss_data(data)
@@ -213,6 +231,38 @@ class StorageManager:
         """获取最新一次抓取的 RSS 数据（当前榜单模式）"""
         return self.get_backend().get_latest_rss_data(date)
 
+    def get_rss_seen_urls(self, date: Optional[str] = None) -> Dict[str, set]:
+        """获取当天已保存的 RSS 条目 URL（用于增量解析）"""
+        return self.get_backend().get_rss_seen_urls(date)
+
+    def get_rss_feed_validators(self, date: Optional[str] = None) -> Dict[str, Dict[str, str]]:
+        """获取各 RSS 源的条件请求校验值（ETag / Last-Modified）"""
+        return self.get_backend().get_rss_feed_validators(date)
+
+    def get_source_activity(self, date: Optional[str] = None) -> Dict[str, Dict[str, List]]:
+        """获取各平台当天的抓取活动（用于自适应调度）"""
+        return self.get_backend().get_source_activity(date)
+
+    def get_rss_source_activity(self, date: Optional[str] = None) -> Dict[str, Dict[str, List]]:
+        """获取各 RSS 源当天的抓取活动（用于自适应调度）"""
+        return self.get_backend().get_rss_source_activity(date)
+
+    def get_source_health(self, date: Optional[str] = None) -> Dict[str, Dict]:
+        """获取各平台当天的抓取健康状况（用于来源熔断）"""
+        return self.get_backend().get_source_health(date)
+
+    def get_rss_source_health(self, date: Optional[str] = None) -> Dict[str, Dict]:
+        """获取各 RSS 源当天的抓取健康状况（用于来源熔断）"""
+        return self.get_backend().get_rss_source_health(date)
+
+    def get_source_latency(self, date: Optional[str] = None) -> Dict[str, List[int]]:
+        """获取各平台当天成功请求的延迟（用于对冲请求）"""
+        return self.get_backend().get_source_latency(date)
+
+    def get_rss_source_latency(self, date: Optional[str] = None) -> Dict[str, List[int]]:
+        """获取各 RSS 源当天成功请求的延迟（用于对冲请求）"""
+        return self.get_backend().get_rss_source_latency(date)
+
     def detect_new_rss_items(self, current_data: RSSData) -> dict:
         """检测新增的 RSS 条目（增量模式）"""
         return self.get_backend().detect_new_rss_items(current_data)
@@ -307,6 +357,84 @@ class StorageManager:
         """
         return self.get_backend().record_push(report_type, date)
 
+    # === 通知发件箱相关方法 ===
+
+    def enqueue_notifications(self, messages: List[Dict], date: Optional[str] = None) -> bool:
+        """
+        批次写入通知发件箱
+
+        Args:
+            messages: 批次列表
+            date: 日期字符串（YYYY-MM-DD），默认为今天
+
+        Returns:
+            是否写入成功
+        """
+        return self.get_backend().enqueue_notifications(messages, date)
+
+    def get_pending_notifications(self, date: Optional[str] = None) -> List[Dict]:
+        """
+        获取通知发件箱中待投递的批次
+
+        Args:
+            date: 日期字符串（YYYY-MM-DD），默认为今天
+
+        Returns:
+            批次列表（按写入顺序）
+        """
+        return self.get_backend().get_pending_notifications(date)
+
+    def update_notifications(self, updates: List[Dict], date: Optional[str] = None) -> bool:
+        """
+        更新通知发件箱批次的投递状态
+
+        Args:
+            updates: 更新列表
+            date: 日期字符串（YYYY-MM-DD），默认为今天
+
+        Returns:
+            是否更新成功
+        """
+        return self.get_backend().update_notifications(updates, date)
+
+    # === 推送台账相关方法 ===
+
+    def get_push_ledger(self, channels: List[str], date: Optional[str] = None) -> Dict[str, Dict]:
+        """
+        读取推送台账
+
+        Args:
+            channels: 渠道名列表
+            date: 日期字符串（YYYY-MM-DD），默认为今天
+
+        Returns:
+            {渠道名: {(item_key, group_word): last_rank}}
+        """
+        return self.get_backend().get_push_ledger(channels, date)
+
+    def record_push_ledger(self, channel: str, entries: List[Dict], date: Optional[str] = None) -> bool:
+        """
+        记录已推送的条目
+
+        Args:
+            channel: 渠道名
+            entries: 条目列表
+            date: 日期字符串（YYYY-MM-DD），默认为今天
+
+        Returns:
+            是否记录成功
+        """
+        return self.get_backend().record_push_ledger(channel, entries, date)
+
+    def flush_uploads(self) -> bool:
+        """
+        同步发件箱、推送台账的写入（远程存储时统一上传一次）
+
+        Returns:
+            是否同步成功
+        """
+        return self.get_backend().flush_uploads()
+
 
 def get_storage_manager(
     backend_type: str = "auto",
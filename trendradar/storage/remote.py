@@ -15,7 +15,7 @@ import tempfile
 import sqlite3
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Set
 
 try:
     import boto3
@@ -117,6 +117,11 @@ class RemoteStorageBackend(SQLiteStorageMixin, StorageBackend):
         # 跟踪下载的文件（用于清理）
         self._downloaded_files: List[Path] = []
         self._db_connections: Dict[str, sqlite3.Connection] = {}
+        # 热度汇总使用的频率词组（见 set_keyword_groups）
+        self._keyword_groups = None
+        self._heat_keyword_cache = None
+        # 发件箱、推送台账写入后待上传的日期（由 flush_uploads 统一上传）
+        self._pending_uploads: Set[str] = set()
 
         print(f"[远程存储] 初始化完成，存储桶: {bucket_name}，签名版本: {signature_version}")
 
@@ -320,7 +325,9 @@ class RemoteStorageBackend(SQLiteStorageMixin, StorageBackend):
             if not local_path.exists():
                 self._download_sqlite(date, db_type)
 
-            conn = sqlite3.connect(db_path)
+            # 热榜和 RSS 在不同线程中抓取，抓取线程创建的连接之后由主线程继续使用；
+            # 同一数据库同一时间只在一个线程中访问
+            conn = sqlite3.connect(db_path, check_same_thread=False)
             conn.row_factory = sqlite3.Row
             self._init_tables(conn, db_type)
             self._db_connections[db_path] = conn
@@ -393,6 +400,15 @@ class RemoteStorageBackend(SQLiteStorageMixin, StorageBackend):
         """检查是否是当天第一次抓取"""
         return self._is_first_crawl_today_impl(date)
 
+    def get_keyword_heat(
+        self,
+        date: Optional[str] = None,
+        keyword_type: Optional[str] = None,
+        keywords: Optional[List[str]] = None,
+    ) -> List[Dict]:
+        """获取指定日期的关键词小时热度汇总"""
+        return self._get_keyword_heat_impl(date, keyword_type, keywords)
+
     def has_pushed_today(self, date: Optional[str] = None) -> bool:
         """检查指定日期是否已推送过"""
         return self._has_pushed_today_impl(date)
@@ -415,6 +431,53 @@ class RemoteStorageBackend(SQLiteStorageMixin, StorageBackend):
 
         return False
 
+    def enqueue_notifications(self, messages: List[Dict], date: Optional[str] = None) -> bool:
+        """批次写入通知发件箱（由 flush_uploads 上传到远程存储，下次运行可以继续投递）"""
+        if not self._enqueue_notifications_impl(messages, date):
+            return False
+        self._pending_uploads.add(self._format_date_folder(date))
+        return True
+
+    def get_pending_notifications(self, date: Optional[str] = None) -> List[Dict]:
+        """获取通知发件箱中待投递的批次"""
+        return self._get_pending_notifications_impl(date)
+
+    def update_notifications(self, updates: List[Dict], date: Optional[str] = None) -> bool:
+        """更新通知发件箱批次的投递状态（由 flush_uploads 上传到远程存储）"""
+        if not self._update_notifications_impl(updates, date):
+            return False
+        self._pending_uploads.add(self._format_date_folder(date))
+        return True
+
+    def get_push_ledger(self, channels: List[str], date: Optional[str] = None) -> Dict[str, Dict]:
+        """读取推送台账"""
+        return self._get_push_ledger_impl(channels, date)
+
+    def record_push_ledger(self, channel: str, entries: List[Dict], date: Optional[str] = None) -> bool:
+        """记录已推送的条目（由 flush_uploads 上传到远程存储，下次运行据此判断增量）"""
+        if not self._record_push_ledger_impl(channel, entries, date):
+            return False
+        self._pending_uploads.add(self._format_date_folder(date))
+        return True
+
+    def flush_uploads(self) -> bool:
+        """
+        上传发件箱、推送台账写入过的数据库（每个数据库只上传一次）
+
+        上传失败的日期保留在待上传列表中，下次调用时重试。
+
+        Returns:
+            是否全部上传成功
+        """
+        success = True
+        for date in sorted(self._pending_uploads):
+            if self._upload_sqlite(date):
+                self._pending_uploads.discard(date)
+            else:
+                print(f"[远程存储] 通知发件箱/推送台账同步到远程存储失败: {date}")
+                success = False
+        return success
+
     # ========================================
     # RSS 数据存储方法
     # ========================================
@@ -456,6 +519,38 @@ class RemoteStorageBackend(SQLiteStorageMixin, StorageBackend):
         """获取最新一次抓取的 RSS 数据"""
         return self._get_latest_rss_data_impl(date)
 
+    def get_rss_seen_urls(self, date: Optional[str] = None) -> Dict[str, set]:
+        """获取当天已保存的 RSS 条目 URL（用于增量解析）"""
+        return self._get_rss_seen_urls_impl(date)
+
+    def get_rss_feed_validators(self, date: Optional[str] = None) -> Dict[str, Dict[str, str]]:
+        """获取各 RSS 源的条件请求校验值（ETag / Last-Modified）"""
+        return self._get_rss_feed_validators_impl(date)
+
+    def get_source_activity(self, date: Optional[str] = None) -> Dict[str, Dict[str, List]]:
+        """获取各平台当天的抓取活动（用于自适应调度）"""
+        return self._get_source_activity_impl(date)
+
+    def get_rss_source_activity(self, date: Optional[str] = None) -> Dict[str, Dict[str, List]]:
+        """获取各 RSS 源当天的抓取活动（用于自适应调度）"""
+        return self._get_rss_source_activity_impl(date)
+
+    def get_source_health(self, date: Optional[str] = None) -> Dict[str, Dict]:
+        """获取各平台当天的抓取健康状况（用于来源熔断）"""
+        return self._get_source_health_impl(date)
+
+    def get_rss_source_health(self, date: Optional[str] = None) -> Dict[str, Dict]:
+        """获取各 RSS 源当天的抓取健康状况（用于来源熔断）"""
+        return self._get_rss_source_health_impl(date)
+
+    def get_source_latency(self, date: Optional[str] = None) -> Dict[str, List[int]]:
+        """获取各平台当天成功请求的延迟（用于对冲请求）"""
+        return self._get_source_latency_impl(date)
+
+    def get_rss_source_latency(self, date: Optional[str] = None) -> Dict[str, List[int]]:
+        """获取各 RSS 源当天成功请求的延迟（用于对冲请求）"""
+        return self._get_rss_source_latency_impl(date)
+
     # ========================================
     # 远程特有功能：TXT/HTML 快照（临时目录）
     # ========================================
@@ -538,6 +633,10 @@ class RemoteStorageBackend(SQLiteStorageMixin, StorageBackend):
         if sys.meta_path is None:
             return
 
+        # 上传尚未同步的发件箱、推送台账
+        if getattr(self, "_pending_uploads", None):
+            self.flush_uploads()
+
         # 关闭数据库连接
         db_connections = getattr(self, "_db_connections", {})
         for db_path, conn in list(db_connections.items()):
@@ -12,6 +12,8 @@ CREATE TABLE IF NOT EXISTS rss_feeds (
     is_active INTEGER DEFAULT 1,              -- 是否启用
     last_fetch_time TEXT,                     -- 最后抓取时间
     last_fetch_status TEXT,                   -- 最后抓取状态（success/failed）
+    etag TEXT,                                -- 最后一次成功抓取返回的 ETag（条件请求）
+    last_modified TEXT,                       -- 最后一次成功抓取返回的 Last-Modified（条件请求）
     item_count INTEGER DEFAULT 0,             -- 当日条目数
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
@@ -50,13 +52,14 @@ CREATE TABLE IF NOT EXISTS rss_crawl_records (
 
 -- ============================================
 -- 抓取来源状态表
--- 记录每次抓取各 RSS 源的成功/失败状态
+-- 记录每次抓取各 RSS 源的成功/失败状态和请求延迟
 -- ============================================
 CREATE TABLE IF NOT EXISTS rss_crawl_status (
     crawl_record_id INTEGER NOT NULL,
     feed_id TEXT NOT NULL,
     status TEXT NOT NULL CHECK(status IN ('success', 'failed')),
     error_message TEXT,                       -- 失败时的错误信息
+    latency_ms INTEGER,                       -- 本次请求延迟（毫秒，用于对冲请求的 p90）
     PRIMARY KEY (crawl_record_id, feed_id),
     FOREIGN KEY (crawl_record_id) REFERENCES rss_crawl_records(id),
     FOREIGN KEY (feed_id) REFERENCES rss_feeds(id)
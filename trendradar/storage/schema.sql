@@ -56,6 +56,49 @@ CREATE TABLE IF NOT EXISTS rank_history (
     FOREIGN KEY (news_item_id) REFERENCES news_items(id)
 );
 
+-- ============================================
+-- 新闻事件聚类表
+-- 入库时按标题 MinHash/LSH 聚类，同一事件的跨平台新闻共享 story_id
+-- story_id 取该事件首条新闻的 news_items.id，分配后不再变化
+-- ============================================
+CREATE TABLE IF NOT EXISTS news_stories (
+    news_item_id INTEGER PRIMARY KEY,
+    story_id INTEGER NOT NULL,
+    signature BLOB,                      -- MinHash 签名（为空表示不参与聚类）
+    FOREIGN KEY (news_item_id) REFERENCES news_items(id)
+);
+
+-- ============================================
+-- 关键词小时热度汇总表
+-- 入库时增量维护：每个关键词在每个平台、每个小时的热度
+-- keyword_type: group = 频率词组（group_key），token = 标题提取的关键词
+-- ============================================
+CREATE TABLE IF NOT EXISTS keyword_heat (
+    keyword TEXT NOT NULL,
+    keyword_type TEXT NOT NULL CHECK(keyword_type IN ('group', 'token')),
+    platform_id TEXT NOT NULL,
+    hour TEXT NOT NULL,                  -- 小时桶（HH）
+    count INTEGER DEFAULT 0,             -- 该小时出现的新闻条数（同一新闻每小时只计一次）
+    best_rank INTEGER,                   -- 该小时的最高排名
+    weight_sum REAL DEFAULT 0,           -- 该小时每次抓取的排名权重之和（11 - min(rank, 10)）
+    PRIMARY KEY (keyword_type, keyword, platform_id, hour)
+);
+
+-- ============================================
+-- 排名动量表
+-- 入库时按抓取增量维护，排名上升记为正数
+-- ============================================
+CREATE TABLE IF NOT EXISTS news_momentum (
+    news_item_id INTEGER PRIMARY KEY,
+    last_rank INTEGER NOT NULL,          -- 最近一次抓取的排名
+    rank_delta INTEGER DEFAULT 0,        -- 最近一次抓取的排名变化（上次排名 - 本次排名）
+    velocity REAL DEFAULT 0,             -- 每次抓取的排名上升速度（指数平滑）
+    worst_rank INTEGER NOT NULL,         -- 目前为止的最差排名
+    max_climb INTEGER DEFAULT 0,         -- 最大爬升幅度（此前最差排名 - 之后的排名）
+    age_minutes INTEGER DEFAULT 0,       -- 首次出现至最近一次抓取的分钟数
+    FOREIGN KEY (news_item_id) REFERENCES news_items(id)
+);
+
 -- ============================================
 -- 抓取记录表
 -- 记录每次抓取的时间和数量
@@ -69,12 +112,13 @@ CREATE TABLE IF NOT EXISTS crawl_records (
 
 -- ============================================
 -- 抓取来源状态表
--- 记录每次抓取各平台的成功/失败状态
+-- 记录每次抓取各平台的成功/失败状态和请求延迟
 -- ============================================
 CREATE TABLE IF NOT EXISTS crawl_source_status (
     crawl_record_id INTEGER NOT NULL,
     platform_id TEXT NOT NULL,
     status TEXT NOT NULL CHECK(status IN ('success', 'failed')),
+    latency_ms INTEGER,                  -- 本次请求延迟（毫秒，用于对冲请求的 p90）
     PRIMARY KEY (crawl_record_id, platform_id),
     FOREIGN KEY (crawl_record_id) REFERENCES crawl_records(id),
     FOREIGN KEY (platform_id) REFERENCES platforms(id)
@@ -93,6 +137,46 @@ CREATE TABLE IF NOT EXISTS push_records (
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
 
+-- ============================================
+-- 通知发件箱
+-- 渲染好的批次先写入发件箱，再逐条投递；失败后按指数退避重试，
+-- 下次运行（或常驻模式空闲时）继续投递未发送的批次
+-- ============================================
+CREATE TABLE IF NOT EXISTS notification_outbox (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    group_id TEXT NOT NULL,              -- 同一渠道同一账号的一次推送，组内按 sequence 顺序投递
+    channel TEXT NOT NULL,               -- 渠道名（feishu / dingtalk / ...）
+    account TEXT NOT NULL DEFAULT '',    -- 账号标签（多账号时为 "账号N"）
+    sequence INTEGER NOT NULL,           -- 投递顺序（从 1 开始）
+    batch_no INTEGER NOT NULL,           -- 批次编号（用户看到的编号，ntfy/Bark 反向推送时与投递顺序不同）
+    total INTEGER NOT NULL,              -- 批次总数
+    report_type TEXT,
+    request TEXT NOT NULL,               -- 请求 JSON（凭据已替换为占位符）
+    status TEXT NOT NULL DEFAULT 'pending' CHECK(status IN ('pending', 'sent', 'failed')),
+    attempts INTEGER NOT NULL DEFAULT 0,
+    next_attempt_at REAL NOT NULL DEFAULT 0,  -- 下次可投递时间（Unix 时间戳）
+    last_error TEXT,
+    created_at TEXT,
+    sent_at TEXT
+);
+
+-- ============================================
+-- 推送台账
+-- 记录各渠道当天已推送的条目和推送时的排名，用于增量推送（只推送新增或明显变化的条目）
+-- ============================================
+CREATE TABLE IF NOT EXISTS push_ledger (
+    channel TEXT NOT NULL,               -- 渠道名（feishu / dingtalk / ...）
+    item_key TEXT NOT NULL,              -- 条目标识（来源 + 规范化 URL，无 URL 时为规范化标题）
+    group_word TEXT NOT NULL,            -- 匹配的词组（同一条目匹配到新词组时重新推送）
+    source_name TEXT,
+    title TEXT,
+    last_rank INTEGER,                   -- 最近一次推送时的最高排名（无排名时为空）
+    push_count INTEGER NOT NULL DEFAULT 1,
+    first_pushed_at TEXT,
+    last_pushed_at TEXT,
+    PRIMARY KEY (channel, item_key, group_word)
+);
+
 -- ============================================
 -- 索引定义
 -- ============================================
@@ -115,3 +199,12 @@ CREATE INDEX IF NOT EXISTS idx_crawl_status_record ON crawl_source_status(crawl_
 
 -- 排名历史索引
 CREATE INDEX IF NOT EXISTS idx_rank_history_news ON rank_history(news_item_id);
+
+-- 事件聚类索引
+CREATE INDEX IF NOT EXISTS idx_news_stories_story ON news_stories(story_id);
+
+-- 排名动量索引（按上升速度查询）
+CREATE INDEX IF NOT EXISTS idx_news_momentum_velocity ON news_momentum(velocity);
+
+-- 发件箱索引（按状态查询待投递批次）
+CREATE INDEX IF NOT EXISTS idx_outbox_status ON notification_outbox(status, group_id, sequence);
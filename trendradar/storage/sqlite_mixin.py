@@ -7,11 +7,20 @@ SQLite 存储 Mixin
 
 import sqlite3
 from abc import abstractmethod
+from array import array
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
-
-from trendradar.storage.base import NewsItem, NewsData, RSSItem, RSSData
+from typing import Any, Dict, List, Optional, Tuple
+
+from trendradar.storage.base import NewsItem, NewsData, RSSItem, RSSData, RankMomentum, RankTimeline
+from trendradar.utils.keywords import extract_title_keywords
+from trendradar.utils.story import (
+    StoryIndex,
+    minhash_signature,
+    signature_from_bytes,
+    signature_to_bytes,
+)
+from trendradar.utils.time import crawl_time_to_minutes
 from trendradar.utils.url import normalize_url
 
 
@@ -85,8 +94,40 @@ class SQLiteStorageMixin:
         else:
             raise FileNotFoundError(f"Schema file not found: {schema_path}")
 
+        self._migrate_columns(conn, db_type)
         conn.commit()
 
+    # 旧数据库中需要补充的列：{db_type: [(表名, 列名, 列定义), ...]}
+    # CREATE TABLE IF NOT EXISTS 不会为已存在的表添加新列
+    _COLUMN_MIGRATIONS = {
+        "news": [
+            ("crawl_source_status", "latency_ms", "INTEGER"),
+        ],
+        "rss": [
+            ("rss_feeds", "etag", "TEXT"),
+            ("rss_feeds", "last_modified", "TEXT"),
+            ("rss_crawl_status", "latency_ms", "INTEGER"),
+        ],
+    }
+
+    def _migrate_columns(self, conn: sqlite3.Connection, db_type: str = "news") -> None:
+        """
+        为旧数据库补充 schema 中新增的列
+
+        Args:
+            conn: 数据库连接
+            db_type: 数据库类型 ("news" 或 "rss")
+        """
+        existing_columns: Dict[str, set] = {}
+        for table, column, definition in self._COLUMN_MIGRATIONS.get(db_type, []):
+            if table not in existing_columns:
+                existing_columns[table] = {
+                    row[1] for row in conn.execute(f"PRAGMA table_info({table})")
+                }
+            if column not in existing_columns[table]:
+                conn.execute(f"ALTER TABLE {table} ADD COLUMN {column} {definition}")
+                existing_columns[table].add(column)
+
     # ========================================
     # 新闻数据存储
     # ========================================
@@ -125,6 +166,13 @@ class SQLiteStorageMixin:
             title_changed_count = 0
             success_sources = []
 
+            # 热度汇总观测：(platform_id, title, rank, 是否为该新闻本小时首次出现)
+            crawl_hour = self._crawl_hour(data.crawl_time)
+            heat_observations = []
+
+            # 排名动量观测：(news_item_id, 上次排名（新增为 None）, 本次排名, 首次抓取时间)
+            momentum_observations = []
+
             for source_id, news_list in data.items.items():
                 success_sources.append(source_id)
 
@@ -136,14 +184,16 @@ class SQLiteStorageMixin:
                         # 检查是否已存在（通过标准化 URL + platform_id）
                         if normalized_url:
                             cursor.execute("""
-                                SELECT id, title FROM news_items
+                                SELECT id, title, last_crawl_time, rank, first_crawl_time
+                                FROM news_items
                                 WHERE url = ? AND platform_id = ?
                             """, (normalized_url, source_id))
                             existing = cursor.fetchone()
 
                             if existing:
                                 # 已存在，更新记录
-                                existing_id, existing_title = existing
+                                (existing_id, existing_title, existing_last_time,
+                                 existing_rank, existing_first_time) = existing
 
                                 # 检查标题是否变化
                                 if existing_title != item.title:
@@ -175,6 +225,13 @@ class SQLiteStorageMixin:
                                 """, (item.title, item.rank, item.mobile_url,
                                       data.crawl_time, now_str, existing_id))
                                 updated_count += 1
+                                heat_observations.append((
+                                    source_id, item.title, item.rank,
+                                    self._crawl_hour(existing_last_time) != crawl_hour,
+                                ))
+                                momentum_observations.append((
+                                    existing_id, existing_rank, item.rank, existing_first_time
+                                ))
                             else:
                                 # 不存在，插入新记录（存储标准化后的 URL）
                                 cursor.execute("""
@@ -194,6 +251,8 @@ class SQLiteStorageMixin:
                                     VALUES (?, ?, ?, ?)
                                 """, (new_id, item.rank, data.crawl_time, now_str))
                                 new_count += 1
+                                heat_observations.append((source_id, item.title, item.rank, True))
+                                momentum_observations.append((new_id, None, item.rank, data.crawl_time))
                         else:
                             # URL 为空的情况，直接插入（不做去重）
                             cursor.execute("""
@@ -213,12 +272,29 @@ class SQLiteStorageMixin:
                                 VALUES (?, ?, ?, ?)
                             """, (new_id, item.rank, data.crawl_time, now_str))
                             new_count += 1
+                            heat_observations.append((source_id, item.title, item.rank, True))
+                            momentum_observations.append((new_id, None, item.rank, data.crawl_time))
 
                     except sqlite3.Error as e:
                         print(f"{log_prefix} 保存新闻条目失败 [{item.title[:30]}...]: {e}")
 
+            # 调度未到期的平台：上次抓取的条目本次仍视为在榜（只用于报告，不计入更新数）
+            for source_id in data.not_due_ids:
+                self._carry_news_items_forward(cursor, source_id, data.crawl_time, now_str)
+
             total_items = new_count + updated_count
 
+            # 事件聚类：为尚未归类的新闻分配 story_id
+            self._assign_story_ids(cursor, log_prefix)
+
+            # 关键词小时热度汇总
+            self._update_keyword_heat(
+                cursor, data.crawl_time, crawl_hour, heat_observations, log_prefix
+            )
+
+            # 排名动量（速度、最大爬升、在榜时长）
+            self._update_news_momentum(cursor, data.crawl_time, momentum_observations, log_prefix)
+
             # ========================================
             # 脱榜检测：检测上次在榜但这次不在榜的新闻
             # ========================================
@@ -284,9 +360,9 @@ class SQLiteStorageMixin:
                 for source_id in success_sources:
                     cursor.execute("""
                         INSERT OR REPLACE INTO crawl_source_status
-                        (crawl_record_id, platform_id, status)
-                        VALUES (?, ?, 'success')
-                    """, (crawl_record_id, source_id))
+                        (crawl_record_id, platform_id, status, latency_ms)
+                        VALUES (?, ?, 'success', ?)
+                    """, (crawl_record_id, source_id, data.latencies.get(source_id)))
 
                 # 记录失败的来源
                 for failed_id in data.failed_ids:
@@ -298,9 +374,9 @@ class SQLiteStorageMixin:
 
                     cursor.execute("""
                         INSERT OR REPLACE INTO crawl_source_status
-                        (crawl_record_id, platform_id, status)
-                        VALUES (?, ?, 'failed')
-                    """, (crawl_record_id, failed_id))
+                        (crawl_record_id, platform_id, status, latency_ms)
+                        VALUES (?, ?, 'failed', ?)
+                    """, (crawl_record_id, failed_id, data.latencies.get(failed_id)))
 
             conn.commit()
 
@@ -310,6 +386,191 @@ class SQLiteStorageMixin:
             print(f"{log_prefix} 保存失败: {e}")
             return False, 0, 0, 0, 0
 
+    def _carry_news_items_forward(
+        self,
+        cursor: sqlite3.Cursor,
+        platform_id: str,
+        crawl_time: str,
+        now_str: str,
+    ) -> int:
+        """
+        将未到期平台在上次抓取时的条目标记为本次仍在榜（排名不变）
+
+        只更新 last_crawl_time，使当前榜单报告和之后真正抓取该平台时的脱榜检测照常进行；
+        本次并没有观测到这些条目，因此不写入排名历史，也不增加 crawl_count。
+
+        Args:
+            cursor: 数据库游标
+            platform_id: 平台 ID
+            crawl_time: 本次抓取时间
+            now_str: 当前时间字符串
+
+        Returns:
+            沿用的条目数
+        """
+        cursor.execute("""
+            SELECT MAX(last_crawl_time) FROM news_items WHERE platform_id = ?
+        """, (platform_id,))
+        row = cursor.fetchone()
+        prev_crawl_time = row[0] if row else None
+        if not prev_crawl_time or prev_crawl_time == crawl_time:
+            return 0
+
+        cursor.execute("""
+            UPDATE news_items SET
+                last_crawl_time = ?,
+                updated_at = ?
+            WHERE platform_id = ? AND last_crawl_time = ?
+        """, (crawl_time, now_str, platform_id, prev_crawl_time))
+        return cursor.rowcount
+
+    def _get_source_activity_impl(self, date: Optional[str] = None) -> Dict[str, Dict[str, List]]:
+        """
+        获取各平台当天的抓取活动（用于自适应调度）
+
+        变化指新闻上榜（首次抓取）或脱榜（rank=0），排名互换不计。
+
+        Args:
+            date: 日期字符串（YYYY-MM-DD），默认为今天
+
+        Returns:
+            {platform_id: {"checks": [成功抓取的分钟数], "changes": [有变化的分钟数]}}
+        """
+        try:
+            conn = self._get_connection(date)
+            cursor = conn.cursor()
+            activity: Dict[str, Dict[str, List]] = {}
+
+            cursor.execute("""
+                SELECT s.platform_id, r.crawl_time
+                FROM crawl_source_status s
+                JOIN crawl_records r ON r.id = s.crawl_record_id
+                WHERE s.status = 'success'
+            """)
+            for platform_id, crawl_time in cursor.fetchall():
+                minutes = crawl_time_to_minutes(crawl_time)
+                if minutes is not None:
+                    entry = activity.setdefault(platform_id, {"checks": [], "changes": []})
+                    entry["checks"].append(minutes)
+
+            cursor.execute("""
+                SELECT platform_id, first_crawl_time FROM news_items
+                UNION
+                SELECT n.platform_id, h.crawl_time
+                FROM rank_history h
+                JOIN news_items n ON n.id = h.news_item_id
+                WHERE h.rank = 0
+            """)
+            for platform_id, crawl_time in cursor.fetchall():
+                minutes = crawl_time_to_minutes(crawl_time)
+                if minutes is not None and platform_id in activity:
+                    activity[platform_id]["changes"].append(minutes)
+
+            return activity
+        except sqlite3.Error as e:
+            print(f"[存储] 读取平台抓取活动失败: {e}")
+            return {}
+
+    def _get_source_health_impl(self, date: Optional[str] = None) -> Dict[str, Dict]:
+        """
+        获取各平台当天的抓取健康状况（用于来源熔断）
+
+        Args:
+            date: 日期字符串（YYYY-MM-DD），默认为今天
+
+        Returns:
+            {platform_id: {"consecutive_failures", "last_failure", "last_success"}}
+        """
+        from trendradar.crawler.breaker import summarize_source_health
+
+        try:
+            conn = self._get_connection(date)
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT s.platform_id, r.crawl_time, s.status
+                FROM crawl_source_status s
+                JOIN crawl_records r ON r.id = s.crawl_record_id
+                ORDER BY r.crawl_time
+            """)
+            return summarize_source_health(cursor.fetchall())
+        except sqlite3.Error as e:
+            print(f"[存储] 读取平台抓取状态失败: {e}")
+            return {}
+
+    def _get_source_latency_impl(self, date: Optional[str] = None) -> Dict[str, List[int]]:
+        """
+        获取各平台当天成功请求的延迟（用于对冲请求）
+
+        Args:
+            date: 日期字符串（YYYY-MM-DD），默认为今天
+
+        Returns:
+            {platform_id: [latency_ms, ...]}
+        """
+        try:
+            conn = self._get_connection(date)
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT platform_id, latency_ms FROM crawl_source_status
+                WHERE status = 'success' AND latency_ms IS NOT NULL
+            """)
+            latencies: Dict[str, List[int]] = {}
+            for platform_id, latency_ms in cursor.fetchall():
+                latencies.setdefault(platform_id, []).append(latency_ms)
+            return latencies
+        except sqlite3.Error as e:
+            print(f"[存储] 读取平台请求延迟失败: {e}")
+            return {}
+
+    def _assign_story_ids(self, cursor: sqlite3.Cursor, log_prefix: str = "[存储]") -> int:
+        """
+        为尚未归类的新闻分配 story_id（入库时增量聚类）
+
+        载入当天已有新闻的 MinHash 签名建立 LSH 索引，新新闻只与同桶候选比较；
+        已分配的 story_id 不会改变。聚类失败不影响新闻数据本身的保存。
+
+        Args:
+            cursor: 数据库游标
+            log_prefix: 日志前缀
+
+        Returns:
+            本次新分配的新闻数量
+        """
+        try:
+            cursor.execute("""
+                SELECT n.id, n.title FROM news_items n
+                LEFT JOIN news_stories s ON s.news_item_id = n.id
+                WHERE s.news_item_id IS NULL
+                ORDER BY n.id
+            """)
+            pending = cursor.fetchall()
+            if not pending:
+                return 0
+
+            index = StoryIndex()
+            cursor.execute("""
+                SELECT news_item_id, story_id, signature FROM news_stories
+                WHERE signature IS NOT NULL
+            """)
+            for news_id, story_id, blob in cursor.fetchall():
+                index.add(news_id, story_id, signature_from_bytes(blob))
+
+            rows = []
+            for news_id, title in pending:
+                signature = minhash_signature(title)
+                story_id = index.assign(news_id, signature)
+                rows.append((news_id, story_id, signature_to_bytes(signature)))
+
+            cursor.executemany("""
+                INSERT OR IGNORE INTO news_stories (news_item_id, story_id, signature)
+                VALUES (?, ?, ?)
+            """, rows)
+            return len(rows)
+
+        except sqlite3.Error as e:
+            print(f"{log_prefix} 事件聚类失败: {e}")
+            return 0
+
     def _get_today_all_data_impl(self, date: Optional[str] = None) -> Optional[NewsData]:
         """
         获取指定日期的所有新闻数据（合并后）
@@ -328,9 +589,13 @@ class SQLiteStorageMixin:
             cursor.execute("""
                 SELECT n.id, n.title, n.platform_id, p.name as platform_name,
                        n.rank, n.url, n.mobile_url,
-                       n.first_crawl_time, n.last_crawl_time, n.crawl_count
+                       n.first_crawl_time, n.last_crawl_time, n.crawl_count,
+                       s.story_id,
+                       m.rank_delta, m.velocity, m.max_climb, m.age_minutes
                 FROM news_items n
                 LEFT JOIN platforms p ON n.platform_id = p.id
+                LEFT JOIN news_stories s ON s.news_item_id = n.id
+                LEFT JOIN news_momentum m ON m.news_item_id = n.id
                 ORDER BY n.platform_id, n.last_crawl_time
             """)
 
@@ -344,8 +609,8 @@ class SQLiteStorageMixin:
             # 批量查询排名历史（同时获取时间和排名）
             # 过滤逻辑：只保留 last_crawl_time 之前的脱榜记录（rank=0）
             # 这样可以避免显示新闻永久脱榜后的无意义记录
-            rank_history_map: Dict[int, List[int]] = {}
-            rank_timeline_map: Dict[int, List[Dict[str, Any]]] = {}
+            rank_history_map: Dict[int, array] = {}
+            rank_timeline_map: Dict[int, RankTimeline] = {}
             if news_ids:
                 placeholders = ",".join("?" * len(news_ids))
                 cursor.execute(f"""
@@ -359,21 +624,18 @@ class SQLiteStorageMixin:
                 for rh_row in cursor.fetchall():
                     news_id, rank, crawl_time = rh_row[0], rh_row[1], rh_row[2]
 
-                    # 构建 ranks 列表（去重，排除脱榜记录 rank=0）
+                    # 构建 ranks 数组（去重，排除脱榜记录 rank=0）
                     if news_id not in rank_history_map:
-                        rank_history_map[news_id] = []
+                        rank_history_map[news_id] = array("i")
                     if rank != 0 and rank not in rank_history_map[news_id]:
                         rank_history_map[news_id].append(rank)
 
-                    # 构建 rank_timeline 列表（完整时间线，包含脱榜）
+                    # 构建 rank_timeline（完整时间线，包含脱榜，rank=0 读取时转为 None）
                     if news_id not in rank_timeline_map:
-                        rank_timeline_map[news_id] = []
+                        rank_timeline_map[news_id] = RankTimeline()
                     # 提取时间部分（HH:MM）
                     time_part = crawl_time.split()[1][:5] if ' ' in crawl_time else crawl_time[:5]
-                    rank_timeline_map[news_id].append({
-                        "time": time_part,
-                        "rank": rank if rank != 0 else None  # 0 转为 None 表示脱榜
-                    })
+                    rank_timeline_map[news_id].append(time_part, rank)
 
             # 按 platform_id 分组
             items: Dict[str, List[NewsItem]] = {}
@@ -392,8 +654,10 @@ class SQLiteStorageMixin:
                     items[platform_id] = []
 
                 # 获取排名历史，如果没有则使用当前排名
-                ranks = rank_history_map.get(news_id, [row[4]])
-                rank_timeline = rank_timeline_map.get(news_id, [])
+                ranks = rank_history_map.get(news_id)
+                if ranks is None:
+                    ranks = array("i", [row[4]])
+                rank_timeline = rank_timeline_map.get(news_id) or RankTimeline()
 
                 items[platform_id].append(NewsItem(
                     title=title,
@@ -408,6 +672,8 @@ class SQLiteStorageMixin:
                     last_time=row[8],   # last_crawl_time
                     count=row[9],       # crawl_count
                     rank_timeline=rank_timeline,
+                    story_id=row[10],
+                    momentum=self._momentum_from_row(row, 11),
                 ))
 
             final_items = items
@@ -474,9 +740,13 @@ class SQLiteStorageMixin:
             cursor.execute("""
                 SELECT n.id, n.title, n.platform_id, p.name as platform_name,
                        n.rank, n.url, n.mobile_url,
-                       n.first_crawl_time, n.last_crawl_time, n.crawl_count
+                       n.first_crawl_time, n.last_crawl_time, n.crawl_count,
+                       s.story_id,
+                       m.rank_delta, m.velocity, m.max_climb, m.age_minutes
                 FROM news_items n
                 LEFT JOIN platforms p ON n.platform_id = p.id
+                LEFT JOIN news_stories s ON s.news_item_id = n.id
+                LEFT JOIN news_momentum m ON m.news_item_id = n.id
                 WHERE n.last_crawl_time = ?
             """, (latest_time,))
 
@@ -490,8 +760,8 @@ class SQLiteStorageMixin:
             # 批量查询排名历史（同时获取时间和排名）
             # 过滤逻辑：只保留 last_crawl_time 之前的脱榜记录（rank=0）
             # 这样可以避免显示新闻永久脱榜后的无意义记录
-            rank_history_map: Dict[int, List[int]] = {}
-            rank_timeline_map: Dict[int, List[Dict[str, Any]]] = {}
+            rank_history_map: Dict[int, array] = {}
+            rank_timeline_map: Dict[int, RankTimeline] = {}
             if news_ids:
                 placeholders = ",".join("?" * len(news_ids))
                 cursor.execute(f"""
@@ -505,21 +775,18 @@ class SQLiteStorageMixin:
                 for rh_row in cursor.fetchall():
                     news_id, rank, crawl_time = rh_row[0], rh_row[1], rh_row[2]
 
-                    # 构建 ranks 列表（去重，排除脱榜记录 rank=0）
+                    # 构建 ranks 数组（去重，排除脱榜记录 rank=0）
                     if news_id not in rank_history_map:
-                        rank_history_map[news_id] = []
+                        rank_history_map[news_id] = array("i")
                     if rank != 0 and rank not in rank_history_map[news_id]:
                         rank_history_map[news_id].append(rank)
 
-                    # 构建 rank_timeline 列表（完整时间线，包含脱榜）
+                    # 构建 rank_timeline（完整时间线，包含脱榜，rank=0 读取时转为 None）
                     if news_id not in rank_timeline_map:
-                        rank_timeline_map[news_id] = []
+                        rank_timeline_map[news_id] = RankTimeline()
                     # 提取时间部分（HH:MM）
                     time_part = crawl_time.split()[1][:5] if ' ' in crawl_time else crawl_time[:5]
-                    rank_timeline_map[news_id].append({
-                        "time": time_part,
-                        "rank": rank if rank != 0 else None  # 0 转为 None 表示脱榜
-                    })
+                    rank_timeline_map[news_id].append(time_part, rank)
 
             items: Dict[str, List[NewsItem]] = {}
             id_to_name: Dict[str, str] = {}
@@ -535,8 +802,10 @@ class SQLiteStorageMixin:
                     items[platform_id] = []
 
                 # 获取排名历史，如果没有则使用当前排名
-                ranks = rank_history_map.get(news_id, [row[4]])
-                rank_timeline = rank_timeline_map.get(news_id, [])
+                ranks = rank_history_map.get(news_id)
+                if ranks is None:
+                    ranks = array("i", [row[4]])
+                rank_timeline = rank_timeline_map.get(news_id) or RankTimeline()
 
                 items[platform_id].append(NewsItem(
                     title=row[1],
@@ -551,6 +820,8 @@ class SQLiteStorageMixin:
                     last_time=row[8],   # last_crawl_time
                     count=row[9],       # crawl_count
                     rank_timeline=rank_timeline,
+                    story_id=row[10],
+                    momentum=self._momentum_from_row(row, 11),
                 ))
 
             # 获取失败的来源（针对最新一次抓取）
@@ -688,6 +959,323 @@ class SQLiteStorageMixin:
             print(f"[存储] 获取抓取时间列表失败: {e}")
             return []
 
+    # ========================================
+    # 排名动量
+    # ========================================
+
+    # 速度的指数平滑系数（越大越看重最近一次抓取）
+    _MOMENTUM_SMOOTHING = 0.5
+
+    @staticmethod
+    def _momentum_from_row(row: tuple, offset: int) -> Optional[RankMomentum]:
+        """从查询结果（rank_delta, velocity, max_climb, age_minutes）构建排名动量"""
+        if row[offset] is None:
+            return None
+        return RankMomentum(
+            rank_delta=row[offset],
+            velocity=row[offset + 1] or 0.0,
+            max_climb=row[offset + 2] or 0,
+            age_minutes=row[offset + 3] or 0,
+        )
+
+    def _update_news_momentum(
+        self,
+        cursor: sqlite3.Cursor,
+        crawl_time: str,
+        observations: List[Tuple[int, Optional[int], int, str]],
+        log_prefix: str = "[存储]",
+    ) -> None:
+        """
+        增量更新本次抓取中新闻的排名动量
+
+        只使用上一次的动量和本次排名，不扫描 rank_history。升级前已存在的
+        新闻从 news_items 中的上次排名开始计算。更新失败不影响新闻数据本身的保存。
+
+        Args:
+            cursor: 数据库游标
+            crawl_time: 本次抓取时间
+            observations: [(news_item_id, 上次排名（新增为 None）, 本次排名, 首次抓取时间), ...]
+            log_prefix: 日志前缀
+        """
+        current_minutes = crawl_time_to_minutes(crawl_time)
+        alpha = self._MOMENTUM_SMOOTHING
+
+        rows = []
+        for news_id, prev_rank, rank, first_time in observations:
+            if not rank or rank <= 0:
+                continue
+            first_minutes = crawl_time_to_minutes(first_time)
+            age = (
+                max(current_minutes - first_minutes, 0)
+                if current_minutes is not None and first_minutes is not None else 0
+            )
+            if prev_rank and prev_rank > 0:
+                delta = prev_rank - rank
+                rows.append((news_id, rank, delta, delta * alpha,
+                             max(prev_rank, rank), max(delta, 0), age))
+            else:
+                rows.append((news_id, rank, 0, 0.0, rank, 0, age))
+
+        if not rows:
+            return
+
+        try:
+            # UPDATE 中的列引用均为更新前的值
+            cursor.executemany(f"""
+                INSERT INTO news_momentum
+                (news_item_id, last_rank, rank_delta, velocity, worst_rank, max_climb, age_minutes)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(news_item_id) DO UPDATE SET
+                    rank_delta = last_rank - excluded.last_rank,
+                    velocity = velocity * {1 - alpha} + (last_rank - excluded.last_rank) * {alpha},
+                    max_climb = MAX(max_climb, worst_rank - excluded.last_rank),
+                    worst_rank = MAX(worst_rank, excluded.last_rank),
+                    last_rank = excluded.last_rank,
+                    age_minutes = excluded.age_minutes
+            """, rows)
+        except sqlite3.Error as e:
+            print(f"{log_prefix} 排名动量更新失败: {e}")
+
+    # ========================================
+    # 关键词热度汇总
+    # ========================================
+
+    # 热度汇总使用的频率词组配置（由 set_keyword_groups 设置，未设置时只汇总标题关键词）
+    # 实例属性，由各存储后端在 __init__ 中初始化为 None
+    _keyword_groups: Optional[Tuple[List[Dict], List, List[str]]]
+
+    # 上一次汇总中各标题的关键词 {标题: [(keyword_type, keyword), ...]}，
+    # 常驻模式下已在榜的标题不再重新分词和匹配词组；词组配置变化时清空
+    # 实例属性，由各存储后端在 __init__ 中初始化为 None
+    _heat_keyword_cache: Optional[Dict[str, List[Tuple[str, str]]]]
+
+    def set_keyword_groups(
+        self,
+        word_groups: List[Dict],
+        filter_words: List,
+        global_filters: Optional[List[str]] = None,
+    ) -> None:
+        """
+        设置热度汇总使用的频率词组（入库时按词组汇总 group 类型热度）
+
+        Args:
+            word_groups: 词组配置列表
+            filter_words: 过滤词列表
+            global_filters: 全局过滤词
+        """
+        keyword_groups = (word_groups, filter_words, global_filters or [])
+        if keyword_groups != self._keyword_groups:
+            self._heat_keyword_cache = None
+        self._keyword_groups = keyword_groups
+
+    @staticmethod
+    def _crawl_hour(crawl_time: Optional[str]) -> str:
+        """从抓取时间（HH-MM 或 YYYY-MM-DD HH:MM:SS）提取小时桶 HH"""
+        if not crawl_time:
+            return ""
+        if " " in crawl_time:
+            crawl_time = crawl_time.split()[1]
+        return crawl_time[:2]
+
+    def _heat_keywords(self, title: str) -> List[Tuple[str, str]]:
+        """
+        获取标题参与热度汇总的关键词
+
+        Returns:
+            [(keyword_type, keyword), ...]，token 去重，group 为第一个匹配的词组
+        """
+        keywords = [("token", kw) for kw in dict.fromkeys(extract_title_keywords(title))]
+
+        if self._keyword_groups:
+            from trendradar.core.frequency import find_matching_group_index
+
+            word_groups, filter_words, global_filters = self._keyword_groups
+            group_idx = find_matching_group_index(
+                title, word_groups, filter_words, global_filters
+            )
+            if group_idx >= 0:
+                keywords.append(("group", word_groups[group_idx]["group_key"]))
+
+        return keywords
+
+    def _accumulate_keyword_heat(
+        self,
+        cursor: sqlite3.Cursor,
+        observations: List[Tuple[str, str, str, int, bool]],
+    ) -> int:
+        """
+        将观测累加到 keyword_heat 表
+
+        Args:
+            cursor: 数据库游标
+            observations: [(platform_id, title, hour, rank, 是否为本小时首次出现), ...]
+
+        Returns:
+            更新的汇总行数
+        """
+        # 同一标题只分词和匹配一次（回填时同一标题有多次抓取的观测），
+        # 上一次汇总已处理过的标题直接复用
+        previous = self._heat_keyword_cache or {}
+        title_keywords: Dict[str, List[Tuple[str, str]]] = {}
+
+        rollup: Dict[Tuple[str, str, str, str], List] = {}
+        for platform_id, title, hour, rank, first_in_hour in observations:
+            if not hour or not rank or rank <= 0:
+                continue
+            weight = 11 - min(rank, 10)
+            keywords = title_keywords.get(title)
+            if keywords is None:
+                keywords = previous.get(title)
+                if keywords is None:
+                    keywords = self._heat_keywords(title)
+                title_keywords[title] = keywords
+            for keyword_type, keyword in keywords:
+                key = (keyword_type, keyword, platform_id, hour)
+                entry = rollup.get(key)
+                if entry is None:
+                    rollup[key] = [1 if first_in_hour else 0, rank, weight]
+                else:
+                    entry[0] += 1 if first_in_hour else 0
+                    entry[1] = min(entry[1], rank)
+                    entry[2] += weight
+
+        if rollup:
+            cursor.executemany("""
+                INSERT INTO keyword_heat
+                (keyword, keyword_type, platform_id, hour, count, best_rank, weight_sum)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(keyword_type, keyword, platform_id, hour) DO UPDATE SET
+                    count = count + excluded.count,
+                    best_rank = MIN(best_rank, excluded.best_rank),
+                    weight_sum = weight_sum + excluded.weight_sum
+            """, [
+                (keyword, keyword_type, platform_id, hour, count, best_rank, weight_sum)
+                for (keyword_type, keyword, platform_id, hour), (count, best_rank, weight_sum)
+                in rollup.items()
+            ])
+
+        # 只保留本次出现的标题，缓存大小与单次抓取的标题数相当
+        self._heat_keyword_cache = title_keywords
+        return len(rollup)
+
+    def _update_keyword_heat(
+        self,
+        cursor: sqlite3.Cursor,
+        crawl_time: str,
+        crawl_hour: str,
+        observations: List[Tuple[str, str, int, bool]],
+        log_prefix: str = "[存储]",
+    ) -> None:
+        """
+        增量更新关键词小时热度
+
+        当天数据库中已有抓取记录但汇总表为空（升级前的数据）时，
+        先从 rank_history 回填之前的抓取。汇总失败不影响新闻数据本身的保存。
+
+        Args:
+            cursor: 数据库游标
+            crawl_time: 本次抓取时间
+            crawl_hour: 本次抓取的小时桶
+            observations: 本次抓取的观测 [(platform_id, title, rank, 是否为本小时首次出现), ...]
+            log_prefix: 日志前缀
+        """
+        try:
+            cursor.execute("SELECT 1 FROM keyword_heat LIMIT 1")
+            if cursor.fetchone() is None:
+                self._rebuild_keyword_heat(cursor, crawl_time)
+
+            self._accumulate_keyword_heat(cursor, [
+                (platform_id, title, crawl_hour, rank, first_in_hour)
+                for platform_id, title, rank, first_in_hour in observations
+            ])
+        except sqlite3.Error as e:
+            print(f"{log_prefix} 关键词热度汇总失败: {e}")
+
+    def _rebuild_keyword_heat(self, cursor: sqlite3.Cursor, before_crawl_time: str) -> int:
+        """
+        从排名历史回填关键词小时热度（只处理指定抓取时间之前的记录）
+
+        Args:
+            cursor: 数据库游标
+            before_crawl_time: 回填截止的抓取时间（不含）
+
+        Returns:
+            更新的汇总行数
+        """
+        cursor.execute("""
+            SELECT n.id, n.platform_id, n.title, rh.rank, rh.crawl_time
+            FROM rank_history rh
+            JOIN news_items n ON rh.news_item_id = n.id
+            WHERE rh.rank > 0 AND rh.crawl_time < ?
+            ORDER BY rh.crawl_time, rh.id
+        """, (before_crawl_time,))
+
+        seen = set()
+        observations = []
+        for news_id, platform_id, title, rank, crawl_time in cursor.fetchall():
+            hour = self._crawl_hour(crawl_time)
+            first_in_hour = (news_id, hour) not in seen
+            seen.add((news_id, hour))
+            observations.append((platform_id, title, hour, rank, first_in_hour))
+
+        return self._accumulate_keyword_heat(cursor, observations)
+
+    def _get_keyword_heat_impl(
+        self,
+        date: Optional[str] = None,
+        keyword_type: Optional[str] = None,
+        keywords: Optional[List[str]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        读取关键词小时热度汇总
+
+        Args:
+            date: 日期字符串，默认为今天
+            keyword_type: 关键词类型过滤（group / token）
+            keywords: 关键词过滤列表
+
+        Returns:
+            [{"keyword", "keyword_type", "platform_id", "hour", "count", "best_rank", "weight_sum"}, ...]
+            按小时、关键词排序
+        """
+        try:
+            conn = self._get_connection(date)
+            cursor = conn.cursor()
+
+            conditions = []
+            params: List[Any] = []
+            if keyword_type:
+                conditions.append("keyword_type = ?")
+                params.append(keyword_type)
+            if keywords:
+                conditions.append(f"keyword IN ({','.join('?' * len(keywords))})")
+                params.extend(keywords)
+            where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+
+            cursor.execute(f"""
+                SELECT keyword, keyword_type, platform_id, hour, count, best_rank, weight_sum
+                FROM keyword_heat
+                {where}
+                ORDER BY hour, keyword_type, keyword, platform_id
+            """, params)
+
+            return [
+                {
+                    "keyword": row[0],
+                    "keyword_type": row[1],
+                    "platform_id": row[2],
+                    "hour": row[3],
+                    "count": row[4],
+                    "best_rank": row[5],
+                    "weight_sum": row[6],
+                }
+                for row in cursor.fetchall()
+            ]
+
+        except Exception as e:
+            print(f"[存储] 读取关键词热度失败: {e}")
+            return []
+
     # ========================================
     # 推送记录
     # ========================================
@@ -755,6 +1343,198 @@ class SQLiteStorageMixin:
             print(f"[存储] 记录推送失败: {e}")
             return False
 
+    # ========================================
+    # 通知发件箱
+    # ========================================
+
+    def _enqueue_notifications_impl(self, messages: List[Dict], date: Optional[str] = None) -> bool:
+        """
+        批次写入发件箱
+
+        Args:
+            messages: 批次列表，每项包含 group_id、channel、account、sequence、
+                      batch_no、total、report_type、request
+            date: 日期字符串（YYYY-MM-DD），默认为今天
+
+        Returns:
+            是否写入成功
+        """
+        if not messages:
+            return True
+
+        try:
+            conn = self._get_connection(date)
+            now_str = self._get_configured_time().strftime("%Y-%m-%d %H:%M:%S")
+
+            conn.executemany("""
+                INSERT INTO notification_outbox
+                (group_id, channel, account, sequence, batch_no, total, report_type,
+                 request, status, attempts, next_attempt_at, created_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, 'pending', 0, 0, ?)
+            """, [
+                (
+                    m["group_id"], m["channel"], m.get("account", ""), m["sequence"],
+                    m["batch_no"], m["total"], m.get("report_type"), m["request"], now_str,
+                )
+                for m in messages
+            ])
+
+            conn.commit()
+            return True
+
+        except Exception as e:
+            print(f"[存储] 写入通知发件箱失败: {e}")
+            return False
+
+    def _get_pending_notifications_impl(self, date: Optional[str] = None) -> List[Dict]:
+        """
+        获取发件箱中待投递的批次
+
+        Args:
+            date: 日期字符串（YYYY-MM-DD），默认为今天
+
+        Returns:
+            批次列表（按写入顺序）
+        """
+        try:
+            conn = self._get_connection(date)
+            cursor = conn.cursor()
+
+            cursor.execute("""
+                SELECT id, group_id, channel, account, sequence, batch_no, total,
+                       report_type, request, attempts, next_attempt_at
+                FROM notification_outbox
+                WHERE status = 'pending'
+                ORDER BY id
+            """)
+
+            columns = [col[0] for col in cursor.description]
+            return [dict(zip(columns, row)) for row in cursor.fetchall()]
+
+        except Exception as e:
+            print(f"[存储] 读取通知发件箱失败: {e}")
+            return []
+
+    def _update_notifications_impl(self, updates: List[Dict], date: Optional[str] = None) -> bool:
+        """
+        更新发件箱批次的投递状态
+
+        Args:
+            updates: 更新列表，每项包含 id、status、attempts、next_attempt_at、last_error
+            date: 日期字符串（YYYY-MM-DD），默认为今天
+
+        Returns:
+            是否更新成功
+        """
+        if not updates:
+            return True
+
+        try:
+            conn = self._get_connection(date)
+            now_str = self._get_configured_time().strftime("%Y-%m-%d %H:%M:%S")
+
+            conn.executemany("""
+                UPDATE notification_outbox
+                SET status = ?, attempts = ?, next_attempt_at = ?, last_error = ?,
+                    sent_at = CASE WHEN ? = 'sent' THEN ? ELSE sent_at END
+                WHERE id = ?
+            """, [
+                (
+                    u["status"], u["attempts"], u.get("next_attempt_at", 0), u.get("last_error"),
+                    u["status"], now_str, u["id"],
+                )
+                for u in updates
+            ])
+
+            conn.commit()
+            return True
+
+        except Exception as e:
+            print(f"[存储] 更新通知发件箱失败: {e}")
+            return False
+
+    # ========================================
+    # 推送台账
+    # ========================================
+
+    def _get_push_ledger_impl(self, channels: List[str], date: Optional[str] = None) -> Dict[str, Dict]:
+        """
+        读取推送台账
+
+        Args:
+            channels: 渠道名列表
+            date: 日期字符串（YYYY-MM-DD），默认为今天
+
+        Returns:
+            {渠道名: {(item_key, group_word): last_rank}}，last_rank 可能为 None
+        """
+        ledger: Dict[str, Dict] = {channel: {} for channel in channels}
+        if not channels:
+            return ledger
+
+        try:
+            conn = self._get_connection(date)
+            cursor = conn.cursor()
+
+            placeholders = ",".join("?" * len(channels))
+            cursor.execute(f"""
+                SELECT channel, item_key, group_word, last_rank
+                FROM push_ledger
+                WHERE channel IN ({placeholders})
+            """, list(channels))
+
+            for channel, item_key, group_word, last_rank in cursor.fetchall():
+                ledger[channel][(item_key, group_word)] = last_rank
+            return ledger
+
+        except Exception as e:
+            print(f"[存储] 读取推送台账失败: {e}")
+            return ledger
+
+    def _record_push_ledger_impl(self, channel: str, entries: List[Dict], date: Optional[str] = None) -> bool:
+        """
+        记录已推送的条目
+
+        Args:
+            channel: 渠道名
+            entries: 条目列表，每项包含 item_key、group_word、source_name、title、rank
+            date: 日期字符串（YYYY-MM-DD），默认为今天
+
+        Returns:
+            是否记录成功
+        """
+        if not entries:
+            return True
+
+        try:
+            conn = self._get_connection(date)
+            now_str = self._get_configured_time().strftime("%Y-%m-%d %H:%M:%S")
+
+            conn.executemany("""
+                INSERT INTO push_ledger
+                (channel, item_key, group_word, source_name, title, last_rank,
+                 push_count, first_pushed_at, last_pushed_at)
+                VALUES (?, ?, ?, ?, ?, ?, 1, ?, ?)
+                ON CONFLICT(channel, item_key, group_word) DO UPDATE SET
+                    title = excluded.title,
+                    last_rank = excluded.last_rank,
+                    push_count = push_count + 1,
+                    last_pushed_at = excluded.last_pushed_at
+            """, [
+                (
+                    channel, e["item_key"], e["group_word"], e.get("source_name"), e.get("title"),
+                    e.get("rank"), now_str, now_str,
+                )
+                for e in entries
+            ])
+
+            conn.commit()
+            return True
+
+        except Exception as e:
+            print(f"[存储] 记录推送台账失败: {e}")
+            return False
+
     # ========================================
     # RSS 数据存储
     # ========================================
@@ -857,6 +1637,27 @@ class SQLiteStorageMixin:
                     except sqlite3.Error as e:
                         print(f"{log_prefix} 保存 RSS 条目失败 [{item.title[:30]}...]: {e}")
 
+            # 增量解析跳过的已存在条目：本次仍视为在列表中
+            for feed_id, urls in data.seen_urls.items():
+                updated_count += self._mark_rss_urls_present(
+                    cursor, feed_id, urls, data.crawl_time, now_str
+                )
+
+            # 未更新（304）的源：上次抓取到的条目本次仍视为在列表中
+            for feed_id in data.not_modified_ids:
+                updated_count += self._mark_rss_feed_items_present(
+                    cursor, feed_id, data.crawl_time, now_str
+                )
+
+            # 调度未到期的源没有请求，条目只为报告沿用，不计入更新数和抓取次数
+            for feed_id in data.not_due_ids:
+                self._mark_rss_feed_items_present(
+                    cursor, feed_id, data.crawl_time, now_str, observed=False
+                )
+
+            # 记录各源的抓取状态和条件请求校验值（需在标记 304 条目之后更新 last_fetch_time）
+            self._update_rss_feed_fetch_state(cursor, data)
+
             total_items = new_count + updated_count
 
             # 记录抓取信息
@@ -874,13 +1675,13 @@ class SQLiteStorageMixin:
             if record_row:
                 crawl_record_id = record_row[0]
 
-                # 记录成功的源
-                for feed_id in data.items.keys():
+                # 记录成功的源（304 未更新也视为成功）
+                for feed_id in list(data.items.keys()) + data.not_modified_ids:
                     cursor.execute("""
                         INSERT OR REPLACE INTO rss_crawl_status
-                        (crawl_record_id, feed_id, status)
-                        VALUES (?, ?, 'success')
-                    """, (crawl_record_id, feed_id))
+                        (crawl_record_id, feed_id, status, latency_ms)
+                        VALUES (?, ?, 'success', ?)
+                    """, (crawl_record_id, feed_id, data.latencies.get(feed_id)))
 
                 # 记录失败的源
                 for failed_id in data.failed_ids:
@@ -891,9 +1692,9 @@ class SQLiteStorageMixin:
 
                     cursor.execute("""
                         INSERT OR REPLACE INTO rss_crawl_status
-                        (crawl_record_id, feed_id, status)
-                        VALUES (?, ?, 'failed')
-                    """, (crawl_record_id, failed_id))
+                        (crawl_record_id, feed_id, status, latency_ms)
+                        VALUES (?, ?, 'failed', ?)
+                    """, (crawl_record_id, failed_id, data.latencies.get(failed_id)))
 
             conn.commit()
 
@@ -903,6 +1704,261 @@ class SQLiteStorageMixin:
             print(f"{log_prefix} 保存 RSS 数据失败: {e}")
             return False, 0, 0
 
+    def _mark_rss_feed_items_present(
+        self,
+        cursor: sqlite3.Cursor,
+        feed_id: str,
+        crawl_time: str,
+        now_str: str,
+        observed: bool = True,
+    ) -> int:
+        """
+        将未更新（304）或调度未到期的源在上次抓取时的条目标记为本次仍在列表中
+
+        上次抓取时间取 rss_feeds.last_fetch_time，旧数据没有该值时取该源条目的最新抓取时间。
+
+        Args:
+            cursor: 数据库游标
+            feed_id: RSS 源 ID
+            crawl_time: 本次抓取时间
+            now_str: 当前时间字符串
+            observed: 本次是否确认过条目仍在列表中（调度未到期时为 False，不增加 crawl_count）
+
+        Returns:
+            标记的条目数
+        """
+        cursor.execute(f"""
+            UPDATE rss_items SET
+                last_crawl_time = ?,
+                {"crawl_count = crawl_count + 1," if observed else ""}
+                updated_at = ?
+            WHERE feed_id = ?
+              AND last_crawl_time = COALESCE(
+                  (SELECT last_fetch_time FROM rss_feeds WHERE id = ?),
+                  (SELECT MAX(last_crawl_time) FROM rss_items WHERE feed_id = ?)
+              )
+              AND last_crawl_time != ?
+        """, (crawl_time, now_str, feed_id, feed_id, feed_id, crawl_time))
+        return cursor.rowcount
+
+    def _mark_rss_urls_present(
+        self,
+        cursor: sqlite3.Cursor,
+        feed_id: str,
+        urls: List[str],
+        crawl_time: str,
+        now_str: str,
+    ) -> int:
+        """
+        将指定 URL 的已保存条目标记为本次仍在列表中（不修改条目内容）
+
+        Args:
+            cursor: 数据库游标
+            feed_id: RSS 源 ID
+            urls: 条目 URL 列表
+            crawl_time: 本次抓取时间
+            now_str: 当前时间字符串
+
+        Returns:
+            标记的条目数
+        """
+        if not urls:
+            return 0
+        cursor.executemany("""
+            UPDATE rss_items SET
+                last_crawl_time = ?,
+                crawl_count = crawl_count + 1,
+                updated_at = ?
+            WHERE url = ? AND feed_id = ? AND last_crawl_time != ?
+        """, [(crawl_time, now_str, url, feed_id, crawl_time) for url in urls])
+        return cursor.rowcount
+
+    def _get_rss_seen_urls_impl(self, date: Optional[str] = None) -> Dict[str, set]:
+        """
+        获取当天已保存的条目 URL（用于增量解析）
+
+        Args:
+            date: 日期字符串（YYYY-MM-DD），默认为今天
+
+        Returns:
+            {feed_id: {url, ...}}
+        """
+        try:
+            conn = self._get_connection(date, db_type="rss")
+            cursor = conn.cursor()
+            cursor.execute("SELECT feed_id, url FROM rss_items WHERE url != ''")
+            seen: Dict[str, set] = {}
+            for feed_id, url in cursor.fetchall():
+                seen.setdefault(feed_id, set()).add(url)
+            return seen
+        except sqlite3.Error as e:
+            print(f"[存储] 读取已保存的 RSS 条目失败: {e}")
+            return {}
+
+    def _update_rss_feed_fetch_state(self, cursor: sqlite3.Cursor, data: RSSData) -> None:
+        """
+        更新 rss_feeds 中各源的最后抓取时间、状态和条件请求校验值
+
+        Args:
+            cursor: 数据库游标
+            data: RSS 数据
+        """
+        for feed_id in list(data.items.keys()) + data.not_modified_ids:
+            validator = data.validators.get(feed_id, {})
+            cursor.execute("""
+                UPDATE rss_feeds SET
+                    feed_url = ?,
+                    last_fetch_time = ?,
+                    last_fetch_status = 'success',
+                    etag = ?,
+                    last_modified = ?
+                WHERE id = ?
+            """, (validator.get("url", ""), data.crawl_time,
+                  validator.get("etag"), validator.get("last_modified"), feed_id))
+
+        # 未到期的源没有请求，只记录条目沿用到的抓取时间，状态和校验值保持不变
+        for feed_id in data.not_due_ids:
+            cursor.execute("""
+                UPDATE rss_feeds SET last_fetch_time = ?
+                WHERE id = ?
+            """, (data.crawl_time, feed_id))
+
+        for feed_id in data.failed_ids:
+            # 失败时保留校验值，下次仍可发送条件请求
+            cursor.execute("""
+                UPDATE rss_feeds SET last_fetch_status = 'failed'
+                WHERE id = ?
+            """, (feed_id,))
+
+    def _get_rss_source_activity_impl(self, date: Optional[str] = None) -> Dict[str, Dict[str, List]]:
+        """
+        获取各 RSS 源当天的抓取活动（用于自适应调度）
+
+        变化指出现新增条目的抓取；304 等未变化的成功抓取只计入 checks。
+
+        Args:
+            date: 日期字符串（YYYY-MM-DD），默认为今天
+
+        Returns:
+            {feed_id: {"checks": [...], "changes": [...], "published": [条目发布时间]}}
+        """
+        try:
+            conn = self._get_connection(date, db_type="rss")
+            cursor = conn.cursor()
+            activity: Dict[str, Dict[str, List]] = {}
+
+            cursor.execute("""
+                SELECT s.feed_id, r.crawl_time
+                FROM rss_crawl_status s
+                JOIN rss_crawl_records r ON r.id = s.crawl_record_id
+                WHERE s.status = 'success'
+            """)
+            for feed_id, crawl_time in cursor.fetchall():
+                minutes = crawl_time_to_minutes(crawl_time)
+                if minutes is not None:
+                    entry = activity.setdefault(
+                        feed_id, {"checks": [], "changes": [], "published": []}
+                    )
+                    entry["checks"].append(minutes)
+
+            cursor.execute("""
+                SELECT DISTINCT feed_id, first_crawl_time FROM rss_items
+            """)
+            for feed_id, crawl_time in cursor.fetchall():
+                minutes = crawl_time_to_minutes(crawl_time)
+                if minutes is not None and feed_id in activity:
+                    activity[feed_id]["changes"].append(minutes)
+
+            cursor.execute("""
+                SELECT feed_id, published_at FROM rss_items
+                WHERE published_at IS NOT NULL AND published_at != ''
+            """)
+            for feed_id, published_at in cursor.fetchall():
+                if feed_id in activity:
+                    activity[feed_id]["published"].append(published_at)
+
+            return activity
+        except sqlite3.Error as e:
+            print(f"[存储] 读取 RSS 源抓取活动失败: {e}")
+            return {}
+
+    def _get_rss_source_health_impl(self, date: Optional[str] = None) -> Dict[str, Dict]:
+        """
+        获取各 RSS 源当天的抓取健康状况（用于来源熔断）
+
+        Args:
+            date: 日期字符串（YYYY-MM-DD），默认为今天
+
+        Returns:
+            {feed_id: {"consecutive_failures", "last_failure", "last_success"}}
+        """
+        from trendradar.crawler.breaker import summarize_source_health
+
+        try:
+            conn = self._get_connection(date, db_type="rss")
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT s.feed_id, r.crawl_time, s.status
+                FROM rss_crawl_status s
+                JOIN rss_crawl_records r ON r.id = s.crawl_record_id
+                ORDER BY r.crawl_time
+            """)
+            return summarize_source_health(cursor.fetchall())
+        except sqlite3.Error as e:
+            print(f"[存储] 读取 RSS 源抓取状态失败: {e}")
+            return {}
+
+    def _get_rss_source_latency_impl(self, date: Optional[str] = None) -> Dict[str, List[int]]:
+        """
+        获取各 RSS 源当天成功请求的延迟（用于对冲请求）
+
+        Args:
+            date: 日期字符串（YYYY-MM-DD），默认为今天
+
+        Returns:
+            {feed_id: [latency_ms, ...]}
+        """
+        try:
+            conn = self._get_connection(date, db_type="rss")
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT feed_id, latency_ms FROM rss_crawl_status
+                WHERE status = 'success' AND latency_ms IS NOT NULL
+            """)
+            latencies: Dict[str, List[int]] = {}
+            for feed_id, latency_ms in cursor.fetchall():
+                latencies.setdefault(feed_id, []).append(latency_ms)
+            return latencies
+        except sqlite3.Error as e:
+            print(f"[存储] 读取 RSS 源请求延迟失败: {e}")
+            return {}
+
+    def _get_rss_feed_validators_impl(self, date: Optional[str] = None) -> Dict[str, Dict[str, str]]:
+        """
+        获取各源最后一次成功抓取的条件请求校验值
+
+        Args:
+            date: 日期字符串（YYYY-MM-DD），默认为今天
+
+        Returns:
+            {feed_id: {"url": ..., "etag": ..., "last_modified": ...}}
+        """
+        try:
+            conn = self._get_connection(date, db_type="rss")
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT id, feed_url, etag, last_modified FROM rss_feeds
+                WHERE last_fetch_time IS NOT NULL
+                  AND (etag IS NOT NULL OR last_modified IS NOT NULL)
+            """)
+            return {
+                row[0]: {"url": row[1] or "", "etag": row[2], "last_modified": row[3]}
+                for row in cursor.fetchall()
+            }
+        except sqlite3.Error as e:
+            print(f"[存储] 读取 RSS 条件请求校验值失败: {e}")
+            return {}
+
     def _get_rss_data_impl(self, date: Optional[str] = None) -> Optional[RSSData]:
         """
         获取指定日期的所有 RSS 数据
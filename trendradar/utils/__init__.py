@@ -9,8 +9,10 @@ from trendradar.utils.time import (
     format_time_filename,
     get_current_time_display,
     convert_time_for_display,
+    crawl_time_to_minutes,
 )
 from trendradar.utils.url import normalize_url, get_url_signature
+from trendradar.utils.story import StoryIndex, minhash_signature, normalize_title
 
 __all__ = [
     "get_configured_time",
@@ -18,6 +20,10 @@ __all__ = [
     "format_time_filename",
     "get_current_time_display",
     "convert_time_for_display",
+    "crawl_time_to_minutes",
     "normalize_url",
     "get_url_signature",
+    "StoryIndex",
+    "minhash_signature",
+    "normalize_title",
 ]
@@ -0,0 +1,46 @@
+# coding=utf-8
+"""
+标题关键词提取模块
+
+提供入库热度汇总与 MCP 分析工具共用的简单关键词提取：
+- extract_title_keywords: 按空白和标点切分标题，过滤停用词和短词
+"""
+
+import re
+from typing import List
+
+
+# 停用词
+STOPWORDS = frozenset({
+    '的', '了', '在', '是', '我', '有', '和', '就', '不', '人', '都', '一', '一个',
+    '上', '也', '很', '到', '说', '要', '去', '你', '会', '着', '没有', '看', '好',
+    '自己', '这',
+})
+
+_URL_PATTERN = re.compile(r'http[s]?://\S+')
+_SYMBOL_PATTERN = re.compile(r'[^\w\s]')
+_SPLIT_PATTERN = re.compile(r'[\s，。！？、]+')
+
+
+def extract_title_keywords(title: str, min_length: int = 2) -> List[str]:
+    """
+    从标题中提取关键词（简单实现）
+
+    Args:
+        title: 标题文本
+        min_length: 最小关键词长度
+
+    Returns:
+        关键词列表（保留出现顺序，可能包含重复）
+    """
+    # 移除URL和特殊字符
+    title = _URL_PATTERN.sub('', title)
+    title = _SYMBOL_PATTERN.sub(' ', title)
+
+    # 简单分词（按空格和常见分隔符）
+    words = _SPLIT_PATTERN.split(title)
+
+    return [
+        word.strip() for word in words
+        if word.strip() and len(word.strip()) >= min_length and word.strip() not in STOPWORDS
+    ]
@@ -0,0 +1,237 @@
+# coding=utf-8
+"""
+新闻事件聚类工具模块
+
+同一事件在微博、知乎、抖音等平台上的标题措辞各不相同。本模块基于
+标准化标题的字符 n-gram MinHash 签名 + LSH 分桶，在入库时增量地为
+每条新闻分配稳定的 story_id（同一事件的新闻共享同一个 story_id）：
+- normalize_title: 标题标准化（小写、去除空白和标点）
+- minhash_signature: 计算标题的 MinHash 签名
+- signature_similarity: 由签名估算两条标题的 Jaccard 相似度
+- StoryIndex: LSH 分桶索引，查询/分配 story_id
+
+每条新标题只与同桶的候选比较，一次抓取的聚类开销为 O(n)。
+"""
+
+import random
+import re
+import zlib
+from array import array
+from typing import Dict, List, Optional, Set, Tuple
+
+
+# n-gram 长度（中文标题以二元组效果最好）
+NGRAM_SIZE = 2
+
+# MinHash 签名长度 = LSH 分段数 × 每段行数
+LSH_BANDS = 16
+LSH_ROWS = 2
+NUM_PERM = LSH_BANDS * LSH_ROWS
+
+# 判定为同一事件的签名相似度阈值（估算的 Jaccard 相似度）
+STORY_SIMILARITY_THRESHOLD = 0.4
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+
+# 固定种子生成哈希置换参数，保证签名跨进程、跨运行稳定
+_rng = random.Random(20240101)
+_PERMUTATIONS: List[Tuple[int, int]] = [
+    (_rng.randint(1, _MERSENNE_PRIME - 1), _rng.randint(0, _MERSENNE_PRIME - 1))
+    for _ in range(NUM_PERM)
+]
+del _rng
+
+_NON_WORD_PATTERN = re.compile(r"[\W_]+", re.UNICODE)
+
+
+def normalize_title(title: str) -> str:
+    """
+    标准化标题：转小写，去除空白、标点和符号
+
+    Args:
+        title: 原始标题
+
+    Returns:
+        标准化后的标题
+    """
+    if not title:
+        return ""
+    return _NON_WORD_PATTERN.sub("", str(title).lower())
+
+
+def title_shingles(title: str, n: int = NGRAM_SIZE) -> Set[str]:
+    """
+    提取标准化标题的字符 n-gram 集合
+
+    Args:
+        title: 原始标题
+        n: n-gram 长度
+
+    Returns:
+        n-gram 集合（标题过短时返回整个标题）
+    """
+    text = normalize_title(title)
+    if not text:
+        return set()
+    if len(text) <= n:
+        return {text}
+    return {text[i:i + n] for i in range(len(text) - n + 1)}
+
+
+def minhash_signature(title: str) -> Optional[array]:
+    """
+    计算标题的 MinHash 签名
+
+    Args:
+        title: 原始标题
+
+    Returns:
+        长度为 NUM_PERM 的无符号整数数组；标题为空时返回 None
+    """
+    shingles = title_shingles(title)
+    if not shingles:
+        return None
+
+    hashes = [zlib.crc32(s.encode("utf-8")) for s in shingles]
+    return array("I", [
+        min(((a * h + b) % _MERSENNE_PRIME) & _MAX_HASH for h in hashes)
+        for a, b in _PERMUTATIONS
+    ])
+
+
+def signature_similarity(sig_a: array, sig_b: array) -> float:
+    """
+    由 MinHash 签名估算 Jaccard 相似度
+
+    Args:
+        sig_a: 签名 A
+        sig_b: 签名 B
+
+    Returns:
+        0-1 之间的相似度
+    """
+    if sig_a is None or sig_b is None or len(sig_a) != len(sig_b):
+        return 0.0
+    same = sum(1 for x, y in zip(sig_a, sig_b) if x == y)
+    return same / len(sig_a)
+
+
+def signature_to_bytes(signature: Optional[array]) -> Optional[bytes]:
+    """签名序列化为 BLOB（用于数据库存储）"""
+    return signature.tobytes() if signature is not None else None
+
+
+def signature_from_bytes(data: Optional[bytes]) -> Optional[array]:
+    """从 BLOB 还原签名（长度不匹配时视为无效）"""
+    if not data:
+        return None
+    signature = array("I")
+    signature.frombytes(data)
+    return signature if len(signature) == NUM_PERM else None
+
+
+class StoryIndex:
+    """
+    LSH 分桶索引
+
+    签名按 LSH_BANDS 段切分，任一段完全相同即成为候选；候选再用签名相似度
+    精确校验。story_id 由调用方提供（通常为事件首条新闻的 ID），
+    新成员加入已有事件时沿用其 story_id，因此 story_id 一经分配保持稳定。
+    """
+
+    def __init__(self, threshold: float = STORY_SIMILARITY_THRESHOLD):
+        self.threshold = threshold
+        self._buckets: Dict[Tuple, List[int]] = {}
+        self._members: Dict[int, Tuple[int, array]] = {}
+
+    def __len__(self) -> int:
+        return len(self._members)
+
+    @staticmethod
+    def _band_keys(signature: array) -> List[Tuple]:
+        return [
+            (band,) + tuple(signature[band * LSH_ROWS:(band + 1) * LSH_ROWS])
+            for band in range(LSH_BANDS)
+        ]
+
+    def add(self, member_id: int, story_id: int, signature: Optional[array]) -> None:
+        """
+        将成员加入索引
+
+        Args:
+            member_id: 成员 ID（如 news_items.id）
+            story_id: 成员所属的事件 ID
+            signature: MinHash 签名（None 时不参与聚类）
+        """
+        if signature is None:
+            return
+        self._members[member_id] = (story_id, signature)
+        for key in self._band_keys(signature):
+            self._buckets.setdefault(key, []).append(member_id)
+
+    def candidates(self, signature: Optional[array]) -> Set[int]:
+        """
+        获取与签名至少有一个 LSH 分段相同的成员
+
+        Args:
+            signature: MinHash 签名
+
+        Returns:
+            候选成员 ID 集合（未经相似度校验）
+        """
+        result: Set[int] = set()
+        if signature is None:
+            return result
+        for key in self._band_keys(signature):
+            bucket = self._buckets.get(key)
+            if bucket:
+                result.update(bucket)
+        return result
+
+    def query(self, signature: Optional[array]) -> Optional[int]:
+        """
+        查找与签名最相似的已有事件
+
+        Args:
+            signature: MinHash 签名
+
+        Returns:
+            相似度达到阈值的事件 ID（相似度相同取较小的 story_id），未找到返回 None
+        """
+        if signature is None:
+            return None
+
+        best_story = None
+        best_similarity = 0.0
+        for member_id in self.candidates(signature):
+            story_id, member_sig = self._members[member_id]
+            similarity = signature_similarity(signature, member_sig)
+            if similarity < self.threshold:
+                continue
+            if (
+                best_story is None
+                or similarity > best_similarity
+                or (similarity == best_similarity and story_id < best_story)
+            ):
+                best_story = story_id
+                best_similarity = similarity
+
+        return best_story
+
+    def assign(self, member_id: int, signature: Optional[array]) -> int:
+        """
+        为新成员分配 story_id 并加入索引
+
+        Args:
+            member_id: 成员 ID
+            signature: MinHash 签名
+
+        Returns:
+            已有事件的 story_id，或以 member_id 作为新事件的 story_id
+        """
+        story_id = self.query(signature)
+        if story_id is None:
+            story_id = member_id
+        self.add(member_id, story_id, signature)
+        return story_id
@@ -91,6 +91,24 @@ def convert_time_for_display(time_str: str) -> str:
     return time_str
 
 
+def crawl_time_to_minutes(crawl_time: Optional[str]) -> Optional[int]:
+    """
+    将抓取时间转换为当天的分钟数
+
+    Args:
+        crawl_time: 抓取时间，如 '15-30' 或 '15:30'
+
+    Returns:
+        分钟数，如 930；无法解析时返回 None
+    """
+    if not crawl_time or len(crawl_time) < 5:
+        return None
+    try:
+        return int(crawl_time[:2]) * 60 + int(crawl_time[3:5])
+    except ValueError:
+        return None
+
+
 def format_iso_time_friendly(
     iso_time: str,
     timezone: str = DEFAULT_TIMEZONE,